@@ -8,43 +8,42 @@ maintaining backward compatibility with code that imported from the original
 analyze_ai_patterns.py file.
 """
 
+from importlib import import_module
 from importlib.metadata import version as _get_version
 
-# Core analyzer and result classes
-# CLI formatters
-from writescore.cli.formatters import (
-    format_detailed_report,
-    format_dual_score_report,
-    format_report,
-)
-from writescore.core.analyzer import AIPatternAnalyzer
-from writescore.core.results import (
-    AnalysisResults,
-    DetailedAnalysis,
-    EmDashInstance,
-    FormattingIssue,
-    HeadingIssue,
-    HighPredictabilitySegment,
-    SentenceBurstinessIssue,
-    SyntacticIssue,
-    TransitionInstance,
-    UniformParagraph,
+# Public names and the modules defining them. They are imported on first
+# access (PEP 562), so ``import writescore`` does not load the analyzer and
+# its dependencies until they are used.
+_EXPORTS = {
+    # Core analyzer and result classes
+    "AIPatternAnalyzer": "writescore.core.analyzer",
+    "AnalysisResults": "writescore.core.results",
+    "DetailedAnalysis": "writescore.core.results",
+    "EmDashInstance": "writescore.core.results",
+    "FormattingIssue": "writescore.core.results",
+    "HeadingIssue": "writescore.core.results",
+    "HighPredictabilitySegment": "writescore.core.results",
+    "SentenceBurstinessIssue": "writescore.core.results",
+    "SyntacticIssue": "writescore.core.results",
+    "TransitionInstance": "writescore.core.results",
+    "UniformParagraph": "writescore.core.results",
     # Optional: individual issue types for detailed analysis
-    VocabInstance,
-)
-
-# History tracking
-from writescore.history.tracker import HistoricalScore, ScoreHistory
-
-# Scoring system
-from writescore.scoring.dual_score import (
-    THRESHOLDS,
-    DualScore,
-    ImprovementAction,
-    ScoreCategory,
-    ScoreDimension,
-)
-from writescore.scoring.dual_score_calculator import calculate_dual_score
+    "VocabInstance": "writescore.core.results",
+    # History tracking
+    "HistoricalScore": "writescore.history.tracker",
+    "ScoreHistory": "writescore.history.tracker",
+    # Scoring system
+    "THRESHOLDS": "writescore.scoring.dual_score",
+    "DualScore": "writescore.scoring.dual_score",
+    "ImprovementAction": "writescore.scoring.dual_score",
+    "ScoreCategory": "writescore.scoring.dual_score",
+    "ScoreDimension": "writescore.scoring.dual_score",
+    "calculate_dual_score": "writescore.scoring.dual_score_calculator",
+    # CLI formatters
+    "format_detailed_report": "writescore.cli.formatters",
+    "format_dual_score_report": "writescore.cli.formatters",
+    "format_report": "writescore.cli.formatters",
+}
 
 __all__ = [
     # Core
@@ -77,7 +76,25 @@ __all__ = [
     "format_dual_score_report",
 ]
 
+# Load the writescore.__version__ submodule now: importing it later (as the
+# CLI and result cache do) would rebind the package's __version__ attribute
+import_module("writescore.__version__")
+
 try:
     __version__ = _get_version("writescore")
 except Exception:
     __version__ = "0.0.0"  # Fallback for development installs
+
+
+def __getattr__(name: str):
+    """Import public names on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,6 +7,8 @@ After installation, it's accessible via the `writescore` command.
 Usage:
     writescore analyze FILE [OPTIONS]
     writescore recalibrate DATASET [OPTIONS]
+    writescore rescore STORE [OPTIONS]
+    writescore serve [OPTIONS]
 
 Extension Points:
     - Refactored from argparse to Click for better UX (Story 1.4.10)
@@ -33,6 +35,23 @@ from writescore.cli.formatters import (  # noqa: E402
 )
 from writescore.core.analysis_config import AnalysisConfig, AnalysisMode  # noqa: E402
 from writescore.core.analyzer import AIPatternAnalyzer  # noqa: E402
+from writescore.core.batch import (  # noqa: E402
+    DEFAULT_DOCUMENT_BATCH_SIZE,
+    default_jobs,
+    iter_batch_results,
+    parse_memory_size,
+    plan_workers,
+)
+from writescore.core.daemon import (  # noqa: E402
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_MAX_QUEUE,
+    AnalysisDaemon,
+    DaemonClient,
+    DaemonError,
+    find_daemon,
+    serve,
+)
 from writescore.core.deployment import (  # noqa: E402
     ParameterComparator,
     ParameterVersionManager,
@@ -44,6 +63,9 @@ from writescore.core.interpretability import (  # noqa: E402
     ScoreInterpreter,
     format_percentile_report,
 )
+from writescore.core.metric_store import MetricStore  # noqa: E402
+from writescore.core.result_cache import ResultCache  # noqa: E402
+from writescore.utils.embeddings import EmbeddingStore, embedding_store_path  # noqa: E402
 
 
 def _get_cli_defaults():
@@ -292,6 +314,17 @@ def show_mode_help():
 │ Example:  writescore chapter.md --mode full                    │
 └─────────────────────────────────────────────────────────────────────────┘
 
+┌─────────────────────────────────────────────────────────────────────────┐
+│ STREAMING MODE - Very Large Documents                                    │
+├─────────────────────────────────────────────────────────────────────────┤
+│ Speed:    Similar to FULL, with progress reporting                      │
+│ Coverage: 100% of document, read in bounded windows                     │
+│ Use When: Manuscripts too large to analyze in memory                    │
+│ Note:     Memory stays flat; per-window metrics are folded online       │
+│                                                                           │
+│ Example:  writescore manuscript.md --mode streaming            │
+└─────────────────────────────────────────────────────────────────────────┘
+
 ╔═══════════════════════════════════════════════════════════════════════════╗
 ║                         PERFORMANCE COMPARISON                            ║
 ╚═══════════════════════════════════════════════════════════════════════════╝
@@ -305,6 +338,7 @@ For a 90-page chapter (~180,000 characters):
 │ ADAPTIVE     │  30-240s    │   10-20%   │ Book chapters (RECOMMENDED) │
 │ SAMPLING     │  60-300s    │  Custom    │ Custom requirements         │
 │ FULL         │ 5-20 min    │   100%     │ Final validation            │
+│ STREAMING    │ 5-20 min    │   100%     │ Very large files            │
 └──────────────┴─────────────┴────────────┴─────────────────────────────┘
 
 ╔═══════════════════════════════════════════════════════════════════════════╗
@@ -336,7 +370,17 @@ For complete documentation: docs/analysis-modes-guide.md
     """)
 
 
-def create_analysis_config(mode, samples, sample_size, sample_strategy, profile="balanced"):
+def create_analysis_config(
+    mode,
+    samples,
+    sample_size,
+    sample_strategy,
+    profile="balanced",
+    use_cache=False,
+    incremental=False,
+    dimension_workers=1,
+    max_time=None,
+):
     """
     Create AnalysisConfig from CLI arguments.
 
@@ -346,16 +390,28 @@ def create_analysis_config(mode, samples, sample_size, sample_strategy, profile=
         sample_size: Characters per sample section
         sample_strategy: Sampling strategy
         profile: Dimension profile (fast/balanced/full)
+        use_cache: Reuse cached dimension results for unchanged documents
+        incremental: Re-analyze only changed sections where dimensions support it
+        dimension_workers: Threads running independent dimensions concurrently
+        max_time: Per-document time limit in seconds (0 = no limit; None = the
+            config default, or no limit in streaming mode)
 
     Returns:
         AnalysisConfig instance
     """
+    if max_time is None:
+        # Streaming exists to cover whole books; the default limit would cut them short
+        max_time = 0 if mode == "streaming" else AnalysisConfig.max_analysis_time_seconds
     return AnalysisConfig(
         mode=AnalysisMode(mode),
         sampling_sections=samples,
         sampling_chars_per_section=sample_size,
         sampling_strategy=sample_strategy,
         dimension_profile=profile,
+        use_result_cache=use_cache,
+        incremental_analysis=incremental,
+        dimension_workers=dimension_workers,
+        max_analysis_time_seconds=max_time or None,
     )
 
 
@@ -417,6 +473,13 @@ def show_dry_run_config(file_path: str, config: AnalysisConfig, detailed, show_s
             print("⚠  Warning: FULL mode on large documents is VERY SLOW")
             print("   Consider --mode adaptive for faster results (30-240s)")
 
+    elif config.mode == AnalysisMode.STREAMING:
+        windows = max(1, file_size // config.streaming_window_chars)
+        print("Behavior: Read incrementally, analyze every window, fold results")
+        print(f"          ~{windows} windows of {config.streaming_window_chars:,} chars")
+        print(f"Expected time: {pages * 2:.0f}-{pages * 10:.0f} seconds")
+        print("Coverage: 100% (memory independent of document size)")
+
     print()
 
     # Show integration with other features
@@ -430,6 +493,14 @@ def show_dry_run_config(file_path: str, config: AnalysisConfig, detailed, show_s
     print("=" * 75)
 
 
+def print_stream_progress(consumed: int, total: int):
+    """Display STREAMING mode progress on stderr (callback for analyze_stream)."""
+    percent = consumed / total * 100 if total else 100.0
+    print(
+        f"\rStreaming: {percent:5.1f}% ({consumed:,} of {total:,} bytes)", end="", file=sys.stderr
+    )
+
+
 def show_coverage_stats(result, config: AnalysisConfig, file_path: str):
     """Display coverage statistics after analysis."""
     file_size = os.path.getsize(file_path)
@@ -451,6 +522,8 @@ def show_coverage_stats(result, config: AnalysisConfig, file_path: str):
             print(f"Mode: FAST (estimated ~{est_coverage:.1f}% coverage)")
         elif config.mode == AnalysisMode.FULL:
             print("Mode: FULL (100% coverage)")
+        elif config.mode == AnalysisMode.STREAMING:
+            print("Mode: STREAMING (100% coverage, read in windows)")
         elif config.mode in [AnalysisMode.SAMPLING, AnalysisMode.ADAPTIVE]:
             total = config.sampling_sections * config.sampling_chars_per_section
             est_coverage = min(total / file_size * 100, 100)
@@ -575,6 +648,11 @@ def run_single_file_analysis(
     no_track_history,
     no_score_summary,
     format,
+    use_cache=False,
+    incremental=False,
+    dimension_workers=1,
+    use_daemon=False,
+    max_time=None,
 ):
     """
     Run analysis on a single file.
@@ -593,6 +671,11 @@ def run_single_file_analysis(
         no_track_history: Disable history tracking flag
         no_score_summary: Suppress score summary flag
         format: Output format
+        use_cache: Reuse cached dimension results for unchanged documents
+        incremental: Re-analyze only changed sections where dimensions support it
+        dimension_workers: Threads running independent dimensions concurrently
+        use_daemon: Analyze in a running `writescore serve` daemon if there is one
+        max_time: Per-file time limit in seconds (see create_analysis_config)
 
     Returns:
         List of results and calculated dual score
@@ -601,7 +684,17 @@ def run_single_file_analysis(
 
     try:
         # Create config
-        config = create_analysis_config(mode, samples, sample_size, sample_strategy, profile)
+        config = create_analysis_config(
+            mode,
+            samples,
+            sample_size,
+            sample_strategy,
+            profile,
+            use_cache=use_cache,
+            incremental=incremental,
+            dimension_workers=dimension_workers,
+            max_time=max_time,
+        )
 
         # Parse domain terms if needed (handled in main function)
         analyzer = AIPatternAnalyzer(config=config)
@@ -611,6 +704,11 @@ def run_single_file_analysis(
             show_dry_run_config(file, config, False, False)
             return [], None
 
+        # A running daemon has its models loaded already (streaming reads locally)
+        daemon = None
+        if use_daemon and config.mode != AnalysisMode.STREAMING:
+            daemon = find_daemon()
+
         # Display mode info (only for text format, to avoid breaking JSON/TSV output)
         if format == "text":
             print(f"\nAnalyzing: {file}")
@@ -623,15 +721,32 @@ def run_single_file_analysis(
             else:
                 print()
 
+            if daemon is not None:
+                print(f"Using analysis daemon ({daemon.address})")
             if show_coverage:
                 print("Coverage statistics will be shown after analysis")
             print()
 
         # Run analysis with timing
         start_time = time.time()
-        result = analyzer.analyze_file(file, config=config)
+        if config.mode == AnalysisMode.STREAMING and format == "text":
+            result = analyzer.analyze_stream(file, config=config, progress=print_stream_progress)
+            print(file=sys.stderr)
+        else:
+            result = _analyze_with_daemon(daemon, file, config) if daemon else None
+            if result is None:
+                result = analyzer.analyze_file(file, config=config)
         elapsed = time.time() - start_time
 
+        # Partial results: warn on stderr so JSON/TSV output stays parseable
+        if result.deadline_exceeded:
+            skipped = ", ".join(result.skipped_dimensions) or "none"
+            print(
+                f"Warning: analysis deadline of {config.max_analysis_time_seconds}s exceeded; "
+                f"partial results (skipped: {skipped}); raise the limit with --max-time",
+                file=sys.stderr,
+            )
+
         # Add mode info to results metadata (for history tracking)
         if not hasattr(result, "metadata"):
             result.metadata = {}
@@ -662,6 +777,13 @@ def run_single_file_analysis(
 
         # Display elapsed time (only for text format, to avoid breaking JSON/TSV output)
         if format == "text":
+            incremental_stats = getattr(result, "incremental", None)
+            if incremental_stats and incremental_stats["reused"]:
+                reused = ", ".join(
+                    f"{name} {count}/{incremental_stats['sections']}"
+                    for name, count in incremental_stats["reused"].items()
+                )
+                print(f"\nIncremental: reused unchanged sections ({reused})")
             print(f"\nCompleted in {elapsed:.1f} seconds")
 
         return [result], calculated_dual_score
@@ -671,10 +793,51 @@ def run_single_file_analysis(
         sys.exit(1)
 
 
-def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, profile, dry_run):
+def _analyze_with_daemon(daemon: DaemonClient, file: str, config: AnalysisConfig):
+    """
+    Analyze a file in the daemon.
+
+    Analysis errors (e.g. an empty file) propagate as they would in-process.
+
+    Args:
+        daemon: Client of the running daemon
+        file: File path
+        config: Analysis configuration
+
+    Returns:
+        AnalysisResults, or None if the daemon is unavailable or busy
+        (the caller then analyzes in-process)
+    """
+    with open(file, encoding="utf-8") as f:
+        text = f.read()
+    try:
+        return daemon.analyze(text, config, source_name=file)
+    except DaemonError as e:
+        print(f"Warning: {e}; analyzing without the daemon", file=sys.stderr)
+        return None
+
+
+def run_batch_analysis(
+    batch_dir,
+    mode,
+    samples,
+    sample_size,
+    sample_strategy,
+    profile,
+    dry_run,
+    jobs=1,
+    max_memory_per_worker=None,
+    use_cache=False,
+    incremental=False,
+    max_time=None,
+):
     """
     Run batch analysis on directory.
 
+    With jobs > 1, files are analyzed in a process pool (see core.batch);
+    progress is printed in completion order and results are returned in
+    file order.
+
     Args:
         batch_dir: Directory path
         mode: Analysis mode
@@ -682,12 +845,26 @@ def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, p
         sample_size: Sample size in characters
         sample_strategy: Sampling strategy
         dry_run: Dry run flag
+        jobs: Number of worker processes (1 = analyze in this process)
+        max_memory_per_worker: Optional per-worker memory budget in bytes
+        use_cache: Reuse cached dimension results for unchanged documents
+        incremental: Re-analyze only changed sections where dimensions support it
+        max_time: Per-file time limit in seconds (see create_analysis_config)
 
     Returns:
         List of results and None for dual_score
     """
     # Create config once (applies to all files)
-    config = create_analysis_config(mode, samples, sample_size, sample_strategy, profile)
+    config = create_analysis_config(
+        mode,
+        samples,
+        sample_size,
+        sample_strategy,
+        profile,
+        use_cache=use_cache,
+        incremental=incremental,
+        max_time=max_time,
+    )
 
     # Parse domain terms if needed (handled in main function)
     analyzer = AIPatternAnalyzer(config=config)
@@ -701,6 +878,7 @@ def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, p
             print(
                 f"Sampling: {config.sampling_sections} × {config.sampling_chars_per_section} chars ({config.sampling_strategy})"
             )
+        print(f"Workers: {jobs}")
         print("\nMode will be applied to all .md files in directory")
         return [], None
 
@@ -719,6 +897,12 @@ def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, p
     if config.mode in [AnalysisMode.SAMPLING, AnalysisMode.ADAPTIVE]:
         print(f"Sampling: {config.sampling_sections} × {config.sampling_chars_per_section} chars")
     print(f"Files to analyze: {len(md_files)}")
+
+    workers = plan_workers(jobs, len(md_files), max_memory_per_worker)
+    if workers > 1:
+        print(f"Workers: {workers}")
+        print()
+        return _run_parallel_batch(md_files, config, workers, max_memory_per_worker), None
     print()
 
     results = []
@@ -738,6 +922,42 @@ def run_batch_analysis(batch_dir, mode, samples, sample_size, sample_strategy, p
     return results, None
 
 
+def _run_parallel_batch(md_files, config, workers, max_memory_per_worker):
+    """
+    Analyze files in a worker pool, reporting progress as each file completes.
+
+    Args:
+        md_files: Sorted list of file paths
+        config: AnalysisConfig shared by all workers
+        workers: Number of worker processes
+        max_memory_per_worker: Optional per-worker memory budget in bytes
+
+    Returns:
+        List of results for successfully analyzed files, in file order
+    """
+    completed = {}
+    for outcome in iter_batch_results(md_files, config, workers, max_memory_per_worker):
+        if outcome.ok:
+            completed[outcome.path] = outcome.result
+            print(f"Analyzed: {Path(outcome.path).name} ✓ ({outcome.elapsed:.1f}s)", flush=True)
+        else:
+            print(f"Error analyzing {outcome.path}: {outcome.error}", file=sys.stderr)
+
+    print(f"\nCompleted {len(completed)} of {len(md_files)} files")
+
+    return [completed[str(f)] for f in md_files if str(f) in completed]
+
+
+def _parse_max_memory(ctx, param, value):
+    """Click callback converting --max-memory-per-worker to bytes."""
+    if value is None:
+        return None
+    try:
+        return parse_memory_size(value)
+    except ValueError as e:
+        raise click.BadParameter(str(e)) from e
+
+
 # Click group for multiple commands
 @click.group(context_settings={"help_option_names": ["-h", "--help"]})
 @click.version_option(version=__version__, prog_name="writescore")
@@ -759,6 +979,62 @@ def cli():
     type=click.Path(exists=True, file_okay=False, dir_okay=True),
     help="Analyze all .md files in directory",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    metavar="N",
+    help="Worker processes for --batch (default: number of CPU cores)",
+)
+@click.option(
+    "--max-memory-per-worker",
+    metavar="SIZE",
+    callback=_parse_max_memory,
+    help="Memory budget per --batch worker, e.g. 2G (limits worker count; "
+    "workers over budget release cached models)",
+)
+@click.option(
+    "--dimension-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    metavar="N",
+    help="Threads running independent dimensions of a single file concurrently (default: 1)",
+)
+@click.option(
+    "--max-time",
+    type=click.IntRange(min=0),
+    default=None,
+    metavar="SECONDS",
+    help="Per-file analysis time limit; dimensions not finished in time are skipped "
+    f"(default: {AnalysisConfig.max_analysis_time_seconds}, none in streaming mode; "
+    "0 = no limit)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-run every dimension instead of reusing cached results for unchanged documents",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help=(
+        "Re-analyze only sections changed since the last run (best with --mode full). "
+        "Only burstiness and semantic coherence reuse unchanged sections; other "
+        "dimensions still analyze the whole document"
+    ),
+)
+@click.option(
+    "--no-daemon",
+    is_flag=True,
+    help="Analyze in this process even if a 'writescore serve' daemon is running",
+)
+@click.option(
+    "--metric-store",
+    metavar="DIR",
+    type=click.Path(file_okay=False),
+    help="Also save raw dimension metrics to this store (see 'writescore rescore')",
+)
 @click.option(
     "--detailed",
     is_flag=True,
@@ -840,9 +1116,9 @@ def cli():
 @click.option(
     "--mode",
     "-m",
-    type=click.Choice(["fast", "adaptive", "sampling", "full"]),
+    type=click.Choice(["fast", "adaptive", "sampling", "full", "streaming"]),
     default=_CLI_DEFAULTS["mode"],
-    help="Analysis mode: fast (5-15s), adaptive (30-240s, RECOMMENDED), sampling (60-300s), full (5-20min)",
+    help="Analysis mode: fast (5-15s), adaptive (30-240s, RECOMMENDED), sampling (60-300s), full (5-20min), streaming (full coverage, constant memory)",
 )
 @click.option(
     "--profile",
@@ -920,6 +1196,14 @@ def cli():
 def analyze_command(
     file,
     batch,
+    jobs,
+    max_memory_per_worker,
+    dimension_workers,
+    max_time,
+    no_cache,
+    incremental,
+    no_daemon,
+    metric_store,
     detailed,
     format,
     domain_terms,
@@ -971,6 +1255,22 @@ def analyze_command(
       # Batch analyze directory
       writescore --batch manuscript/sections --format tsv
 
+      # Batch analyze with 4 workers, each limited to 3 GB
+      writescore --batch manuscript/ --jobs 4 --max-memory-per-worker 3G
+
+      # Re-run every dimension, ignoring cached results
+      writescore chapter-01.md --no-cache
+
+      # Edit-score loop: burstiness and coherence re-analyze changed sections only
+      writescore chapter-01.md --mode full --incremental
+
+      # Lower single-file latency: run independent dimensions on 4 threads
+      writescore chapter-01.md --dimension-workers 4
+
+      # Single files are analyzed by a running daemon (writescore serve)
+      # unless --no-daemon is given
+      writescore chapter-01.md --no-daemon
+
     For detailed mode information: writescore --help-modes
     """
     # Validate inputs
@@ -1054,7 +1354,24 @@ def analyze_command(
     domain_patterns = parse_domain_terms(domain_terms) if domain_terms else None
 
     # Create config for analyzer (used by all modes)
-    config = create_analysis_config(mode, samples, sample_size, sample_strategy, profile)
+    if incremental and no_cache:
+        click.echo(
+            "Warning: --incremental reuses cached sections; with --no-cache every section is "
+            "re-analyzed.",
+            err=True,
+        )
+
+    config = create_analysis_config(
+        mode,
+        samples,
+        sample_size,
+        sample_strategy,
+        profile,
+        use_cache=not no_cache,
+        incremental=incremental,
+        dimension_workers=dimension_workers,
+        max_time=max_time,
+    )
 
     # Set content type in ConfigRegistry if specified
     if content_type:
@@ -1091,7 +1408,18 @@ def analyze_command(
     # Standard analysis mode
     if batch:
         results, calculated_dual_score = run_batch_analysis(
-            batch, mode, samples, sample_size, sample_strategy, profile, dry_run
+            batch,
+            mode,
+            samples,
+            sample_size,
+            sample_strategy,
+            profile,
+            dry_run,
+            jobs=jobs or default_jobs(),
+            max_memory_per_worker=max_memory_per_worker,
+            use_cache=not no_cache,
+            incremental=incremental,
+            max_time=max_time,
         )
     else:
         results, calculated_dual_score = run_single_file_analysis(
@@ -1109,8 +1437,21 @@ def analyze_command(
             no_track_history,
             no_score_summary,
             format,
+            use_cache=not no_cache,
+            incremental=incremental,
+            dimension_workers=dimension_workers,
+            # The daemon has its own content type setting (process-wide registry)
+            use_daemon=not no_daemon and not content_type,
+            max_time=max_time,
         )
 
+    if metric_store and results:
+        store = MetricStore(Path(metric_store))
+        for r in results:
+            store.add_results(r)
+        store.save()
+        click.echo(f"Metrics of {len(results)} file(s) stored in {metric_store}", err=True)
+
     # Format and output
     output_lines = []
 
@@ -1193,6 +1534,41 @@ def analyze_command(
     type=click.Path(),
     help="Path to save normality test report (only with --auto-select-method)",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    metavar="N",
+    help="Worker processes analyzing documents (default: number of CPU cores)",
+)
+@click.option(
+    "--max-memory-per-worker",
+    metavar="SIZE",
+    callback=_parse_max_memory,
+    help="Memory budget per worker, e.g. 2G (limits worker count; "
+    "workers over budget release cached models)",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_DOCUMENT_BATCH_SIZE,
+    metavar="N",
+    help=f"Documents per worker task; model passes are batched across them "
+    f"(default: {DEFAULT_DOCUMENT_BATCH_SIZE})",
+)
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False),
+    help="Record finished analyses in this file and resume from it after an interruption",
+)
+@click.option(
+    "--mode",
+    "-m",
+    type=click.Choice(["fast", "adaptive", "sampling", "full"]),
+    default="adaptive",
+    help="Analysis mode used for every document (default: adaptive; see 'analyze --help-modes')",
+)
 @click.option("-v", "--verbose", is_flag=True, help="Enable verbose logging")
 def recalibrate_command(
     dataset,
@@ -1205,6 +1581,11 @@ def recalibrate_command(
     dry_run,
     auto_select_method,
     normality_report,
+    jobs,
+    max_memory_per_worker,
+    batch_size,
+    checkpoint,
+    mode,
     verbose,
 ):
     """Recalibrate scoring parameters from validation dataset.
@@ -1240,9 +1621,14 @@ def recalibrate_command(
       # Auto-select scoring method using Shapiro-Wilk normality testing
       writescore recalibrate validation_data/v2.0.jsonl \\
         --auto-select-method --normality-report reports/normality.txt
+
+      # Large dataset: 8 workers, resumable after an interruption
+      writescore recalibrate validation_data/v2.0.jsonl \\
+        --jobs 8 --checkpoint reports/v2.0.checkpoint
     """
     import logging
 
+    from writescore.core.distribution_analyzer import DistributionAnalyzer
     from writescore.core.recalibration import RecalibrationWorkflow
 
     # Setup logging
@@ -1264,8 +1650,16 @@ def recalibrate_command(
         dimension_list = list(dimensions) if dimensions else None
         normality_report_path = Path(normality_report) if normality_report else None
 
+        checkpoint_path = Path(checkpoint) if checkpoint else None
+
         # Create workflow with auto_select_method flag
-        workflow = RecalibrationWorkflow(auto_select_method=auto_select_method)
+        analyzer = DistributionAnalyzer(
+            config=AnalysisConfig(mode=AnalysisMode(mode)),
+            jobs=jobs or default_jobs(),
+            batch_size=batch_size,
+            max_memory_per_worker=max_memory_per_worker,
+        )
+        workflow = RecalibrationWorkflow(auto_select_method=auto_select_method, analyzer=analyzer)
 
         click.echo("=" * 80)
         click.echo("PARAMETER RECALIBRATION")
@@ -1286,6 +1680,10 @@ def recalibrate_command(
         else:
             click.echo("Method Selection: FIXED (hardcoded defaults)")
 
+        click.echo(f"Workers: up to {analyzer.jobs} (batches of {batch_size} documents)")
+        if checkpoint_path:
+            click.echo(f"Checkpoint: {checkpoint_path}")
+
         if dry_run:
             click.echo("Mode: DRY-RUN (no changes will be saved)")
 
@@ -1298,6 +1696,7 @@ def recalibrate_command(
             existing_params_path=existing_path,
             dimension_names=dimension_list,
             backup=not no_backup,
+            checkpoint_path=checkpoint_path,
         )
 
         # Print summary to console
@@ -1369,6 +1768,8 @@ def recalibrate_command(
 
     except KeyboardInterrupt:
         click.echo("\n\nRecalibration interrupted by user", err=True)
+        if checkpoint:
+            click.echo(f"Re-run with --checkpoint {checkpoint} to resume", err=True)
         sys.exit(130)
 
     except Exception as e:
@@ -1380,6 +1781,117 @@ def recalibrate_command(
         sys.exit(1)
 
 
+# Rescore command (score stored metrics under a parameter set)
+@cli.command(name="rescore")
+@click.argument("store", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--params",
+    "params_spec",
+    metavar="VERSION|FILE",
+    help="Parameter version or file to score with (default: built-in dimension scoring)",
+)
+@click.option(
+    "--compare",
+    "compare_spec",
+    metavar="VERSION|FILE",
+    help="Baseline parameter version or file; report score shifts from it to --params",
+)
+@click.option(
+    "--params-dir",
+    type=click.Path(),
+    default="config/parameters",
+    help="Directory containing parameter files",
+)
+@click.option(
+    "--archive-dir",
+    type=click.Path(),
+    default="config/parameters/archive",
+    help="Directory for archived versions",
+)
+@click.option(
+    "--no-normalization", is_flag=True, help="Skip z-score normalization of dimension scores"
+)
+@click.option("-o", "--output", type=click.Path(), help="Write per-document scores to JSON file")
+@click.option("--json", "output_json", is_flag=True, help="Output in JSON format")
+def rescore_command(
+    store, params_spec, compare_spec, params_dir, archive_dir, no_normalization, output, output_json
+):
+    """Recompute scores from stored metrics without re-analyzing documents.
+
+    Scores every document in a metric store (written by 'analyze
+    --metric-store') under a parameter set: dimension scores, quality score
+    and detection risk.
+
+    Examples:
+
+      # Collect metrics once
+      writescore analyze --batch corpus/ --metric-store metrics/
+
+      # Score under a candidate parameter version
+      writescore rescore metrics/ --params v2.0
+
+      # Score shifts from the deployed version to a candidate file
+      writescore rescore metrics/ --params config/candidate.yaml --compare v1.0
+    """
+    import json
+
+    from writescore.core.dimension_loader import DimensionLoader
+    from writescore.core.rescoring import load_parameters, rescore
+    from writescore.core.validation import ScoreShiftAnalyzer
+
+    metric_store = MetricStore(Path(store))
+    dimension_names = metric_store.dimensions()
+    if not dimension_names:
+        click.echo(f"Error: No stored metrics in {store}", err=True)
+        sys.exit(1)
+    DimensionLoader().load_dimensions(dimension_names)
+
+    manager = ParameterVersionManager(params_dir=Path(params_dir), archive_dir=Path(archive_dir))
+    try:
+        params = load_parameters(params_spec, manager) if params_spec else None
+        baseline = load_parameters(compare_spec, manager) if compare_spec else None
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    result = rescore(metric_store, params, enable_normalization=not no_normalization)
+    data = result.to_dict()
+
+    shift_report = None
+    if compare_spec:
+        before = rescore(metric_store, baseline, enable_normalization=not no_normalization)
+        shift_report = ScoreShiftAnalyzer().analyze_shift(
+            before.document_scores(),
+            result.document_scores(),
+            old_version=before.to_dict()["version"],
+            new_version=data["version"],
+        )
+        data["score_shift"] = shift_report.to_dict()
+
+    if output:
+        output_path = Path(output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(data, indent=2))
+
+    if output_json:
+        click.echo(json.dumps(data, indent=2))
+        return
+
+    click.echo(f"Parameters: {data['version']}")
+    click.echo(f"Documents: {len(result.doc_ids)}")
+    click.echo(f"Scored from parameters: {', '.join(result.parameterized) or 'none'}")
+    if len(result.doc_ids):
+        click.echo(
+            f"Quality score: mean {result.quality_score.mean():.1f}, "
+            f"min {result.quality_score.min():.1f}, max {result.quality_score.max():.1f}"
+        )
+    if shift_report is not None:
+        click.echo()
+        click.echo(shift_report.format_text_report())
+    if output:
+        click.echo(f"\nScores written to {output}")
+
+
 # Versions command (list parameter versions)
 @cli.command(name="versions")
 @click.option(
@@ -1785,5 +2297,200 @@ def validate_config_command(config_dir, verbose):
         sys.exit(1)
 
 
+# Serve command (long-lived analysis daemon)
+@cli.command(name="serve")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Unix socket to listen on (default: ~/.cache/writescore/daemon.sock)",
+)
+@click.option(
+    "--port",
+    type=click.IntRange(0, 65535),
+    default=None,
+    help="Listen on localhost:PORT over HTTP instead of a Unix socket",
+)
+@click.option(
+    "--max-concurrent",
+    type=click.IntRange(min=1),
+    default=DEFAULT_MAX_CONCURRENT,
+    metavar="N",
+    help=f"Analyses running at the same time (default: {DEFAULT_MAX_CONCURRENT})",
+)
+@click.option(
+    "--max-queue",
+    type=click.IntRange(min=0),
+    default=DEFAULT_MAX_QUEUE,
+    metavar="N",
+    help=f"Requests waiting for a slot; more are refused (default: {DEFAULT_MAX_QUEUE})",
+)
+@click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=0),
+    default=DEFAULT_IDLE_TIMEOUT,
+    metavar="SECONDS",
+    help=f"Release models after this long without requests, 0 = never "
+    f"(default: {DEFAULT_IDLE_TIMEOUT})",
+)
+@click.option(
+    "--profile",
+    "-p",
+    type=click.Choice(["fast", "balanced", "full"]),
+    default=_CLI_DEFAULTS["profile"],
+    help="Dimension profile whose models are loaded at startup",
+)
+@click.option("--no-warm-up", is_flag=True, help="Load models on the first request instead")
+@click.option("--status", is_flag=True, help="Show the running daemon's status and exit")
+@click.option("--stop", is_flag=True, help="Stop the running daemon and exit")
+@click.option("--verbose", "-v", is_flag=True, help="Log each request to stderr")
+def serve_command(
+    socket_path,
+    port,
+    max_concurrent,
+    max_queue,
+    idle_timeout,
+    profile,
+    no_warm_up,
+    status,
+    stop,
+    verbose,
+):
+    """Run a long-lived analysis daemon with models kept loaded.
+
+    'writescore analyze FILE' sends single-file analyses to a running daemon
+    (same results as in-process, without loading models on every call) and
+    analyzes in-process when none is running. Editors and hooks can also call
+    the HTTP API directly: POST /analyze with {"text": ..., "config": {...}}
+    returns the document 'writescore analyze --format json' prints.
+
+    Examples:
+
+      # Start the daemon on the default Unix socket
+      writescore serve
+
+      # Serve HTTP on localhost:8765, two analyses at a time
+      writescore serve --port 8765 --max-concurrent 2
+
+      # Check on or stop the running daemon
+      writescore serve --status
+      writescore serve --stop
+    """
+    import json
+
+    if status or stop:
+        if socket_path or port is not None:
+            client = DaemonClient(socket_path=socket_path, port=port)
+        else:
+            client = find_daemon()
+        try:
+            if client is None:
+                raise DaemonError("no daemon is running")
+            if stop:
+                client.shutdown()
+                click.echo(f"Stopped daemon at {client.address}")
+            else:
+                click.echo(json.dumps(client.health(), indent=2))
+        except DaemonError as e:
+            click.echo(f"Error: {e}", err=True)
+            sys.exit(1)
+        return
+
+    daemon = AnalysisDaemon(
+        max_concurrent=max_concurrent, max_queue=max_queue, idle_timeout=idle_timeout
+    )
+    warm_config = None
+    if not no_warm_up:
+        defaults = _get_cli_defaults()
+        warm_config = create_analysis_config(
+            defaults["mode"], defaults["sampling_sections"], 2000, "even", profile
+        )
+
+    def ready(address):
+        click.echo(f"writescore daemon {__version__} listening on {address} (pid {os.getpid()})")
+        click.echo("Press Ctrl+C to stop", err=True)
+
+    try:
+        serve(
+            daemon,
+            socket_path=socket_path,
+            port=port,
+            warm_config=warm_config,
+            verbose=verbose,
+            ready=ready,
+        )
+    except (DaemonError, OSError) as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+
+# Cache commands (on-disk analysis result cache)
+@cli.group(name="cache")
+def cache_group():
+    """Inspect or clear the analysis result cache.
+
+    'writescore analyze' reuses cached dimension results for documents whose
+    text, analysis settings and scoring parameters are unchanged, and cached
+    sentence embeddings for unchanged sentences of revised documents. The
+    cache lives in $XDG_CACHE_HOME/writescore (default: ~/.cache/writescore).
+    """
+    pass
+
+
+@cache_group.command(name="stats")
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Cache directory (default: ~/.cache/writescore)",
+)
+@click.option("--json", "output_json", is_flag=True, help="Output in JSON format")
+def cache_stats_command(cache_dir, output_json):
+    """Show cache location, size, entries and hit rate."""
+    import json
+
+    stats = ResultCache(cache_dir).stats()
+    stats["embeddings"] = EmbeddingStore(embedding_store_path(cache_dir)).stats()
+
+    if output_json:
+        click.echo(json.dumps(stats, indent=2))
+        return
+
+    lookups = stats["hits"] + stats["misses"]
+    hit_rate = f"{stats['hits'] / lookups:.0%}" if lookups else "n/a"
+    click.echo(f"Cache: {stats['path']}")
+    click.echo(f"  Entries:   {stats['entries']}")
+    click.echo(
+        f"  Size:      {stats['total_bytes'] / 1024**2:.1f} MB"
+        f" of {stats['max_bytes'] / 1024**2:.0f} MB"
+    )
+    click.echo(f"  Hits:      {stats['hits']}")
+    click.echo(f"  Misses:    {stats['misses']}")
+    click.echo(f"  Hit rate:  {hit_rate}")
+    click.echo(f"  Evictions: {stats['evictions']}")
+    embeddings = stats["embeddings"]
+    click.echo(f"Embeddings: {embeddings['path']}")
+    click.echo(f"  Entries:   {embeddings['entries']}")
+    click.echo(
+        f"  Size:      {embeddings['total_bytes'] / 1024**2:.1f} MB"
+        f" of {embeddings['max_bytes'] / 1024**2:.0f} MB"
+    )
+
+
+@cache_group.command(name="clear")
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Cache directory (default: ~/.cache/writescore)",
+)
+def cache_clear_command(cache_dir):
+    """Remove all cached analysis results and sentence embeddings."""
+    removed = ResultCache(cache_dir).clear()
+    embeddings = EmbeddingStore(embedding_store_path(cache_dir)).clear()
+    click.echo(f"Removed {removed} cached result(s) and {embeddings} cached embedding(s)")
+
+
 if __name__ == "__main__":
     cli()
@@ -2,7 +2,28 @@
 Core analysis engine module.
 """
 
-from writescore.core.analyzer import AIPatternAnalyzer
-from writescore.core.results import AnalysisResults, DetailedAnalysis
+from importlib import import_module
+
+# Imported on first access (PEP 562), so importing a core submodule such as
+# writescore.core.dimension_registry does not load the analyzer
+_EXPORTS = {
+    "AIPatternAnalyzer": "writescore.core.analyzer",
+    "AnalysisResults": "writescore.core.results",
+    "DetailedAnalysis": "writescore.core.results",
+}
 
 __all__ = ["AIPatternAnalyzer", "AnalysisResults", "DetailedAnalysis"]
+
+
+def __getattr__(name: str):
+    """Import public names on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
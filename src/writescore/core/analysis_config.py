@@ -17,7 +17,7 @@ class AnalysisMode(str, Enum):
     ADAPTIVE = "adaptive"  # Adapt to document length (recommended)
     SAMPLING = "sampling"  # Sample N sections, aggregate
     FULL = "full"  # Analyze entire document
-    STREAMING = "streaming"  # Progressive analysis (future)
+    STREAMING = "streaming"  # Read incrementally in bounded windows (see core.streaming)
 
 
 @dataclass
@@ -34,7 +34,8 @@ class AnalysisConfig:
         sampling_chars_per_section: Characters per sample (default: 2000)
         sampling_strategy: Strategy for sample selection (even, weighted, adaptive)
         max_text_length: Optional hard limit on text length
-        max_analysis_time_seconds: Optional timeout for analysis
+        max_analysis_time_seconds: Per-document deadline; dimensions run cheapest
+            first and those cut off are reported as skipped (None = no limit)
         dimension_overrides: Dict of dimension-specific config overrides
         enable_detailed_analysis: Enable detailed metrics (default: True)
 
@@ -42,6 +43,36 @@ class AnalysisConfig:
         dimension_profile: Profile for dimension loading (fast/balanced/full/custom)
         dimensions_to_load: Explicit list of dimensions (overrides profile)
         custom_profiles: User-defined dimension profiles
+
+        # Shared causal language model (perplexity, predictability)
+        language_model_name: Model shared by LM-based dimensions (default: gpt2)
+        language_model_device: Inference device (None = auto: MPS > CUDA > CPU)
+        language_model_dtype: Optional dtype ("float32", "float16", "bfloat16")
+        language_model_threads: Optional torch intra-op thread count
+
+        # On-disk result cache (see core.result_cache)
+        use_result_cache: Reuse cached dimension results for unchanged text (default: False)
+        result_cache_dir: Cache directory (None = ~/.cache/writescore)
+        result_cache_max_bytes: Cache size bound before LRU eviction
+        incremental_analysis: Rebuild supporting dimensions from cached per-section
+            summaries, re-analyzing only changed sections (see core.incremental)
+
+        # STREAMING mode (see core.streaming)
+        streaming_window_chars: Target window size; windows end at paragraph boundaries
+
+        # Concurrent dimension execution (see core.dimension_executor)
+        dimension_workers: Threads running independent dimensions concurrently
+            (default: 1 = one after another); torch threads are divided between them
+
+        # Sentiment dimension
+        sentiment_max_paragraphs: Paragraphs scored per text (None = all)
+        sentiment_max_sentences: Sentences scored when there are fewer than 3
+            paragraphs (None = all)
+        sentiment_batch_size: Chunks per batched classifier forward pass
+
+        # Figurative language dimension
+        metaphor_max_sentences: Sentences scanned for metaphor candidates outside
+            FULL mode (None = all; FULL mode always scans every sentence)
     """
 
     # Document processing configuration
@@ -62,6 +93,46 @@ class AnalysisConfig:
     # Score normalization configuration (Story 2.4.1, AC7)
     enable_score_normalization: bool = True  # Enable z-score normalization across dimensions
 
+    # Shared causal language model configuration
+    language_model_name: str = "gpt2"  # One model serves perplexity and predictability
+    language_model_device: Optional[str] = None  # None = auto (MPS > CUDA > CPU)
+    language_model_dtype: Optional[str] = None  # None = model default (float32)
+    language_model_threads: Optional[int] = None  # None = torch default
+
+    # On-disk result cache configuration
+    use_result_cache: bool = False  # CLI enables by default (--no-cache disables)
+    result_cache_dir: Optional[str] = None  # None = default_cache_dir()
+    result_cache_max_bytes: int = 512 * 1024 * 1024
+    incremental_analysis: bool = False  # Requires use_result_cache to reuse sections
+
+    # STREAMING mode configuration
+    streaming_window_chars: int = 20000
+
+    # Concurrent dimension execution
+    dimension_workers: int = 1  # 1 = run dimensions one after another
+
+    # Sentiment dimension chunking and batching
+    sentiment_max_paragraphs: Optional[int] = 30  # None = score every paragraph
+    sentiment_max_sentences: Optional[int] = 50  # Sentence fallback for < 3 paragraphs
+    sentiment_batch_size: int = 16  # Chunks per classifier forward pass
+
+    # Figurative language metaphor scan
+    metaphor_max_sentences: Optional[int] = 50  # Ignored in FULL mode (every sentence)
+
+    def get_language_model_name(self, dimension_name: str) -> str:
+        """
+        Get the causal language model a dimension should use.
+
+        Args:
+            dimension_name: Name of dimension (for override lookup)
+
+        Returns:
+            dimension_overrides[dimension_name]["model_name"] if set,
+            otherwise language_model_name (shared across dimensions)
+        """
+        override = self.dimension_overrides.get(dimension_name, {})
+        return override.get("model_name") or self.language_model_name
+
     def get_effective_limit(self, dimension_name: str, text_length: int) -> Optional[int]:
         """
         Calculate effective character limit based on mode.
@@ -81,7 +152,7 @@ class AnalysisConfig:
                 * text > 50000 chars: Use sampling (return None to trigger sampling)
             - SAMPLING mode: Return None (triggers extract_samples)
             - FULL mode: Return None (no limit)
-            - STREAMING mode: Return None (future implementation)
+            - STREAMING mode: Return None (each streamed window is analyzed in full)
             - Check dimension_overrides for custom limits
         """
         # Check for dimension-specific override
@@ -110,7 +181,7 @@ class AnalysisConfig:
             return None  # No limit - analyze entire document
 
         elif self.mode == AnalysisMode.STREAMING:
-            return None  # Future: progressive analysis
+            return None  # Windows are bounded by streaming_window_chars
 
         else:
             return 2000  # Fallback to safe default
@@ -12,18 +12,28 @@ import json
 import re
 import statistics
 import sys
-from dataclasses import asdict
+from dataclasses import asdict, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Required dependencies
 from marko import Markdown
 
-from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
+from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig, AnalysisMode
+from writescore.core.deployment import get_active_parameter_version
+from writescore.core.dimension_executor import dimension_cost, run_concurrently
 from writescore.core.dimension_loader import DimensionLoader
 
 # Registry-based dimension loading (Story 1.4.11)
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.document_context import DocumentContext
+from writescore.core.incremental import analyze_sections, split_sections
+from writescore.core.result_cache import (
+    ResultCache,
+    compute_cache_key,
+    get_result_cache,
+    is_cacheable,
+)
 
 # Core results
 from writescore.core.results import (
@@ -35,6 +45,7 @@ from writescore.core.results import (
     UniformParagraph,
     VocabInstance,
 )
+from writescore.core.streaming import LineSource, iter_windows
 from writescore.history.tracker import ScoreHistory
 
 # Scoring and history
@@ -44,6 +55,16 @@ from writescore.scoring.dual_score import (
 
 # Dual score calculator
 from writescore.scoring.dual_score_calculator import calculate_dual_score as _calculate_dual_score
+from writescore.utils.deadline import Deadline, DeadlineExceeded, deadline_scope
+from writescore.utils.vocabulary_index import AI_VOCABULARY_INDEX
+
+# Reported as file_path when analyzing text that did not come from a file
+DEFAULT_SOURCE_NAME = "<text>"
+
+
+def _skipped_result(reason: str) -> Dict[str, Any]:
+    """Raw result for a dimension not analyzed before the deadline."""
+    return {"available": False, "skipped": True, "error": f"Skipped: {reason}"}
 
 
 class AIPatternAnalyzer:
@@ -58,77 +79,6 @@ class AIPatternAnalyzer:
     5. Track history over time
     """
 
-    # Replacement suggestions for AI vocabulary (for detailed mode)
-    AI_VOCAB_REPLACEMENTS = {
-        r"\bdelv(e|es|ing)\b": ["explore", "examine", "investigate", "look at", "dig into"],
-        r"\brobust(ness)?\b": ["reliable", "powerful", "solid", "effective", "well-designed"],
-        r"\bleverag(e|es|ing)\b": ["use", "apply", "take advantage of", "employ", "work with"],
-        r"\bharness(es|ing)?\b": ["use", "apply", "employ", "tap into", "utilize"],
-        r"\bfacilitat(e|es|ing)\b": ["enable", "help", "make easier", "allow", "support"],
-        r"\bunderscore(s|d|ing)?\b": ["emphasize", "highlight", "stress", "point out", "show"],
-        r"\bpivotal\b": ["key", "important", "critical", "essential", "crucial"],
-        r"\bseamless(ly)?\b": ["smooth", "easy", "straightforward", "effortless", "natural"],
-        r"\bholistic(ally)?\b": ["complete", "comprehensive", "full", "thorough", "whole"],
-        r"\bcomprehensive(ly)?\b": ["thorough", "complete", "detailed", "full", "extensive"],
-        r"\boptimiz(e|es|ing|ation)\b": [
-            "improve",
-            "enhance",
-            "fine-tune",
-            "make better",
-            "refine",
-        ],
-        r"\bstreamlin(e|ed|ing)\b": ["simplify", "improve", "make efficient", "refine", "enhance"],
-        r"\butiliz(e|es|ation|ing)\b": ["use", "employ", "apply", "work with"],
-        r"\bunpack(s|ing)?\b": ["explain", "explore", "break down", "examine", "analyze"],
-        r"\bmyriad\b": ["many", "countless", "numerous", "various", "multiple"],
-        r"\bplethora\b": ["many", "abundance", "wealth", "plenty", "lots"],
-        r"\bparamount\b": ["critical", "essential", "crucial", "vital", "key"],
-        r"\bquintessential\b": ["typical", "classic", "perfect example", "ideal", "archetypal"],
-        r"\binnovative\b": ["new", "creative", "novel", "original", "fresh"],
-        r"\bcutting-edge\b": ["advanced", "modern", "latest", "state-of-the-art", "new"],
-        r"\brevolutionary\b": [
-            "groundbreaking",
-            "major",
-            "significant",
-            "transformative",
-            "game-changing",
-        ],
-        r"\bgame-changing\b": ["significant", "major", "important", "transformative", "impactful"],
-        r"\btransformative\b": ["significant", "major", "powerful", "game-changing", "impactful"],
-        r"\bdive deep\b": [
-            "explore thoroughly",
-            "examine closely",
-            "investigate",
-            "look closely at",
-            "study",
-        ],
-        r"\bdeep dive\b": [
-            "thorough look",
-            "detailed examination",
-            "close look",
-            "in-depth analysis",
-            "careful study",
-        ],
-        r"\becosystem\b": ["environment", "system", "network", "platform", "framework"],
-        r"\blandscape\b": ["field", "area", "space", "domain", "world"],
-        r"\bparadigm\s+shift\b": [
-            "major change",
-            "fundamental shift",
-            "big change",
-            "transformation",
-            "sea change",
-        ],
-        r"\bsynerg(y|istic)\b": [
-            "cooperation",
-            "collaboration",
-            "combined effect",
-            "teamwork",
-            "partnership",
-        ],
-        r"\bcommence(s|d)?\b": ["start", "begin", "initiate", "launch", "kick off"],
-        r"\bendeavor(s)?\b": ["effort", "project", "attempt", "undertaking", "initiative"],
-    }
-
     # Transition replacements (for detailed mode)
     TRANSITION_REPLACEMENTS = {
         "Furthermore,": [
@@ -353,8 +303,8 @@ class AIPatternAnalyzer:
         """
         Analyze a single markdown file for AI patterns.
 
-        This is the main entry point that orchestrates all dimension analyses,
-        calculates scores, and produces comprehensive results.
+        Reads the file and delegates to analyze_text(), so results are
+        identical to analyzing the file's contents in memory.
 
         Args:
             file_path: Path to markdown file to analyze
@@ -366,16 +316,88 @@ class AIPatternAnalyzer:
         Raises:
             FileNotFoundError: If file doesn't exist
         """
-        # Story 1.4.6: Infrastructure only - config parameter added, threaded to all dimensions
-        config = config or DEFAULT_CONFIG
-
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
+        # STREAMING mode never holds the whole file in memory
+        if config is not None and config.mode == AnalysisMode.STREAMING:
+            return self.analyze_stream(file_path, config=config)
+
         with open(path, encoding="utf-8") as f:
             text = f.read()
 
+        return self.analyze_text(text, config=config, source_name=file_path)
+
+    def analyze_stream(
+        self,
+        file_path: str,
+        config: Optional[AnalysisConfig] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> AnalysisResults:
+        """
+        Analyze a markdown file in STREAMING mode, reading it incrementally.
+
+        The file is split into bounded-size windows (see core.streaming) and
+        each dimension folds its per-window results, so memory stays flat
+        regardless of file size. Streamed results are not cached. If
+        config.max_analysis_time_seconds runs out, reading stops and the
+        results cover the windows analyzed so far (deadline_exceeded is set).
+
+        Args:
+            file_path: Path to markdown file to analyze
+            config: Analysis configuration (mode is forced to STREAMING)
+            progress: Optional callback(bytes_read, total_bytes) called after each window
+
+        Returns:
+            AnalysisResults object with complete analysis
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        config = config or DEFAULT_CONFIG
+        if config.mode != AnalysisMode.STREAMING:
+            config = replace(config, mode=AnalysisMode.STREAMING)
+
+        return self._analyze_windows(LineSource.from_file(file_path), config, file_path, progress)
+
+    def analyze_text(
+        self,
+        text: str,
+        config: Optional[AnalysisConfig] = None,
+        source_name: str = DEFAULT_SOURCE_NAME,
+    ) -> AnalysisResults:
+        """
+        Analyze markdown text for AI patterns, entirely in memory.
+
+        This is the main entry point that orchestrates all dimension analyses,
+        calculates scores, and produces comprehensive results. analyze_file()
+        is a thin reader on top of it.
+
+        Dimensions run cheapest first (DimensionStrategy.analysis_cost) under a
+        deadline of config.max_analysis_time_seconds. Dimensions still running
+        or not started when it expires are reported as skipped and the partial
+        results are returned (and not cached).
+
+        Args:
+            text: Text content to analyze
+            config: Analysis configuration (None = current behavior, uses DEFAULT_CONFIG)
+            source_name: Name reported as the result's file_path (e.g., editor buffer name)
+
+        Returns:
+            AnalysisResults object with complete analysis
+        """
+        # Story 1.4.6: Infrastructure only - config parameter added, threaded to all dimensions
+        config = config or DEFAULT_CONFIG
+
+        if config.mode == AnalysisMode.STREAMING:
+            return self._analyze_windows(LineSource.from_text(text), config, source_name)
+
+        deadline = Deadline(config.max_analysis_time_seconds)
+
         # Strip HTML comments (metadata blocks) before analysis
         text = self._strip_html_comments(text)
 
@@ -385,25 +407,137 @@ class AIPatternAnalyzer:
         # Run all dimension analyses (Story 1.4.11: Registry-based analysis)
         word_count = self._count_words(text)
 
-        # Registry-based dimension analysis loop
-        dimension_results = {}
-        for dim_name, dim in self.dimensions.items():
-            try:
-                # Prepare kwargs based on dimension needs
-                kwargs: Dict[str, Any] = {"config": config}
+        # Reuse cached dimension results for unchanged text (scoring still re-runs)
+        cache = get_result_cache(config)
+        cache_key = None
+        parameter_version = None
+        dimension_results = None
+        if cache is not None:
+            parameter_version = get_active_parameter_version()
+            cache_key = compute_cache_key(text, config, self.dimensions.keys(), parameter_version)
+            dimension_results = cache.get(cache_key)
+
+        # Incremental mode: per-section summaries for unchanged sections come from the cache
+        incremental = None
+        if dimension_results is None:
+            sections = None
+            if config.incremental_analysis:
+                sections = split_sections(text)
+                incremental = {"sections": len(sections), "reused": {}}
+            dimension_results = self._run_dimensions(
+                text,
+                lines,
+                word_count,
+                config,
+                sections,
+                cache,
+                parameter_version,
+                incremental,
+                deadline,
+            )
+            if cache is not None and is_cacheable(dimension_results):
+                cache.put(cache_key, dimension_results)
 
-                # Dimension-specific kwargs
-                if dim_name in ["structure", "formatting"]:
-                    kwargs["word_count"] = word_count
+        results = self._build_results(dimension_results, word_count, source_name)
 
-                # Execute analysis
-                result = dim.analyze(text, lines, **kwargs)
-                dimension_results[dim_name] = result
+        # Incremental mode: section count and per-dimension reused sections
+        results.incremental = incremental
+
+        return results
+
+    def _analyze_windows(
+        self,
+        source: LineSource,
+        config: AnalysisConfig,
+        source_name: str,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> AnalysisResults:
+        """
+        Run every loaded dimension over streamed windows and build results.
+
+        Args:
+            source: Document lines
+            config: Analysis configuration (STREAMING mode)
+            source_name: Name reported as the result's file_path
+            progress: Optional callback(consumed, total) called after each window
+
+        Returns:
+            AnalysisResults object with complete analysis
+        """
+        deadline = Deadline(config.max_analysis_time_seconds)
+        dimension_results: Dict[str, Any] = {}
+        accumulators = {}
+        for dim_name, dim in self.dimensions.items():
+            try:
+                accumulators[dim_name] = dim.create_stream_accumulator(config)
+            except Exception as e:
+                print(f"Warning: {dim_name} analysis failed: {e}", file=sys.stderr)
+                dimension_results[dim_name] = {"available": False, "error": str(e)}
 
+        word_count = 0
+        deadline_exceeded = False
+        with deadline_scope(deadline):
+            for window in iter_windows(source, config.streaming_window_chars):
+                window_words = self._count_words(window)
+                word_count += window_words
+
+                # Shared per-window state (spaCy parses reused across dimensions)
+                document = DocumentContext(window)
+                for dim_name, accumulator in list(accumulators.items()):
+                    kwargs: Dict[str, Any] = {"document": document}
+                    if dim_name in ["structure", "formatting"]:
+                        kwargs["word_count"] = window_words
+                    try:
+                        accumulator.add(window, **kwargs)
+                    except DeadlineExceeded as e:
+                        dimension_results[dim_name] = _skipped_result(str(e))
+                        del accumulators[dim_name]
+                    except Exception as e:
+                        print(f"Warning: {dim_name} analysis failed: {e}", file=sys.stderr)
+                        dimension_results[dim_name] = {"available": False, "error": str(e)}
+                        del accumulators[dim_name]
+
+                if progress is not None:
+                    progress(source.consumed, source.total)
+
+                # Out of time: report the windows analyzed so far
+                if deadline.expired:
+                    deadline_exceeded = True
+                    break
+
+        for dim_name, accumulator in accumulators.items():
+            try:
+                dimension_results[dim_name] = accumulator.result()
             except Exception as e:
                 print(f"Warning: {dim_name} analysis failed: {e}", file=sys.stderr)
                 dimension_results[dim_name] = {"available": False, "error": str(e)}
 
+        # Keep the loaded dimension order
+        dimension_results = {name: dimension_results[name] for name in self.dimensions}
+        results = self._build_results(dimension_results, word_count, source_name)
+        results.deadline_exceeded = results.deadline_exceeded or deadline_exceeded
+        return results
+
+    def _build_results(
+        self, dimension_results: Dict[str, Any], word_count: int, source_name: str
+    ) -> AnalysisResults:
+        """
+        Score raw dimension results and build the AnalysisResults object.
+
+        Args:
+            dimension_results: Raw per-dimension results
+            word_count: Total words in the analyzed text
+            source_name: Name reported as the result's file_path
+
+        Returns:
+            AnalysisResults object with scores and dimension_results
+        """
+        skipped = [
+            name
+            for name, result in dimension_results.items()
+            if isinstance(result, dict) and result.get("skipped")
+        ]
+
         # Story 1.10.1: Enrich dimension results with tier/weight/score metadata
         dimension_results = self._enrich_dimension_results(dimension_results)
 
@@ -453,7 +587,7 @@ class AIPatternAnalyzer:
         )
 
         results = AnalysisResults(
-            file_path=file_path,
+            file_path=source_name,
             total_words=word_count,
             total_sentences=burstiness.get("total_sentences", 0),
             total_paragraphs=paragraphs.get("total_paragraphs", 0),
@@ -630,38 +764,117 @@ class AIPatternAnalyzer:
         results.dimension_results = dimension_results
         results.dimension_count = len(dimension_results)  # Number of dimensions analyzed
 
+        # Dimensions not analyzed before the analysis deadline
+        results.skipped_dimensions = skipped
+        results.deadline_exceeded = bool(skipped)
+
         return results
 
-    def analyze_text(self, text: str, config: Optional[AnalysisConfig] = None) -> AnalysisResults:
+    def _run_dimensions(
+        self,
+        text: str,
+        lines: List[str],
+        word_count: int,
+        config: AnalysisConfig,
+        sections: Optional[List[str]] = None,
+        cache: Optional[ResultCache] = None,
+        parameter_version: Optional[str] = None,
+        incremental: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
         """
-        Analyze text directly for AI patterns (without file I/O).
+        Run every loaded dimension's analyze() on the text.
 
-        This method provides the same analysis as analyze_file but operates on
-        text strings directly. Useful for testing and integration scenarios.
+        In incremental mode, dimensions that support it are rebuilt from
+        per-section summaries (see core.incremental) instead.
+
+        Dimensions run in ascending analysis_cost order under the deadline;
+        once it expires, the running dimension stops at its next cancellation
+        point and the remaining ones are not started. With
+        config.dimension_workers > 1 independent dimensions run concurrently
+        (see core.dimension_executor).
 
         Args:
-            text: Text content to analyze
-            config: Analysis configuration (None = current behavior, uses DEFAULT_CONFIG)
+            text: Text to analyze (HTML comments already stripped)
+            lines: Text split into lines
+            word_count: Pre-calculated word count
+            config: Analysis configuration
+            sections: split_sections(text) in incremental mode (None = whole document)
+            cache: Result cache for section summaries (None = no reuse)
+            parameter_version: Active scoring parameter version
+            incremental: Incremental stats; reused section counts are added per dimension
+            deadline: Analysis deadline (None = no limit)
 
         Returns:
-            AnalysisResults object with complete analysis
+            Raw per-dimension results in loaded dimension order; failed dimensions
+            map to {"available": False, "error": message}, dimensions cut off by
+            the deadline also have "skipped": True
         """
-        import tempfile
-        from pathlib import Path
+        deadline = deadline or Deadline()
 
-        # Create a temporary file and delegate to analyze_file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".md", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(text)
-            temp_file = f.name
+        # Shared per-document state (spaCy parses reused across dimensions)
+        document = DocumentContext(text)
 
-        try:
-            results = self.analyze_file(temp_file, config=config)
-            return results
-        finally:
-            # Clean up temp file
-            Path(temp_file).unlink(missing_ok=True)
+        def run_dimension(dim_name: str) -> Dict[str, Any]:
+            if deadline.expired:
+                return _skipped_result(f"analysis deadline of {deadline.seconds:g}s exceeded")
+            try:
+                # Prepare kwargs based on dimension needs
+                kwargs: Dict[str, Any] = {"config": config, "document": document}
+
+                # Dimension-specific kwargs
+                if dim_name in ["structure", "formatting"]:
+                    kwargs["word_count"] = word_count
+
+                # Execute analysis
+                dim = self.dimensions[dim_name]
+                if sections is not None and dim.supports_incremental(text, config):
+                    result, reused = analyze_sections(
+                        dim,
+                        text,
+                        sections,
+                        cache=cache,
+                        parameter_version=parameter_version,
+                        **kwargs,
+                    )
+                    if incremental is not None:
+                        incremental["reused"][dim_name] = reused
+                else:
+                    result = dim.analyze(text, lines, **kwargs)
+                return result
+
+            except DeadlineExceeded as e:
+                return _skipped_result(str(e))
+            except Exception as e:
+                print(f"Warning: {dim_name} analysis failed: {e}", file=sys.stderr)
+                return {"available": False, "error": str(e)}
+
+        # Registry-based dimension analysis, cheapest dimensions first
+        order = self._schedule_dimensions()
+        with deadline_scope(deadline):
+            if config.dimension_workers > 1:
+                dimension_results = run_concurrently(
+                    self.dimensions,
+                    order,
+                    run_dimension,
+                    config.dimension_workers,
+                    budget_torch_threads=config.language_model_threads is None,
+                )
+            else:
+                dimension_results = {dim_name: run_dimension(dim_name) for dim_name in order}
+
+        # Keep the loaded dimension order
+        return {name: dimension_results[name] for name in self.dimensions}
+
+    def _schedule_dimensions(self) -> List[str]:
+        """
+        Order loaded dimensions for analysis, cheapest first.
+
+        Returns:
+            Dimension names sorted by analysis_cost (stable for equal costs)
+        """
+
+        return sorted(self.dimensions, key=lambda name: dimension_cost(self.dimensions[name]))
 
     def _enrich_dimension_results(self, dimension_results: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1419,30 +1632,27 @@ class AIPatternAnalyzer:
         """Detect AI vocabulary with line numbers and context."""
         instances = []
 
-        for line_num, line in enumerate(self.lines, start=1):
+        def skip_line(line: str) -> bool:
             # Skip HTML comments (metadata), headings, and code blocks
             if self._is_line_in_html_comment(line):
-                continue
-            if line.strip().startswith("#") or line.strip().startswith("```"):
-                continue
-
-            for pattern, suggestions in self.AI_VOCAB_REPLACEMENTS.items():
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    word = match.group()
-                    # Extract context (20 chars each side)
-                    start = max(0, match.start() - 20)
-                    end = min(len(line), match.end() + 20)
-                    context = f"...{line[start:end]}..."
-
-                    instances.append(
-                        VocabInstance(
-                            line_number=line_num,
-                            word=word,
-                            context=context,
-                            full_line=line.strip(),
-                            suggestions=suggestions[:5],  # Top 5 suggestions
-                        )
-                    )
+                return True
+            return line.strip().startswith("#") or line.strip().startswith("```")
+
+        for line_num, line, hit in AI_VOCABULARY_INDEX.scan_lines(self.lines, skip_line):
+            # Extract context (20 chars each side)
+            start = max(0, hit.start - 20)
+            end = min(len(line), hit.end + 20)
+            context = f"...{line[start:end]}..."
+
+            instances.append(
+                VocabInstance(
+                    line_number=line_num,
+                    word=line[hit.start : hit.end],
+                    context=context,
+                    full_line=line.strip(),
+                    suggestions=list(hit.entry.suggestions[:5]),  # Top 5 suggestions
+                )
+            )
 
         return instances
 
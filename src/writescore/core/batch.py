@@ -0,0 +1,486 @@
+"""
+Parallel batch analysis.
+
+Runs AIPatternAnalyzer.analyze_file over many files with a process pool.
+Each worker builds its analyzer (and loads its models) once, then analyzes
+files until the batch is done. Results are yielded in completion order, and
+a failure in one file is reported for that file only. If a worker process
+dies, the files that were in flight are run again one at a time to find the
+one that crashed it, and the other unfinished files are resubmitted.
+
+Dataset documents (recalibration) go through the same kind of pool, but
+workers run individual dimensions on batches of documents: each dimension
+first prefetches the whole batch (DimensionStrategy.prefetch), so language
+model and embedding passes are batched across documents.
+
+Memory guard: every worker holds its own torch and spaCy models, so an
+optional per-worker memory budget limits how many workers are started
+(available RAM / budget) and makes a worker release all its models
+(language, embedding and spaCy) when its resident memory grows past the
+budget.
+"""
+
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from writescore.core.analysis_config import AnalysisConfig
+
+# Dataset documents per worker task (documents prefetched together)
+DEFAULT_DOCUMENT_BATCH_SIZE = 16
+
+_MEMORY_UNITS = {
+    "": 1,
+    "B": 1,
+    "K": 1024,
+    "KB": 1024,
+    "M": 1024**2,
+    "MB": 1024**2,
+    "G": 1024**3,
+    "GB": 1024**3,
+}
+
+
+@dataclass
+class BatchFileResult:
+    """Outcome of analyzing one file in a batch."""
+
+    path: str
+    result: Optional[Any] = None  # AnalysisResults on success
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was analyzed successfully."""
+        return self.error is None
+
+
+@dataclass
+class DocumentMetrics:
+    """Outcome of analyzing one dataset document with some dimensions."""
+
+    doc_id: str
+    metrics: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # dimension -> metrics
+    errors: Dict[str, str] = field(default_factory=dict)  # dimension -> error message
+    elapsed: float = 0.0
+
+
+# (document id, text, names of the dimensions to run)
+DocumentTask = Tuple[str, str, List[str]]
+
+
+def parse_memory_size(value: str) -> int:
+    """
+    Parse a memory size such as "1500M", "2G" or "2147483648" into bytes.
+
+    Args:
+        value: Size with optional K/M/G suffix (binary units)
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the value cannot be parsed or is not positive
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([KMG]?B?)\s*", str(value).upper())
+    if not match:
+        raise ValueError(f"Invalid memory size '{value}'. Use e.g. 1500M or 2G")
+    size = int(float(match.group(1)) * _MEMORY_UNITS[match.group(2)])
+    if size <= 0:
+        raise ValueError(f"Memory size must be positive, got '{value}'")
+    return size
+
+
+def default_jobs() -> int:
+    """Default number of batch workers (number of CPU cores)."""
+    return os.cpu_count() or 1
+
+
+def available_memory() -> Optional[int]:
+    """
+    Get available physical memory in bytes.
+
+    Returns:
+        Available bytes, or None if it cannot be determined on this platform
+    """
+    try:
+        import psutil
+
+        return int(psutil.virtual_memory().available)
+    except ImportError:
+        pass
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def current_memory() -> Optional[int]:
+    """
+    Get resident memory of the current process in bytes.
+
+    Uses psutil, or /proc/self/statm on Linux without psutil. Peak resident
+    memory (ru_maxrss) is no substitute: it never drops after the models are
+    released, so the memory guard would release them after every file.
+
+    Returns:
+        Resident bytes, or None if they cannot be measured on this platform
+        (the memory guard is then skipped)
+    """
+    try:
+        import psutil
+
+        return int(psutil.Process().memory_info().rss)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def plan_workers(jobs: int, num_files: int, max_memory_per_worker: Optional[int] = None) -> int:
+    """
+    Decide how many workers to start.
+
+    Args:
+        jobs: Requested number of workers
+        num_files: Number of files in the batch
+        max_memory_per_worker: Optional per-worker memory budget in bytes
+
+    Returns:
+        Number of workers (at least 1, at most num_files)
+    """
+    workers = max(1, min(jobs, num_files))
+    if max_memory_per_worker:
+        available = available_memory()
+        if available is not None:
+            workers = min(workers, max(1, available // max_memory_per_worker))
+    return workers
+
+
+# ============================================================================
+# WORKER PROCESS
+# ============================================================================
+
+_worker_analyzer = None
+_worker_dimensions: Dict[str, Any] = {}
+_worker_config: Optional[AnalysisConfig] = None
+_worker_memory_limit: Optional[int] = None
+
+
+def _init_worker(config: AnalysisConfig, max_memory_per_worker: Optional[int]) -> None:
+    """Build the worker's analyzer once (runs in each worker process)."""
+    global _worker_analyzer, _worker_config, _worker_memory_limit
+
+    from writescore.core.analyzer import AIPatternAnalyzer
+
+    _worker_config = config
+    _worker_memory_limit = max_memory_per_worker
+    _worker_analyzer = AIPatternAnalyzer(config=config)
+
+
+def _init_dataset_worker(
+    dimension_names: List[str], config: AnalysisConfig, max_memory_per_worker: Optional[int]
+) -> None:
+    """Load the worker's dimensions once (runs in each worker process)."""
+    global _worker_dimensions, _worker_config, _worker_memory_limit
+
+    from writescore.core.dimension_loader import DimensionLoader
+    from writescore.core.dimension_registry import DimensionRegistry
+
+    _worker_config = config
+    _worker_memory_limit = max_memory_per_worker
+    DimensionLoader().load_dimensions(dimension_names)
+    _worker_dimensions = {
+        name: DimensionRegistry.get(name) for name in dimension_names if DimensionRegistry.has(name)
+    }
+
+
+def _release_models() -> None:
+    """Release every shared model (language, embedding, spaCy) held by the worker."""
+    from writescore.core.daemon import release_models
+
+    release_models()
+
+
+def _enforce_memory_limit() -> None:
+    """
+    Release models if the worker is over its memory budget.
+
+    If the worker is still over budget right after a full release, further
+    releases cannot help and would reload the models after every task; the
+    guard is then disabled for this worker.
+    """
+    global _worker_memory_limit
+
+    if _worker_memory_limit:
+        used = current_memory()
+        if used is not None and used > _worker_memory_limit:
+            _release_models()
+            used = current_memory()
+            if used is not None and used > _worker_memory_limit:
+                print(
+                    f"Warning: worker {os.getpid()} uses {used // 2**20} MiB after releasing "
+                    "its models, over the per-worker budget; memory guard disabled",
+                    file=sys.stderr,
+                )
+                _worker_memory_limit = None
+
+
+def _analyze_in_worker(path: str) -> BatchFileResult:
+    """Analyze one file in a worker, isolating any error to this file."""
+    start = time.time()
+    try:
+        result = _worker_analyzer.analyze_file(path, config=_worker_config)
+        outcome = BatchFileResult(path=path, result=result, elapsed=time.time() - start)
+    except Exception as e:
+        outcome = BatchFileResult(path=path, error=str(e), elapsed=time.time() - start)
+
+    _enforce_memory_limit()
+    return outcome
+
+
+def _analyze_documents_in_worker(tasks: List[DocumentTask]) -> List[DocumentMetrics]:
+    """Analyze a batch of dataset documents in a worker."""
+    outcomes = analyze_documents(_worker_dimensions, tasks, _worker_config)
+    _enforce_memory_limit()
+    return outcomes
+
+
+# ============================================================================
+# DATASET DOCUMENTS
+# ============================================================================
+
+
+def analyze_documents(
+    dimensions: Dict[str, Any],
+    tasks: Sequence[DocumentTask],
+    config: Optional[AnalysisConfig] = None,
+) -> List[DocumentMetrics]:
+    """
+    Run dimensions on a batch of documents.
+
+    Every dimension first gets the texts of all documents it will analyze
+    through prefetch(), so model-based dimensions run batched passes over
+    the whole batch; then each document is analyzed with a shared
+    DocumentContext, as AIPatternAnalyzer does. An error in one dimension is
+    reported for that document and dimension only.
+
+    Args:
+        dimensions: Dimension name -> DimensionStrategy
+        tasks: (document id, text, dimension names) per document
+        config: Analysis configuration (None = DEFAULT_CONFIG)
+
+    Returns:
+        DocumentMetrics per task, in task order
+    """
+    from writescore.core.analysis_config import DEFAULT_CONFIG
+    from writescore.core.document_context import DocumentContext
+
+    config = config or DEFAULT_CONFIG
+
+    for name, dimension in dimensions.items():
+        texts = [text for _, text, names in tasks if name in names]
+        if texts:
+            try:
+                dimension.prefetch(texts, config)
+            except Exception as e:
+                # analyze() computes what the prefetch did not
+                print(f"Warning: {name} prefetch failed: {e}", file=sys.stderr)
+
+    outcomes = []
+    for doc_id, text, names in tasks:
+        start = time.time()
+        outcome = DocumentMetrics(doc_id=doc_id)
+        lines = text.split("\n")
+        document = DocumentContext(text)
+        for name in names:
+            dimension = dimensions.get(name)
+            if dimension is None:
+                outcome.errors[name] = "dimension not loaded"
+                continue
+            try:
+                outcome.metrics[name] = dimension.analyze(
+                    text, lines, config=config, document=document
+                )
+            except Exception as e:
+                outcome.errors[name] = str(e)
+        outcome.elapsed = time.time() - start
+        outcomes.append(outcome)
+    return outcomes
+
+
+# ============================================================================
+# POOL
+# ============================================================================
+
+
+def _split_threads(config: AnalysisConfig, jobs: int) -> AnalysisConfig:
+    """Split the machine's cores between workers for torch, unless configured."""
+    if config.language_model_threads is not None:
+        return config
+    threads = max(1, default_jobs() // max(1, jobs))
+    return replace(config, language_model_threads=threads)
+
+
+def _start_pool(
+    jobs: int, initializer: Callable[..., None], initargs: Tuple[Any, ...]
+) -> ProcessPoolExecutor:
+    """Start a spawn process pool."""
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+def _iter_pool(
+    jobs: int,
+    initializer: Callable[..., None],
+    initargs: Tuple[Any, ...],
+    fn: Callable[[Any], Any],
+    items: Sequence[Any],
+) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    """
+    Run fn on every item in a spawn process pool, in completion order.
+
+    A worker that dies (e.g. killed for memory) breaks the whole pool, and
+    every unfinished item fails with BrokenProcessPool although only the
+    items in flight can have caused it. The pool dispatches items in
+    submission order, at most 2 * jobs + 1 at a time, so those are among the
+    first unfinished ones: they are run again one at a time, and only an item
+    that breaks a pool on its own is reported as failed. The remaining items
+    are resubmitted to a new pool.
+
+    Yields:
+        (item index, result, None) on success, or (item index, None, error)
+    """
+    in_flight = 2 * jobs + 1
+    pending = list(range(len(items)))
+    while pending:
+        executor = _start_pool(jobs, initializer, initargs)
+        unfinished = []
+        try:
+            futures = {executor.submit(fn, items[index]): index for index in pending}
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    yield index, future.result(), None
+                except BrokenProcessPool:
+                    unfinished.append(index)
+                except Exception as e:
+                    yield index, None, f"worker failed: {e}"
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        unfinished.sort()
+        yield from _iter_isolated(initializer, initargs, fn, items, unfinished[:in_flight])
+        pending = unfinished[in_flight:]
+
+
+def _iter_isolated(
+    initializer: Callable[..., None],
+    initargs: Tuple[Any, ...],
+    fn: Callable[[Any], Any],
+    items: Sequence[Any],
+    indices: List[int],
+) -> Iterator[Tuple[int, Any, Optional[str]]]:
+    """Run items one at a time in a single-worker pool, restarted after a crash."""
+    executor = None
+    try:
+        for index in indices:
+            if executor is None:
+                executor = _start_pool(1, initializer, initargs)
+            try:
+                yield index, executor.submit(fn, items[index]).result(), None
+            except BrokenProcessPool as e:
+                # Only this item was in flight: it broke the pool
+                executor.shutdown(wait=True)
+                executor = None
+                yield index, None, f"worker failed: {e}"
+            except Exception as e:
+                yield index, None, f"worker failed: {e}"
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def iter_batch_results(
+    paths: Sequence[str],
+    config: AnalysisConfig,
+    jobs: int,
+    max_memory_per_worker: Optional[int] = None,
+) -> Iterator[BatchFileResult]:
+    """
+    Analyze files in a process pool, yielding results in completion order.
+
+    Workers use the spawn start method (safe with torch/MPS/CUDA state in the
+    parent) and split the machine's cores between them for torch inference,
+    unless config.language_model_threads is already set.
+
+    Args:
+        paths: Files to analyze
+        config: Analysis configuration shared by all workers
+        jobs: Number of worker processes
+        max_memory_per_worker: Optional per-worker memory budget in bytes
+
+    Yields:
+        BatchFileResult for each file, as soon as it finishes
+    """
+    path_list = [str(p) for p in paths]
+    initargs = (_split_threads(config, jobs), max_memory_per_worker)
+    for index, result, error in _iter_pool(
+        jobs, _init_worker, initargs, _analyze_in_worker, path_list
+    ):
+        yield result if error is None else BatchFileResult(path=path_list[index], error=error)
+
+
+def iter_document_metrics(
+    tasks: Sequence[DocumentTask],
+    dimension_names: List[str],
+    config: AnalysisConfig,
+    jobs: int,
+    batch_size: int = DEFAULT_DOCUMENT_BATCH_SIZE,
+    max_memory_per_worker: Optional[int] = None,
+) -> Iterator[List[DocumentMetrics]]:
+    """
+    Analyze dataset documents in a process pool, yielding batches as they finish.
+
+    Workers load the dimensions once and analyze batch_size documents per
+    task (see analyze_documents()). Workers use the spawn start method and
+    split the machine's cores between them, as in iter_batch_results().
+
+    Args:
+        tasks: (document id, text, dimension names) per document
+        dimension_names: Dimensions the workers load
+        config: Analysis configuration shared by all workers
+        jobs: Number of worker processes
+        batch_size: Documents per worker task
+        max_memory_per_worker: Optional per-worker memory budget in bytes
+
+    Yields:
+        DocumentMetrics of one batch, as soon as the batch finishes
+    """
+    batches = [list(tasks[i : i + batch_size]) for i in range(0, len(tasks), batch_size)]
+    initargs = (list(dimension_names), _split_threads(config, jobs), max_memory_per_worker)
+    for index, outcomes, error in _iter_pool(
+        jobs, _init_dataset_worker, initargs, _analyze_documents_in_worker, batches
+    ):
+        if error is None:
+            yield outcomes
+        else:
+            yield [
+                DocumentMetrics(doc_id=doc_id, errors=dict.fromkeys(names, error))
+                for doc_id, _, names in batches[index]
+            ]
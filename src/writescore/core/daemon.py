@@ -0,0 +1,867 @@
+"""
+Long-lived analysis daemon (``writescore serve``).
+
+Every ``writescore analyze`` process pays interpreter startup, dimension
+registration and model loading (spaCy, GPT-2, DistilBERT, MiniLM) before it
+scores a word, which dominates editor integrations and pre-commit hooks that
+analyze one file per call. The daemon keeps analyzers and their models
+resident and serves analysis over HTTP, on a Unix socket (default) or a
+localhost TCP port:
+
+    GET  /health    Daemon status (version, pid, queue, models loaded)
+    POST /analyze   {"text": ..., "source_name": ..., "config": {...}} ->
+                    the document ``writescore analyze --format json`` prints
+    POST /unload    Release models now (they reload on the next request)
+    POST /shutdown  Stop the daemon
+
+At most ``max_concurrent`` analyses run at a time; further requests wait in
+a queue of ``max_queue`` and are refused with 503 when it is full. After
+``idle_timeout`` seconds without requests the models are released.
+
+Requests are unauthenticated, so the server only answers requests whose Host
+header is a loopback name and POSTs sent as application/json, which a web
+page cannot make, and it ignores config fields that name local paths.
+
+On startup the daemon records its address in ``daemon.json`` in the cache
+directory. find_daemon() reads it, so ``writescore analyze`` uses a running
+daemon transparently and analyzes in-process when there is none.
+"""
+
+import contextlib
+import gc
+import http.client
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, fields, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from writescore.__version__ import __version__
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
+from writescore.core.result_cache import default_cache_dir
+from writescore.core.results import (
+    AnalysisError,
+    AnalysisResults,
+    EmptyFileError,
+    InsufficientDataError,
+)
+
+DEFAULT_MAX_CONCURRENT = 1
+DEFAULT_MAX_QUEUE = 16
+DEFAULT_IDLE_TIMEOUT = 900  # Seconds without requests before models are released
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+MAX_ANALYZERS = 8  # Analyzers kept per distinct config/domain terms
+CONNECT_TIMEOUT = 1.0  # Seconds allowed for finding a running daemon
+
+# Host header values accepted by the HTTP server (the Unix socket client sends
+# "localhost"). Anything else is a page in a browser that resolved its own
+# domain to the loopback address (DNS rebinding).
+LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+
+# Config fields naming a path on the daemon's machine. They are dropped from
+# requests: the daemon writes to its own cache directory only.
+PATH_CONFIG_FIELDS = ("result_cache_dir",)
+
+INFO_FILE = "daemon.json"
+SOCKET_FILE = "daemon.sock"
+
+# Result attributes that are not dataclass fields (so not part of the JSON
+# document), such as incremental stats and newer dimension score categories
+ATTRIBUTES_HEADER = "X-WriteScore-Attributes"
+
+# Long enough for every dimension to run (and load its models) on warm-up
+WARMUP_TEXT = """# Warm-up
+
+The daemon analyzes this short document once at startup, so that the first
+real request does not have to wait for models to load. It contains a few
+ordinary sentences. Some are short. Others run on a little longer, with a
+clause or two, to give the syntactic and predictability dimensions something
+to parse.
+
+A second paragraph gives the coherence and burstiness dimensions more than
+one unit to compare. However, the content itself does not matter; the
+results are discarded.
+"""
+
+_ANALYSIS_ERRORS = {
+    cls.__name__: cls for cls in (AnalysisError, EmptyFileError, InsufficientDataError)
+}
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot be reached or cannot serve a request."""
+
+    pass
+
+
+class DaemonBusyError(DaemonError):
+    """Raised when the daemon's request queue is full."""
+
+    pass
+
+
+# ============================================================================
+# PATHS AND SERIALIZATION
+# ============================================================================
+
+
+def daemon_info_path(cache_dir: Optional[str] = None) -> Path:
+    """
+    Get the file in which a running daemon records its address.
+
+    Args:
+        cache_dir: Cache directory (default: default_cache_dir())
+
+    Returns:
+        Path to daemon.json
+    """
+    return (Path(cache_dir) if cache_dir else default_cache_dir()) / INFO_FILE
+
+
+def default_socket_path(cache_dir: Optional[str] = None) -> Path:
+    """
+    Get the default Unix socket path.
+
+    Args:
+        cache_dir: Cache directory (default: default_cache_dir())
+
+    Returns:
+        Path to daemon.sock
+    """
+    return (Path(cache_dir) if cache_dir else default_cache_dir()) / SOCKET_FILE
+
+
+def config_to_dict(config: AnalysisConfig) -> Dict[str, Any]:
+    """
+    Convert an AnalysisConfig to a JSON-serializable dict.
+
+    Args:
+        config: Analysis configuration
+
+    Returns:
+        Dict of all config fields (mode as its string value)
+    """
+    data = asdict(config)
+    data["mode"] = config.mode.value
+    return data
+
+
+def config_from_dict(data: Dict[str, Any]) -> AnalysisConfig:
+    """
+    Rebuild an AnalysisConfig from config_to_dict() output.
+
+    The data comes from daemon clients, so it may not point the daemon at
+    local files: PATH_CONFIG_FIELDS are dropped (their defaults apply) and
+    model names must be Hugging Face Hub ids, not local model directories.
+
+    Args:
+        data: Config fields (missing fields take their defaults)
+
+    Returns:
+        AnalysisConfig
+
+    Raises:
+        ValueError: If data contains unknown fields, an invalid mode or a
+            model name that is a local path
+    """
+    known = {f.name for f in fields(AnalysisConfig)}
+    unknown = sorted(set(data) - known)
+    if unknown:
+        raise ValueError(f"Unknown config fields: {', '.join(unknown)}")
+    values = {k: v for k, v in data.items() if k not in PATH_CONFIG_FIELDS}
+    if "mode" in values:
+        values["mode"] = AnalysisMode(values["mode"])
+    config = AnalysisConfig(**values)
+
+    _check_model_name(config.language_model_name)
+    for overrides in (config.dimension_overrides or {}).values():
+        if isinstance(overrides, dict) and "model_name" in overrides:
+            _check_model_name(overrides["model_name"])
+    return config
+
+
+def _check_model_name(name: Any) -> None:
+    """Raise ValueError unless name is a Hub id ("gpt2" or "org/model")."""
+    if not isinstance(name, str):
+        raise ValueError(f"Model name must be a string, got {type(name).__name__}")
+    parts = name.split("/")
+    if (
+        len(parts) > 2
+        or any(part in ("", ".", "..") for part in parts)
+        or name.startswith("~")
+        or "\\" in name
+        or ":" in name
+    ):
+        raise ValueError(f"Model name must be a Hugging Face Hub id, not a path: {name!r}")
+
+
+# ============================================================================
+# MODEL RELEASE
+# ============================================================================
+
+
+def release_models() -> None:
+    """
+    Release every shared model held by this process.
+
+    Clears the shared language models, embedding models and spaCy models,
+    and the model references registered dimensions keep. Each loads again
+    on next use.
+    """
+    from writescore.core.dimension_registry import DimensionRegistry
+    from writescore.utils.embeddings import clear_embedding_services
+    from writescore.utils.language_model import clear_language_models
+    from writescore.utils.spacy_loader import clear_spacy_models
+
+    for dimension in DimensionRegistry.get_all():
+        dimension.clear_model_cache()
+    clear_language_models()
+    clear_embedding_services()
+    clear_spacy_models()
+    gc.collect()
+
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+# ============================================================================
+# DAEMON STATE
+# ============================================================================
+
+
+class AnalysisDaemon:
+    """
+    Resident analyzers with request queuing and idle model release.
+
+    Transport-independent: the HTTP handler calls analyze(), status() and
+    unload(); tests can drive it directly.
+
+    Analyses run on the calling (request) thread. A semaphore admits
+    max_concurrent of them at a time, the rest block on it; requests beyond
+    max_concurrent + max_queue are refused. Dimension instances are shared
+    process-wide, so max_concurrent > 1 runs the same dimensions on several
+    threads at once.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        """
+        Create the daemon state (no models are loaded yet).
+
+        Args:
+            max_concurrent: Analyses running at the same time
+            max_queue: Requests allowed to wait for a running analysis
+            idle_timeout: Seconds without requests before models are
+                released (0 = keep models loaded)
+        """
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        if max_queue < 0:
+            raise ValueError(f"max_queue must not be negative, got {max_queue}")
+
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.idle_timeout = idle_timeout
+        self.started = time.time()
+
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._pending = 0  # Running plus queued requests
+        self._running = 0
+        self._last_activity = time.monotonic()
+        self._models_loaded = False
+        self._served = 0
+        self._refused = 0
+
+        self._analyzers: OrderedDict[str, Any] = OrderedDict()
+        self._analyzers_lock = threading.Lock()
+
+    # ------------------------------------------------------------------------
+    # Analysis
+    # ------------------------------------------------------------------------
+
+    def analyze(
+        self,
+        text: str,
+        config: AnalysisConfig,
+        source_name: str = "<stdin>",
+        domain_terms: Optional[List[str]] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Analyze text, waiting for a free slot.
+
+        Args:
+            text: Markdown text
+            config: Analysis configuration
+            source_name: Name reported as the result's file_path
+            domain_terms: Optional technical terms for voice analysis
+
+        Returns:
+            (JSON document as printed by ``--format json``, result
+            attributes that are not dataclass fields)
+
+        Raises:
+            DaemonBusyError: If the queue is full
+            AnalysisError: If the text cannot be analyzed
+        """
+        with self._lock:
+            if self._pending >= self.max_concurrent + self.max_queue:
+                self._refused += 1
+                raise DaemonBusyError(
+                    f"{self._pending} requests pending (limit "
+                    f"{self.max_concurrent} running + {self.max_queue} queued)"
+                )
+            self._pending += 1
+
+        try:
+            with self._slots:
+                with self._lock:
+                    self._running += 1
+                    self._models_loaded = True
+                try:
+                    analyzer = self._get_analyzer(config, domain_terms)
+                    result = analyzer.analyze_text(text, config=config, source_name=source_name)
+                finally:
+                    with self._lock:
+                        self._running -= 1
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._served += 1
+                self._last_activity = time.monotonic()
+
+        data = asdict(result)
+        data["analysis_mode"] = config.mode.value
+        field_names = {f.name for f in fields(result)}
+        attributes = {k: v for k, v in vars(result).items() if k not in field_names}
+        return data, attributes
+
+    def warm_up(self, config: AnalysisConfig) -> None:
+        """
+        Load the models a profile uses by analyzing a short sample.
+
+        Args:
+            config: Configuration whose dimension profile to warm up
+        """
+        self.analyze(WARMUP_TEXT, replace(config, use_result_cache=False))
+
+    def _get_analyzer(self, config: AnalysisConfig, domain_terms: Optional[List[str]]):
+        """Get (or build) the analyzer for a config and domain terms."""
+        from writescore.core.analyzer import AIPatternAnalyzer
+
+        key = json.dumps([config_to_dict(config), domain_terms], sort_keys=True)
+        with self._analyzers_lock:
+            analyzer = self._analyzers.get(key)
+            if analyzer is None:
+                analyzer = AIPatternAnalyzer(domain_terms=domain_terms, config=config)
+                self._analyzers[key] = analyzer
+                while len(self._analyzers) > MAX_ANALYZERS:
+                    self._analyzers.popitem(last=False)
+            else:
+                self._analyzers.move_to_end(key)
+        return analyzer
+
+    # ------------------------------------------------------------------------
+    # Idle model release
+    # ------------------------------------------------------------------------
+
+    def unload(self) -> bool:
+        """
+        Release models if no analysis is running.
+
+        Holds every slot while releasing, so queued requests wait for the
+        release to finish and then reload what they need.
+
+        Returns:
+            True if models were released, False if an analysis was running
+        """
+        acquired = 0
+        try:
+            while acquired < self.max_concurrent and self._slots.acquire(blocking=False):
+                acquired += 1
+            if acquired < self.max_concurrent:
+                return False
+            release_models()
+            with self._lock:
+                self._models_loaded = False
+            return True
+        finally:
+            for _ in range(acquired):
+                self._slots.release()
+
+    def unload_if_idle(self) -> bool:
+        """
+        Release models if they are loaded and idle_timeout has passed.
+
+        Returns:
+            True if models were released
+        """
+        if self.idle_timeout <= 0:
+            return False
+        with self._lock:
+            idle = time.monotonic() - self._last_activity
+            if not self._models_loaded or self._pending or idle < self.idle_timeout:
+                return False
+        return self.unload()
+
+    # ------------------------------------------------------------------------
+    # Status
+    # ------------------------------------------------------------------------
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get daemon status.
+
+        Returns:
+            Dict with version, pid, uptime, request counters, queue state
+            and whether models are loaded
+        """
+        with self._lock:
+            return {
+                "status": "ok",
+                "version": __version__,
+                "pid": os.getpid(),
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "idle_seconds": round(time.monotonic() - self._last_activity, 1),
+                "models_loaded": self._models_loaded,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "idle_timeout": self.idle_timeout,
+                "served": self._served,
+                "refused": self._refused,
+            }
+
+
+# ============================================================================
+# HTTP TRANSPORT
+# ============================================================================
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end of an AnalysisDaemon (server.analysis_daemon)."""
+
+    server_version = f"writescore/{__version__}"
+
+    def do_GET(self):
+        if not self._check_request():
+            return
+        if self.path == "/health":
+            self._send_json(200, self.server.analysis_daemon.status())
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        if not self._check_request(json_body=True):
+            return
+        daemon = self.server.analysis_daemon
+        if self.path == "/analyze":
+            self._handle_analyze(daemon)
+        elif self.path == "/unload":
+            self._send_json(200, {"unloaded": daemon.unload()})
+        elif self.path == "/shutdown":
+            self._send_json(200, {"status": "shutting down"})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def _check_request(self, json_body: bool = False) -> bool:
+        """
+        Refuse requests a web page could make (sends the error response).
+
+        A page cannot send an application/json POST cross-origin without a
+        CORS preflight, which the daemon does not answer, and cannot set the
+        Host header, which names its own domain even when that resolves to
+        the loopback address.
+
+        Args:
+            json_body: Require Content-Type application/json
+
+        Returns:
+            True if the request may be served
+        """
+        host = self.headers.get("Host", "")
+        hostname = host[1:].partition("]")[0] if host.startswith("[") else host.partition(":")[0]
+        if hostname.lower() not in LOOPBACK_HOSTS:
+            self._send_json(403, {"error": f"Host not allowed: {host!r}"})
+            return False
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if json_body and content_type != "application/json":
+            self._send_json(415, {"error": "Content-Type must be application/json"})
+            return False
+        return True
+
+    def _handle_analyze(self, daemon: AnalysisDaemon) -> None:
+        """Parse an analyze request, run it and send the result."""
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_REQUEST_BYTES:
+            self._send_json(413, {"error": f"Request exceeds {MAX_REQUEST_BYTES} bytes"})
+            return
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+            text = request["text"]
+            if not isinstance(text, str):
+                raise ValueError("'text' must be a string")
+            config = config_from_dict(request.get("config") or {})
+            source_name = request.get("source_name") or "<stdin>"
+            domain_terms = request.get("domain_terms")
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_json(400, {"error": f"Invalid request: {e}"})
+            return
+
+        try:
+            data, attributes = daemon.analyze(text, config, source_name, domain_terms)
+        except DaemonBusyError as e:
+            self._send_json(503, {"error": f"Daemon busy: {e}"})
+            return
+        except AnalysisError as e:
+            self._send_json(422, {"error": str(e), "type": type(e).__name__})
+            return
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        self._send_json(200, data, {ATTRIBUTES_HEADER: json.dumps(attributes)})
+
+    def _send_json(self, status: int, data: Any, headers: Optional[Dict[str, str]] = None):
+        """Send a JSON response."""
+        body = json.dumps(data, indent=2).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            sys.stderr.write(f"[{self.log_date_time_string()}] {format % args}\n")
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded HTTP server on a Unix socket."""
+
+    daemon_threads = True
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a Unix socket."""
+
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+
+class DaemonClient:
+    """Client for a running analysis daemon."""
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        port: Optional[int] = None,
+        host: str = "127.0.0.1",
+    ):
+        """
+        Create a client (does not connect).
+
+        Args:
+            socket_path: Unix socket of the daemon
+            port: TCP port of the daemon (used when socket_path is None)
+            host: TCP host of the daemon
+        """
+        if socket_path is None and port is None:
+            raise ValueError("Either socket_path or port is required")
+        self.socket_path = socket_path
+        self.port = port
+        self.host = host
+
+    @property
+    def address(self) -> str:
+        """Human-readable daemon address."""
+        if self.socket_path:
+            return f"unix:{self.socket_path}"
+        return f"http://{self.host}:{self.port}"
+
+    def _request(
+        self, method: str, path: str, body: Optional[Dict] = None, timeout: Optional[float] = None
+    ) -> Tuple[int, Mapping[str, str], Any]:
+        """Send a request; returns (status, headers, decoded JSON body)."""
+        if self.socket_path:
+            connection = _UnixHTTPConnection(self.socket_path, timeout=timeout)
+        else:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+        try:
+            payload = json.dumps(body).encode("utf-8") if body is not None else None
+            headers = {"Content-Type": "application/json"} if method == "POST" else {}
+            connection.request(method, path, body=payload, headers=headers)
+            response = connection.getresponse()
+            data = json.loads(response.read() or b"null")
+            return response.status, response.headers, data
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            raise DaemonError(f"Cannot reach daemon at {self.address}: {e}") from e
+        finally:
+            connection.close()
+
+    def health(self, timeout: Optional[float] = CONNECT_TIMEOUT) -> Dict[str, Any]:
+        """
+        Get daemon status.
+
+        Args:
+            timeout: Seconds to wait for the daemon
+
+        Returns:
+            Status dict (see AnalysisDaemon.status())
+
+        Raises:
+            DaemonError: If the daemon does not answer
+        """
+        status, _, data = self._request("GET", "/health", timeout=timeout)
+        if status != 200:
+            raise DaemonError(f"Daemon health check failed ({status})")
+        return data
+
+    def analyze(
+        self,
+        text: str,
+        config: AnalysisConfig,
+        source_name: str = "<stdin>",
+        domain_terms: Optional[List[str]] = None,
+    ) -> AnalysisResults:
+        """
+        Analyze text in the daemon.
+
+        Args:
+            text: Markdown text
+            config: Analysis configuration
+            source_name: Name reported as the result's file_path
+            domain_terms: Optional technical terms for voice analysis
+
+        Returns:
+            AnalysisResults, including attributes set outside the dataclass
+            fields (e.g. .incremental)
+
+        Raises:
+            DaemonBusyError: If the daemon's queue is full
+            DaemonError: If the daemon cannot be reached or fails
+            AnalysisError: If the text cannot be analyzed (same type as
+                raised in-process)
+        """
+        request = {
+            "text": text,
+            "source_name": source_name,
+            "config": config_to_dict(config),
+            "domain_terms": domain_terms,
+        }
+        status, headers, data = self._request("POST", "/analyze", request)
+        if status == 503:
+            raise DaemonBusyError(data.get("error", "Daemon busy"))
+        if status == 422:
+            error_class = _ANALYSIS_ERRORS.get(data.get("type"), AnalysisError)
+            raise error_class(data.get("error", "Analysis failed"))
+        if status != 200:
+            raise DaemonError(f"Daemon analysis failed ({status}): {data.get('error')}")
+
+        result = AnalysisResults.from_dict(data)
+        for name, value in json.loads(headers.get(ATTRIBUTES_HEADER) or "{}").items():
+            setattr(result, name, value)
+        return result
+
+    def unload(self) -> bool:
+        """
+        Ask the daemon to release its models now.
+
+        Returns:
+            True if released, False if an analysis was running
+        """
+        _, _, data = self._request("POST", "/unload")
+        return bool(data.get("unloaded"))
+
+    def shutdown(self) -> None:
+        """Ask the daemon to stop."""
+        self._request("POST", "/shutdown", timeout=CONNECT_TIMEOUT)
+
+
+def _client_from_info(info: Dict[str, Any]) -> DaemonClient:
+    """Build a client from a daemon.json record."""
+    if info.get("socket"):
+        return DaemonClient(socket_path=info["socket"])
+    return DaemonClient(port=int(info["port"]), host=info.get("host", "127.0.0.1"))
+
+
+def find_daemon(cache_dir: Optional[str] = None) -> Optional[DaemonClient]:
+    """
+    Find a running daemon of this writescore version.
+
+    A daemon of another version is ignored, since its results could differ
+    from an in-process analysis.
+
+    Args:
+        cache_dir: Cache directory holding daemon.json (default: default_cache_dir())
+
+    Returns:
+        DaemonClient, or None if no usable daemon is running
+    """
+    try:
+        info = json.loads(daemon_info_path(cache_dir).read_text(encoding="utf-8"))
+        client = _client_from_info(info)
+        status = client.health()
+    except (OSError, ValueError, KeyError, TypeError, DaemonError):
+        return None
+    if status.get("version") != __version__:
+        return None
+    return client
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+
+def _bind_unix_server(socket_path: Path) -> _UnixHTTPServer:
+    """Bind the Unix socket, replacing a stale one (owner-only access)."""
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        try:
+            DaemonClient(socket_path=str(socket_path)).health()
+        except DaemonError:
+            socket_path.unlink()
+        else:
+            raise DaemonError(f"A daemon is already listening on {socket_path}")
+
+    old_umask = os.umask(0o177)
+    try:
+        return _UnixHTTPServer(str(socket_path), _RequestHandler)
+    finally:
+        os.umask(old_umask)
+
+
+def _write_info(path: Path, info: Dict[str, Any]) -> None:
+    """Atomically write daemon.json."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(info, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _remove_info(path: Path) -> None:
+    """Remove daemon.json if it still describes this process."""
+    try:
+        if json.loads(path.read_text(encoding="utf-8")).get("pid") == os.getpid():
+            path.unlink()
+    except (OSError, ValueError):
+        pass
+
+
+def serve(
+    daemon: AnalysisDaemon,
+    socket_path: Optional[str] = None,
+    port: Optional[int] = None,
+    host: str = "127.0.0.1",
+    warm_config: Optional[AnalysisConfig] = None,
+    cache_dir: Optional[str] = None,
+    verbose: bool = False,
+    ready=None,
+) -> None:
+    """
+    Serve daemon requests until shut down (SIGTERM, SIGINT or /shutdown).
+
+    Args:
+        daemon: Daemon state to serve
+        socket_path: Unix socket path (default: default_socket_path());
+            ignored when port is given
+        port: Serve on localhost TCP instead of a Unix socket (0 = any free port)
+        host: TCP host (keep it a loopback address: requests are unauthenticated)
+        warm_config: Configuration to warm up models with in the background
+            (None = load models on the first request)
+        cache_dir: Cache directory for daemon.json (default: default_cache_dir())
+        verbose: Log each request to stderr
+        ready: Optional callback(address) called once the daemon is listening
+
+    Raises:
+        DaemonError: If another daemon already listens on the socket
+    """
+    info: Dict[str, Any] = {"pid": os.getpid(), "version": __version__}
+    unix_socket: Optional[Path] = None
+    if port is not None:
+        server = ThreadingHTTPServer((host, port), _RequestHandler)
+        server.daemon_threads = True
+        info.update(host=host, port=server.server_address[1])
+    else:
+        unix_socket = Path(socket_path) if socket_path else default_socket_path(cache_dir)
+        server = _bind_unix_server(unix_socket)
+        info["socket"] = str(unix_socket)
+    server.analysis_daemon = daemon
+    server.verbose = verbose
+
+    info_path = daemon_info_path(cache_dir)
+    _write_info(info_path, info)
+
+    stop = threading.Event()
+
+    def monitor_idle():
+        interval = min(max(daemon.idle_timeout / 4, 1.0), 30.0)
+        while not stop.wait(interval):
+            if daemon.unload_if_idle() and verbose:
+                print("Released idle models", file=sys.stderr)
+
+    threading.Thread(target=monitor_idle, name="writescore-idle", daemon=True).start()
+    if warm_config is not None:
+        threading.Thread(
+            target=_warm_up, args=(daemon, warm_config), name="writescore-warmup", daemon=True
+        ).start()
+
+    previous_handler = None
+    if threading.current_thread() is threading.main_thread():
+        previous_handler = signal.signal(
+            signal.SIGTERM,
+            lambda signum, frame: threading.Thread(target=server.shutdown, daemon=True).start(),
+        )
+
+    try:
+        if ready is not None:
+            ready(_client_from_info(info).address)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+        if previous_handler is not None:
+            signal.signal(signal.SIGTERM, previous_handler)
+        if unix_socket is not None:
+            with contextlib.suppress(OSError):
+                unix_socket.unlink()
+        _remove_info(info_path)
+
+
+def _warm_up(daemon: AnalysisDaemon, config: AnalysisConfig) -> None:
+    """Warm up models, reporting (not raising) failures."""
+    try:
+        daemon.warm_up(config)
+    except Exception as e:
+        print(f"Warning: model warm-up failed: {e}", file=sys.stderr)
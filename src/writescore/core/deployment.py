@@ -36,6 +36,42 @@ DEFAULT_PARAMS_DIR = Path("config/parameters")
 DEFAULT_ARCHIVE_DIR = Path("config/parameters/archive")
 DEFAULT_ACTIVE_FILE = Path("config/scoring_parameters.yaml")
 
+# Active version per (path, mtime, size), so repeated lookups skip re-parsing YAML
+_active_version_cache: Dict[Any, Optional[str]] = {}
+
+
+def get_active_parameter_version(active_file: Optional[Path] = None) -> Optional[str]:
+    """
+    Get the version of the active parameter file without creating directories.
+
+    Args:
+        active_file: Path to active parameter file (default: DEFAULT_ACTIVE_FILE)
+
+    Returns:
+        Version string, or None if no active file or it has no version
+    """
+    active_file = Path(active_file or DEFAULT_ACTIVE_FILE)
+    try:
+        stat = active_file.stat()
+    except OSError:
+        return None
+
+    cache_key = (str(active_file.resolve()), stat.st_mtime_ns, stat.st_size)
+    if cache_key in _active_version_cache:
+        return _active_version_cache[cache_key]
+
+    try:
+        with open(active_file) as f:
+            data = yaml.safe_load(f)
+        version = data.get("version")
+        result = str(version) if version is not None else None
+    except Exception as e:
+        logger.error(f"Could not read current version: {e}")
+        return None
+
+    _active_version_cache[cache_key] = result
+    return result
+
 
 @dataclass
 class ParameterChange:
@@ -241,17 +277,7 @@ class ParameterVersionManager:
 
     def get_current_version(self) -> Optional[str]:
         """Get the currently active parameter version."""
-        if not self.active_file.exists():
-            return None
-
-        try:
-            with open(self.active_file) as f:
-                data = yaml.safe_load(f)
-            version = data.get("version")
-            return str(version) if version is not None else None
-        except Exception as e:
-            logger.error(f"Could not read current version: {e}")
-            return None
+        return get_active_parameter_version(self.active_file)
 
     def get_version_path(self, version: str) -> Optional[Path]:
         """
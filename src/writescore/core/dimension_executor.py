@@ -0,0 +1,190 @@
+"""
+Concurrent execution of independent dimensions within one document.
+
+With AnalysisConfig.dimension_workers > 1, AIPatternAnalyzer runs dimensions
+on a thread pool. The model-based dimensions spend most of their time in
+torch and spaCy code that releases the GIL, so wall time approaches the cost
+of the slowest dimension instead of the sum of all of them.
+
+Dimensions that share an expensive per-document resource
+(DimensionStrategy.shared_resources: the spaCy parse, language model scores)
+are chained: they run one after another on the same worker, cheapest first,
+so later ones reuse the parse or logits the first one computed instead of
+computing them again concurrently. Torch intra-op threads are divided between
+the chains that run models (DimensionStrategy.uses_torch), so concurrent
+dimensions do not oversubscribe the cores.
+"""
+
+import contextvars
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+def dimension_cost(dimension: Any) -> float:
+    """
+    Get a dimension's analysis_cost (1 if it does not declare a number).
+
+    Args:
+        dimension: DimensionStrategy instance
+
+    Returns:
+        Relative analysis cost
+    """
+    value = getattr(dimension, "analysis_cost", 1)
+    return value if isinstance(value, (int, float)) else 1
+
+
+def _shared_resources(dimension: Any) -> Tuple[str, ...]:
+    """Get a dimension's shared_resources (empty if it does not declare any)."""
+    value = getattr(dimension, "shared_resources", ())
+    return tuple(value) if isinstance(value, (tuple, list, set, frozenset)) else ()
+
+
+def _uses_torch(dimension: Any) -> bool:
+    """Whether a dimension declares that it runs torch models."""
+    return getattr(dimension, "uses_torch", False) is True
+
+
+def plan_chains(dimensions: Dict[str, Any], order: List[str]) -> List[List[str]]:
+    """
+    Group dimensions that share resources into chains run on one worker.
+
+    Args:
+        dimensions: Loaded dimensions by name
+        order: Dimension names in execution order (cheapest first)
+
+    Returns:
+        Chains of dimension names, each in execution order; chains are sorted
+        by total cost, most expensive first, so the longest chains start first
+    """
+    # Union-find over dimensions, joined through the resources they share
+    parent = {name: name for name in order}
+
+    def find(name: str) -> str:
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    first_user: Dict[str, str] = {}
+    for name in order:
+        for resource in _shared_resources(dimensions[name]):
+            if resource in first_user:
+                parent[find(name)] = find(first_user[resource])
+            else:
+                first_user[resource] = name
+
+    grouped: Dict[str, List[str]] = {}
+    for name in order:
+        grouped.setdefault(find(name), []).append(name)
+
+    planned = list(grouped.values())
+    return sorted(
+        planned,
+        key=lambda chain: sum(dimension_cost(dimensions[name]) for name in chain),
+        reverse=True,
+    )
+
+
+def torch_thread_budget(
+    chains: List[List[str]],
+    dimensions: Dict[str, Any],
+    workers: int,
+    cpu_count: Optional[int] = None,
+) -> Optional[int]:
+    """
+    Torch intra-op threads for each chain running models concurrently.
+
+    Args:
+        chains: Planned chains (see plan_chains())
+        dimensions: Loaded dimensions by name
+        workers: Thread pool size
+        cpu_count: Available cores (None = os.cpu_count())
+
+    Returns:
+        Threads per model chain (at least 1), or None if no chain runs models
+    """
+    model_chains = sum(1 for chain in chains if any(_uses_torch(dimensions[n]) for n in chain))
+    if model_chains == 0:
+        return None
+    cpu_count = cpu_count or os.cpu_count() or 1
+    return max(1, cpu_count // min(workers, model_chains))
+
+
+def _set_torch_threads(num_threads: int) -> None:
+    """Set torch intra-op threads (thread pool initializer)."""
+    import torch
+
+    torch.set_num_threads(num_threads)
+
+
+@contextmanager
+def torch_threads(num_threads: Optional[int]) -> Iterator[None]:
+    """
+    Limit torch intra-op threads, restoring the previous count afterwards.
+
+    Args:
+        num_threads: Thread count (None = leave unchanged)
+    """
+    if num_threads is None:
+        yield
+        return
+
+    import torch
+
+    previous = torch.get_num_threads()
+    torch.set_num_threads(num_threads)
+    try:
+        yield
+    finally:
+        torch.set_num_threads(previous)
+
+
+def run_concurrently(
+    dimensions: Dict[str, Any],
+    order: List[str],
+    run_dimension: Callable[[str], Dict[str, Any]],
+    workers: int,
+    budget_torch_threads: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run dimensions on a thread pool, chaining those that share resources.
+
+    Each task runs in a copy of the caller's context, so context variables
+    such as the active analysis deadline apply inside the workers.
+
+    Args:
+        dimensions: Loaded dimensions by name
+        order: Dimension names in execution order (cheapest first)
+        run_dimension: Analyzes one dimension by name and returns its raw
+            result (must not raise for dimension failures)
+        workers: Thread pool size
+        budget_torch_threads: Divide torch intra-op threads between model chains
+
+    Returns:
+        Raw results by dimension name
+    """
+    chains = plan_chains(dimensions, order)
+    threads = torch_thread_budget(chains, dimensions, workers) if budget_torch_threads else None
+
+    def run_chain(chain: List[str]) -> Dict[str, Dict[str, Any]]:
+        return {name: run_dimension(name) for name in chain}
+
+    results: Dict[str, Dict[str, Any]] = {}
+    # The thread count is process-wide in some torch builds and per-thread
+    # (OpenMP) in others, so set it both around the pool and in each worker
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(workers, len(chains))),
+        thread_name_prefix="writescore-dimension",
+        initializer=_set_torch_threads if threads is not None else None,
+        initargs=(threads,) if threads is not None else (),
+    )
+    with torch_threads(threads), executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, run_chain, chain) for chain in chains
+        ]
+        for future in futures:
+            results.update(future.result())
+    return results
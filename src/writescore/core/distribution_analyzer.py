@@ -4,6 +4,11 @@ Distribution analysis for percentile-anchored parameters.
 Analyzes validation dataset across all dimensions to compute empirical
 distributions, percentiles, and statistics for parameter derivation.
 
+Documents are analyzed in batches (model passes batched across documents,
+see core.batch), optionally by a pool of worker processes, and every
+finished (document, dimension) analysis can be checkpointed to disk
+(core.metric_checkpoint) so an interrupted run resumes where it stopped.
+
 Created in Story 2.5 Task 3.
 """
 
@@ -13,17 +18,50 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import numpy as np
 
+from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
+from writescore.core.batch import (
+    DEFAULT_DOCUMENT_BATCH_SIZE,
+    DocumentMetrics,
+    DocumentTask,
+    analyze_documents,
+    iter_document_metrics,
+    plan_workers,
+)
 from writescore.core.dataset import ValidationDataset
 from writescore.core.dimension_loader import DimensionLoader
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.metric_checkpoint import CheckpointKey, MetricCheckpoint
+from writescore.core.result_cache import compute_cache_key
 
 logger = logging.getLogger(__name__)
 
 
+# Primary metric keys that scoring parameters are derived from, per dimension
+# (based on the existing dimension implementations)
+PARAMETER_METRICS: Dict[str, List[str]] = {
+    "burstiness": ["variance"],
+    "lexical": ["type_token_ratio"],
+    "advanced_lexical": ["gltr_rank_10_ratio"],
+    "perplexity": ["perplexity"],
+    "predictability": ["avg_rank"],
+    "readability": ["flesch_reading_ease"],
+    "sentiment": ["sentiment_variance"],
+    "syntactic": ["avg_depth"],
+    "structure": ["avg_paragraph_length"],
+    "transition_marker": ["density"],
+    "voice": ["passive_ratio"],
+    "formatting": ["em_dash_density"],
+    "semantic_coherence": ["coherence_score"],
+    "pragmatic_markers": ["hedging_density"],
+    "ai_vocabulary": ["ai_vocab_density"],
+    "figurative_language": ["figurative_ratio"],
+}
+
+
 @dataclass
 class DimensionStatistics:
     """
@@ -207,21 +245,39 @@ class DistributionAnalyzer:
     derivation.
     """
 
-    def __init__(self, registry: Optional[DimensionRegistry] = None):
+    def __init__(
+        self,
+        registry: Optional[DimensionRegistry] = None,
+        config: Optional[AnalysisConfig] = None,
+        jobs: int = 1,
+        batch_size: int = DEFAULT_DOCUMENT_BATCH_SIZE,
+        max_memory_per_worker: Optional[int] = None,
+    ):
         """
         Initialize analyzer.
 
         Args:
             registry: DimensionRegistry with loaded dimensions. If None, creates new.
+            config: Analysis configuration passed to every dimension (default: DEFAULT_CONFIG)
+            jobs: Worker processes (1 = analyze in this process with the registry's dimensions)
+            batch_size: Documents analyzed together (model passes are batched across them)
+            max_memory_per_worker: Optional per-worker memory budget in bytes
         """
         self.registry = registry or DimensionRegistry
+        self.config = config or DEFAULT_CONFIG
+        self.jobs = jobs
+        self.batch_size = max(1, batch_size)
+        self.max_memory_per_worker = max_memory_per_worker
         if self.registry.get_count() == 0:
             # Load dimensions if registry is empty
             loader = DimensionLoader()
             loader.load_from_profile("full")
 
     def analyze_dataset(
-        self, dataset: ValidationDataset, dimension_names: Optional[List[str]] = None
+        self,
+        dataset: ValidationDataset,
+        dimension_names: Optional[List[str]] = None,
+        checkpoint_path: Optional[Path] = None,
     ) -> DistributionAnalysis:
         """
         Analyze validation dataset across all dimensions.
@@ -229,6 +285,8 @@ class DistributionAnalyzer:
         Args:
             dataset: ValidationDataset to analyze
             dimension_names: Optional list of dimensions to analyze. If None, analyzes all.
+            checkpoint_path: Optional checkpoint database; analyses recorded there by an
+                earlier (interrupted) run are reused and new ones are added
 
         Returns:
             DistributionAnalysis with complete statistics
@@ -244,7 +302,11 @@ class DistributionAnalyzer:
         logger.info(f"Analyzing {len(dimension_names)} dimensions")
 
         # Collect metric values for each dimension, split by label
-        metric_values = self._collect_metric_values(dataset, dimension_names)
+        if checkpoint_path is not None:
+            with MetricCheckpoint(checkpoint_path) as checkpoint:
+                metric_values = self._collect_metric_values(dataset, dimension_names, checkpoint)
+        else:
+            metric_values = self._collect_metric_values(dataset, dimension_names)
 
         # Compute statistics for each dimension and label
         analysis = DistributionAnalysis(
@@ -268,36 +330,68 @@ class DistributionAnalyzer:
         return analysis
 
     def _collect_metric_values(
-        self, dataset: ValidationDataset, dimension_names: List[str]
+        self,
+        dataset: ValidationDataset,
+        dimension_names: List[str],
+        checkpoint: Optional[MetricCheckpoint] = None,
     ) -> Dict[str, Dict[str, Dict[str, List[float]]]]:
         """
         Collect metric values for each dimension, split by label.
 
+        Analyses found in the checkpoint are reused; the remaining (document,
+        dimension) pairs are analyzed in batches and recorded in the
+        checkpoint as each batch finishes.
+
         Returns:
             Dict[dimension_name][label][metric_name] = List[values]
         """
-        # Structure: dimension -> label -> metric_name -> values
+        # Primary metric values of each finished analysis (full metrics are not kept)
+        extracted: Dict[CheckpointKey, Dict[str, float]] = {}
+
+        keys: Dict[CheckpointKey, str] = {}
+        if checkpoint is not None:
+            for doc in dataset.documents:
+                for dim_name in dimension_names:
+                    keys[(doc.id, dim_name)] = compute_cache_key(doc.text, self.config, [dim_name])
+            for doc_id, dim_name, metrics in checkpoint.completed(keys):
+                extracted[(doc_id, dim_name)] = self._extract_metrics(dim_name, metrics)
+            if extracted:
+                logger.info(f"Resuming: {len(extracted)} analyses reused from {checkpoint.path}")
+
+        tasks: List[DocumentTask] = []
+        for doc in dataset.documents:
+            pending = [name for name in dimension_names if (doc.id, name) not in extracted]
+            if pending:
+                tasks.append((doc.id, doc.text, pending))
+
+        analyzed = 0
+        for batch in self._analyze_tasks(tasks, dimension_names):
+            for outcome in batch:
+                for dim_name, error in outcome.errors.items():
+                    logger.warning(f"Error analyzing {dim_name} on doc {outcome.doc_id}: {error}")
+                for dim_name, metrics in outcome.metrics.items():
+                    extracted[(outcome.doc_id, dim_name)] = self._extract_metrics(dim_name, metrics)
+            if checkpoint is not None:
+                checkpoint.record(
+                    (outcome.doc_id, dim_name, keys[(outcome.doc_id, dim_name)], metrics)
+                    for outcome in batch
+                    for dim_name, metrics in outcome.metrics.items()
+                )
+            analyzed += len(batch)
+            logger.info(f"Analyzed {analyzed}/{len(tasks)} documents")
+
+        # Structure: dimension -> label -> metric_name -> values (in dataset order)
         values: Dict[str, Dict[str, Dict[str, List[float]]]] = defaultdict(
             lambda: defaultdict(lambda: defaultdict(list))
         )
-
-        # Process each document
         for doc in dataset.documents:
             for dim_name in dimension_names:
-                try:
-                    metrics = self._analyze_document(dim_name, doc.text)
-
-                    # Extract primary metric value(s)
-                    metric_dict = self._extract_metrics(dim_name, metrics)
-
-                    # Add to label-specific and combined lists
-                    for metric_name, value in metric_dict.items():
-                        values[dim_name][doc.label][metric_name].append(value)
-                        values[dim_name]["combined"][metric_name].append(value)
+                metric_dict = extracted.get((doc.id, dim_name), {})
 
-                except Exception as e:
-                    logger.warning(f"Error analyzing {dim_name} on doc {doc.id}: {e}")
-                    continue
+                # Add to label-specific and combined lists
+                for metric_name, value in metric_dict.items():
+                    values[dim_name][doc.label][metric_name].append(value)
+                    values[dim_name]["combined"][metric_name].append(value)
 
         # Convert nested defaultdicts to regular dicts for type compatibility
         return {
@@ -305,11 +399,35 @@ class DistributionAnalyzer:
             for dim, labels in values.items()
         }
 
-    def _analyze_document(self, dimension_name: str, text: str) -> Dict[str, Any]:
-        """Run dimension analyzer on document text."""
-        dimension = self.registry.get(dimension_name)
-        lines = text.split("\n")
-        return dimension.analyze(text, lines)
+    def _analyze_tasks(
+        self, tasks: List[DocumentTask], dimension_names: List[str]
+    ) -> Iterator[List[DocumentMetrics]]:
+        """
+        Analyze documents in batches, in this process or in a worker pool.
+
+        Yields:
+            DocumentMetrics of each finished batch
+        """
+        workers = plan_workers(
+            self.jobs, -(-len(tasks) // self.batch_size), self.max_memory_per_worker
+        )
+        if workers > 1:
+            logger.info(f"Analyzing {len(tasks)} documents with {workers} workers")
+            yield from iter_document_metrics(
+                tasks,
+                dimension_names,
+                self.config,
+                workers,
+                batch_size=self.batch_size,
+                max_memory_per_worker=self.max_memory_per_worker,
+            )
+            return
+
+        dimensions = {
+            name: self.registry.get(name) for name in dimension_names if self.registry.has(name)
+        }
+        for start in range(0, len(tasks), self.batch_size):
+            yield analyze_documents(dimensions, tasks[start : start + self.batch_size], self.config)
 
     def _extract_metrics(self, dimension_name: str, metrics: Dict[str, Any]) -> Dict[str, float]:
         """
@@ -318,29 +436,8 @@ class DistributionAnalyzer:
         Returns dict of metric_name -> value. Most dimensions have one primary
         metric, but some may have multiple.
         """
-        # Map dimension names to their primary metric keys
-        # This is based on the existing dimension implementations
-        metric_mapping = {
-            "burstiness": ["variance"],
-            "lexical": ["type_token_ratio"],
-            "advanced_lexical": ["gltr_rank_10_ratio"],
-            "perplexity": ["perplexity"],
-            "predictability": ["avg_rank"],
-            "readability": ["flesch_reading_ease"],
-            "sentiment": ["sentiment_variance"],
-            "syntactic": ["avg_depth"],
-            "structure": ["avg_paragraph_length"],
-            "transition_marker": ["density"],
-            "voice": ["passive_ratio"],
-            "formatting": ["em_dash_density"],
-            "semantic_coherence": ["coherence_score"],
-            "pragmatic_markers": ["hedging_density"],
-            "ai_vocabulary": ["ai_vocab_density"],
-            "figurative_language": ["figurative_ratio"],
-        }
-
         result = {}
-        metric_keys = metric_mapping.get(dimension_name, [])
+        metric_keys = PARAMETER_METRICS.get(dimension_name, [])
 
         for key in metric_keys:
             if key in metrics:
@@ -0,0 +1,157 @@
+"""
+Per-document analysis context shared across dimensions.
+
+SyntacticDimension, AdvancedLexicalDimension and EnergyDimension each need a
+spaCy parse of the same document. AIPatternAnalyzer creates one
+DocumentContext per analysis and passes it to every dimension as the
+``document`` keyword argument; dimensions ask it for parsed Docs instead of
+calling spaCy themselves, so each distinct text is parsed once. The context
+also shares the paragraph/sentence/word segmentation of each text
+(get_segments(), see writescore.core.segmentation).
+
+Texts are normalized with clean_text() (HTML comments and fenced code blocks
+removed) before parsing, and the normalized text is the cache key. Sampled
+analysis works the same way: each sample is parsed once no matter how many
+dimensions request it.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from writescore.core.segmentation import SegmentedDocument
+from writescore.utils.deadline import check_deadline
+from writescore.utils.spacy_loader import get_spacy_model
+from writescore.utils.text_processing import clean_text
+
+DEFAULT_SPACY_MODEL = "en_core_web_sm"
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for parsing (removes HTML comments and code blocks).
+
+    Args:
+        text: Raw or prepared text
+
+    Returns:
+        Normalized text used as the parse cache key
+    """
+    return clean_text(text, remove_code_blocks=True)
+
+
+def run_pipeline(nlp, text: str):
+    """
+    Parse text, with an analysis deadline check before each pipeline component.
+
+    Equivalent to nlp(text) for a spaCy Language; other callables are simply
+    called.
+
+    Args:
+        nlp: spaCy Language (or any callable returning a Doc)
+        text: Text to parse
+
+    Returns:
+        Parsed Doc
+
+    Raises:
+        DeadlineExceeded: If the active analysis deadline passes
+    """
+    check_deadline()
+    if not hasattr(nlp, "make_doc") or not hasattr(nlp, "pipeline"):
+        return nlp(text)
+    doc = nlp.make_doc(text)
+    for _name, component in nlp.pipeline:
+        check_deadline()
+        doc = component(doc)
+    return doc
+
+
+class DocumentContext:
+    """
+    Lazily parsed spaCy Docs for one document analysis.
+
+    Attributes:
+        text: Full document text being analyzed
+        model_name: spaCy model used for parsing
+    """
+
+    def __init__(self, text: str, model_name: str = DEFAULT_SPACY_MODEL):
+        """
+        Create a context (nothing is parsed until requested).
+
+        Args:
+            text: Full document text being analyzed
+            model_name: spaCy model used for parsing
+        """
+        self.text = text
+        self.model_name = model_name
+        self._docs: Dict[str, Any] = {}
+        self._segments: Dict[str, SegmentedDocument] = {}
+        self._lock = threading.Lock()
+
+    def get_doc(self, text: Optional[str] = None, nlp=None):
+        """
+        Get the parsed Doc for text, parsing it on first request.
+
+        Args:
+            text: Text to parse (default: full document text)
+            nlp: Optional spaCy Language to parse with (default: shared model)
+
+        Returns:
+            spaCy Doc of the normalized text
+        """
+        key = normalize_text(self.text if text is None else text)
+        doc = self._docs.get(key)
+        if doc is None:
+            with self._lock:
+                doc = self._docs.get(key)
+                if doc is None:
+                    nlp = nlp or get_spacy_model(self.model_name)
+                    doc = run_pipeline(nlp, key)
+                    self._docs[key] = doc
+        return doc
+
+    def get_segments(self, text: Optional[str] = None) -> SegmentedDocument:
+        """
+        Get the segmentation of text, creating it on first request.
+
+        Unlike get_doc(), the text is not normalized: segment offsets index the
+        exact text the dimension analyzes.
+
+        Args:
+            text: Text to segment (default: full document text)
+
+        Returns:
+            SegmentedDocument of text
+        """
+        key = self.text if text is None else text
+        segments = self._segments.get(key)
+        if segments is None:
+            segments = self._segments.setdefault(key, SegmentedDocument(key))
+        return segments
+
+    @property
+    def parsed_count(self) -> int:
+        """Number of distinct texts parsed so far."""
+        return len(self._docs)
+
+
+def parse_document(text: str, document: Optional[DocumentContext] = None, nlp=None):
+    """
+    Parse text through the shared document context when one is available.
+
+    Dimensions called outside AIPatternAnalyzer (e.g., directly in tests) have
+    no context; the text is then normalized and parsed directly.
+
+    Args:
+        text: Text to parse
+        document: Per-analysis DocumentContext, or None
+        nlp: Optional spaCy Language to parse with (default: shared model)
+
+    Returns:
+        spaCy Doc of the normalized text
+    """
+    if document is not None:
+        return document.get_doc(text, nlp)
+    nlp = nlp or get_spacy_model(DEFAULT_SPACY_MODEL)
+    return run_pipeline(nlp, normalize_text(text))
@@ -0,0 +1,132 @@
+"""
+Incremental per-section re-analysis.
+
+Writers usually edit one section at a time. In incremental mode the document
+is split into heading-delimited sections, and dimensions that support it
+(DimensionStrategy.supports_incremental) compute a mergeable summary per
+section. Summaries are cached by section content, so re-analyzing an edited
+document only summarizes the changed sections; the document-level result is
+then rebuilt by merge_section_summaries().
+
+Merging must give the same result as analyzing the whole document. Sections
+therefore only start at headings that follow an empty line outside fenced
+code, so no paragraph spans two sections. Dimensions whose metrics depend on
+cross-section context (language model perplexity, heading hierarchy) are
+still analyzed on the whole document.
+
+Currently only burstiness and semantic coherence support it; every other
+dimension re-analyzes the whole document. Structure depends on the heading
+hierarchy, and AI vocabulary phrases match across any whitespace, so one can
+span a section boundary. Other count-based dimensions do not implement
+section summaries yet.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from writescore.core.analysis_config import AnalysisConfig
+from writescore.core.result_cache import ResultCache, compute_cache_key
+
+# ATX heading (e.g., "## Methods")
+_HEADING_PATTERN = re.compile(r"^#{1,6}\s")
+
+# Fenced code block delimiter
+_FENCE_PATTERN = re.compile(r"^\s*(```|~~~)")
+
+
+def split_sections(text: str) -> List[str]:
+    """
+    Split markdown into heading-delimited sections.
+
+    A section starts at an ATX heading that follows an empty line (or starts
+    the text) outside fenced code. Content before the first heading is its
+    own section. Joining the sections gives back the original text.
+
+    Args:
+        text: Markdown text
+
+    Returns:
+        List of section strings (empty list for empty text)
+    """
+    sections: List[str] = []
+    current: List[str] = []
+    in_fence = False
+    previous_empty = True
+
+    for line in text.splitlines(keepends=True):
+        if _FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        elif not in_fence and previous_empty and current and _HEADING_PATTERN.match(line):
+            sections.append("".join(current))
+            current = []
+        current.append(line)
+        previous_empty = line == "\n"
+
+    if current:
+        sections.append("".join(current))
+    return sections
+
+
+def compute_section_key(
+    section: str,
+    dimension_name: str,
+    config: AnalysisConfig,
+    parameter_version: Optional[str] = None,
+) -> str:
+    """
+    Compute the cache key for one dimension's summary of one section.
+
+    Args:
+        section: Section text
+        dimension_name: Dimension producing the summary
+        config: Analysis configuration
+        parameter_version: Active scoring parameter version
+
+    Returns:
+        Hex SHA-256 digest (distinct from whole-document keys)
+    """
+    return compute_cache_key(section, config, [f"section:{dimension_name}"], parameter_version)
+
+
+def analyze_sections(
+    dimension,
+    text: str,
+    sections: List[str],
+    config: AnalysisConfig,
+    cache: Optional[ResultCache] = None,
+    parameter_version: Optional[str] = None,
+    **kwargs,
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Analyze text with one dimension from per-section summaries.
+
+    Args:
+        dimension: DimensionStrategy supporting incremental analysis
+        text: Full text (the concatenation of sections)
+        sections: Output of split_sections(text)
+        config: Analysis configuration
+        cache: Cache for section summaries (None = summarize every section)
+        parameter_version: Active scoring parameter version
+        **kwargs: Keyword arguments passed through to merge_section_summaries()
+
+    Returns:
+        Tuple of (dimension result, number of sections reused from cache)
+    """
+    summaries = []
+    reused = 0
+    for section in sections:
+        summary = None
+        key = None
+        if cache is not None:
+            key = compute_section_key(section, dimension.dimension_name, config, parameter_version)
+            summary = cache.get(key)
+
+        if summary is None:
+            summary = dimension.summarize_section(section, config)
+            if cache is not None and not summary.get("error"):
+                cache.put(key, summary)
+        else:
+            reused += 1
+        summaries.append(summary)
+
+    return dimension.merge_section_summaries(summaries, text, config, **kwargs), reused
@@ -0,0 +1,112 @@
+"""
+Checkpoint of completed dataset analyses.
+
+Analyzing a recalibration dataset runs every dimension on thousands of
+documents. MetricCheckpoint records each finished (document, dimension)
+analysis in a SQLite database as soon as its batch completes, so an
+interrupted run resumes with only the missing pairs.
+
+Each row carries the content-addressed key of its analysis
+(result_cache.compute_cache_key() over the document text, the analysis
+config and the dimension), so a row only counts as done while the document
+text, the config and the writescore version are unchanged. Results with an
+error are not recorded; a resumed run retries them.
+"""
+
+import pickle
+import sqlite3
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+# (document id, dimension name)
+CheckpointKey = Tuple[str, str]
+
+
+class MetricCheckpoint:
+    """
+    SQLite file of raw dimension metrics per (document, dimension).
+
+    One connection is kept open for the checkpoint's lifetime; each record()
+    call is one transaction.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) a checkpoint.
+
+        Args:
+            path: Database file (parent directories are created)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS metrics ("
+            "doc_id TEXT NOT NULL, dimension TEXT NOT NULL, key TEXT NOT NULL, "
+            "payload BLOB NOT NULL, PRIMARY KEY (doc_id, dimension))"
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM metrics").fetchone()[0]
+
+    def completed(self, keys: Dict[CheckpointKey, str]) -> Iterator[Tuple[str, str, Dict]]:
+        """
+        Iterate over recorded analyses that are still valid.
+
+        Args:
+            keys: (document id, dimension) -> current analysis key
+
+        Yields:
+            (document id, dimension, metrics) for each recorded pair whose
+            key matches; unreadable rows are skipped (and re-analyzed)
+        """
+        rows = self._conn.execute("SELECT doc_id, dimension, key, payload FROM metrics")
+        for doc_id, dimension, key, payload in rows:
+            if keys.get((doc_id, dimension)) != key:
+                continue
+            try:
+                metrics = pickle.loads(zlib.decompress(payload))
+            except Exception:
+                continue
+            yield doc_id, dimension, metrics
+
+    def record(self, results: Iterable[Tuple[str, str, str, Dict[str, Any]]]) -> int:
+        """
+        Record finished analyses in one transaction.
+
+        Args:
+            results: (document id, dimension, analysis key, metrics) tuples
+
+        Returns:
+            Number of analyses recorded (results with an "error" are skipped)
+        """
+        rows = [
+            (
+                doc_id,
+                dimension,
+                key,
+                zlib.compress(pickle.dumps(metrics, protocol=pickle.HIGHEST_PROTOCOL)),
+            )
+            for doc_id, dimension, key, metrics in results
+            if isinstance(metrics, dict) and not metrics.get("error")
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO metrics(doc_id, dimension, key, payload) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "MetricCheckpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
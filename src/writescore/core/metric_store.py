@@ -0,0 +1,330 @@
+"""
+Columnar store of raw dimension metrics.
+
+Dimension scores are a function of the raw metrics dict returned by
+analyze() (calculate_score() never looks at the text), so a corpus only has
+to be analyzed once to be scored under any number of parameter sets. The
+MetricStore keeps those metrics on disk, one compressed .npz table per
+dimension with one row per document:
+
+- Numeric leaves of the (nested) metrics dict become float64 columns named
+  by their dotted key path (e.g. "lexical_diversity.mtld_score"); NaN marks
+  a row where the metric is missing. The original int/bool types are kept
+  in the table metadata.
+- All other leaves (strings, lists, None) are kept per row as JSON, so the
+  full metrics dict of any row can be rebuilt for calculate_score().
+
+Rows are keyed by document id (the analyzed file path by default); adding a
+document again replaces its row. Only raw analyze() output is stored: the
+score, weight and tier metadata AIPatternAnalyzer adds to its results are
+dropped, so stored rows are scored afresh under any parameter set. Tables
+are written without pickling and load with plain numpy.
+
+See core.rescoring for scoring a store under a parameter set.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TABLE_SUFFIX = ".npz"
+FORMAT_VERSION = 1
+
+# Numeric column kinds (restored when a row is rebuilt), checked in order
+_KINDS = (
+    ("bool", (bool, np.bool_)),
+    ("int", (int, np.integer)),
+    ("float", (float, np.floating)),
+)
+_CASTS = {"bool": bool, "int": int, "float": float}
+
+# Keys AIPatternAnalyzer._enrich_dimension_results() adds to raw analyze() output
+ENRICHMENT_KEYS = frozenset({"tier", "score", "weight", "tier_mapping", "recommendations"})
+
+
+def _numeric_kind(value: Any) -> Optional[str]:
+    """Kind of a numeric value, or None for other values."""
+    for kind, types in _KINDS:
+        if isinstance(value, types):
+            return kind
+    return None
+
+
+def flatten_metrics(
+    metrics: Dict[str, Any], prefix: str = ""
+) -> Tuple[Dict[str, float], Dict[str, str], Dict[str, Any]]:
+    """
+    Split a metrics dict into numeric columns and other values.
+
+    Args:
+        metrics: Dimension metrics (as returned by analyze())
+        prefix: Key path of metrics within the top-level dict
+
+    Returns:
+        Tuple of (dotted key -> numeric value, dotted key -> kind
+        ("bool"/"int"/"float"), dotted key -> other JSON-serializable value)
+    """
+    numeric: Dict[str, float] = {}
+    kinds: Dict[str, str] = {}
+    other: Dict[str, Any] = {}
+    for key, value in metrics.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            sub_numeric, sub_kinds, sub_other = flatten_metrics(value, f"{path}.")
+            numeric.update(sub_numeric)
+            kinds.update(sub_kinds)
+            other.update(sub_other)
+        else:
+            kind = _numeric_kind(value)
+            if kind is None:
+                other[path] = value
+            else:
+                numeric[path] = float(value)
+                kinds[path] = kind
+    return numeric, kinds, other
+
+
+def unflatten_metrics(values: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild a nested metrics dict from dotted key paths.
+
+    Args:
+        values: Dotted key -> value
+
+    Returns:
+        Nested metrics dict
+    """
+    metrics: Dict[str, Any] = {}
+    for path, value in values.items():
+        node = metrics
+        *parents, leaf = path.split(".")
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    return metrics
+
+
+@dataclass
+class MetricTable:
+    """
+    One dimension's stored metrics, one row per document.
+
+    Attributes:
+        dimension_name: Dimension the metrics belong to
+        doc_ids: Document ids in ascending order
+        columns: Dotted key -> float64 values per row (NaN = missing)
+        kinds: Dotted key -> original numeric kind
+        extras: Per-row JSON of the non-numeric values
+    """
+
+    dimension_name: str
+    doc_ids: np.ndarray
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+    kinds: Dict[str, str] = field(default_factory=dict)
+    extras: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def column(self, name: str) -> Optional[np.ndarray]:
+        """Get a column by dotted key (None if no row has it)."""
+        return self.columns.get(name)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Rebuild the metrics dict of one row.
+
+        Args:
+            index: Row index
+
+        Returns:
+            Metrics dict as returned by the dimension's analyze()
+        """
+        values: Dict[str, Any] = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            if not np.isnan(value):
+                values[name] = _CASTS[self.kinds.get(name, "float")](value)
+        if self.extras is not None and self.extras[index]:
+            values.update(json.loads(str(self.extras[index])))
+        return unflatten_metrics(values)
+
+    def rows(self) -> Iterable[Dict[str, Any]]:
+        """Rebuild the metrics dicts of all rows, in doc_ids order."""
+        return (self.row(index) for index in range(len(self)))
+
+    def save(self, path: Path) -> None:
+        """Write the table as a compressed .npz file."""
+        meta = {
+            "format_version": FORMAT_VERSION,
+            "dimension_name": self.dimension_name,
+            "columns": list(self.columns),
+            "kinds": self.kinds,
+        }
+        arrays = {f"col_{index}": column for index, column in enumerate(self.columns.values())}
+        extras = self.extras if self.extras is not None else np.full(len(self), "", dtype=str)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(
+                f,
+                meta=np.array(json.dumps(meta)),
+                doc_ids=np.asarray(self.doc_ids, dtype=str),
+                extras=np.asarray(extras, dtype=str),
+                **arrays,
+            )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "MetricTable":
+        """
+        Read a table written by save().
+
+        Raises:
+            ValueError: If the file is not a metric table of a supported version
+        """
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("format_version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported metric table format in {path}")
+            columns = {
+                name: data[f"col_{index}"].astype(np.float64)
+                for index, name in enumerate(meta["columns"])
+            }
+            return cls(
+                dimension_name=meta["dimension_name"],
+                doc_ids=data["doc_ids"],
+                columns=columns,
+                kinds=meta.get("kinds", {}),
+                extras=data["extras"],
+            )
+
+    @classmethod
+    def from_rows(cls, dimension_name: str, rows: Dict[str, Dict[str, Any]]) -> "MetricTable":
+        """
+        Build a table from metrics dicts.
+
+        Args:
+            dimension_name: Dimension the metrics belong to
+            rows: Document id -> metrics dict
+
+        Returns:
+            MetricTable with rows sorted by document id
+        """
+        doc_ids = sorted(rows)
+        flattened = [flatten_metrics(rows[doc_id]) for doc_id in doc_ids]
+
+        names: Dict[str, None] = {}
+        kinds: Dict[str, str] = {}
+        for numeric, row_kinds, _ in flattened:
+            names.update(dict.fromkeys(numeric))
+            for name, kind in row_kinds.items():
+                # A column holding both ints and floats is a float column
+                kinds[name] = kind if kinds.get(name, kind) == kind else "float"
+
+        columns = {name: np.full(len(doc_ids), np.nan) for name in names}
+        for index, (numeric, _, _) in enumerate(flattened):
+            for name, value in numeric.items():
+                columns[name][index] = value
+
+        extras = np.array(
+            [json.dumps(other, default=str) if other else "" for _, _, other in flattened],
+            dtype=str,
+        )
+        return cls(
+            dimension_name=dimension_name,
+            doc_ids=np.array(doc_ids, dtype=str),
+            columns=columns,
+            kinds=kinds,
+            extras=extras,
+        )
+
+
+class MetricStore:
+    """
+    Directory of per-dimension metric tables.
+
+    Rows are buffered by add() and written by save(), which merges them into
+    the existing tables (a document added again replaces its old row).
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Store directory (created on first save)
+        """
+        self.path = Path(path)
+        self._pending: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def table_path(self, dimension_name: str) -> Path:
+        """Path of a dimension's table."""
+        return self.path / f"{dimension_name}{TABLE_SUFFIX}"
+
+    def add(self, doc_id: str, dimension_results: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Buffer the metrics of one analyzed document.
+
+        Args:
+            doc_id: Document id (e.g. file path)
+            dimension_results: Dimension name -> metrics dict
+        """
+        for dimension_name, metrics in dimension_results.items():
+            if isinstance(metrics, dict):
+                self._pending.setdefault(dimension_name, {})[str(doc_id)] = metrics
+
+    def add_results(self, results: Any, doc_id: Optional[str] = None) -> None:
+        """
+        Buffer the metrics of an AnalysisResults.
+
+        The enrichment metadata (ENRICHMENT_KEYS) of each dimension is
+        dropped; the analysis-time score would otherwise override rescoring.
+
+        Args:
+            results: AnalysisResults with dimension_results
+            doc_id: Document id (default: results.file_path)
+        """
+        raw_results = {
+            dimension_name: (
+                {key: value for key, value in metrics.items() if key not in ENRICHMENT_KEYS}
+                if isinstance(metrics, dict)
+                else metrics
+            )
+            for dimension_name, metrics in results.dimension_results.items()
+        }
+        self.add(doc_id or results.file_path, raw_results)
+
+    def save(self) -> None:
+        """Merge buffered rows into the tables on disk."""
+        for dimension_name, rows in self._pending.items():
+            path = self.table_path(dimension_name)
+            if path.exists():
+                existing = MetricTable.load(path)
+                stored = {
+                    doc_id: metrics
+                    for doc_id, metrics in zip(existing.doc_ids.tolist(), existing.rows())
+                    if doc_id not in rows
+                }
+                rows = {**stored, **rows}
+            MetricTable.from_rows(dimension_name, rows).save(path)
+            logger.info(f"Stored {len(rows)} rows of {dimension_name} metrics in {path}")
+        self._pending.clear()
+
+    def dimensions(self) -> List[str]:
+        """Names of the dimensions with a stored table."""
+        return sorted(path.stem for path in self.path.glob(f"*{TABLE_SUFFIX}"))
+
+    def load(self, dimension_name: str) -> Optional[MetricTable]:
+        """Load a dimension's table (None if it has none)."""
+        path = self.table_path(dimension_name)
+        return MetricTable.load(path) if path.exists() else None
+
+    def doc_ids(self) -> np.ndarray:
+        """Sorted ids of all documents with stored metrics in any table."""
+        ids = [table.doc_ids for table in map(self.load, self.dimensions()) if table is not None]
+        return np.unique(np.concatenate(ids)) if ids else np.array([], dtype=str)
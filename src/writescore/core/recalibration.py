@@ -208,7 +208,11 @@ class RecalibrationWorkflow:
     7. Generate summary report
     """
 
-    def __init__(self, auto_select_method: bool = False):
+    def __init__(
+        self,
+        auto_select_method: bool = False,
+        analyzer: Optional[DistributionAnalyzer] = None,
+    ):
         """
         Initialize recalibration workflow.
 
@@ -216,9 +220,11 @@ class RecalibrationWorkflow:
             auto_select_method: If True, use Shapiro-Wilk normality testing to
                               automatically select scoring method for each dimension.
                               Default: False (uses hardcoded method mapping).
+            analyzer: DistributionAnalyzer to run (e.g. with worker processes).
+                      Default: serial analysis with the default config.
         """
         self.auto_select_method = auto_select_method
-        self.analyzer = DistributionAnalyzer()
+        self.analyzer = analyzer or DistributionAnalyzer()
         self.deriver = ParameterDeriver(auto_select_method=auto_select_method)
         self.dataset: Optional[ValidationDataset] = None
         self.analysis: Optional[DistributionAnalysis] = None
@@ -243,13 +249,16 @@ class RecalibrationWorkflow:
         return dataset
 
     def run_distribution_analysis(
-        self, dimension_names: Optional[List[str]] = None
+        self,
+        dimension_names: Optional[List[str]] = None,
+        checkpoint_path: Optional[Path] = None,
     ) -> DistributionAnalysis:
         """
         Run distribution analysis on loaded dataset.
 
         Args:
             dimension_names: Optional list of dimensions to analyze
+            checkpoint_path: Optional checkpoint to resume from and record analyses in
 
         Returns:
             DistributionAnalysis results
@@ -258,7 +267,9 @@ class RecalibrationWorkflow:
             raise ValueError("No dataset loaded. Call load_dataset() first.")
 
         logger.info("Running distribution analysis...")
-        self.analysis = self.analyzer.analyze_dataset(self.dataset, dimension_names=dimension_names)
+        self.analysis = self.analyzer.analyze_dataset(
+            self.dataset, dimension_names=dimension_names, checkpoint_path=checkpoint_path
+        )
         logger.info(
             f"Analyzed {len(self.analysis.dimensions)} dimensions "
             f"across {self.dataset.get_statistics()['total_documents']} documents"
@@ -413,6 +424,7 @@ class RecalibrationWorkflow:
         existing_params_path: Optional[Path] = None,
         dimension_names: Optional[List[str]] = None,
         backup: bool = True,
+        checkpoint_path: Optional[Path] = None,
     ) -> Tuple[Dict[str, DimensionParameters], RecalibrationReport]:
         """
         Run complete recalibration workflow.
@@ -423,6 +435,8 @@ class RecalibrationWorkflow:
             existing_params_path: Path to existing parameters (for comparison)
             dimension_names: Optional list of dimensions to process
             backup: Whether to backup existing parameters
+            checkpoint_path: Optional distribution analysis checkpoint (resumes a
+                             previous interrupted run)
 
         Returns:
             Tuple of (derived_parameters, report)
@@ -435,7 +449,9 @@ class RecalibrationWorkflow:
         self.load_dataset(dataset_path)
 
         # Step 2: Run distribution analysis
-        self.run_distribution_analysis(dimension_names=dimension_names)
+        self.run_distribution_analysis(
+            dimension_names=dimension_names, checkpoint_path=checkpoint_path
+        )
 
         # Step 3: Derive parameters
         self.derive_parameters(dimension_names=dimension_names)
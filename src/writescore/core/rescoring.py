@@ -0,0 +1,300 @@
+"""
+Re-scoring stored metrics under a parameter set.
+
+Scores are recomputed from a MetricStore (see core.metric_store) instead of
+re-running analyze() over the corpus, so the effect of a candidate
+PercentileParameters set on every document can be evaluated in seconds:
+
+- Dimensions with parameters are scored column-wise from the metric their
+  parameters were derived from (DistributionAnalyzer's primary metric),
+  using the Gaussian, monotonic or threshold formula of the parameters'
+  scoring type over the whole column at once.
+- Other dimensions are scored with their own calculate_score() on each
+  stored metrics dict (no text analysis).
+- Quality score and detection risk are then aggregated like
+  calculate_dual_score(): z-score normalization, scaling to the effective
+  dimension weights, summing.
+
+RescoreResult.document_scores() has the per-document dimension scores in
+the layout ScoreShiftAnalyzer.analyze_shift() takes.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from writescore.core.deployment import ParameterVersionManager
+from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.distribution_analyzer import PARAMETER_METRICS
+from writescore.core.metric_store import ENRICHMENT_KEYS, MetricStore, MetricTable
+from writescore.core.parameter_loader import ParameterLoader
+from writescore.core.parameters import (
+    DimensionParameters,
+    GaussianParameters,
+    MonotonicParameters,
+    PercentileParameters,
+    ThresholdParameters,
+)
+from writescore.scoring.dual_score_calculator import get_effective_weights
+from writescore.scoring.score_normalization import get_normalizer
+
+logger = logging.getLogger(__name__)
+
+
+def score_values(values: np.ndarray, dim_params: DimensionParameters) -> np.ndarray:
+    """
+    Score metric values with a dimension's parameters.
+
+    Uses the same formulas as DimensionStrategy._gaussian_score() and
+    _monotonic_score(); threshold parameters map each value to the score of
+    its category (values below the first threshold fall in the first one).
+
+    Args:
+        values: Metric values (NaN = missing)
+        dim_params: Parameters of the dimension
+
+    Returns:
+        Scores (0-100), NaN where the value is missing
+    """
+    values = np.asarray(values, dtype=np.float64)
+    params = dim_params.parameters
+
+    if isinstance(params, GaussianParameters):
+        width = max(params.width.value, 1e-10)
+        scores = 100.0 * np.exp(-((values - params.target.value) ** 2) / (2 * width**2))
+
+    elif isinstance(params, MonotonicParameters):
+        low, high = params.threshold_low.value, params.threshold_high.value
+        range_size = high - low
+        proportion = (values - low) / range_size
+        excess = np.maximum(values - high, 0.0) / range_size
+        if params.direction == "increasing":
+            scores = np.where(
+                values < low,
+                25.0,
+                np.where(values < high, 25.0 + 50.0 * proportion, 75.0 + 25.0 * -np.expm1(-excess)),
+            )
+        else:
+            scores = np.where(
+                values < low,
+                75.0,
+                np.where(values < high, 75.0 - 50.0 * proportion, 25.0 * np.exp(-excess)),
+            )
+
+    elif isinstance(params, ThresholdParameters):
+        thresholds = np.array([t.value for t in params.thresholds])
+        category = np.searchsorted(thresholds, values, side="right")
+        scores = np.asarray(params.scores, dtype=np.float64)[np.minimum(category, len(thresholds))]
+
+    else:
+        raise ValueError(f"Unsupported parameters for {dim_params.dimension_name}")
+
+    return np.where(np.isnan(values), np.nan, np.clip(scores, 0.0, 100.0))
+
+
+def parameter_metric(table: MetricTable) -> Optional[str]:
+    """
+    Get the column a dimension's parameters apply to.
+
+    Same choice as DistributionAnalyzer._extract_metrics(): the dimension's
+    primary metric if stored, else its first top-level numeric metric
+    (analyzer enrichment columns of older stores, such as score, are skipped).
+
+    Args:
+        table: The dimension's stored metrics
+
+    Returns:
+        Column name, or None if the table has no top-level numeric metric
+    """
+    for name in PARAMETER_METRICS.get(table.dimension_name, []):
+        if name in table.columns:
+            return name
+    return next(
+        (name for name in table.columns if "." not in name and name not in ENRICHMENT_KEYS),
+        None,
+    )
+
+
+def load_parameters(
+    spec: str, manager: Optional[ParameterVersionManager] = None
+) -> PercentileParameters:
+    """
+    Load a parameter set by file path or deployed version.
+
+    Args:
+        spec: Path to a parameter file, or a version ("2.0" or "v2.0")
+        manager: Version manager to look versions up in (default directories)
+
+    Returns:
+        PercentileParameters
+
+    Raises:
+        FileNotFoundError: If spec is neither a file nor a known version
+    """
+    path = Path(spec)
+    if path.is_file():
+        return ParameterLoader.load(path)
+
+    manager = manager or ParameterVersionManager()
+    for version in (spec, spec[1:] if spec.startswith("v") else None):
+        version_path = manager.get_version_path(version) if version else None
+        if version_path:
+            return ParameterLoader.load(version_path)
+    raise FileNotFoundError(f"No parameter file or version '{spec}'")
+
+
+@dataclass
+class RescoreResult:
+    """
+    Scores of every stored document under one parameter set.
+
+    Attributes:
+        doc_ids: Document ids (sorted)
+        dimension_scores: Dimension name -> raw 0-100 scores (NaN = unavailable)
+        quality_score: Quality score per document (0-100, higher = better)
+        detection_risk: Detection risk per document (0-100, lower = better)
+        parameters_version: Version of the parameters used (None = built-in scoring)
+        parameterized: Dimensions scored from parameters (others used calculate_score)
+    """
+
+    doc_ids: np.ndarray
+    dimension_scores: Dict[str, np.ndarray]
+    quality_score: np.ndarray
+    detection_risk: np.ndarray
+    parameters_version: Optional[str] = None
+    parameterized: List[str] = field(default_factory=list)
+
+    def document_scores(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the dimension scores of each document (unavailable ones omitted).
+
+        Returns:
+            Dict mapping document id to dimension scores (for ScoreShiftAnalyzer)
+        """
+        scores: Dict[str, Dict[str, float]] = {doc_id: {} for doc_id in self.doc_ids.tolist()}
+        for name, values in self.dimension_scores.items():
+            for doc_id, value in zip(self.doc_ids.tolist(), values.tolist()):
+                if not np.isnan(value):
+                    scores[doc_id][name] = round(value, 2)
+        return scores
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "version": self.parameters_version or "built-in",
+            "parameterized_dimensions": self.parameterized,
+            "scores": self.document_scores(),
+            "dual_scores": {
+                doc_id: {"quality_score": quality, "detection_risk": risk}
+                for doc_id, quality, risk in zip(
+                    self.doc_ids.tolist(),
+                    self.quality_score.tolist(),
+                    self.detection_risk.tolist(),
+                )
+            },
+        }
+
+
+def _available_rows(table: MetricTable) -> np.ndarray:
+    """Rows that hold metrics and are not marked unavailable."""
+    has_data = table.extras != "" if table.extras is not None else np.zeros(len(table), bool)
+    for column in table.columns.values():
+        has_data |= ~np.isnan(column)
+    available = table.column("available")
+    if available is not None:
+        has_data &= available != 0
+    return has_data
+
+
+def _score_table(table: MetricTable, dimension: Any, dim_params: Optional[DimensionParameters]):
+    """
+    Raw scores of a dimension's stored rows.
+
+    Returns:
+        Tuple of (scores with NaN for unavailable rows, whether parameters were used)
+    """
+    available = _available_rows(table)
+    scores = np.full(len(table), np.nan)
+    metric = parameter_metric(table) if dim_params is not None else None
+
+    if metric is not None:
+        scores = score_values(table.columns[metric], dim_params)
+        scores[~available] = np.nan
+    else:
+        for index in np.flatnonzero(available).tolist():
+            try:
+                scores[index] = dimension.calculate_score(table.row(index))
+            except Exception as e:
+                doc_id = table.doc_ids[index]
+                logger.warning(f"Error scoring {table.dimension_name} for {doc_id}: {e}")
+                scores[index] = 0.0
+
+    # Pre-calculated scores take precedence, as in calculate_dual_score(),
+    # unless the dimension is scored from parameters
+    stored = table.column("score")
+    if stored is not None and metric is None:
+        scores = np.where(available & ~np.isnan(stored), stored, scores)
+    return scores, metric is not None
+
+
+def rescore(
+    store: MetricStore,
+    params: Optional[PercentileParameters] = None,
+    enable_normalization: bool = True,
+) -> RescoreResult:
+    """
+    Recompute dimension and dual scores of every document in a store.
+
+    Registered dimensions (DimensionRegistry) are scored; stored metrics of
+    dimensions that are not registered are ignored.
+
+    Args:
+        store: MetricStore with the documents' raw metrics
+        params: Parameter set to score with (None = each dimension's calculate_score())
+        enable_normalization: Apply z-score normalization before weighting
+
+    Returns:
+        RescoreResult
+    """
+    doc_ids = store.doc_ids()
+    dimensions = DimensionRegistry.get_all()
+    weights = get_effective_weights(dimensions)
+    normalizer = get_normalizer(enabled=enable_normalization)
+
+    dimension_scores: Dict[str, np.ndarray] = {}
+    parameterized: List[str] = []
+    quality = np.zeros(len(doc_ids))
+
+    for dim in dimensions:
+        name = dim.dimension_name
+        table = store.load(name)
+        if table is None or not len(table):
+            continue
+
+        dim_params = params.get_dimension(name) if params else None
+        table_scores, used_params = _score_table(table, dim, dim_params)
+        if used_params:
+            parameterized.append(name)
+
+        # Align to all documents (documents without this dimension are unavailable)
+        scores = np.full(len(doc_ids), np.nan)
+        scores[np.searchsorted(doc_ids, table.doc_ids)] = table_scores
+        dimension_scores[name] = scores
+
+        normalized = scores
+        if enable_normalization and name in normalizer.stats:
+            mean, stdev = normalizer.stats[name]["mean"], normalizer.stats[name]["stdev"]
+            normalized = np.clip(50.0 + (scores - mean) / (stdev or 1.0) * 15.0, 0.0, 100.0)
+        quality += np.nan_to_num(normalized / 100.0 * weights.get(name, dim.weight))
+
+    return RescoreResult(
+        doc_ids=doc_ids,
+        dimension_scores=dimension_scores,
+        quality_score=np.round(quality, 1),
+        detection_risk=np.round(100.0 - quality, 1),
+        parameters_version=params.version if params else None,
+        parameterized=parameterized,
+    )
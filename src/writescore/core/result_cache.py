@@ -0,0 +1,331 @@
+"""
+Content-addressed on-disk cache for dimension analysis results.
+
+Re-analyzing an unchanged document repeats every dimension, including the
+language model and sentence-transformer passes. ResultCache stores the raw
+per-dimension results (before scoring) in a SQLite database, keyed by a hash
+of everything that determines them:
+
+- The analyzed text (after HTML comment stripping)
+- AnalysisConfig fields that affect dimension output
+- The set of loaded dimensions
+- The active scoring parameter version, the writescore version and the
+  AI vocabulary lexicon version
+
+On a hit, AIPatternAnalyzer skips the dimensions and only re-runs scoring
+and reporting. The cache is size-bounded with least-recently-used eviction.
+
+Location: $XDG_CACHE_HOME/writescore, else ~/.cache/writescore. (Not a
+WRITESCORE_* variable: those are reserved for configuration overrides.)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from writescore.__version__ import __version__
+from writescore.core.analysis_config import AnalysisConfig
+from writescore.utils.vocabulary_index import VOCABULARY_VERSION
+
+# Default maximum cache size on disk (bytes)
+DEFAULT_MAX_CACHE_BYTES = 512 * 1024 * 1024
+
+CACHE_FILENAME = "results.sqlite3"
+
+# AnalysisConfig fields that change what dimensions compute
+_KEY_CONFIG_FIELDS = (
+    "mode",
+    "sampling_sections",
+    "sampling_chars_per_section",
+    "sampling_strategy",
+    "max_text_length",
+    "dimension_overrides",
+    "enable_detailed_analysis",
+    "language_model_name",
+    "language_model_dtype",
+    "sentiment_max_paragraphs",
+    "sentiment_max_sentences",
+    "metaphor_max_sentences",
+)
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the default cache directory.
+
+    Returns:
+        $XDG_CACHE_HOME/writescore, or ~/.cache/writescore
+    """
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return base / "writescore"
+
+
+def compute_cache_key(
+    text: str,
+    config: AnalysisConfig,
+    dimension_names: Iterable[str],
+    parameter_version: Optional[str] = None,
+) -> str:
+    """
+    Compute the content-addressed key for a document analysis.
+
+    Args:
+        text: Analyzed text (after HTML comment stripping)
+        config: Analysis configuration
+        dimension_names: Names of loaded dimensions
+        parameter_version: Active scoring parameter version (None if unknown)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    config_fields = {}
+    for name in _KEY_CONFIG_FIELDS:
+        value = getattr(config, name, None)
+        config_fields[name] = getattr(value, "value", value)
+
+    descriptor = {
+        "writescore": __version__,
+        "parameters": parameter_version,
+        "vocabulary": VOCABULARY_VERSION,
+        "dimensions": sorted(dimension_names),
+        "config": config_fields,
+        "text": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+    }
+    encoded = json.dumps(descriptor, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def is_cacheable(dimension_results: Dict[str, Any]) -> bool:
+    """
+    Check whether dimension results are complete enough to cache.
+
+    Results with any dimension error (e.g., a model failed to load) are not
+    cached, so the next run retries them.
+
+    Args:
+        dimension_results: Raw per-dimension results
+
+    Returns:
+        True if no dimension reported an error
+    """
+    return not any(
+        isinstance(result, dict) and result.get("error") for result in dimension_results.values()
+    )
+
+
+class ResultCache:
+    """
+    SQLite-backed LRU cache of raw dimension results.
+
+    Safe to share between threads and between processes (batch workers):
+    each operation uses a short transaction and SQLite file locking.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        """
+        Open (or create) a cache.
+
+        Args:
+            cache_dir: Directory for the cache database (default: default_cache_dir())
+            max_bytes: Maximum total payload size before LRU eviction
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.path = self.cache_dir / CACHE_FILENAME
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema on first use."""
+        if not self._initialized:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results(accessed)")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER)"
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _bump(self, conn: sqlite3.Connection, counter: str) -> None:
+        """Increment a persistent hit/miss counter."""
+        conn.execute(
+            "INSERT INTO counters(name, value) VALUES (?, 1) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (counter,),
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached dimension results.
+
+        Args:
+            key: Key from compute_cache_key()
+
+        Returns:
+            Cached dimension results, or None on a miss
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT payload FROM results WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    self._bump(conn, "misses")
+                    conn.commit()
+                    return None
+                conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key))
+                self._bump(conn, "hits")
+                conn.commit()
+            finally:
+                conn.close()
+
+        try:
+            return pickle.loads(zlib.decompress(row[0]))
+        except Exception:
+            # Corrupt or incompatible entry - treat as a miss
+            self.delete(key)
+            return None
+
+    def put(self, key: str, dimension_results: Dict[str, Any]) -> None:
+        """
+        Store dimension results, evicting least recently used entries if needed.
+
+        Args:
+            key: Key from compute_cache_key()
+            dimension_results: Raw per-dimension results
+        """
+        try:
+            payload = zlib.compress(
+                pickle.dumps(dimension_results, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            print(f"Warning: could not cache analysis results: {e}", file=sys.stderr)
+            return
+        if len(payload) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results(key, payload, size, created, accessed) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, len(payload), now, now),
+                )
+                self._evict(conn)
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries until under max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute(
+            "SELECT key, size FROM results ORDER BY accessed ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+            self._bump(conn, "evictions")
+
+    def delete(self, key: str) -> None:
+        """Remove one entry."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                conn.commit()
+            finally:
+                conn.close()
+
+    def clear(self) -> int:
+        """
+        Remove all entries and reset counters.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                count = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+                conn.execute("DELETE FROM results")
+                conn.execute("DELETE FROM counters")
+                conn.commit()
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with path, entries, total_bytes, max_bytes, hits, misses, evictions
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                entries, total = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+                ).fetchone()
+                counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+            finally:
+                conn.close()
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "total_bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "evictions": counters.get("evictions", 0),
+        }
+
+
+_caches: Dict[str, ResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_result_cache(config: AnalysisConfig) -> Optional[ResultCache]:
+    """
+    Get the shared ResultCache configured by config, if caching is enabled.
+
+    Args:
+        config: Analysis configuration
+
+    Returns:
+        ResultCache, or None if config.use_result_cache is False
+    """
+    if not config.use_result_cache:
+        return None
+    cache_dir = Path(config.result_cache_dir) if config.result_cache_dir else default_cache_dir()
+    key = f"{cache_dir.resolve()}:{config.result_cache_max_bytes}"
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = ResultCache(cache_dir, max_bytes=config.result_cache_max_bytes)
+            _caches[key] = cache
+    return cache
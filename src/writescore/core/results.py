@@ -5,7 +5,7 @@ This module contains all dataclasses used to represent analysis results,
 detailed findings, and exception types.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Any, Dict, List, Optional, Tuple
 
 # ============================================================================
@@ -533,3 +533,28 @@ class AnalysisResults:
     overall_score: float = 0.0  # Numeric overall score (0-100)
     execution_time: float = 0.0  # Analysis execution time in seconds
     dimension_count: int = 0  # Number of dimensions analyzed - MUST be 12 in v5.0.0
+
+    # Analysis deadline (AnalysisConfig.max_analysis_time_seconds)
+    skipped_dimensions: List[str] = field(
+        default_factory=list
+    )  # Dimensions not analyzed before the deadline
+    deadline_exceeded: bool = False  # True if results are partial
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AnalysisResults":
+        """
+        Rebuild results from their asdict() / ``--format json`` form.
+
+        Keys that are not result fields (e.g. "analysis_mode") are ignored.
+
+        Args:
+            data: Dictionary produced by dataclasses.asdict(results)
+
+        Returns:
+            AnalysisResults equal to the original
+        """
+        values = {f.name: data[f.name] for f in fields(cls) if f.name in data}
+        for name in ("sentence_range", "paragraph_range"):
+            if isinstance(values.get(name), list):
+                values[name] = tuple(values[name])
+        return cls(**values)
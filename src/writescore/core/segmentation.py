@@ -0,0 +1,230 @@
+"""
+Shared paragraph, sentence and word segmentation of a document.
+
+Most dimensions need the same basic units: paragraphs (blank-line separated),
+sentences within paragraphs and word tokens. Splitting the text separately in
+every dimension repeats the same full-text regex passes; a SegmentedDocument
+computes each level once, on first use, and stores it as arrays of
+(start, end) character offsets into the original text. Strings are only
+materialized when asked for, and any offset maps back to its line number.
+
+AIPatternAnalyzer shares segmentations through the per-document
+DocumentContext (``document.get_segments(text)``), so every dimension
+analyzing the same (full, truncated or sampled) text gets the same object.
+Outside the analyzer, segment_text() builds one directly.
+
+Segmentation rules (kept identical to the splits the dimensions used):
+
+- Paragraphs: text split on blank lines (``\\n\\s*\\n``), each piece stripped
+  of surrounding whitespace, empty pieces dropped.
+- Sentences: each paragraph split on sentence punctuation followed by
+  whitespace (``[.!?]+\\s+``), pieces stripped, empty pieces dropped.
+- Words: maximal runs of word characters (``\\w+``, i.e. ``\\b\\w+\\b``).
+"""
+
+import re
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from writescore.core.document_context import DocumentContext
+
+PARAGRAPH_SEPARATOR = re.compile(r"\n\s*\n")
+SENTENCE_SEPARATOR = re.compile(r"[.!?]+\s+")
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def _stripped_spans(text: str, separator: "re.Pattern[str]", start: int, end: int) -> List[int]:
+    """
+    Split text[start:end] like re.split(), keeping stripped non-empty pieces.
+
+    Args:
+        text: Full text
+        separator: Separator regex
+        start: Region start offset
+        end: Region end offset
+
+    Returns:
+        Flat list of start, end offsets (into text) of the stripped pieces
+    """
+    spans = []
+    piece_start = start
+    for match in [*separator.finditer(text, start, end), None]:
+        piece_end = match.start() if match else end
+        piece = text[piece_start:piece_end]
+        stripped = piece.strip()
+        if stripped:
+            offset = piece_start + len(piece) - len(piece.lstrip())
+            spans.extend((offset, offset + len(stripped)))
+        if match:
+            piece_start = match.end()
+    return spans
+
+
+def _span_array(flat: List[int]) -> np.ndarray:
+    """Shape a flat offset list into an (n, 2) int64 array."""
+    return np.array(flat, dtype=np.int64).reshape(-1, 2)
+
+
+class SegmentedDocument:
+    """
+    Lazily computed paragraph, sentence and word spans of one text.
+
+    Span arrays have shape (n, 2) and hold [start, end) offsets into text.
+
+    Attributes:
+        text: Segmented text
+    """
+
+    def __init__(self, text: str):
+        """
+        Create a segmentation (nothing is split until requested).
+
+        Args:
+            text: Text to segment
+        """
+        self.text = text
+        self._line_starts: Optional[np.ndarray] = None
+        self._paragraph_spans: Optional[np.ndarray] = None
+        self._sentence_spans: Optional[np.ndarray] = None
+        self._sentence_paragraphs: Optional[np.ndarray] = None
+        self._word_spans: Optional[np.ndarray] = None
+        self._paragraphs: Optional[List[str]] = None
+
+    # ========================================================================
+    # SPANS
+    # ========================================================================
+
+    @property
+    def paragraph_spans(self) -> np.ndarray:
+        """(start, end) of each non-empty, stripped paragraph."""
+        if self._paragraph_spans is None:
+            self._paragraph_spans = _span_array(
+                _stripped_spans(self.text, PARAGRAPH_SEPARATOR, 0, len(self.text))
+            )
+        return self._paragraph_spans
+
+    @property
+    def sentence_spans(self) -> np.ndarray:
+        """(start, end) of each non-empty, stripped sentence, in text order."""
+        if self._sentence_spans is None:
+            flat: List[int] = []
+            paragraph_of: List[int] = []
+            for index, (start, end) in enumerate(self.paragraph_spans.tolist()):
+                spans = _stripped_spans(self.text, SENTENCE_SEPARATOR, start, end)
+                flat.extend(spans)
+                paragraph_of.extend([index] * (len(spans) // 2))
+            self._sentence_paragraphs = np.array(paragraph_of, dtype=np.int64)
+            self._sentence_spans = _span_array(flat)
+        return self._sentence_spans
+
+    @property
+    def sentence_paragraphs(self) -> np.ndarray:
+        """Index of the paragraph containing each sentence."""
+        if self._sentence_paragraphs is None:
+            self.sentence_spans  # noqa: B018 - computes both arrays
+        return self._sentence_paragraphs
+
+    @property
+    def word_spans(self) -> np.ndarray:
+        """(start, end) of each word token."""
+        if self._word_spans is None:
+            self._word_spans = _span_array(
+                [offset for match in WORD_PATTERN.finditer(self.text) for offset in match.span()]
+            )
+        return self._word_spans
+
+    # ========================================================================
+    # MATERIALIZED VIEWS
+    # ========================================================================
+
+    @property
+    def paragraphs(self) -> List[str]:
+        """Paragraph strings."""
+        if self._paragraphs is None:
+            self._paragraphs = self._slices(self.paragraph_spans)
+        return self._paragraphs
+
+    def paragraph_sentences(self, index: int) -> List[str]:
+        """
+        Get the sentences of one paragraph.
+
+        Args:
+            index: Paragraph index
+
+        Returns:
+            Sentence strings of that paragraph
+        """
+        spans = self.sentence_spans[self.sentence_paragraphs == index]
+        return self._slices(spans)
+
+    @property
+    def sentences(self) -> List[str]:
+        """Sentence strings of all paragraphs."""
+        return self._slices(self.sentence_spans)
+
+    @property
+    def word_count(self) -> int:
+        """Number of word tokens (len(re.findall(r"\\b\\w+\\b", text)))."""
+        return len(self.word_spans)
+
+    def _slices(self, spans: np.ndarray) -> List[str]:
+        """Materialize spans as strings."""
+        text = self.text
+        return [text[start:end] for start, end in spans.tolist()]
+
+    # ========================================================================
+    # LINE MAPPING
+    # ========================================================================
+
+    @property
+    def line_starts(self) -> np.ndarray:
+        """Offset at which each line starts."""
+        if self._line_starts is None:
+            starts = [0] + [match.end() for match in re.finditer("\n", self.text)]
+            self._line_starts = np.array(starts, dtype=np.int64)
+        return self._line_starts
+
+    def line_numbers(self, offsets: np.ndarray) -> np.ndarray:
+        """
+        Map character offsets to 1-based line numbers.
+
+        Args:
+            offsets: Offsets into text (e.g. paragraph_spans[:, 0])
+
+        Returns:
+            Line number of each offset
+        """
+        return np.searchsorted(self.line_starts, offsets, side="right")
+
+    def line_number(self, offset: int) -> int:
+        """
+        Map one character offset to its 1-based line number.
+
+        Args:
+            offset: Offset into text
+
+        Returns:
+            Line number
+        """
+        return int(self.line_numbers(np.array([offset]))[0])
+
+
+def segment_text(text: str, document: Optional["DocumentContext"] = None) -> SegmentedDocument:
+    """
+    Get the segmentation of text, shared through the document context if available.
+
+    Dimensions called outside AIPatternAnalyzer (e.g., directly in tests) have
+    no context; the text is then segmented directly.
+
+    Args:
+        text: Text to segment
+        document: Per-analysis DocumentContext, or None
+
+    Returns:
+        SegmentedDocument of text
+    """
+    if document is not None:
+        return document.get_segments(text)
+    return SegmentedDocument(text)
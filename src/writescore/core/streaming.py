@@ -0,0 +1,442 @@
+"""
+Streaming analysis for documents too large to hold in memory.
+
+In STREAMING mode the analyzer reads the markdown file incrementally and
+feeds bounded-size windows to every dimension. Windows end at blank lines
+outside fenced code, so paragraphs and code blocks are never cut unless a
+single block exceeds twice the window size. Each dimension folds its
+per-window results into a document-level result through a StreamAccumulator
+(see DimensionStrategy.create_stream_accumulator):
+
+- WindowFoldAccumulator (default) analyzes each window in FULL mode and
+  folds the results online, with the same semantics as
+  DimensionStrategy._aggregate_sampled_metrics() uses for samples.
+- Dimensions with additive metrics provide exact accumulators built from
+  RunningStats (Welford mean/variance) and DistinctSketch (type counts).
+
+Memory depends on the window size and accumulator bounds, not on the
+document size.
+"""
+
+import hashlib
+import heapq
+import io
+import math
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
+
+# Target window size (characters); windows end at the next paragraph boundary
+DEFAULT_WINDOW_CHARS = 20000
+
+# Maximum items kept for list metrics (flagged phrases, example sentences)
+DEFAULT_MAX_LIST_ITEMS = 1000
+
+# Distinct items counted exactly before DistinctSketch starts estimating
+DEFAULT_SKETCH_SIZE = 16384
+
+_COMMENT_START = "<!--"
+_COMMENT_END = "-->"
+
+
+class LineSource:
+    """
+    Document lines with progress tracking.
+
+    Iterating yields lines (with line endings); consumed/total report how
+    much of the input has been read, in bytes for files and characters for
+    in-memory text.
+    """
+
+    def __init__(self, lines: Iterable[Tuple[str, int]], total: int):
+        """
+        Args:
+            lines: Iterable of (line, size) pairs
+            total: Total input size (same unit as size)
+        """
+        self._lines = lines
+        self.total = total
+        self.consumed = 0
+
+    @classmethod
+    def from_file(cls, path: str) -> "LineSource":
+        """Read a UTF-8 file line by line (newlines normalized like text mode)."""
+        path_obj = Path(path)
+        return cls(_read_utf8_lines(path_obj), path_obj.stat().st_size)
+
+    @classmethod
+    def from_text(cls, text: str) -> "LineSource":
+        """Iterate the lines of in-memory text."""
+        return cls(((line, len(line)) for line in io.StringIO(text)), len(text))
+
+    def __iter__(self) -> Iterator[str]:
+        for line, size in self._lines:
+            self.consumed += size
+            yield line
+
+
+def _read_utf8_lines(path: Path) -> Iterator[Tuple[str, int]]:
+    """Yield (decoded line, byte length) pairs of a file."""
+    with open(path, "rb") as f:
+        for raw in f:
+            line = raw.decode("utf-8")
+            if line.endswith("\r\n"):
+                line = line[:-2] + "\n"
+            yield line, len(raw)
+
+
+def _strip_comment_spans(line: str, in_comment: bool) -> Tuple[str, bool]:
+    """
+    Remove HTML comments from one line, carrying state across lines.
+
+    Equivalent to removing "<!--.*?-->" (DOTALL) from the whole text.
+
+    Returns:
+        Tuple of (line without comments, whether a comment is still open)
+    """
+    if not in_comment and _COMMENT_START not in line:
+        return line, False
+
+    kept = []
+    position = 0
+    while position < len(line):
+        if in_comment:
+            end = line.find(_COMMENT_END, position)
+            if end == -1:
+                return "".join(kept), True
+            position = end + len(_COMMENT_END)
+            in_comment = False
+        else:
+            start = line.find(_COMMENT_START, position)
+            if start == -1:
+                kept.append(line[position:])
+                break
+            kept.append(line[position:start])
+            position = start + len(_COMMENT_START)
+            in_comment = True
+    return "".join(kept), in_comment
+
+
+def iter_windows(lines: Iterable[str], window_chars: int = DEFAULT_WINDOW_CHARS) -> Iterator[str]:
+    """
+    Split a stream of markdown lines into bounded-size windows.
+
+    HTML comments are removed. A window is emitted at the first blank line
+    outside fenced code after it reaches window_chars characters, or at any
+    line once it reaches twice that. Joining the windows gives the
+    comment-stripped text.
+
+    Args:
+        lines: Lines with line endings (e.g., a LineSource)
+        window_chars: Target window size in characters
+
+    Yields:
+        Window text
+    """
+    buffer: List[str] = []
+    size = 0
+    in_comment = False
+    in_fence = False
+
+    for line in lines:
+        line, in_comment = _strip_comment_spans(line, in_comment)
+        if not line:
+            continue
+        stripped = line.strip()
+        if stripped.startswith(("```", "~~~")):
+            in_fence = not in_fence
+
+        buffer.append(line)
+        size += len(line)
+
+        at_boundary = line.endswith("\n") and not stripped and not in_fence
+        if (size >= window_chars and at_boundary) or size >= 2 * window_chars:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+
+    if buffer:
+        yield "".join(buffer)
+
+
+class RunningStats:
+    """
+    Online mean and variance (Welford), mergeable across windows.
+
+    Matches statistics.mean() and statistics.stdev() (sample standard
+    deviation) on the same values, up to floating point rounding.
+    """
+
+    __slots__ = ("count", "mean", "_m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add several observations."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Fold in another accumulator (Chan et al. parallel update)."""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean, other._m2
+            self.min, self.max = other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 for fewer than two observations)."""
+        if self.count < 2:
+            return 0.0
+        return max(self._m2, 0.0) / (self.count - 1)
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
+
+
+class DistinctSketch:
+    """
+    Distinct-item counter with bounded memory (k-minimum-values sketch).
+
+    Counts are exact until more than k distinct items have been added;
+    beyond that the estimate has a relative standard error of about
+    1/sqrt(k). Hashes are stable across processes, so estimates are
+    reproducible.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_SIZE):
+        self.k = k
+        self._heap: List[int] = []  # Negated hashes: max-heap of the k smallest
+        self._members: set = set()
+
+    @staticmethod
+    def _hash(item: str) -> int:
+        return int.from_bytes(hashlib.blake2b(item.encode("utf-8"), digest_size=8).digest(), "big")
+
+    def add(self, item: str) -> None:
+        """Add one item."""
+        self._add_hash(self._hash(item))
+
+    def update(self, items: Iterable[str]) -> None:
+        """Add several items."""
+        for item in items:
+            self.add(item)
+
+    def merge(self, other: "DistinctSketch") -> None:
+        """Fold in another sketch (estimates the size of the union)."""
+        for negated in other._heap:
+            self._add_hash(-negated)
+
+    def _add_hash(self, value: int) -> None:
+        if value in self._members:
+            return
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, -value)
+            self._members.add(value)
+        elif value < -self._heap[0]:
+            evicted = -heapq.heapreplace(self._heap, -value)
+            self._members.discard(evicted)
+            self._members.add(value)
+
+    def estimate(self) -> int:
+        """Estimated number of distinct items."""
+        if len(self._heap) < self.k:
+            return len(self._heap)
+        kth_smallest = -self._heap[0]
+        return int(round((self.k - 1) * 2**64 / (kth_smallest + 1)))
+
+
+def _dedupe_key(item: Any) -> Any:
+    """Hashable identity of a list item (matches _aggregate_sampled_metrics)."""
+    if isinstance(item, (str, int, float, bool, tuple)):
+        return item
+    return str(item)
+
+
+class MetricFolder:
+    """
+    Online version of DimensionStrategy._aggregate_sampled_metrics().
+
+    Per key, by the type of the first non-None value: numbers are averaged,
+    booleans take the majority, strings the most common value, lists are
+    concatenated and deduplicated (keeping at most max_list_items), and
+    dicts are folded recursively.
+    """
+
+    def __init__(self, max_list_items: int = DEFAULT_MAX_LIST_ITEMS):
+        self.max_list_items = max_list_items
+        self._fields: Dict[str, Optional[list]] = {}
+
+    def add(self, metrics: Dict[str, Any]) -> None:
+        """Fold in one window's metrics."""
+        for key, value in metrics.items():
+            state = self._fields.get(key)
+            if value is None:
+                self._fields.setdefault(key, None)
+                continue
+            if state is None:
+                state = self._fields[key] = self._new_state(value)
+            self._fold(state, value)
+
+    def _new_state(self, value: Any) -> list:
+        if isinstance(value, bool):
+            return ["bool", 0, 0]
+        if isinstance(value, (int, float)):
+            return ["number", 0.0, 0]
+        if isinstance(value, str):
+            return ["str", Counter()]
+        if isinstance(value, list):
+            return ["list", [], set()]
+        if isinstance(value, dict):
+            return ["dict", MetricFolder(self.max_list_items)]
+        return ["first", value]
+
+    def _fold(self, state: list, value: Any) -> None:
+        kind = state[0]
+        if kind == "number" and isinstance(value, (int, float)):
+            state[1] += value
+            state[2] += 1
+        elif kind == "bool":
+            state[1] += 1 if value else 0
+            state[2] += 1
+        elif kind == "str" and isinstance(value, str):
+            state[1][value] += 1
+        elif kind == "list" and isinstance(value, list):
+            items, seen = state[1], state[2]
+            for item in value:
+                if len(items) >= self.max_list_items:
+                    break
+                item_key = _dedupe_key(item)
+                if item_key not in seen:
+                    items.append(item)
+                    seen.add(item_key)
+        elif kind == "dict" and isinstance(value, dict):
+            state[1].add(value)
+
+    def result(self) -> Dict[str, Any]:
+        """Get the folded metrics."""
+        folded: Dict[str, Any] = {}
+        for key, state in self._fields.items():
+            if state is None:
+                folded[key] = None
+                continue
+            kind = state[0]
+            if kind == "number":
+                folded[key] = state[1] / state[2]
+            elif kind == "bool":
+                folded[key] = state[1] > state[2] / 2
+            elif kind == "str":
+                folded[key] = state[1].most_common(1)[0][0]
+            elif kind == "list":
+                folded[key] = list(state[1])
+            elif kind == "dict":
+                folded[key] = state[1].result()
+            else:
+                folded[key] = state[1]
+        return folded
+
+
+class StreamAccumulator(ABC):
+    """
+    Folds one dimension's per-window analysis into a document result.
+
+    Subclasses implement _add() and _result(); result() adds the standard
+    analysis metadata.
+    """
+
+    def __init__(self, dimension, config: AnalysisConfig):
+        """
+        Args:
+            dimension: DimensionStrategy being accumulated
+            config: Analysis configuration (STREAMING mode)
+        """
+        self.dimension = dimension
+        self.config = config
+        self.windows = 0
+        self.total_length = 0
+
+    def add(self, window: str, **kwargs) -> None:
+        """
+        Analyze one window.
+
+        Args:
+            window: Window text (HTML comments already stripped)
+            **kwargs: Per-window analyze() keyword arguments (document, word_count)
+        """
+        self.windows += 1
+        self.total_length += len(window)
+        self._add(window, **kwargs)
+
+    def result(self) -> Dict[str, Any]:
+        """Get the document-level result, like analyze() on the whole text."""
+        return {
+            "available": True,
+            **self._result(),
+            "analysis_mode": self.config.mode.value,
+            "samples_analyzed": self.windows,
+            "total_text_length": self.total_length,
+            "analyzed_text_length": self.total_length,
+            "coverage_percentage": 100.0 if self.total_length > 0 else 0.0,
+        }
+
+    @abstractmethod
+    def _add(self, window: str, **kwargs) -> None:
+        """Fold one window's text into the accumulated state."""
+        pass
+
+    @abstractmethod
+    def _result(self) -> Dict[str, Any]:
+        """Get the accumulated metrics (without analysis metadata)."""
+        pass
+
+
+class WindowFoldAccumulator(StreamAccumulator):
+    """Analyzes each window in FULL mode and folds results with MetricFolder."""
+
+    def __init__(
+        self,
+        dimension,
+        config: AnalysisConfig,
+        max_list_items: int = DEFAULT_MAX_LIST_ITEMS,
+    ):
+        super().__init__(dimension, config)
+        self._window_config = replace(config, mode=AnalysisMode.FULL)
+        self._folder = MetricFolder(max_list_items)
+
+    def _add(self, window: str, **kwargs) -> None:
+        metrics = self.dimension.analyze(
+            window, window.splitlines(), config=self._window_config, **kwargs
+        )
+        self._folder.add(metrics)
+
+    def _result(self) -> Dict[str, Any]:
+        return self._folder.result()
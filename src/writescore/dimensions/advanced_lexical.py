@@ -11,27 +11,37 @@ Analyzes sophisticated lexical diversity metrics beyond basic Type-Token Ratio:
 Weight: 14.0% (second highest in ADVANCED tier)
 Tier: ADVANCED
 
-Requires dependencies: scipy, textacy, spacy
+Requires dependencies: scipy, spacy (English stop word list only)
+
+MATTR and RTTR are computed on interned token IDs (see utils.diversity); no
+spaCy parse is needed.
+
+HDD, Yule's K, Maas and concentration are computed from the word frequency
+spectrum (see utils.lexical_stats). Sampled and streamed analyses merge the
+spectra of all samples/windows, so these metrics cover every analyzed word
+rather than averaging per-sample values.
 
 Research: +8% accuracy improvement over basic TTR/MTLD metrics
 Refactored in Story 1.4.5 - Split from AdvancedDimension for single responsibility.
 """
 
-import math
 import re
 import sys
-from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple
 
-from scipy.stats import hypergeom
-from textacy.text_stats import diversity
-
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.streaming import MetricFolder, StreamAccumulator
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
-from writescore.utils import load_spacy_model
+from writescore.utils.diversity import TokenSequence
+from writescore.utils.lazy_import import lazy_import
+from writescore.utils.lexical_stats import FrequencySpectrum
+
+# Loaded on first analysis (the stop list only, no spaCy model)
+stop_words = lazy_import("spacy.lang.en.stop_words")
 
-nlp_spacy = load_spacy_model("en_core_web_sm")
+# Word tokens for MATTR/RTTR (contractions kept whole)
+WORD_TOKEN = re.compile(r"\w+(?:['’]\w+)*")
 
 
 class AdvancedLexicalDimension(DimensionStrategy):
@@ -108,7 +118,7 @@ class AdvancedLexicalDimension(DimensionStrategy):
             text: Full text content
             lines: Text split into lines (optional)
             config: Analysis configuration (None = ADAPTIVE)
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters (unused)
 
         Returns:
             Dict with advanced lexical analysis results + metadata:
@@ -136,14 +146,15 @@ class AdvancedLexicalDimension(DimensionStrategy):
         if isinstance(prepared, list):
             samples = prepared
             sample_results = []
+            pooled = FrequencySpectrum()
 
             for _position, sample_text in samples:
-                advanced_lexical = self._calculate_advanced_lexical_diversity(sample_text)
-                textacy_metrics = self._calculate_textacy_lexical_diversity(sample_text)
-                sample_results.append({**advanced_lexical, **textacy_metrics})
+                pooled.merge(self._word_spectrum(sample_text))
+                sample_results.append(self._calculate_mattr_rttr(sample_text))
 
-            # Aggregate metrics from all samples
+            # Aggregate MATTR/RTTR from all samples; spectrum metrics over all sampled words
             aggregated = self._aggregate_sampled_metrics(sample_results)
+            aggregated.update(self._spectrum_diversity(pooled))
             analyzed_length = sum(len(sample_text) for _, sample_text in samples)
             samples_analyzed = len(samples)
 
@@ -151,8 +162,8 @@ class AdvancedLexicalDimension(DimensionStrategy):
         else:
             analyzed_text = prepared
             advanced_lexical = self._calculate_advanced_lexical_diversity(analyzed_text)
-            textacy_metrics = self._calculate_textacy_lexical_diversity(analyzed_text)
-            aggregated = {**advanced_lexical, **textacy_metrics}
+            window_metrics = self._calculate_mattr_rttr(analyzed_text)
+            aggregated = {**advanced_lexical, **window_metrics}
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
 
@@ -169,6 +180,10 @@ class AdvancedLexicalDimension(DimensionStrategy):
             else 0.0,
         }
 
+    def create_stream_accumulator(self, config: AnalysisConfig) -> StreamAccumulator:
+        """Streaming analysis over merged word spectra (see AdvancedLexicalStreamAccumulator)."""
+        return AdvancedLexicalStreamAccumulator(self, config)
+
     # ========================================================================
     # SCORING METHODS - DimensionStrategy Contract
     # ========================================================================
@@ -243,7 +258,7 @@ class AdvancedLexicalDimension(DimensionStrategy):
 
         if not metrics.get("available", False):
             recommendations.append(
-                "Advanced lexical analysis unavailable. Install required dependencies: scipy, textacy, spacy."
+                "Advanced lexical analysis unavailable. Install required dependencies: scipy, spacy."
             )
             return recommendations
 
@@ -298,7 +313,7 @@ class AdvancedLexicalDimension(DimensionStrategy):
 
     def _calculate_advanced_lexical_diversity(self, text: str) -> Dict:
         """
-        Calculate advanced lexical diversity metrics using scipy.
+        Calculate advanced lexical diversity metrics from the word frequency spectrum.
 
         HDD (Hypergeometric Distribution D):
         - Most robust lexical diversity metric
@@ -312,97 +327,63 @@ class AdvancedLexicalDimension(DimensionStrategy):
 
         Research: +8% accuracy improvement over TTR/MTLD
         """
-        try:
-            # Remove code blocks and extract words
-            text = re.sub(r"```[\s\S]*?```", "", text)
-            words = re.findall(r"\b[a-z]{3,}\b", text.lower())
+        return self._spectrum_diversity(self._word_spectrum(text))
 
-            if len(words) < 50:
-                return {}  # Not enough text for reliable metrics
+    def _word_spectrum(self, text: str) -> FrequencySpectrum:
+        """Count the words (3+ letters, lowercase, outside code blocks) of a text."""
+        text = re.sub(r"```[\s\S]*?```", "", text)
+        return FrequencySpectrum.from_tokens(re.findall(r"\b[a-z]{3,}\b", text.lower()))
 
-            # Calculate word frequencies
-            word_freq = Counter(words)
-            N = len(words)  # Total tokens
-            V = len(word_freq)  # Unique tokens (types)
+    def _spectrum_diversity(self, spectrum: FrequencySpectrum) -> Dict:
+        """
+        Calculate HDD, Yule's K, Maas and vocabulary concentration.
 
-            # ============================================================
-            # 1. HDD (Hypergeometric Distribution D)
-            # ============================================================
-            # HDD = (sum of P(word drawn at least once in 42-token sample))
-            # More robust than TTR because it's sample-size independent
-            sample_size = 42  # Standard HDD sample size
-            if sample_size > N:
-                hdd_score = None
-            else:
-                hdd_sum = 0.0
-                for _word, count in word_freq.items():
-                    # Probability word is NOT drawn in sample
-                    # P(not drawn) = hypergeom.pmf(0, N, count, sample_size)
-                    prob_not_drawn = hypergeom.pmf(0, N, count, sample_size)
-                    # P(drawn at least once) = 1 - P(not drawn)
-                    prob_drawn = 1.0 - prob_not_drawn
-                    hdd_sum += prob_drawn
-
-                hdd_score = round(hdd_sum / sample_size, 3)
-
-            # ============================================================
-            # 2. Yule's K (Vocabulary Richness)
-            # ============================================================
-            # K = 10^4 * (M2 - M1) / M1^2
-            # where M1 = sum of frequencies, M2 = sum of (freq * (freq - 1))
-            M1 = N
-            M2 = sum(freq * (freq - 1) for freq in word_freq.values())
+        Args:
+            spectrum: Word frequency spectrum of the analyzed text
 
-            if M1 > 0:
-                yules_k = 10000 * (M2 - M1) / (M1**2)
-                yules_k = round(yules_k, 2)
-            else:
-                yules_k = None
-
-            # ============================================================
-            # 3. Maas (Length-Corrected TTR)
-            # ============================================================
-            # Maas = (log(N) - log(V)) / log(N)^2
-            # Less affected by text length than raw TTR
-            if N > 0 and V > 0:
-                maas_score = (math.log(N) - math.log(V)) / (math.log(N) ** 2)
-                maas_score = round(maas_score, 3)
-            else:
-                maas_score = None
+        Returns:
+            Dict of metrics (empty if fewer than 50 words)
+        """
+        try:
+            if spectrum.tokens < 50:
+                return {}  # Not enough text for reliable metrics
 
-            # ============================================================
-            # 4. Vocabulary Concentration (Zipfian Analysis)
-            # ============================================================
-            # Measure how concentrated vocabulary is in high-frequency words
-            # AI text tends to have higher concentration (more repetitive)
-            sorted_freqs = sorted(word_freq.values(), reverse=True)
-            top_10_percent = max(1, V // 10)
-            top_10_concentration = sum(sorted_freqs[:top_10_percent]) / N
+            # HDD = (sum of P(word drawn at least once in 42-token sample)) / 42
+            # More robust than TTR because it's sample-size independent
+            hdd_score = spectrum.hdd()
+            # K = 10^4 * (M2 - M1) / M1^2
+            yules_k = spectrum.yules_k()
+            # Maas = (log(N) - log(V)) / log(N)^2, less affected by length than raw TTR
+            maas_score = spectrum.maas()
+            # Share of the top 10% of types (AI text tends to be more concentrated)
+            concentration = spectrum.concentration()
 
             return {
-                "hdd_score": hdd_score,
-                "yules_k": yules_k,
-                "maas_score": maas_score,
-                "vocab_concentration": round(top_10_concentration, 3),
+                "hdd_score": round(hdd_score, 3) if hdd_score is not None else None,
+                "yules_k": round(yules_k, 2) if yules_k is not None else None,
+                "maas_score": round(maas_score, 3) if maas_score is not None else None,
+                "vocab_concentration": round(concentration, 3)
+                if concentration is not None
+                else None,
             }
         except Exception as e:
             print(f"Warning: Advanced lexical diversity calculation failed: {e}", file=sys.stderr)
             return {}
 
-    def _calculate_textacy_lexical_diversity(self, text: str) -> Dict:
+    def _calculate_mattr_rttr(self, text: str) -> Dict:
         """
-        Calculate MATTR and RTTR using textacy (Advanced lexical diversity metrics).
+        Calculate MATTR and RTTR from interned word tokens.
 
         NOTE: This method no longer truncates text - truncation/sampling
         is handled by caller via _prepare_text().
 
         MATTR (Moving Average Type-Token Ratio):
-        - Window size 100 (research-validated default)
+        - Window size 100 (research-validated default), 50 for short texts
         - AI: <0.65, Human: ≥0.70
         - 0.89 correlation with human judgments (McCarthy & Jarvis, 2010)
 
         RTTR (Root Type-Token Ratio):
-        - RTTR = Types / √Tokens
+        - RTTR = Types / √Tokens over alphabetic non-stop words
         - Length-independent measure
         - AI: <7.5, Human: ≥7.5
 
@@ -415,34 +396,24 @@ class AdvancedLexicalDimension(DimensionStrategy):
         try:
             # Remove code blocks for accurate text analysis
             text_clean = re.sub(r"```[\s\S]*?```", "", text)
+            sequence = TokenSequence(WORD_TOKEN.findall(text_clean.lower()))
 
-            # Process with spaCy (now processes full text, pre-truncated/sampled by caller)
-            doc = nlp_spacy(text_clean)
-
-            # Calculate MATTR (segment size 100 is research-validated)
-            # Using textacy's segmented_ttr with moving-avg variant (MATTR)
-            try:
-                mattr = diversity.segmented_ttr(doc, segment_size=100, variant="moving-avg")
-            except Exception as e:
-                # Fallback if text too short for segment size 100
-                print(
-                    f"Warning: MATTR calculation failed, trying smaller segment: {e}",
-                    file=sys.stderr,
-                )
-                try:
-                    # Try smaller segment size
-                    mattr = diversity.segmented_ttr(doc, segment_size=50, variant="moving-avg")
-                except Exception:
-                    mattr = 0.0
+            # Calculate MATTR (segment size 100 is research-validated;
+            # smaller segment if the text is too short)
+            mattr = sequence.mattr(100)
+            if mattr is None:
+                mattr = sequence.mattr(50)
+            if mattr is None:
+                mattr = 0.0
 
             # Calculate RTTR
-            # Count only alphabetic tokens for consistency
-            tokens = [token for token in doc if token.is_alpha and not token.is_stop]
-            types = {token.text.lower() for token in tokens}
-            n_tokens = len(tokens)
-            n_types = len(types)
-
-            rttr = n_types / (n_tokens**0.5) if n_tokens > 0 else 0.0
+            # Count only alphabetic non-stop tokens (stop test once per type)
+            content = sequence.select(
+                lambda word: word.isalpha() and word not in stop_words.STOP_WORDS
+            )
+            n_tokens = content.tokens
+            n_types = content.types
+            rttr = content.rttr()
 
             # Score MATTR (12 points max)
             if mattr >= 0.75:
@@ -476,7 +447,7 @@ class AdvancedLexicalDimension(DimensionStrategy):
                 "tokens": n_tokens,
             }
         except Exception as e:
-            print(f"Warning: Textacy lexical diversity calculation failed: {e}", file=sys.stderr)
+            print(f"Warning: MATTR/RTTR calculation failed: {e}", file=sys.stderr)
             return {
                 "available": False,
                 "mattr": 0.0,
@@ -488,6 +459,29 @@ class AdvancedLexicalDimension(DimensionStrategy):
             }
 
 
+class AdvancedLexicalStreamAccumulator(StreamAccumulator):
+    """
+    Streaming advanced lexical diversity.
+
+    The word frequency spectra of all windows are merged, so HDD, Yule's K,
+    Maas and concentration equal analyze() on the whole document (memory
+    grows with the vocabulary, not with the document). MATTR and RTTR are
+    computed per window and averaged.
+    """
+
+    def __init__(self, dimension: AdvancedLexicalDimension, config: AnalysisConfig):
+        super().__init__(dimension, config)
+        self.spectrum = FrequencySpectrum()
+        self._folder = MetricFolder()
+
+    def _add(self, window: str, **kwargs) -> None:
+        self.spectrum.merge(self.dimension._word_spectrum(window))
+        self._folder.add(self.dimension._calculate_mattr_rttr(window))
+
+    def _result(self) -> Dict[str, Any]:
+        return {**self._folder.result(), **self.dimension._spectrum_diversity(self.spectrum)}
+
+
 # Backward compatibility alias
 AdvancedLexicalAnalyzer = AdvancedLexicalDimension
 
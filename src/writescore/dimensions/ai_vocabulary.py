@@ -16,100 +16,29 @@ Weight: 3.0% of total score
 Tier: CORE
 """
 
-import re
 from typing import Any, Dict, List, Optional
 
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
 from writescore.core.results import VocabInstance
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
-from writescore.utils.text_processing import count_words
+from writescore.utils.vocabulary_index import AI_VOCABULARY_INDEX, VocabularyScan
+
+# Tier word lists and suggestions are views of the shared vocabulary index
+# (utils/vocabulary_index.py), which also holds each word's detected forms
 
 # Tier 1 - Extremely High AI Association (14 patterns, 3× weight)
-TIER_1_PATTERNS = [
-    "delve",
-    "robust",
-    "leverage",
-    "harness",
-    "underscore",
-    "holistic",
-    "myriad",
-    "plethora",
-    "quintessential",
-    "paramount",
-    "foster",
-    "realm",
-    "tapestry",
-    "embark",
-]
+TIER_1_PATTERNS = AI_VOCABULARY_INDEX.tier_words(1)
 
 # Tier 2 - High AI Association (12 patterns, 2× weight)
-TIER_2_PATTERNS = [
-    "revolutionize",
-    "game-changing",
-    "cutting-edge",
-    "pivotal",
-    "intricate",
-    "nuanced",
-    "multifaceted",
-    "comprehensive",
-    "innovative",
-    "transformative",
-    "seamless",
-    "dynamic",
-]
+TIER_2_PATTERNS = AI_VOCABULARY_INDEX.tier_words(2)
 
 # Tier 3 - Moderate AI Association (8 patterns, 1× weight)
-TIER_3_PATTERNS = [
-    "optimize",
-    "streamline",
-    "facilitate",
-    "enhance",
-    "mitigate",
-    "navigate",
-    "ecosystem",
-    "landscape",
-]
+TIER_3_PATTERNS = AI_VOCABULARY_INDEX.tier_words(3)
 
 # Human-friendly alternatives for each AI vocabulary word
 AI_VOCAB_ALTERNATIVES = {
-    # Tier 1
-    "delve": ["explore", "examine", "investigate", "look into"],
-    "robust": ["strong", "reliable", "sturdy", "solid"],
-    "leverage": ["use", "apply", "employ", "utilize"],
-    "harness": ["use", "employ", "channel", "direct"],
-    "underscore": ["emphasize", "highlight", "stress", "show"],
-    "holistic": ["comprehensive", "complete", "integrated", "whole"],
-    "myriad": ["many", "countless", "numerous", "various"],
-    "plethora": ["many", "abundance", "wealth", "plenty"],
-    "quintessential": ["typical", "classic", "perfect example", "ideal"],
-    "paramount": ["critical", "essential", "crucial", "vital"],
-    "foster": ["encourage", "promote", "support", "develop"],
-    "realm": ["area", "field", "domain", "sphere"],
-    "tapestry": ["collection", "mixture", "blend", "combination"],
-    "embark": ["start", "begin", "undertake", "initiate"],
-    # Tier 2
-    "revolutionize": ["transform", "change", "improve", "reshape"],
-    "game-changing": ["significant", "major", "important", "transformative"],
-    "cutting-edge": ["advanced", "modern", "latest", "new"],
-    "pivotal": ["key", "crucial", "important", "critical"],
-    "intricate": ["complex", "detailed", "elaborate", "complicated"],
-    "nuanced": ["subtle", "refined", "detailed", "complex"],
-    "multifaceted": ["complex", "varied", "diverse", "many-sided"],
-    "comprehensive": ["complete", "thorough", "full", "extensive"],
-    "innovative": ["new", "creative", "novel", "original"],
-    "transformative": ["significant", "major", "powerful", "impactful"],
-    "seamless": ["smooth", "easy", "straightforward", "effortless"],
-    "dynamic": ["changing", "active", "energetic", "flexible"],
-    # Tier 3
-    "optimize": ["improve", "enhance", "fine-tune", "refine"],
-    "streamline": ["simplify", "improve", "make efficient", "refine"],
-    "facilitate": ["enable", "help", "make easier", "support"],
-    "enhance": ["improve", "strengthen", "boost", "increase"],
-    "mitigate": ["reduce", "lessen", "minimize", "address"],
-    "navigate": ["move through", "handle", "deal with", "manage"],
-    "ecosystem": ["environment", "system", "network", "platform"],
-    "landscape": ["field", "area", "space", "domain"],
+    entry.word: list(entry.suggestions) for entry in AI_VOCABULARY_INDEX.entries
 }
 
 
@@ -355,12 +284,12 @@ class AiVocabularyDimension(DimensionStrategy):
         Returns:
             Dict with tier-weighted metrics
         """
-        word_count = count_words(text)
-
-        # Detect patterns for each tier
-        tier1_words = self._detect_tier_patterns(text, TIER_1_PATTERNS)
-        tier2_words = self._detect_tier_patterns(text, TIER_2_PATTERNS)
-        tier3_words = self._detect_tier_patterns(text, TIER_3_PATTERNS)
+        # One pass over the tokens yields the word count and every tier's words
+        scan = AI_VOCABULARY_INDEX.scan(text)
+        word_count = scan.word_count
+        tier1_words = self._detect_tier_patterns(text, TIER_1_PATTERNS, scan)
+        tier2_words = self._detect_tier_patterns(text, TIER_2_PATTERNS, scan)
+        tier3_words = self._detect_tier_patterns(text, TIER_3_PATTERNS, scan)
 
         # Calculate weighted count
         tier1_count = len(tier1_words)
@@ -387,65 +316,32 @@ class AiVocabularyDimension(DimensionStrategy):
             },
         }
 
-    def _detect_tier_patterns(self, text: str, tier_patterns: List[str]) -> List[str]:
+    def _detect_tier_patterns(
+        self,
+        text: str,
+        tier_patterns: List[str],
+        scan: Optional[VocabularyScan] = None,
+    ) -> List[str]:
         """
         Detect patterns for a specific tier.
 
         Args:
             text: Text to analyze
-            tier_patterns: List of pattern strings to detect
+            tier_patterns: Canonical words to detect
+            scan: AI_VOCABULARY_INDEX.scan(text), if already scanned
 
         Returns:
-            List of detected words
+            List of detected words, grouped by canonical word in tier order
         """
-        # Comprehensive pattern mappings for each base word
-        pattern_mappings = {
-            "delve": r"\bdelv(e|es|ing)\b",
-            "robust": r"\brobust(ness)?\b",
-            "leverage": r"\bleverag(e|es|ing)\b",
-            "harness": r"\bharness(es|ing)?\b",
-            "underscore": r"\bunderscore[sd]?\b|\bunderscoring\b",
-            "holistic": r"\bholistic(ally)?\b",
-            "myriad": r"\bmyriad\b",
-            "plethora": r"\bplethora\b",
-            "quintessential": r"\bquintessential\b",
-            "paramount": r"\bparamount\b",
-            "foster": r"\bfoster(s|ed|ing)?\b",
-            "realm": r"\brealm(s)?\b",
-            "tapestry": r"\btapestr(y|ies)\b",
-            "embark": r"\bembark(s|ed|ing)?\b",
-            "revolutionize": r"\brevolutioniz(e|es|ed|ing)\b",
-            "game-changing": r"\bgame-changing\b",
-            "cutting-edge": r"\bcutting-edge\b",
-            "pivotal": r"\bpivotal\b",
-            "intricate": r"\bintricate(ly)?\b",
-            "nuanced": r"\bnuanced?\b",
-            "multifaceted": r"\bmultifaceted\b",
-            "comprehensive": r"\bcomprehensive(ly)?\b",
-            "innovative": r"\binnovative(ly)?\b",
-            "transformative": r"\btransformative(ly)?\b",
-            "seamless": r"\bseamless(ly)?\b",
-            "dynamic": r"\bdynamic(ally|s)?\b",
-            "optimize": r"\boptimiz(e|es|ation|ing)\b",
-            "streamline": r"\bstreamlin(e|ed|ing)\b",
-            "facilitate": r"\bfacilitate[sd]?\b|\bfacilitating\b",
-            "enhance": r"\benhance(s|d|ment|ing)?\b",
-            "mitigate": r"\bmitigat(e|es|ed|ing|ion)\b",
-            "navigate": r"\bnavigat(e|es|ed|ing|ion)\b",
-            "ecosystem": r"\becosystem(s)?\b",
-            "landscape": r"\blandscape(s)?\b",
-        }
+        if scan is None:
+            scan = AI_VOCABULARY_INDEX.scan(text)
 
-        words_found = []
+        found: Dict[str, List[str]] = {word: [] for word in tier_patterns}
+        for hit in scan.hits:
+            if hit.entry.word in found:
+                found[hit.entry.word].append(text[hit.start : hit.end])
 
-        # Build regex patterns for tier words
-        for word in tier_patterns:
-            # Get comprehensive pattern or use simple fallback
-            pattern = pattern_mappings.get(word, rf"\b{word}(?:s|es|ed|ing)?\b")
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            words_found.extend([m.group() for m in matches])
-
-        return words_found
+        return [word for words in found.values() for word in words]
 
     def _aggregate_sampled_tier_metrics(self, sample_results: List[Dict]) -> Dict[str, Any]:
         """
@@ -521,6 +417,9 @@ class AiVocabularyDimension(DimensionStrategy):
         """
         Detect AI vocabulary with line numbers, context, and tier classification.
 
+        Reports every word in the vocabulary index, including untiered words
+        that are not scored.
+
         Args:
             lines: Text split into lines
             html_comment_checker: Function to check if line is in HTML comment
@@ -530,41 +429,28 @@ class AiVocabularyDimension(DimensionStrategy):
         """
         instances = []
 
-        for line_num, line in enumerate(lines, start=1):
+        def skip_line(line: str) -> bool:
             # Skip HTML comments, headings, and code blocks
             if html_comment_checker and html_comment_checker(line):
-                continue
-            if line.strip().startswith("#") or line.strip().startswith("```"):
-                continue
-
-            # Check all tiers
-            for _tier_num, tier_patterns in enumerate(
-                [TIER_1_PATTERNS, TIER_2_PATTERNS, TIER_3_PATTERNS], 1
-            ):
-                for word in tier_patterns:
-                    pattern = rf"\b{word}(?:s|es|ed|ing)?\b"
-                    for match in re.finditer(pattern, line, re.IGNORECASE):
-                        matched_word = match.group()
-                        # Extract context (20 chars each side)
-                        start = max(0, match.start() - 20)
-                        end = min(len(line), match.end() + 20)
-                        context = f"...{line[start:end]}..."
-
-                        # Get base word for suggestions
-                        base_word = word.lower()
-                        suggestions = AI_VOCAB_ALTERNATIVES.get(
-                            base_word, ["use simpler alternative"]
-                        )
-
-                        instances.append(
-                            VocabInstance(
-                                line_number=line_num,
-                                word=matched_word,
-                                context=context,
-                                full_line=line.strip(),
-                                suggestions=suggestions[:5],  # Top 5 suggestions
-                            )
-                        )
+                return True
+            return line.strip().startswith("#") or line.strip().startswith("```")
+
+        # One scan of the document, with each hit located by line
+        for line_num, line, hit in AI_VOCABULARY_INDEX.scan_lines(lines, skip_line):
+            # Extract context (20 chars each side)
+            start = max(0, hit.start - 20)
+            end = min(len(line), hit.end + 20)
+            context = f"...{line[start:end]}..."
+
+            instances.append(
+                VocabInstance(
+                    line_number=line_num,
+                    word=line[hit.start : hit.end],
+                    context=context,
+                    full_line=line.strip(),
+                    suggestions=list(hit.entry.suggestions[:5]),  # Top 5 suggestions
+                )
+            )
 
         return instances
 
@@ -20,6 +20,7 @@ from marko import Markdown
 
 # Configuration support
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
+from writescore.core.streaming import StreamAccumulator, WindowFoldAccumulator
 
 
 class DimensionTier(str, Enum):
@@ -296,6 +297,75 @@ class DimensionStrategy(ABC):
     # CONCRETE METHODS - Optional override in subclasses
     # ========================================================================
 
+    @property
+    def analysis_cost(self) -> int:
+        """
+        Relative cost of analyze(), used to schedule dimensions under a deadline.
+
+        AIPatternAnalyzer runs dimensions in ascending cost order, so when
+        AnalysisConfig.max_analysis_time_seconds runs out, the dimensions left
+        unanalyzed are the expensive model-based ones.
+
+        Returns:
+            int: 1 for regex/statistics dimensions (default); model-based
+                 dimensions return larger values (spaCy 3, embeddings 5, LMs 10)
+        """
+        return 1
+
+    @property
+    def shared_resources(self) -> Tuple[str, ...]:
+        """
+        Expensive per-document resources this dimension shares with others.
+
+        With concurrent dimension execution (AnalysisConfig.dimension_workers),
+        dimensions sharing a resource run one after another on the same worker,
+        so later ones reuse the first one's work instead of repeating it.
+
+        Returns:
+            Tuple[str, ...]: Resource names, e.g. ("spacy_doc",) or ("language_model",)
+                             Empty by default (dimension is independent)
+        """
+        return ()
+
+    @property
+    def uses_torch(self) -> bool:
+        """
+        Whether analyze() runs torch models.
+
+        Concurrent dimension execution divides torch intra-op threads between
+        the dimensions that run models, so they do not oversubscribe the cores.
+
+        Returns:
+            bool: False by default
+        """
+        return False
+
+    def clear_model_cache(self) -> None:
+        """
+        Release models this dimension holds (they reload on next use).
+
+        Long-lived processes (the analysis daemon) call this on every
+        registered dimension to free model RAM when idle. Dimensions that
+        keep no model reference need not override it.
+        """
+        return None
+
+    def prefetch(self, texts: List[str], config: Optional[AnalysisConfig] = None) -> None:
+        """
+        Warm shared model caches for documents that will be analyzed next.
+
+        Dataset analysis (core.batch.analyze_documents) calls this with a
+        batch of documents before analyzing them one by one, so model-based
+        dimensions can run their model over the whole batch at once; analyze()
+        then finds the results in the shared cache. Dimensions without a
+        batchable model need not override it.
+
+        Args:
+            texts: Texts of the upcoming documents
+            config: Analysis configuration they will be analyzed with
+        """
+        return None
+
     def get_impact_level(self, score: float) -> str:
         """
         Calculate impact level based on score gap from 100 (perfect).
@@ -407,6 +477,105 @@ class DimensionStrategy(ABC):
         """
         return []
 
+    # ========================================================================
+    # INCREMENTAL ANALYSIS (optional - see core.incremental)
+    # ========================================================================
+
+    def supports_incremental(self, text: str, config: Optional[AnalysisConfig] = None) -> bool:
+        """
+        Check whether analyze() on text can be rebuilt from per-section summaries.
+
+        Default implementation returns False. Dimensions that override it must
+        implement summarize_section() and merge_section_summaries() so that
+        merging the summaries of the sections from
+        core.incremental.split_sections() equals analyze() on the whole text.
+
+        Args:
+            text: Full text that would be analyzed
+            config: Analysis configuration
+
+        Returns:
+            bool: True if incremental analysis gives the same result as analyze()
+        """
+        return False
+
+    def summarize_section(
+        self, section: str, config: Optional[AnalysisConfig] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute a mergeable summary of one document section.
+
+        Summaries are cached per section, so they must be picklable and depend
+        only on the section text and config. A summary containing an "error"
+        key is not cached.
+
+        Args:
+            section: Section text (heading-delimited)
+            config: Analysis configuration
+
+        Returns:
+            Dict summary consumed by merge_section_summaries()
+        """
+        raise NotImplementedError(f"{self.dimension_name} does not support incremental analysis")
+
+    def merge_section_summaries(
+        self,
+        summaries: List[Dict[str, Any]],
+        text: str,
+        config: Optional[AnalysisConfig] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Build the analyze() result for the whole text from section summaries.
+
+        Args:
+            summaries: summarize_section() output for each section, in order
+            text: Full text (the concatenation of the sections)
+            config: Analysis configuration
+            **kwargs: Same keyword arguments analyze() receives
+
+        Returns:
+            Dict identical to analyze(text, config=config, **kwargs)
+        """
+        raise NotImplementedError(f"{self.dimension_name} does not support incremental analysis")
+
+    def _analyzes_full_text(self, text: str, config: Optional[AnalysisConfig] = None) -> bool:
+        """
+        Check whether _prepare_text() would return the full text (no truncation or sampling).
+
+        Args:
+            text: Full text content
+            config: Analysis configuration
+
+        Returns:
+            bool: True if the whole text is analyzed directly
+        """
+        config = config or DEFAULT_CONFIG
+        limit = config.get_effective_limit(self.dimension_name, len(text))
+        if limit is not None:
+            return limit >= len(text)
+        return not config.should_use_sampling(len(text))
+
+    # ========================================================================
+    # STREAMING ANALYSIS (optional - see core.streaming)
+    # ========================================================================
+
+    def create_stream_accumulator(self, config: AnalysisConfig) -> StreamAccumulator:
+        """
+        Create the accumulator that folds per-window results in STREAMING mode.
+
+        Default implementation analyzes each window in FULL mode and folds the
+        results (numbers averaged, lists concatenated). Dimensions whose
+        metrics are additive should override this with an exact accumulator.
+
+        Args:
+            config: Analysis configuration (STREAMING mode)
+
+        Returns:
+            StreamAccumulator for one document
+        """
+        return WindowFoldAccumulator(self, config)
+
     # ========================================================================
     # BACKWARD COMPATIBILITY METHODS
     # ========================================================================
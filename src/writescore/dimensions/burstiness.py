@@ -13,11 +13,27 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.document_context import DocumentContext
 from writescore.core.results import SentenceBurstinessIssue
+from writescore.core.segmentation import segment_text
+from writescore.core.streaming import DEFAULT_MAX_LIST_ITEMS, RunningStats, StreamAccumulator
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
 from writescore.scoring.dual_score import THRESHOLDS
 from writescore.utils.text_processing import safe_ratio
 
+# Sentence length classes in words (26-29 words fall in none of them)
+SHORT_SENTENCE_MAX_WORDS = 10
+MEDIUM_SENTENCE_MAX_WORDS = 25
+LONG_SENTENCE_MIN_WORDS = 30
+
+
+def count_length_classes(lengths: List[int]) -> Tuple[int, int, int]:
+    """Count short, medium and long sentences among sentence word counts."""
+    short = sum(1 for x in lengths if x <= SHORT_SENTENCE_MAX_WORDS)
+    medium = sum(1 for x in lengths if SHORT_SENTENCE_MAX_WORDS < x <= MEDIUM_SENTENCE_MAX_WORDS)
+    long = sum(1 for x in lengths if x >= LONG_SENTENCE_MIN_WORDS)
+    return short, medium, long
+
 
 class BurstinessDimension(DimensionStrategy):
     """
@@ -86,6 +102,7 @@ class BurstinessDimension(DimensionStrategy):
         """
         config = config or DEFAULT_CONFIG
         total_text_length = len(text)
+        document = kwargs.get("document")
 
         # Prepare text based on mode (FAST/ADAPTIVE/SAMPLING/FULL)
         prepared = self._prepare_text(text, config, self.dimension_name)
@@ -97,7 +114,7 @@ class BurstinessDimension(DimensionStrategy):
 
             for _position, sample_text in samples:
                 sentence_burst = self._analyze_sentence_burstiness(sample_text)
-                paragraph_var = self._analyze_paragraph_variation(sample_text)
+                paragraph_var = self._analyze_paragraph_variation(sample_text, document)
                 paragraph_cv = self._calculate_paragraph_cv(sample_text)
                 sample_results.append(
                     {
@@ -116,7 +133,7 @@ class BurstinessDimension(DimensionStrategy):
         else:
             analyzed_text = prepared
             sentence_burst = self._analyze_sentence_burstiness(analyzed_text)
-            paragraph_var = self._analyze_paragraph_variation(analyzed_text)
+            paragraph_var = self._analyze_paragraph_variation(analyzed_text, document)
             paragraph_cv = self._calculate_paragraph_cv(analyzed_text)
             aggregated = {
                 "sentence_burstiness": sentence_burst,
@@ -139,6 +156,73 @@ class BurstinessDimension(DimensionStrategy):
             else 0.0,
         }
 
+    # ========================================================================
+    # INCREMENTAL ANALYSIS - sentence and paragraph lengths merge exactly
+    # ========================================================================
+
+    def supports_incremental(self, text: str, config: Optional[AnalysisConfig] = None) -> bool:
+        """Incremental analysis applies whenever the full text is analyzed."""
+        return self._analyzes_full_text(text, config)
+
+    def summarize_section(
+        self, section: str, config: Optional[AnalysisConfig] = None
+    ) -> Dict[str, Any]:
+        """
+        Summarize one section as its sentence and paragraph word counts.
+
+        Args:
+            section: Section text
+            config: Analysis configuration (unused)
+
+        Returns:
+            Dict of length lists for merge_section_summaries()
+        """
+        return {
+            "sentence_lengths": self._sentence_lengths(section),
+            "paragraph_lengths": self._paragraph_word_counts(section),
+            "paragraph_cv_lengths": self._paragraph_cv_lengths(section),
+        }
+
+    def merge_section_summaries(
+        self,
+        summaries: List[Dict[str, Any]],
+        text: str,
+        config: Optional[AnalysisConfig] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Compute document burstiness from concatenated section length lists.
+
+        Args:
+            summaries: summarize_section() output for each section, in order
+            text: Full text
+            config: Analysis configuration
+            **kwargs: Additional parameters (unused)
+
+        Returns:
+            Dict identical to analyze() on the full text
+        """
+        config = config or DEFAULT_CONFIG
+
+        def merged(key: str) -> List[int]:
+            return [length for summary in summaries for length in summary[key]]
+
+        return {
+            "sentence_burstiness": self._sentence_length_stats(merged("sentence_lengths")),
+            "paragraph_variation": self._paragraph_length_stats(merged("paragraph_lengths")),
+            "paragraph_cv": self._paragraph_cv_stats(merged("paragraph_cv_lengths")),
+            "available": True,
+            "analysis_mode": config.mode.value,
+            "samples_analyzed": 1,
+            "total_text_length": len(text),
+            "analyzed_text_length": len(text),
+            "coverage_percentage": 100.0 if text else 0.0,
+        }
+
+    def create_stream_accumulator(self, config: AnalysisConfig) -> StreamAccumulator:
+        """Streaming analysis with exact Welford statistics (see BurstinessStreamAccumulator)."""
+        return BurstinessStreamAccumulator(self, config)
+
     def analyze_detailed(
         self, lines: List[str], html_comment_checker=None
     ) -> List[SentenceBurstinessIssue]:
@@ -302,6 +386,10 @@ class BurstinessDimension(DimensionStrategy):
 
     def _analyze_sentence_burstiness(self, text: str) -> Dict:
         """Analyze sentence length variation."""
+        return self._sentence_length_stats(self._sentence_lengths(text))
+
+    def _sentence_lengths(self, text: str) -> List[int]:
+        """Get word counts of prose sentences (headings, list markers and code excluded)."""
         # Remove headings and list markers for sentence analysis
         lines = []
         for line in text.splitlines():
@@ -330,6 +418,10 @@ class BurstinessDimension(DimensionStrategy):
                 if word_count > 0:  # Only count non-empty sentences
                     all_lengths.append(word_count)
 
+        return all_lengths
+
+    def _sentence_length_stats(self, all_lengths: List[int]) -> Dict:
+        """Summarize sentence word counts (mean, stdev, short/medium/long counts)."""
         if not all_lengths:
             return {
                 "total_sentences": 0,
@@ -343,9 +435,7 @@ class BurstinessDimension(DimensionStrategy):
                 "lengths": [],
             }
 
-        short = sum(1 for x in all_lengths if x <= 10)
-        medium = sum(1 for x in all_lengths if 11 <= x <= 25)
-        long = sum(1 for x in all_lengths if x >= 30)
+        short, medium, long = count_length_classes(all_lengths)
 
         return {
             "total_sentences": len(all_lengths),
@@ -359,9 +449,17 @@ class BurstinessDimension(DimensionStrategy):
             "lengths": all_lengths,
         }
 
-    def _analyze_paragraph_variation(self, text: str) -> Dict[str, Any]:
+    def _analyze_paragraph_variation(
+        self, text: str, document: Optional[DocumentContext] = None
+    ) -> Dict[str, Any]:
         """Analyze paragraph length variation."""
-        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+        return self._paragraph_length_stats(self._paragraph_word_counts(text, document))
+
+    def _paragraph_word_counts(
+        self, text: str, document: Optional[DocumentContext] = None
+    ) -> List[int]:
+        """Get word counts of prose paragraphs (headings and code blocks excluded)."""
+        paragraphs = segment_text(text, document).paragraphs
         # Filter out headings and code blocks
         para_words = []
         for para in paragraphs:
@@ -371,6 +469,10 @@ class BurstinessDimension(DimensionStrategy):
             if words:
                 para_words.append(len(words))
 
+        return para_words
+
+    def _paragraph_length_stats(self, para_words: List[int]) -> Dict[str, Any]:
+        """Summarize paragraph word counts."""
         if not para_words:
             return {"total_paragraphs": 0, "mean": 0, "stdev": 0, "min": 0, "max": 0}
 
@@ -393,6 +495,10 @@ class BurstinessDimension(DimensionStrategy):
         Returns:
             Dict with mean_length, stddev, cv, score, assessment, paragraph_count
         """
+        return self._paragraph_cv_stats(self._paragraph_cv_lengths(text))
+
+    def _paragraph_cv_lengths(self, text: str) -> List[int]:
+        """Get word counts of paragraphs with at least 10 words (headings and code excluded)."""
         # Split by double newlines to get paragraphs
         paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
 
@@ -411,20 +517,28 @@ class BurstinessDimension(DimensionStrategy):
             filtered_paragraphs.append(p)
 
         # Count words per paragraph
-        lengths = [len(p.split()) for p in filtered_paragraphs]
+        return [len(p.split()) for p in filtered_paragraphs]
 
+    def _paragraph_cv_stats(self, lengths: List[int]) -> Dict[str, Any]:
+        """Score the coefficient of variation of paragraph word counts."""
         if len(lengths) < 3:
+            return self._paragraph_cv_result(len(lengths), 0.0, 0.0)
+        return self._paragraph_cv_result(
+            len(lengths), statistics.mean(lengths), statistics.stdev(lengths)
+        )
+
+    def _paragraph_cv_result(self, count: int, mean_length: float, stddev: float) -> Dict[str, Any]:
+        """Score paragraph length mean and standard deviation (count = paragraphs)."""
+        if count < 3:
             return {
                 "mean_length": 0.0,
                 "stddev": 0.0,
                 "cv": 0.0,
                 "score": 10.0,  # Benefit of doubt for insufficient data
                 "assessment": "INSUFFICIENT_DATA",
-                "paragraph_count": len(lengths),
+                "paragraph_count": count,
             }
 
-        mean_length = statistics.mean(lengths)
-        stddev = statistics.stdev(lengths)
         cv = stddev / mean_length if mean_length > 0 else 0.0
 
         # Scoring based on research thresholds
@@ -443,7 +557,7 @@ class BurstinessDimension(DimensionStrategy):
             "cv": round(cv, 2),
             "score": score,
             "assessment": assessment,
-            "paragraph_count": len(lengths),
+            "paragraph_count": count,
         }
 
     def _analyze_burstiness_issues_detailed(
@@ -511,6 +625,81 @@ class BurstinessDimension(DimensionStrategy):
         return issues
 
 
+class BurstinessStreamAccumulator(StreamAccumulator):
+    """
+    Streaming burstiness with online sentence and paragraph length statistics.
+
+    Windows end at paragraph boundaries, so per-window length lists are
+    exactly the document's; their mean and standard deviation are
+    accumulated with Welford's algorithm instead of being kept in memory.
+    The "lengths" list holds only the first DEFAULT_MAX_LIST_ITEMS sentences.
+    """
+
+    def __init__(self, dimension: BurstinessDimension, config: AnalysisConfig):
+        super().__init__(dimension, config)
+        self.sentences = RunningStats()
+        self.short = 0
+        self.medium = 0
+        self.long = 0
+        self.lengths: List[int] = []
+        self.paragraphs = RunningStats()
+        self.cv_paragraphs = RunningStats()
+
+    def _add(self, window: str, **kwargs) -> None:
+        lengths = self.dimension._sentence_lengths(window)
+        self.sentences.update(lengths)
+        short, medium, long = count_length_classes(lengths)
+        self.short += short
+        self.medium += medium
+        self.long += long
+        self.lengths.extend(lengths[: DEFAULT_MAX_LIST_ITEMS - len(self.lengths)])
+
+        self.paragraphs.update(
+            self.dimension._paragraph_word_counts(window, kwargs.get("document"))
+        )
+        self.cv_paragraphs.update(self.dimension._paragraph_cv_lengths(window))
+
+    def _result(self) -> Dict[str, Any]:
+        sentences = self.sentences
+        if sentences.count:
+            sentence_burstiness = {
+                "total_sentences": sentences.count,
+                "mean": round(sentences.mean, 1),
+                "stdev": round(sentences.stdev, 1) if sentences.count > 1 else 0,
+                "min": sentences.min,
+                "max": sentences.max,
+                "short": self.short,
+                "medium": self.medium,
+                "long": self.long,
+                "lengths": self.lengths,
+            }
+        else:
+            sentence_burstiness = self.dimension._sentence_length_stats([])
+
+        paragraphs = self.paragraphs
+        if paragraphs.count:
+            paragraph_variation = {
+                "total_paragraphs": paragraphs.count,
+                "mean": round(paragraphs.mean, 1),
+                "stdev": round(paragraphs.stdev, 1) if paragraphs.count > 1 else 0,
+                "min": paragraphs.min,
+                "max": paragraphs.max,
+            }
+        else:
+            paragraph_variation = self.dimension._paragraph_length_stats([])
+
+        cv_paragraphs = self.cv_paragraphs
+        paragraph_cv = self.dimension._paragraph_cv_result(
+            cv_paragraphs.count, cv_paragraphs.mean, cv_paragraphs.stdev
+        )
+
+        return {
+            "sentence_burstiness": sentence_burstiness,
+            "paragraph_variation": paragraph_variation,
+            "paragraph_cv": paragraph_cv,
+        }
+
+
 # Backward compatibility alias
 BurstinessAnalyzer = BurstinessDimension
 
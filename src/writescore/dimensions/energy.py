@@ -20,15 +20,18 @@ import re
 import statistics
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.document_context import DocumentContext, parse_document
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
 from writescore.utils.lexicons import (
-    get_abstract_words,
+    abstract_mask,
     get_dynamic_verbs,
     get_static_verbs,
-    get_word_concreteness,
-    is_power_word,
+    lookup_concreteness,
+    power_word_mask,
 )
 
 # Lazy load spacy
@@ -36,13 +39,13 @@ _nlp = None
 
 
 def get_nlp():
-    """Lazy load spaCy model."""
+    """Lazy load the shared spaCy model."""
     global _nlp
     if _nlp is None:
-        from writescore.utils.spacy_loader import load_spacy_model
+        from writescore.utils.spacy_loader import get_spacy_model
 
         try:
-            _nlp = load_spacy_model("en_core_web_sm")
+            _nlp = get_spacy_model("en_core_web_sm")
         except OSError:
             # Model not installed, return None
             return None
@@ -96,6 +99,16 @@ class EnergyDimension(DimensionStrategy):
             "Analyzes writing dynamism: active voice, verb strength, concrete language, power words"
         )
 
+    @property
+    def analysis_cost(self) -> int:
+        """Return relative analysis cost (spaCy parse)."""
+        return 3
+
+    @property
+    def shared_resources(self) -> Tuple[str, ...]:
+        """Return resources shared with other dimensions (spaCy parse)."""
+        return ("spacy_doc",)
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -114,12 +127,14 @@ class EnergyDimension(DimensionStrategy):
             text: Full text content
             lines: Text split into lines (optional)
             config: Analysis configuration (None = current behavior)
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters including:
+                document (DocumentContext): Shared parse cache for this analysis
 
         Returns:
             Dict with energy analysis results
         """
         config = config or DEFAULT_CONFIG
+        document = kwargs.get("document")
         total_text_length = len(text)
 
         # Prepare text based on mode (FAST/ADAPTIVE/SAMPLING/FULL)
@@ -131,7 +146,7 @@ class EnergyDimension(DimensionStrategy):
             sample_results = []
 
             for _position, sample_text in samples:
-                energy_metrics = self._analyze_energy(sample_text)
+                energy_metrics = self._analyze_energy(sample_text, document)
                 sample_results.append({"energy": energy_metrics})
 
             # Aggregate metrics from all samples
@@ -142,7 +157,7 @@ class EnergyDimension(DimensionStrategy):
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            energy_metrics = self._analyze_energy(analyzed_text)
+            energy_metrics = self._analyze_energy(analyzed_text, document)
             aggregated = {"energy": energy_metrics}
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
@@ -311,7 +326,9 @@ class EnergyDimension(DimensionStrategy):
     # HELPER METHODS
     # ========================================================================
 
-    def _analyze_energy(self, text: str) -> Dict[str, Any]:
+    def _analyze_energy(
+        self, text: str, document: Optional[DocumentContext] = None
+    ) -> Dict[str, Any]:
         """
         Analyze all energy metrics for a text sample.
 
@@ -320,6 +337,7 @@ class EnergyDimension(DimensionStrategy):
 
         Args:
             text: Text to analyze
+            document: Shared parse cache (parses directly when None)
 
         Returns:
             Dict with energy metrics
@@ -330,12 +348,11 @@ class EnergyDimension(DimensionStrategy):
         if nlp is None:
             return self._analyze_energy_regex_fallback(text)
 
-        doc = nlp(text)
+        doc = parse_document(text, document, nlp)
 
         # Load lexicons (cached after first call)
         dynamic_verbs = get_dynamic_verbs()
         static_verbs = get_static_verbs()
-        abstract_words = get_abstract_words()
 
         # 1. Passive voice detection
         passive_count = 0
@@ -362,27 +379,17 @@ class EnergyDimension(DimensionStrategy):
         # Uses Brysbaert concreteness norms when available, fallback to curated list
         words = [token.text.lower() for token in doc if token.is_alpha]
         total_words = len(words)
-
-        # Try lexicon-based concreteness scoring first
-        concreteness_scores = []
-        abstract_count = 0
-        for w in words:
-            conc_score = get_word_concreteness(w)
-            if conc_score is not None:
-                concreteness_scores.append(conc_score)
-                if conc_score < 2.5:  # Below mid-point = abstract
-                    abstract_count += 1
-            elif w in abstract_words:  # Fallback to curated list
-                abstract_count += 1
+        abstract_count, power_count, concreteness_scores = self._score_words(words)
 
         abstract_ratio = abstract_count / total_words if total_words > 0 else 0.0
 
         # Calculate mean concreteness if we have scores
-        mean_concreteness = statistics.mean(concreteness_scores) if concreteness_scores else None
+        mean_concreteness = (
+            float(concreteness_scores.mean(dtype=np.float64)) if concreteness_scores.size else None
+        )
 
         # 4. Power words density
         # Uses Warriner dominance norms when available, fallback to curated list
-        power_count = sum(1 for w in words if is_power_word(w))
         power_density = power_count / total_words if total_words > 0 else 0.0
 
         # 5. Rhythm contrast (adjacent sentence length coefficient of variation)
@@ -429,7 +436,6 @@ class EnergyDimension(DimensionStrategy):
         # Load lexicons (cached after first call)
         dynamic_verbs = get_dynamic_verbs()
         static_verbs = get_static_verbs()
-        abstract_words = get_abstract_words()
 
         # Split into sentences
         sentences = re.split(r"[.!?]+", text)
@@ -456,22 +462,10 @@ class EnergyDimension(DimensionStrategy):
 
         dynamic_ratio = dynamic_count / total_verbs if total_verbs > 0 else 0.0
 
-        # Abstract language - check lexicon first, then fallback
-        abstract_count = 0
-        concreteness_scores = []
-        for w in words:
-            conc_score = get_word_concreteness(w)
-            if conc_score is not None:
-                concreteness_scores.append(conc_score)
-                if conc_score < 2.5:
-                    abstract_count += 1
-            elif w in abstract_words:
-                abstract_count += 1
+        # Abstract language and power words - lexicon first, then fallback
+        abstract_count, power_count, concreteness_scores = self._score_words(words)
 
         abstract_ratio = abstract_count / total_words if total_words > 0 else 0.0
-
-        # Power words - uses lexicon with fallback
-        power_count = sum(1 for w in words if is_power_word(w))
         power_density = power_count / total_words if total_words > 0 else 0.0
 
         # Rhythm contrast
@@ -497,14 +491,34 @@ class EnergyDimension(DimensionStrategy):
         }
 
         # Add concreteness score if available from Brysbaert norms
-        if concreteness_scores:
-            result["mean_concreteness"] = round(statistics.mean(concreteness_scores), 3)
+        if concreteness_scores.size:
+            mean_concreteness = float(concreteness_scores.mean(dtype=np.float64))
+            result["mean_concreteness"] = round(mean_concreteness, 3)
             result["concreteness_coverage"] = (
                 round(len(concreteness_scores) / total_words, 3) if total_words > 0 else 0.0
             )
 
         return result
 
+    def _score_words(self, words: List[str]) -> Tuple[int, int, np.ndarray]:
+        """
+        Score a token list against the concreteness and dominance lexicons.
+
+        Looks up all words at once; falls back to the curated abstract and
+        power word lists when the norms are unavailable.
+
+        Args:
+            words: Lowercase word tokens
+
+        Returns:
+            (abstract word count, power word count, concreteness scores of
+            the words found in the concreteness lexicon)
+        """
+        concreteness = lookup_concreteness(words)
+        abstract_count = int(np.count_nonzero(abstract_mask(words)))
+        power_count = int(np.count_nonzero(power_word_mask(words)))
+        return abstract_count, power_count, concreteness[~np.isnan(concreteness)]
+
     def _calculate_rhythm_contrast(self, sent_lengths: List[int]) -> float:
         """
         Calculate rhythm contrast as normalized mean absolute difference
@@ -36,18 +36,27 @@ Refactored in Story 2.1 to use DimensionStrategy pattern with self-registration.
 import os
 import re
 import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
-# Required NLP imports
-import nltk
-from nltk.corpus import wordnet as wn
-from nltk.tokenize import sent_tokenize, word_tokenize
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
 
-from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
+from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig, AnalysisMode
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.result_cache import default_cache_dir
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
+from writescore.utils.deadline import check_deadline
+from writescore.utils.embeddings import (
+    EmbeddingStore,
+    get_embedding_service,
+    get_embedding_store_for,
+    unit_rows,
+)
+from writescore.utils.lazy_import import lazy_import
+from writescore.utils.phrase_matcher import get_phrase_matcher, is_word_bounded
+
+# Required NLP imports (loaded on first analysis)
+nltk = lazy_import("nltk")
 
 # Technical literals - words that function metaphorically in general discourse
 # but literally in technical contexts (AC: 4)
@@ -199,6 +208,38 @@ DEFAULT_IDIOMS = [
 ]
 
 
+# Placeholder for a model that has not been requested yet
+_NOT_LOADED = object()
+
+# Semantic gap scoring: phrases closer than this to their literal definition
+# are treated as literal usage
+LITERAL_SIMILARITY_THRESHOLD = 0.7
+
+
+@lru_cache(maxsize=8192)
+def _literal_definition(word: str) -> Optional[str]:
+    """First WordNet definition of a (lowercase) word, or None if it has none."""
+    synsets = nltk.corpus.wordnet.synsets(word)
+    return synsets[0].definition() if synsets else None
+
+
+def semantic_gap_confidences(contextual: np.ndarray, literal: np.ndarray) -> np.ndarray:
+    """
+    Metaphor confidence from the semantic gap between paired embeddings.
+
+    Args:
+        contextual: Phrase embeddings, one row per candidate
+        literal: Literal definition embeddings, row-aligned with contextual
+
+    Returns:
+        Confidence 0.0-1.0 per row: 1 - cosine similarity, or 0.0 when the
+        phrase is close to its literal meaning
+    """
+    similarities = np.einsum("ij,ij->i", unit_rows(contextual), unit_rows(literal))
+    confidences = np.where(similarities < LITERAL_SIMILARITY_THRESHOLD, 1.0 - similarities, 0.0)
+    return np.clip(confidences, 0.0, 1.0)
+
+
 class FigurativeLanguageDimension(DimensionStrategy):
     """
     Analyzes figurative language dimension - metaphors, similes, idioms.
@@ -226,33 +267,22 @@ class FigurativeLanguageDimension(DimensionStrategy):
         """
         Initialize and self-register with dimension registry.
 
-        Performs one-time setup:
-        - Downloads NLTK WordNet data if not present (first run only)
-        - Loads sentence transformer model for metaphor detection
-        - Compiles regex patterns and loads lexicons
+        Compiles regex patterns and loads lexicons. NLTK data (downloaded if
+        not present, first run only) and the sentence transformer model are
+        set up on first use, so importing the dimension stays cheap.
 
-        Note: First run may take 30-60 seconds due to model downloads.
-        Subsequent runs are much faster (~2-5 seconds for initialization).
+        Note: First analysis may take 30-60 seconds due to model downloads.
         """
         super().__init__()
 
         # Self-register with registry (AC: 6)
         DimensionRegistry.register(self)
 
-        # Ensure NLTK resources are available (auto-download if needed)
-        # Following NLTK 3.9.2 best practices
-        self._setup_punkt()
-        self._setup_wordnet()
+        # NLTK resources are checked (and downloaded if needed) on first use
+        self._nltk_ready = False
 
-        # Load sentence transformer model for embedding-based metaphor detection
-        # Model: all-MiniLM-L6-v2 (lightweight, 384-dim embeddings)
-        # Performance: 2-5ms per sentence (CPU), <1ms (GPU)
-        # Note: First run downloads ~90MB model, subsequent runs load from cache
-        try:
-            self.model = SentenceTransformer("all-MiniLM-L6-v2")
-        except Exception as e:
-            print(f"Warning: Failed to load sentence transformer: {e}", file=sys.stderr)
-            self.model = None
+        # Sentence transformer model, loaded on first access of self.model
+        self._model: Any = _NOT_LOADED
 
         # Compile simile patterns (AC: 2)
         # Patterns detect explicit simile markers: "like", "as X as"
@@ -270,10 +300,54 @@ class FigurativeLanguageDimension(DimensionStrategy):
         self.ai_cliche_words = AI_CLICHE_WORDS
         self.formulaic_markers = FORMULAIC_MARKERS
 
+        # Compile lexicons into single-pass matchers (the idiom automaton is
+        # cached on disk per lexicon version)
+        self.idiom_matcher = get_phrase_matcher(self.idiom_lexicon, default_cache_dir())
+        self.cliche_matcher = get_phrase_matcher(
+            list(self.ai_cliche_words) + list(self.formulaic_markers)
+        )
+
     # ========================================================================
     # INITIALIZATION HELPERS
     # ========================================================================
 
+    @property
+    def model(self):
+        """
+        Sentence transformer for embedding-based metaphor detection (None if unavailable).
+
+        Model: all-MiniLM-L6-v2 (lightweight, 384-dim embeddings), shared with
+        semantic coherence through the process-wide embedding service.
+        Performance: 2-5ms per sentence (CPU), <1ms (GPU).
+        Note: First run downloads ~90MB model, subsequent runs load from cache.
+        """
+        if self._model is _NOT_LOADED:
+            try:
+                self._model = get_embedding_service().model
+            except Exception as e:
+                print(f"Warning: Failed to load sentence transformer: {e}", file=sys.stderr)
+                self._model = None
+        return self._model
+
+    @model.setter
+    def model(self, value) -> None:
+        self._model = value
+
+    def clear_model_cache(self) -> None:
+        """Forget the sentence transformer (reloaded on next access of self.model)."""
+        self._model = _NOT_LOADED
+
+    def _ensure_nltk_data(self) -> None:
+        """
+        Ensure NLTK resources are available on first use (auto-download if needed).
+
+        Following NLTK 3.9.2 best practices.
+        """
+        if not self._nltk_ready:
+            self._setup_punkt()
+            self._setup_wordnet()
+            self._nltk_ready = True
+
     def _setup_punkt(self) -> None:
         """
         Ensure NLTK punkt tokenizer data is available, downloading if necessary.
@@ -289,7 +363,7 @@ class FigurativeLanguageDimension(DimensionStrategy):
         """
         try:
             # Test if punkt_tab is accessible by tokenizing a test sentence
-            sent_tokenize("Test sentence.")
+            nltk.tokenize.sent_tokenize("Test sentence.")
         except LookupError:
             # punkt_tab not found - download it
             print("Downloading NLTK punkt tokenizer data (first run only)...", file=sys.stderr)
@@ -318,7 +392,7 @@ class FigurativeLanguageDimension(DimensionStrategy):
 
         try:
             # Test if WordNet is accessible
-            wn.synsets("test")
+            nltk.corpus.wordnet.synsets("test")
         except LookupError:
             # WordNet not found - download it
             print("Downloading NLTK WordNet data (first run only)...", file=sys.stderr)
@@ -328,7 +402,7 @@ class FigurativeLanguageDimension(DimensionStrategy):
                 print("✓ WordNet setup complete", file=sys.stderr)
 
                 # Verify installation
-                test_synsets = wn.synsets("test")
+                test_synsets = nltk.corpus.wordnet.synsets("test")
                 if not test_synsets:
                     print("Warning: WordNet downloaded but returned no results", file=sys.stderr)
             except Exception as e:
@@ -359,6 +433,16 @@ class FigurativeLanguageDimension(DimensionStrategy):
         """Return dimension description."""
         return "Detects figurative language patterns (metaphors, similes, idioms) to identify AI-generated content"
 
+    @property
+    def analysis_cost(self) -> int:
+        """Return relative analysis cost (sentence-transformer embeddings)."""
+        return 5
+
+    @property
+    def uses_torch(self) -> bool:
+        """Return True (runs torch models)."""
+        return True
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -399,7 +483,7 @@ class FigurativeLanguageDimension(DimensionStrategy):
             sample_results = []
 
             for _position, sample_text in samples:
-                fig_lang = self._analyze_figurative_patterns(sample_text)
+                fig_lang = self._analyze_figurative_patterns(sample_text, config)
                 sample_results.append({"figurative_language": fig_lang})
 
             # Aggregate metrics from all samples
@@ -410,7 +494,7 @@ class FigurativeLanguageDimension(DimensionStrategy):
         # Handle direct analysis
         else:
             analyzed_text = prepared
-            fig_lang = self._analyze_figurative_patterns(analyzed_text)
+            fig_lang = self._analyze_figurative_patterns(analyzed_text, config)
             aggregated = {"figurative_language": fig_lang}
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
@@ -428,7 +512,9 @@ class FigurativeLanguageDimension(DimensionStrategy):
             else 0.0,
         }
 
-    def _analyze_figurative_patterns(self, text: str) -> Dict[str, Any]:
+    def _analyze_figurative_patterns(
+        self, text: str, config: Optional[AnalysisConfig] = None
+    ) -> Dict[str, Any]:
         """
         Core figurative language analysis.
 
@@ -439,6 +525,7 @@ class FigurativeLanguageDimension(DimensionStrategy):
 
         Args:
             text: Text to analyze
+            config: Analysis configuration (selects the on-disk embedding cache)
 
         Returns:
             Dict with pattern detection results
@@ -451,13 +538,14 @@ class FigurativeLanguageDimension(DimensionStrategy):
         idioms = self._detect_idioms_lexicon(text)
 
         # Tier 3: Embedding-based metaphor detection
-        metaphors = self._detect_metaphors_embedding(text)
+        metaphors = self._detect_metaphors_embedding(text, config)
 
         # Calculate aggregate metrics
         total_figurative = len(similes) + len(metaphors) + len(idioms)
 
         # Calculate frequency per 1k words
-        words = word_tokenize(text)
+        self._ensure_nltk_data()
+        words = nltk.tokenize.word_tokenize(text)
         word_count = len(words)
         freq_per_1k = (total_figurative / word_count * 1000.0) if word_count > 0 else 0.0
 
@@ -512,7 +600,9 @@ class FigurativeLanguageDimension(DimensionStrategy):
 
         return similes
 
-    def _detect_metaphors_embedding(self, text: str) -> List[Dict[str, Any]]:
+    def _detect_metaphors_embedding(
+        self, text: str, config: Optional[AnalysisConfig] = None
+    ) -> List[Dict[str, Any]]:
         """
         Detect metaphors using embedding-based semantic gap analysis.
 
@@ -523,11 +613,16 @@ class FigurativeLanguageDimension(DimensionStrategy):
         4. Calculate cosine similarity - low similarity indicates metaphor
         5. Threshold: similarity < 0.4 suggests metaphorical usage
 
-        Performance: 2-5ms per sentence (CPU), <1ms (GPU)
+        Candidates for the whole text are collected first; unique phrases and
+        unique definitions are then embedded in one batch each (embeddings are
+        cached by text, so definitions are reused across documents) and scored
+        with one matrix operation.
+
         Expected accuracy: 83-90% (per 2024-2025 benchmarks)
 
         Args:
             text: Text to analyze
+            config: Analysis configuration (sentence limit, on-disk embedding cache)
 
         Returns:
             List of detected metaphors with semantic gap scores
@@ -535,46 +630,97 @@ class FigurativeLanguageDimension(DimensionStrategy):
         if self.model is None:
             return []
 
+        config = config or DEFAULT_CONFIG
         metaphors = []
 
         try:
-            # Tokenize text into sentences for context
-            sentences = sent_tokenize(text)
-
-            # Limit analysis to prevent performance issues
-            # Target: 6-12 seconds per 10k words
-            max_sentences = min(len(sentences), 50)
-
-            for sentence in sentences[:max_sentences]:
-                tokens = word_tokenize(sentence)
-
-                # Check adjacent word pairs for semantic mismatches
-                for i in range(len(tokens) - 1):
-                    # Skip very common words (articles, prepositions)
-                    if tokens[i].lower() in ["the", "a", "an", "of", "in", "on", "at"]:
-                        continue
-
-                    phrase = f"{tokens[i]} {tokens[i+1]}"
-
-                    # Check if this could be a metaphor
-                    if self._is_potential_metaphor(tokens[i], sentence):
-                        confidence = self._calculate_metaphor_confidence(phrase, tokens[i])
-
-                        if confidence > 0.6:
-                            metaphors.append(
-                                {
-                                    "phrase": phrase,
-                                    "type": "metaphor",
-                                    "confidence": round(confidence, 2),
-                                    "semantic_gap": round(1.0 - confidence, 2),
-                                }
-                            )
+            # Limit the scan outside FULL mode (target: 6-12 seconds per 10k words)
+            max_sentences = (
+                None if config.mode == AnalysisMode.FULL else config.metaphor_max_sentences
+            )
+            candidates = self._collect_metaphor_candidates(text, max_sentences)
+            confidences = self._metaphor_confidences(candidates, get_embedding_store_for(config))
+
+            for (phrase, _), confidence in zip(candidates, confidences):
+                if confidence > 0.6:
+                    metaphors.append(
+                        {
+                            "phrase": phrase,
+                            "type": "metaphor",
+                            "confidence": round(confidence, 2),
+                            "semantic_gap": round(1.0 - confidence, 2),
+                        }
+                    )
 
         except Exception as e:
             print(f"Warning: Metaphor detection failed: {e}", file=sys.stderr)
 
         return metaphors
 
+    def _collect_metaphor_candidates(
+        self, text: str, max_sentences: Optional[int] = None
+    ) -> List[Tuple[str, str]]:
+        """
+        Collect adjacent word pairs whose first word could be metaphorical.
+
+        Args:
+            text: Text to analyze
+            max_sentences: Sentences to scan (None = all)
+
+        Returns:
+            (phrase, literal definition of its first word) pairs in text order
+        """
+        # Tokenize text into sentences for context
+        self._ensure_nltk_data()
+        sentences = nltk.tokenize.sent_tokenize(text)
+        if max_sentences is not None:
+            sentences = sentences[:max_sentences]
+
+        candidates = []
+        for sentence in sentences:
+            check_deadline()
+            tokens = nltk.tokenize.word_tokenize(sentence)
+
+            # Check adjacent word pairs for semantic mismatches
+            for i in range(len(tokens) - 1):
+                # Skip very common words (articles, prepositions)
+                if tokens[i].lower() in ["the", "a", "an", "of", "in", "on", "at"]:
+                    continue
+
+                if self._is_potential_metaphor(tokens[i], sentence):
+                    definition = _literal_definition(tokens[i].lower())
+                    if definition is not None:
+                        candidates.append((f"{tokens[i]} {tokens[i + 1]}", definition))
+        return candidates
+
+    def _metaphor_confidences(
+        self, candidates: List[Tuple[str, str]], store: Optional[EmbeddingStore] = None
+    ) -> List[float]:
+        """
+        Score candidates by the semantic gap between phrase and literal definition.
+
+        Args:
+            candidates: (phrase, literal definition) pairs
+            store: Optional on-disk embedding cache
+
+        Returns:
+            Confidence 0.0-1.0 per candidate (higher = more likely metaphorical)
+        """
+        if not candidates:
+            return []
+
+        phrases = list(dict.fromkeys(phrase for phrase, _ in candidates))
+        definitions = list(dict.fromkeys(definition for _, definition in candidates))
+        service = get_embedding_service()
+        phrase_units = unit_rows(service.encode(phrases, store=store))
+        definition_units = unit_rows(service.encode(definitions, store=store))
+
+        phrase_rows = {phrase: row for row, phrase in enumerate(phrases)}
+        definition_rows = {definition: row for row, definition in enumerate(definitions)}
+        contextual = phrase_units[[phrase_rows[phrase] for phrase, _ in candidates]]
+        literal = definition_units[[definition_rows[definition] for _, definition in candidates]]
+        return semantic_gap_confidences(contextual, literal).tolist()
+
     def _is_potential_metaphor(self, word: str, context: str) -> bool:
         """
         Check if word could be used metaphorically in context.
@@ -589,7 +735,8 @@ class FigurativeLanguageDimension(DimensionStrategy):
             bool: True if word could be metaphorical
         """
         try:
-            synsets = wn.synsets(word.lower())
+            self._ensure_nltk_data()
+            synsets = nltk.corpus.wordnet.synsets(word.lower())
 
             if not synsets:
                 return False
@@ -601,7 +748,9 @@ class FigurativeLanguageDimension(DimensionStrategy):
         except Exception:
             return False
 
-    def _calculate_metaphor_confidence(self, phrase: str, base_word: str) -> float:
+    def _calculate_metaphor_confidence(
+        self, phrase: str, base_word: str, store: Optional[EmbeddingStore] = None
+    ) -> float:
         """
         Calculate confidence that phrase is metaphorical.
 
@@ -610,6 +759,7 @@ class FigurativeLanguageDimension(DimensionStrategy):
         Args:
             phrase: Phrase to analyze
             base_word: Base word to get literal definition
+            store: Optional on-disk embedding cache
 
         Returns:
             float: Confidence score 0.0-1.0 (higher = more likely metaphorical)
@@ -618,27 +768,12 @@ class FigurativeLanguageDimension(DimensionStrategy):
             return 0.0
 
         try:
-            # Get contextual embedding
-            contextual_emb = self.model.encode(phrase)
-
             # Get literal definition from WordNet
-            synsets = wn.synsets(base_word.lower())
-            if not synsets:
+            self._ensure_nltk_data()
+            literal_def = _literal_definition(base_word.lower())
+            if literal_def is None:
                 return 0.0
-
-            literal_def = synsets[0].definition()
-            literal_emb = self.model.encode(literal_def)
-
-            # Calculate semantic gap (cosine similarity)
-            similarity = float(
-                cosine_similarity(contextual_emb.reshape(1, -1), literal_emb.reshape(1, -1))[0][0]
-            )
-
-            # Low similarity = high metaphorical usage
-            # Invert similarity to get confidence
-            confidence = 1.0 - similarity if similarity < 0.7 else 0.0
-
-            return float(max(0.0, min(1.0, confidence)))
+            return self._metaphor_confidences([(phrase, literal_def)], store)[0]
 
         except Exception:
             return 0.0
@@ -658,11 +793,13 @@ class FigurativeLanguageDimension(DimensionStrategy):
         Returns:
             List of detected idioms with confidence scores
         """
-        text_lower = text.lower()
+        # One pass over the text finds every lexicon idiom with its positions
+        occurrences = self.idiom_matcher.occurrences(text)
         idioms = []
 
         for idiom_pattern in self.idiom_lexicon:
-            if idiom_pattern.lower() in text_lower:
+            spans = occurrences.get(idiom_pattern.lower())
+            if spans:
                 # Get base confidence from lexicon tier
                 metadata = getattr(self, "idiom_metadata", {}).get(idiom_pattern.lower(), {})
                 base_confidence = metadata.get("confidence", 0.8)
@@ -670,7 +807,7 @@ class FigurativeLanguageDimension(DimensionStrategy):
 
                 # Verify not used literally via surrounding context
                 # Domain-tier idioms get special handling (always idiomatic in technical contexts)
-                context_confidence = self._check_idiom_context(text, idiom_pattern, tier)
+                context_confidence = self._check_idiom_context(text, idiom_pattern, tier, spans)
 
                 # Combine base confidence with context confidence
                 final_confidence = base_confidence * context_confidence
@@ -688,7 +825,13 @@ class FigurativeLanguageDimension(DimensionStrategy):
 
         return idioms
 
-    def _check_idiom_context(self, text: str, idiom: str, tier: str = "extended") -> float:
+    def _check_idiom_context(
+        self,
+        text: str,
+        idiom: str,
+        tier: str = "extended",
+        spans: Optional[List[Tuple[int, int]]] = None,
+    ) -> float:
         """
         Determine if idiom is used figuratively vs. literally.
 
@@ -712,18 +855,21 @@ class FigurativeLanguageDimension(DimensionStrategy):
             text: Full text
             idiom: Idiom phrase to check
             tier: Idiom tier ('core', 'extended', 'domain')
+            spans: (start, end) of every occurrence of the idiom, from the idiom
+                matcher (None = search the text)
 
         Returns:
             float: Confidence score 0.0-1.0 (>0.5 = likely figurative)
         """
-        # Find idiom position in text
-        idiom_match = re.search(re.escape(idiom), text, re.IGNORECASE)
-        if not idiom_match:
+        # Find idiom positions in text
+        if spans is None:
+            spans = [match.span() for match in re.finditer(re.escape(idiom), text, re.IGNORECASE)]
+        if not spans:
             return 0.0
 
-        # Extract context window (50 chars before/after)
-        start_pos = max(0, idiom_match.start() - 50)
-        end_pos = min(len(text), idiom_match.end() + 50)
+        # Extract context window (50 chars before/after the first occurrence)
+        start_pos = max(0, spans[0][0] - 50)
+        end_pos = min(len(text), spans[0][1] + 50)
         context_window = text[start_pos:end_pos].lower()
 
         # Default confidence (assume figurative)
@@ -737,7 +883,11 @@ class FigurativeLanguageDimension(DimensionStrategy):
                 confidence -= 0.3
 
         # Check for quotation marks (metalinguistic usage)
-        if f'"{idiom}"' in text or f"'{idiom}'" in text:
+        if any(
+            text[start:end] == idiom and text[start - 1 : start] == quote == text[end : end + 1]
+            for start, end in spans
+            for quote in ('"', "'")
+        ):
             confidence -= 0.4
 
         # Check technical literals exception list
@@ -868,27 +1018,26 @@ class FigurativeLanguageDimension(DimensionStrategy):
         Returns:
             List of detected clichés with multipliers
         """
-        text_lower = text.lower()
+        # One pass over the text finds cliché words and formulaic markers
+        occurrences = self.cliche_matcher.occurrences(text)
         cliches = []
 
-        # Check individual words
+        # Check individual words (whole words only)
         for word, multiplier in self.ai_cliche_words.items():
-            pattern = r"\b" + re.escape(word) + r"\b"
-            matches = list(re.finditer(pattern, text_lower))
-
-            for match in matches:
-                cliches.append(
-                    {
-                        "phrase": word,
-                        "type": "ai_cliche",
-                        "multiplier": multiplier,
-                        "position": match.start(),
-                    }
-                )
+            for start, end in occurrences.get(word, []):
+                if is_word_bounded(text, start, end):
+                    cliches.append(
+                        {
+                            "phrase": word,
+                            "type": "ai_cliche",
+                            "multiplier": multiplier,
+                            "position": start,
+                        }
+                    )
 
         # Check formulaic markers
         for marker in self.formulaic_markers:
-            if marker in text_lower:
+            if marker in occurrences:
                 cliches.append({"phrase": marker, "type": "formulaic", "multiplier": 2.0})
 
         return cliches
@@ -19,7 +19,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.document_context import DocumentContext
 from writescore.core.results import EmDashInstance, FormattingIssue
+from writescore.core.segmentation import segment_text
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
 from writescore.scoring.dual_score import THRESHOLDS
 from writescore.utils.text_processing import count_words
@@ -93,6 +95,7 @@ class FormattingDimension(DimensionStrategy):
         """
         config = config or DEFAULT_CONFIG
         total_text_length = len(text)
+        document = kwargs.get("document")
 
         # Prepare text based on mode (FAST/ADAPTIVE/SAMPLING/FULL)
         prepared = self._prepare_text(text, config, self.dimension_name)
@@ -104,7 +107,7 @@ class FormattingDimension(DimensionStrategy):
 
             for _position, sample_text in samples:
                 formatting = self._analyze_formatting(sample_text)
-                bold_italic = self._analyze_bold_italic_patterns(sample_text)
+                bold_italic = self._analyze_bold_italic_patterns(sample_text, document)
                 list_usage = self._analyze_list_usage(sample_text)
                 punctuation = self._analyze_punctuation_clustering(sample_text)
                 whitespace = self._analyze_whitespace_patterns(sample_text)
@@ -129,7 +132,7 @@ class FormattingDimension(DimensionStrategy):
         else:
             analyzed_text = prepared
             formatting = self._analyze_formatting(analyzed_text)
-            bold_italic = self._analyze_bold_italic_patterns(analyzed_text)
+            bold_italic = self._analyze_bold_italic_patterns(analyzed_text, document)
             list_usage = self._analyze_list_usage(analyzed_text)
             punctuation = self._analyze_punctuation_clustering(analyzed_text)
             whitespace = self._analyze_whitespace_patterns(analyzed_text)
@@ -390,7 +393,9 @@ class FormattingDimension(DimensionStrategy):
 
         return {"em_dashes": em_dashes, "bold": bold, "italics": italic}
 
-    def _analyze_bold_italic_patterns(self, text: str) -> Dict:
+    def _analyze_bold_italic_patterns(
+        self, text: str, document: Optional[DocumentContext] = None
+    ) -> Dict:
         """
         Analyze bold/italic formatting distribution patterns.
 
@@ -411,7 +416,7 @@ class FormattingDimension(DimensionStrategy):
 
         # Calculate formatting consistency (spacing between bold/italic)
         # AI tends to use formatting at regular intervals
-        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+        paragraphs = segment_text(text, document).paragraphs
         formatting_per_para = []
         for para in paragraphs:
             para_bold = len(re.findall(r"\*\*[^*]+\*\*|__[^_]+__", para))
@@ -16,17 +16,17 @@ Refactored in Story 1.4 to use DimensionStrategy pattern with self-registration.
 
 import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple
-
-import nltk
-from nltk.stem import PorterStemmer
-
-# Required imports
-from nltk.tokenize import word_tokenize
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.streaming import DistinctSketch, StreamAccumulator
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
+from writescore.utils.diversity import MTLD_THRESHOLD, TokenSequence, porter_stem
+from writescore.utils.lazy_import import lazy_import
+
+# Required imports (loaded on first analysis)
+nltk = lazy_import("nltk")
 
 
 class LexicalDimension(DimensionStrategy):
@@ -46,8 +46,8 @@ class LexicalDimension(DimensionStrategy):
         super().__init__()
         # Self-register with registry
         DimensionRegistry.register(self)
-        # Ensure NLTK punkt tokenizer is available
-        self._setup_punkt()
+        # NLTK punkt tokenizer availability is checked on first tokenization
+        self._punkt_ready = False
 
     # ========================================================================
     # REQUIRED PROPERTIES - DimensionStrategy Contract
@@ -92,7 +92,7 @@ class LexicalDimension(DimensionStrategy):
         """
         try:
             # Test if punkt_tab is accessible by tokenizing a test word
-            word_tokenize("test")
+            nltk.tokenize.word_tokenize("test")
         except LookupError:
             # punkt_tab not found - download it
             print("Downloading NLTK punkt tokenizer data (first run only)...", file=sys.stderr)
@@ -186,6 +186,10 @@ class LexicalDimension(DimensionStrategy):
         text = "n".join(lines)
         return self.analyze(text, lines)
 
+    def create_stream_accumulator(self, config: AnalysisConfig) -> StreamAccumulator:
+        """Streaming analysis with type-count sketches (see LexicalStreamAccumulator)."""
+        return LexicalStreamAccumulator(self, config)
+
     def score(self, analysis_results: Dict[str, Any]) -> tuple:
         """
         Calculate lexical diversity score.
@@ -333,10 +337,7 @@ class LexicalDimension(DimensionStrategy):
 
     def _analyze_lexical_diversity(self, text: str) -> Dict:
         """Calculate Type-Token Ratio (lexical diversity)."""
-        # Remove code blocks
-        text = re.sub(r"```[sS]*?```", "", text)
-        # Get all words (lowercase for uniqueness)
-        words = [w.lower() for w in re.findall(r"\b[\w'-]+\b", text)]
+        words = self._ttr_words(text)
 
         if not words:
             return {"unique": 0, "diversity": 0.0}
@@ -346,65 +347,134 @@ class LexicalDimension(DimensionStrategy):
 
         return {"unique": unique, "diversity": round(diversity, 3)}
 
+    def _ttr_words(self, text: str) -> List[str]:
+        """Get lowercase words for the type-token ratio."""
+        # Remove code blocks
+        text = re.sub(r"```[sS]*?```", "", text)
+        # Get all words (lowercase for uniqueness)
+        return [w.lower() for w in re.findall(r"\b[\w'-]+\b", text)]
+
+    def _nltk_words(self, text: str) -> List[str]:
+        """Get lowercase alphanumeric NLTK word tokens."""
+        # Remove code blocks
+        text = re.sub(r"```[sS]*?```", "", text)
+
+        # Tokenize (ensuring the NLTK punkt tokenizer is available)
+        if not self._punkt_ready:
+            self._setup_punkt()
+            self._punkt_ready = True
+        words = nltk.tokenize.word_tokenize(text.lower())
+        return [w for w in words if w.isalnum()]  # Keep only alphanumeric
+
     def _analyze_nltk_lexical(self, text: str) -> Dict:
         """Enhanced lexical diversity using NLTK."""
         try:
-            # Remove code blocks
-            text = re.sub(r"```[sS]*?```", "", text)
-
-            # Tokenize
-            words = word_tokenize(text.lower())
-            words = [w for w in words if w.isalnum()]  # Keep only alphanumeric
+            words = self._nltk_words(text)
 
             if not words:
                 return {}
 
+            # Intern tokens once; MTLD and stemmed diversity share the IDs
+            sequence = TokenSequence(words)
+
             # Calculate MTLD (Moving Average Type-Token Ratio)
             # This is more accurate than simple TTR for longer texts
-            mtld = self._calculate_mtld(words)
+            mtld = self._calculate_mtld(sequence)
 
             # Calculate stemmed diversity (catches word variants)
-            stemmer = PorterStemmer()
-            stemmed = [stemmer.stem(w) for w in words]
-            stemmed_unique = len(set(stemmed))
-            stemmed_diversity = stemmed_unique / len(stemmed) if stemmed else 0
+            stemmed_diversity = sequence.stemmed_ttr()
 
             return {"mtld_score": round(mtld, 2), "stemmed_diversity": round(stemmed_diversity, 3)}
         except Exception as e:
             print(f"Warning: NLTK lexical analysis failed: {e}", file=sys.stderr)
             return {}
 
-    def _calculate_mtld(self, words: List[str], threshold: float = 0.72) -> float:
+    def _calculate_mtld(
+        self, words: Union[List[str], TokenSequence], threshold: float = MTLD_THRESHOLD
+    ) -> float:
         """Calculate Moving Average Type-Token Ratio (MTLD)."""
-        if len(words) < 50:
-            return len(set(words)) / len(words) * 100  # Fallback to TTR
-
-        def _mtld_direction(words_list):
-            factor = 0
-            factor_lengths = []
-            types_seen = set()
-            tokens = 0
-
-            for word in words_list:
-                tokens += 1
-                types_seen.add(word)
-                if len(types_seen) / tokens < threshold:
-                    factor += 1
-                    factor_lengths.append(tokens)
-                    types_seen = set()
-                    tokens = 0
-
-            # Add partial factor
-            if tokens > 0:
-                factor += (1 - (len(types_seen) / tokens)) / (1 - threshold)
-
-            return (len(words_list) / factor) if factor > 0 else len(words_list)
-
-        # Calculate in both directions and average
-        forward = _mtld_direction(words)
-        backward = _mtld_direction(words[::-1])
-
-        return float((forward + backward) / 2)
+        sequence = words if isinstance(words, TokenSequence) else TokenSequence(words)
+        if len(sequence) < 50:
+            return sequence.ttr() * 100  # Fallback to TTR
+
+        # Calculated in both directions and averaged
+        return sequence.mtld(threshold)
+
+
+class LexicalStreamAccumulator(StreamAccumulator):
+    """
+    Streaming lexical diversity without keeping the vocabulary in memory.
+
+    Word and stem types are counted with DistinctSketch (exact up to its
+    size, estimated beyond). MTLD is computed online in the forward
+    direction only: the backward pass needs the whole token sequence, so
+    streamed MTLD can differ slightly from analyze() on long documents.
+    """
+
+    MTLD_THRESHOLD = MTLD_THRESHOLD
+
+    def __init__(self, dimension: LexicalDimension, config: AnalysisConfig):
+        super().__init__(dimension, config)
+        self.word_count = 0
+        self.word_types = DistinctSketch()
+        self.token_count = 0
+        self.token_types = DistinctSketch()
+        self.stem_types = DistinctSketch()
+        self.nltk_failed = False
+        # Forward MTLD state: completed factors and the open segment
+        self._factors = 0
+        self._segment_types: set = set()
+        self._segment_tokens = 0
+
+    def _add(self, window: str, **kwargs) -> None:
+        words = self.dimension._ttr_words(window)
+        self.word_count += len(words)
+        self.word_types.update(words)
+
+        if self.nltk_failed:
+            return
+        try:
+            tokens = self.dimension._nltk_words(window)
+        except Exception as e:
+            print(f"Warning: NLTK lexical analysis failed: {e}", file=sys.stderr)
+            self.nltk_failed = True
+            return
+
+        self.token_count += len(tokens)
+        self.token_types.update(tokens)
+        self.stem_types.update(porter_stem(token) for token in tokens)
+        for token in tokens:
+            self._segment_tokens += 1
+            self._segment_types.add(token)
+            if len(self._segment_types) / self._segment_tokens < self.MTLD_THRESHOLD:
+                self._factors += 1
+                self._segment_types = set()
+                self._segment_tokens = 0
+
+    def _mtld(self) -> float:
+        """Forward MTLD of all tokens seen so far."""
+        if self.token_count < 50:
+            return self.token_types.estimate() / self.token_count * 100  # Fallback to TTR
+
+        factor: float = self._factors
+        if self._segment_tokens > 0:
+            ratio = len(self._segment_types) / self._segment_tokens
+            factor += (1 - ratio) / (1 - self.MTLD_THRESHOLD)
+        return self.token_count / factor if factor > 0 else float(self.token_count)
+
+    def _result(self) -> Dict[str, Any]:
+        if not self.word_count:
+            return {"lexical_diversity": {"unique": 0, "diversity": 0.0}}
+
+        unique = self.word_types.estimate()
+        lexical: Dict[str, Any] = {
+            "unique": unique,
+            "diversity": round(unique / self.word_count, 3),
+        }
+        if self.token_count and not self.nltk_failed:
+            lexical["mtld_score"] = round(self._mtld(), 2)
+            lexical["stemmed_diversity"] = round(self.stem_types.estimate() / self.token_count, 3)
+        return {"lexical_diversity": lexical}
 
 
 # Backward compatibility alias
@@ -16,7 +16,9 @@ Perplexity = exp(-(1/N) × Σ log P(w_i | context))
 - AI median: 21.2 (40% lower)
 - Strong discrimination signal
 
-**Performance**: Requires GPT-2 language model (~2-3 seconds per 1k words)
+**Performance**: Requires GPT-2 language model (~2-3 seconds per 1k words).
+The model and each scored text window are shared with PredictabilityDimension
+via utils.language_model.
 
 Weight: 3.0% of total score (validated with 29.5% discrimination)
 Tier: ADVANCED (requires language model)
@@ -25,28 +27,28 @@ Implemented in Story 2.4.0.7.
 Refactored in Story 1.4 to use DimensionStrategy pattern with self-registration.
 """
 
-import math
 import sys
-import threading
-from typing import Any, Dict, List, Optional, Tuple
-
-# Required imports
-import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
-from transformers.utils import logging as transformers_logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
+from writescore.utils.language_model import (
+    LanguageModelService,
+    clear_language_models,
+    get_language_model,
+    get_language_model_for,
+)
+from writescore.utils.lazy_import import lazy_import
 
-transformers_logging.set_verbosity_error()
-
+# Required imports (loaded on first analysis)
+if TYPE_CHECKING:
+    import torch
+else:
+    torch = lazy_import("torch")
 
-# Global model instances (lazy loading with thread-safety)
-_perplexity_model = None
-_perplexity_tokenizer = None
-_perplexity_device = None  # Device for model inference (MPS, CUDA, or CPU)
-_model_lock = threading.Lock()  # Thread-safe model loading
+# Tokens scored for document perplexity (1024 tokens ≈ 4000 chars, one GPT-2 window)
+MAX_PERPLEXITY_TOKENS = 1024
 
 
 class PerplexityDimension(DimensionStrategy):
@@ -102,6 +104,21 @@ class PerplexityDimension(DimensionStrategy):
         """Return dimension description."""
         return "Mathematical perplexity calculation using language model (29.5% discrimination, 24.6 point score difference)"
 
+    @property
+    def analysis_cost(self) -> int:
+        """Return relative analysis cost (causal language model passes)."""
+        return 10
+
+    @property
+    def shared_resources(self) -> Tuple[str, ...]:
+        """Return resources shared with other dimensions (language model scores)."""
+        return ("language_model",)
+
+    @property
+    def uses_torch(self) -> bool:
+        """Return True (runs torch models)."""
+        return True
+
     # ========================================================================
     # MODEL LOADING AND CACHING
     # ========================================================================
@@ -109,86 +126,37 @@ class PerplexityDimension(DimensionStrategy):
     @classmethod
     def _get_device(cls):
         """
-        Get optimal device for model inference.
-
-        Priority order:
-        1. MPS (Apple Silicon Metal Performance Shaders) - 5-10× faster on M1/M2
-        2. CUDA (NVIDIA GPU)
-        3. CPU (fallback)
+        Get device used for model inference (MPS > CUDA > CPU by default).
 
         Returns:
-            torch.device: Optimal device for inference
-        """
-        global _perplexity_device
-        if _perplexity_device is None:
-            # Check for Apple Silicon MPS
-            if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
-                _perplexity_device = torch.device("mps")
-            # Check for NVIDIA CUDA
-            elif torch.cuda.is_available():
-                _perplexity_device = torch.device("cuda")
-            # Fallback to CPU
-            else:
-                _perplexity_device = torch.device("cpu")
-        return _perplexity_device
+            torch.device of the shared language model
+        """
+        return get_language_model().device
 
     @classmethod
     def _get_model(cls):
         """
-        Load and cache GPT-2 model for perplexity calculation.
-
-        Thread-safe lazy loading with module-level caching.
-        First call loads model (~2-5 seconds), subsequent calls instant.
-
-        Performance optimization:
-        - Automatically uses MPS (Apple Silicon) if available for 5-10× speedup
-        - Falls back to CUDA (NVIDIA) or CPU
+        Get the shared causal LM (loaded once per process, shared with predictability).
 
         Returns:
-            Cached GPT-2 model instance on optimal device
-        """
-        global _perplexity_model
-        if _perplexity_model is None:
-            with _model_lock:
-                # Double-check after acquiring lock
-                if _perplexity_model is None:
-                    device = cls._get_device()
-                    print(
-                        "Loading GPT-2 model for perplexity calculation (one-time setup)...",
-                        file=sys.stderr,
-                    )
-                    print(f"Using device: {device}", file=sys.stderr)
-
-                    _perplexity_model = AutoModelForCausalLM.from_pretrained("gpt2")
-                    _perplexity_model.eval()
-
-                    # Move model to optimal device (MPS on M1, CUDA on NVIDIA, CPU otherwise)
-                    _perplexity_model.to(device)
-                    print(f"Model loaded and moved to {device}", file=sys.stderr)
-        return _perplexity_model
+            Cached model instance on its inference device
+        """
+        return get_language_model().model
 
     @classmethod
     def _get_tokenizer(cls):
         """
-        Load and cache GPT-2 tokenizer.
-
-        Thread-safe lazy loading with module-level caching.
+        Get the shared tokenizer.
 
         Returns:
-            Cached GPT-2 tokenizer instance
+            Cached tokenizer instance
         """
-        global _perplexity_tokenizer
-        if _perplexity_tokenizer is None:
-            with _model_lock:
-                # Double-check after acquiring lock
-                if _perplexity_tokenizer is None:
-                    _perplexity_tokenizer = AutoTokenizer.from_pretrained("gpt2")
-        return _perplexity_tokenizer
+        return get_language_model().tokenizer
 
     @classmethod
     def clear_model_cache(cls):
         """
-        Clear cached perplexity model.
+        Clear cached language models.
 
         Useful for:
         - Testing (reset state between tests)
@@ -197,22 +165,42 @@ class PerplexityDimension(DimensionStrategy):
 
         Thread-safe via lock protection.
         """
-        global _perplexity_model, _perplexity_tokenizer, _perplexity_device
-        with _model_lock:
-            _perplexity_model = None
-            _perplexity_tokenizer = None
-            _perplexity_device = None
+        clear_language_models()
+
+    def prefetch(self, texts: List[str], config: Optional[AnalysisConfig] = None) -> None:
+        """
+        Score the first window of every text in batched forward passes.
+
+        analyze() of each text then reads its scores from the shared
+        language model's cache (see LanguageModelService.prefetch()).
+
+        Args:
+            texts: Texts of the upcoming documents
+            config: Analysis configuration (selects the language model)
+        """
+        language_model = get_language_model_for(config or DEFAULT_CONFIG, self.dimension_name)
+        sequences = []
+        for text in texts:
+            try:
+                tokens = self._tokenize(text, language_model)
+            except ValueError:
+                continue  # analyze() reports invalid text
+            sequences.append(tokens[0, :MAX_PERPLEXITY_TOKENS].tolist())
+        language_model.prefetch(sequences)
 
     # ========================================================================
     # PERPLEXITY CALCULATION
     # ========================================================================
 
-    def _tokenize(self, text: str) -> torch.Tensor:
+    def _tokenize(
+        self, text: str, language_model: Optional[LanguageModelService] = None
+    ) -> "torch.Tensor":
         """
         Tokenize text with input validation.
 
         Args:
             text: Input text to tokenize
+            language_model: Shared LM service (default: process default model)
 
         Returns:
             Token tensor
@@ -233,8 +221,8 @@ class PerplexityDimension(DimensionStrategy):
         if not text.strip():
             raise ValueError("Text must contain printable characters")
 
-        tokenizer = self._get_tokenizer()
-        tokens: torch.Tensor = tokenizer.encode(text, return_tensors="pt")
+        language_model = language_model or get_language_model()
+        tokens = torch.tensor([language_model.encode(text)], dtype=torch.long)
 
         # Validate token length (prevent memory exhaustion)
         if tokens.shape[1] > 50_000:  # ~200k chars, reasonable max
@@ -245,7 +233,7 @@ class PerplexityDimension(DimensionStrategy):
 
         return tokens
 
-    def _get_token_log_prob(self, context: torch.Tensor, target: torch.Tensor) -> float:
+    def _get_token_log_prob(self, context: "torch.Tensor", target: "torch.Tensor") -> float:
         """
         Get log probability of target token given context.
 
@@ -273,20 +261,24 @@ class PerplexityDimension(DimensionStrategy):
 
         return float(log_prob)
 
-    def _calculate_perplexity(self, text: str) -> Tuple[float, float, int]:
+    def _calculate_perplexity(
+        self, text: str, language_model: Optional[LanguageModelService] = None
+    ) -> Tuple[float, float, int]:
         """
-        Calculate mathematical perplexity using GPT-2 model (optimized).
+        Calculate mathematical perplexity using the shared language model.
 
         Formula: Perplexity = exp(-(1/N) × Σ log P(w_i | context))
 
         Performance optimizations:
-        - Uses PyTorch's built-in cross-entropy loss (much faster than token-by-token)
         - Limits to first 1024 tokens for very long documents
-        - Single forward pass through model
+        - Single forward pass through model, shared with PredictabilityDimension:
+          per-token log-probabilities come from the same cached pass that
+          produces GLTR ranks, so the second dimension does not re-run the model
         - MPS acceleration on Apple Silicon (5-10× speedup on M1/M2)
 
         Args:
             text: Input text
+            language_model: Shared LM service (default: process default model)
 
         Returns:
             Tuple of (perplexity, avg_log_prob, token_count)
@@ -294,38 +286,18 @@ class PerplexityDimension(DimensionStrategy):
         Raises:
             ValueError: If text is invalid
         """
-        tokens = self._tokenize(text)
-        token_count = tokens.shape[1]
+        language_model = language_model or get_language_model()
+        tokens = self._tokenize(text, language_model)
 
         # Limit context window for performance (1024 tokens ≈ 4000 chars)
-        MAX_TOKENS = 1024
-        if token_count > MAX_TOKENS:
-            tokens = tokens[:, :MAX_TOKENS]
-            token_count = MAX_TOKENS
-
-        model = self._get_model()
-        device = self._get_device()
-
-        # Move tokens to same device as model (MPS, CUDA, or CPU)
-        tokens = tokens.to(device)
-
-        # Efficient computation using PyTorch's built-in cross-entropy loss
-        # This is much faster than token-by-token calculation (single forward pass)
-        with torch.no_grad():
-            # Model expects input_ids and labels
-            # We shift labels by 1 to predict next token
-            outputs = model(tokens, labels=tokens)
-
-            # loss is average negative log-likelihood
-            loss = outputs.loss.item()
-
-        # Average log probability is negative of loss
-        avg_log_prob = -loss
+        token_ids = tokens[0, :MAX_PERPLEXITY_TOKENS].tolist()
+        scores = language_model.score_tokens(token_ids)
 
-        # Perplexity = exp(-avg_log_prob) = exp(loss)
-        perplexity = math.exp(loss)
+        # Average log probability is negative of mean NLL; perplexity = exp(mean NLL)
+        avg_log_prob = -scores.mean_nll
+        perplexity = scores.perplexity
 
-        return perplexity, avg_log_prob, token_count
+        return perplexity, avg_log_prob, scores.token_count
 
     # ========================================================================
     # SCORING METHODS
@@ -431,8 +403,9 @@ class PerplexityDimension(DimensionStrategy):
             }
 
         try:
-            # Calculate perplexity
-            perplexity, avg_log_prob, token_count = self._calculate_perplexity(text)
+            # Calculate perplexity with the shared language model
+            language_model = get_language_model_for(config, self.dimension_name)
+            perplexity, avg_log_prob, token_count = self._calculate_perplexity(text, language_model)
 
             # Apply monotonic scoring
             score = self._score_perplexity(perplexity)
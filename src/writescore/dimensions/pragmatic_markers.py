@@ -40,7 +40,9 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.segmentation import segment_text
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
+from writescore.utils.pattern_set import PatternSet
 
 
 class PragmaticMarkersDimension(DimensionStrategy):
@@ -266,6 +268,22 @@ class PragmaticMarkersDimension(DimensionStrategy):
         "purportedly": re.compile(r"\bpurportedly\b", re.IGNORECASE),
     }
 
+    # All categories combined for a single scan per text (pattern names are
+    # unique across categories)
+    PRAGMATIC_PATTERNS = PatternSet(
+        {
+            **EPISTEMIC_HEDGES,
+            **FREQUENCY_HEDGES,
+            **EPISTEMIC_VERBS,
+            **STRONG_CERTAINTY,
+            **SUBJECTIVE_CERTAINTY,
+            **ASSERTION_ACTS,
+            **FORMULAIC_AI_ACTS,
+            **ATTITUDE_MARKERS,
+            **LIKELIHOOD_ADVERBIALS,
+        }
+    )
+
     # ========================================================================
     # SCORING THRESHOLDS - Research-backed baselines
     # Updated in Story 2.6 for expanded 126-pattern lexicon
@@ -714,15 +732,20 @@ class PragmaticMarkersDimension(DimensionStrategy):
         # Calculate word count once (used by all methods)
         total_words = kwargs.get("word_count")
         if total_words is None:
-            total_words = len(re.findall(r"\b\w+\b", text))
+            total_words = segment_text(text, kwargs.get("document")).word_count
 
-        # Run all individual analyses
-        hedging = self._analyze_hedging(text, total_words=total_words)
-        certainty = self._analyze_certainty(text, total_words=total_words)
-        speech_acts = self._analyze_speech_acts(text, total_words=total_words)
+        # Scan once for all 126 patterns, then run the individual analyses on the counts
+        counts = self.PRAGMATIC_PATTERNS.counts(text)
+        hedging = self._analyze_hedging(text, total_words=total_words, counts=counts)
+        certainty = self._analyze_certainty(text, total_words=total_words, counts=counts)
+        speech_acts = self._analyze_speech_acts(text, total_words=total_words, counts=counts)
         # New categories added in Story 2.6
-        attitude_markers = self._analyze_attitude_markers(text, total_words=total_words)
-        likelihood_adverbials = self._analyze_likelihood_adverbials(text, total_words=total_words)
+        attitude_markers = self._analyze_attitude_markers(
+            text, total_words=total_words, counts=counts
+        )
+        likelihood_adverbials = self._analyze_likelihood_adverbials(
+            text, total_words=total_words, counts=counts
+        )
 
         # Calculate composite metrics
         certainty_hedge_ratio = self._calculate_certainty_hedge_ratio(
@@ -747,7 +770,12 @@ class PragmaticMarkersDimension(DimensionStrategy):
             "pragmatic_balance": pragmatic_balance,
         }
 
-    def _analyze_hedging(self, text: str, total_words: Optional[int] = None) -> Dict[str, Any]:
+    def _analyze_hedging(
+        self,
+        text: str,
+        total_words: Optional[int] = None,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Any]:
         """
         Analyze epistemic hedging patterns.
 
@@ -762,6 +790,7 @@ class PragmaticMarkersDimension(DimensionStrategy):
         Args:
             text: Text to analyze
             total_words: Pre-calculated word count (optional)
+            counts: Pattern counts from PRAGMATIC_PATTERNS (optional, scanned if omitted)
 
         Returns:
             Dict with:
@@ -778,6 +807,8 @@ class PragmaticMarkersDimension(DimensionStrategy):
             total_words = len(re.findall(r"\b\w+\b", text))
 
         words_in_thousands = total_words / 1000 if total_words > 0 else 1
+        if counts is None:
+            counts = self.PRAGMATIC_PATTERNS.counts(text)
 
         # Count each epistemic hedging pattern (43 patterns in Story 2.6)
         counts_by_type = {}
@@ -805,8 +836,8 @@ class PragmaticMarkersDimension(DimensionStrategy):
             "in_general",
         }
 
-        for hedge_type, pattern in self.EPISTEMIC_HEDGES.items():
-            count = len(pattern.findall(text))
+        for hedge_type in self.EPISTEMIC_HEDGES:
+            count = counts[hedge_type]
             counts_by_type[hedge_type] = count
             epistemic_hedge_count += count
             # Track approximators separately
@@ -815,15 +846,15 @@ class PragmaticMarkersDimension(DimensionStrategy):
 
         # Count frequency hedge patterns (6 patterns)
         frequency_hedges_count = 0
-        for hedge_type, pattern in self.FREQUENCY_HEDGES.items():
-            count = len(pattern.findall(text))
+        for hedge_type in self.FREQUENCY_HEDGES:
+            count = counts[hedge_type]
             counts_by_type[hedge_type] = count
             frequency_hedges_count += count
 
         # Count epistemic verb patterns (8 patterns)
         epistemic_verbs_count = 0
-        for verb_type, pattern in self.EPISTEMIC_VERBS.items():
-            count = len(pattern.findall(text))
+        for verb_type in self.EPISTEMIC_VERBS:
+            count = counts[verb_type]
             counts_by_type[verb_type] = count
             epistemic_verbs_count += count
 
@@ -847,7 +878,12 @@ class PragmaticMarkersDimension(DimensionStrategy):
             "epistemic_verbs_count": epistemic_verbs_count,
         }
 
-    def _analyze_certainty(self, text: str, total_words: Optional[int] = None) -> Dict[str, Any]:
+    def _analyze_certainty(
+        self,
+        text: str,
+        total_words: Optional[int] = None,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Any]:
         """
         Analyze certainty marker patterns.
 
@@ -858,6 +894,7 @@ class PragmaticMarkersDimension(DimensionStrategy):
         Args:
             text: Text to analyze
             total_words: Pre-calculated word count (optional)
+            counts: Pattern counts from PRAGMATIC_PATTERNS (optional, scanned if omitted)
 
         Returns:
             Dict with:
@@ -872,13 +909,15 @@ class PragmaticMarkersDimension(DimensionStrategy):
             total_words = len(re.findall(r"\b\w+\b", text))
 
         words_in_thousands = total_words / 1000 if total_words > 0 else 1
+        if counts is None:
+            counts = self.PRAGMATIC_PATTERNS.counts(text)
 
         # Count strong certainty patterns
         strong_counts = {}
         strong_total = 0
 
-        for certainty_type, pattern in self.STRONG_CERTAINTY.items():
-            count = len(pattern.findall(text))
+        for certainty_type in self.STRONG_CERTAINTY:
+            count = counts[certainty_type]
             strong_counts[certainty_type] = count
             strong_total += count
 
@@ -886,8 +925,8 @@ class PragmaticMarkersDimension(DimensionStrategy):
         subjective_counts = {}
         subjective_total = 0
 
-        for certainty_type, pattern in self.SUBJECTIVE_CERTAINTY.items():
-            count = len(pattern.findall(text))
+        for certainty_type in self.SUBJECTIVE_CERTAINTY:
+            count = counts[certainty_type]
             subjective_counts[certainty_type] = count
             subjective_total += count
 
@@ -903,7 +942,12 @@ class PragmaticMarkersDimension(DimensionStrategy):
             "subjective_percentage": subjective_percentage,
         }
 
-    def _analyze_speech_acts(self, text: str, total_words: Optional[int] = None) -> Dict[str, Any]:
+    def _analyze_speech_acts(
+        self,
+        text: str,
+        total_words: Optional[int] = None,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> Dict[str, Any]:
         """
         Analyze speech act patterns.
 
@@ -914,6 +958,7 @@ class PragmaticMarkersDimension(DimensionStrategy):
         Args:
             text: Text to analyze
             total_words: Pre-calculated word count (optional)
+            counts: Pattern counts from PRAGMATIC_PATTERNS (optional, scanned if omitted)
 
         Returns:
             Dict with:
@@ -929,16 +974,18 @@ class PragmaticMarkersDimension(DimensionStrategy):
             total_words = len(re.findall(r"\b\w+\b", text))
 
         words_in_thousands = total_words / 1000 if total_words > 0 else 1
+        if counts is None:
+            counts = self.PRAGMATIC_PATTERNS.counts(text)
 
         # Count assertion speech acts
         assertion_count = 0
-        for pattern in self.ASSERTION_ACTS.values():
-            assertion_count += len(pattern.findall(text))
+        for act_type in self.ASSERTION_ACTS:
+            assertion_count += counts[act_type]
 
         # Count formulaic AI speech acts
         formulaic_count = 0
-        for pattern in self.FORMULAIC_AI_ACTS.values():
-            formulaic_count += len(pattern.findall(text))
+        for act_type in self.FORMULAIC_AI_ACTS:
+            formulaic_count += counts[act_type]
 
         # Calculate totals and ratios
         total_count = assertion_count + formulaic_count
@@ -955,7 +1002,10 @@ class PragmaticMarkersDimension(DimensionStrategy):
         }
 
     def _analyze_attitude_markers(
-        self, text: str, total_words: Optional[int] = None
+        self,
+        text: str,
+        total_words: Optional[int] = None,
+        counts: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
         """
         Analyze attitude marker patterns.
@@ -974,6 +1024,7 @@ class PragmaticMarkersDimension(DimensionStrategy):
         Args:
             text: Text to analyze
             total_words: Pre-calculated word count (optional)
+            counts: Pattern counts from PRAGMATIC_PATTERNS (optional, scanned if omitted)
 
         Returns:
             Dict with:
@@ -986,12 +1037,14 @@ class PragmaticMarkersDimension(DimensionStrategy):
             total_words = len(re.findall(r"\b\w+\b", text))
 
         words_in_thousands = total_words / 1000 if total_words > 0 else 1
+        if counts is None:
+            counts = self.PRAGMATIC_PATTERNS.counts(text)
 
         counts_by_type = {}
         total_count = 0
 
-        for marker_type, pattern in self.ATTITUDE_MARKERS.items():
-            count = len(pattern.findall(text))
+        for marker_type in self.ATTITUDE_MARKERS:
+            count = counts[marker_type]
             counts_by_type[marker_type] = count
             total_count += count
 
@@ -1008,7 +1061,10 @@ class PragmaticMarkersDimension(DimensionStrategy):
         }
 
     def _analyze_likelihood_adverbials(
-        self, text: str, total_words: Optional[int] = None
+        self,
+        text: str,
+        total_words: Optional[int] = None,
+        counts: Optional[Dict[str, int]] = None,
     ) -> Dict[str, Any]:
         """
         Analyze likelihood adverbial patterns.
@@ -1027,6 +1083,7 @@ class PragmaticMarkersDimension(DimensionStrategy):
         Args:
             text: Text to analyze
             total_words: Pre-calculated word count (optional)
+            counts: Pattern counts from PRAGMATIC_PATTERNS (optional, scanned if omitted)
 
         Returns:
             Dict with:
@@ -1039,12 +1096,14 @@ class PragmaticMarkersDimension(DimensionStrategy):
             total_words = len(re.findall(r"\b\w+\b", text))
 
         words_in_thousands = total_words / 1000 if total_words > 0 else 1
+        if counts is None:
+            counts = self.PRAGMATIC_PATTERNS.counts(text)
 
         counts_by_type = {}
         total_count = 0
 
-        for adverbial_type, pattern in self.LIKELIHOOD_ADVERBIALS.items():
-            count = len(pattern.findall(text))
+        for adverbial_type in self.LIKELIHOOD_ADVERBIALS:
+            count = counts[adverbial_type]
             counts_by_type[adverbial_type] = count
             total_count += count
 
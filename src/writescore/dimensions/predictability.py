@@ -16,9 +16,10 @@ Tier: ADVANCED
 
 Performance (Story 1.4.14):
 - 120-second timeout prevents hanging on large documents
-- Model caching: 80-95% faster on repeated analyses
+- Model caching: 80-95% faster on repeated analyses (shared with perplexity)
 - Thread-safe model loading for concurrent analysis
 - First analysis: 2-10s, subsequent: ~0.1-0.5s
+- Single forward pass per context window for all token ranks (utils.gltr)
 
 Requires dependencies: transformers, torch
 
@@ -27,29 +28,30 @@ Refactored in Story 1.4.5 - Split from AdvancedDimension for single responsibili
 """
 
 import re
-import statistics
 import sys
 import threading
 from typing import Any, Dict, List, Optional, Tuple
 
-# Required imports
-import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
-from transformers.utils import logging as transformers_logging
-
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
 from writescore.core.results import HighPredictabilitySegment
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
-from writescore.utils.text_processing import safe_ratio
-
-transformers_logging.set_verbosity_error()
-
-
-# Global model instances (lazy loading with thread-safety)
-_perplexity_model = None
-_perplexity_tokenizer = None
-_model_lock = threading.Lock()  # Thread-safe model loading
+from writescore.utils.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    current_deadline,
+    deadline_scope,
+)
+from writescore.utils.gltr import compute_token_ranks, summarize_ranks
+from writescore.utils.language_model import (
+    LanguageModelService,
+    clear_language_models,
+    get_language_model,
+    get_language_model_for,
+)
+
+# Tokens scored per 75-word chunk in detailed (high-predictability segment) analysis
+SEGMENT_MAX_TOKENS = 100
 
 
 class PredictabilityDimension(DimensionStrategy):
@@ -77,6 +79,8 @@ class PredictabilityDimension(DimensionStrategy):
     def __init__(self):
         """Initialize and self-register with dimension registry."""
         super().__init__()
+        # Language model used by the most recent analyze() (reused by analyze_detailed)
+        self._language_model: Optional[LanguageModelService] = None
         # Self-register with registry
         DimensionRegistry.register(self)
 
@@ -104,6 +108,21 @@ class PredictabilityDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes GLTR token predictability patterns (80% F1-score, validated 2025)"
 
+    @property
+    def analysis_cost(self) -> int:
+        """Return relative analysis cost (causal language model passes)."""
+        return 10
+
+    @property
+    def shared_resources(self) -> Tuple[str, ...]:
+        """Return resources shared with other dimensions (language model scores)."""
+        return ("language_model",)
+
+    @property
+    def uses_torch(self) -> bool:
+        """Return True (runs torch models)."""
+        return True
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -148,6 +167,10 @@ class PredictabilityDimension(DimensionStrategy):
         config = config or DEFAULT_CONFIG
         total_text_length = len(text)
 
+        # Shared causal LM (same model and cached passes as PerplexityDimension)
+        language_model = get_language_model_for(config, self.dimension_name)
+        self._language_model = language_model
+
         # Prepare text based on mode (FAST/ADAPTIVE/SAMPLING/FULL)
         prepared = self._prepare_text(text, config, self.dimension_name)
 
@@ -160,12 +183,16 @@ class PredictabilityDimension(DimensionStrategy):
             # Batch samples into single GLTR call for efficiency
             # GLTR has high per-call overhead, so concatenating samples is much faster
             combined_text = " ".join(sample_text for _, sample_text in samples)
-            aggregated = self._calculate_gltr_metrics_with_timeout(combined_text, timeout=120)
+            aggregated = self._calculate_gltr_metrics_with_timeout(
+                combined_text, timeout=120, language_model=language_model
+            )
 
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            gltr_metrics = self._calculate_gltr_metrics_with_timeout(analyzed_text, timeout=120)
+            gltr_metrics = self._calculate_gltr_metrics_with_timeout(
+                analyzed_text, timeout=120, language_model=language_model
+            )
             aggregated = gltr_metrics
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
@@ -335,7 +362,10 @@ class PredictabilityDimension(DimensionStrategy):
     # ========================================================================
 
     def _calculate_gltr_metrics_with_timeout(
-        self, text: str, timeout: int = 120
+        self,
+        text: str,
+        timeout: int = 120,
+        language_model: Optional[LanguageModelService] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Calculate GLTR metrics with timeout protection (Story 1.4.14).
@@ -347,30 +377,41 @@ class PredictabilityDimension(DimensionStrategy):
         Args:
             text: Text to analyze (pre-truncated/sampled by caller)
             timeout: Timeout in seconds (default 120)
+            language_model: Shared LM service (default: process default model)
 
         Returns:
             Dict with GLTR metrics, or None if timeout/error
 
-        Thread-safety:
-            Uses daemon thread for timeout enforcement.
-            Thread properly cleaned up after timeout or completion.
+        Cancellation:
+            The calculation runs in a worker thread under a deadline of
+            timeout seconds (or the analysis deadline, if sooner). The
+            language model checks it between context windows, so a timed-out
+            worker stops at its next window instead of running on. If the
+            analysis deadline itself passes, DeadlineExceeded is raised so
+            the analyzer reports the dimension as skipped.
         """
+        outer = current_deadline()
+        deadline = Deadline(timeout).earliest(outer)
         result = [None]
-        exception = [None]
+        exception: List[Optional[BaseException]] = [None]
 
         def worker():
             """Worker thread to execute GLTR calculation."""
             try:
-                result[0] = self._calculate_gltr_metrics(text)
-            except Exception as e:
+                with deadline_scope(deadline):
+                    result[0] = self._calculate_gltr_metrics(text, language_model)
+            except BaseException as e:
                 exception[0] = e
 
         thread = threading.Thread(target=worker, daemon=True)
         thread.start()
-        thread.join(timeout)
+        thread.join(deadline.remaining())
+
+        if outer is not None and outer.expired:
+            outer.check()
 
-        if thread.is_alive():
-            # Timeout occurred - thread still running
+        if thread.is_alive() or isinstance(exception[0], DeadlineExceeded):
+            # Timeout occurred - the worker stops at its next cancellation point
             print(f"Warning: GLTR analysis timed out after {timeout}s", file=sys.stderr)
             return None
 
@@ -384,7 +425,9 @@ class PredictabilityDimension(DimensionStrategy):
     @staticmethod
     def clear_model_cache():
         """
-        Clear cached GLTR model (Story 1.4.14).
+        Clear cached language models (Story 1.4.14).
+
+        The model is shared with PerplexityDimension, so this releases it for both.
 
         Useful for:
         - Testing (reset state between tests)
@@ -393,10 +436,32 @@ class PredictabilityDimension(DimensionStrategy):
 
         Thread-safe via lock protection.
         """
-        global _perplexity_model, _perplexity_tokenizer
-        with _model_lock:
-            _perplexity_model = None
-            _perplexity_tokenizer = None
+        clear_language_models()
+
+    def prefetch(self, texts: List[str], config: Optional[AnalysisConfig] = None) -> None:
+        """
+        Score the first window of every text in batched forward passes.
+
+        Prepares each text as analyze() does, so its GLTR pass finds the
+        scores in the shared language model's cache (see
+        LanguageModelService.prefetch()). After PerplexityDimension.prefetch()
+        most first windows are already cached.
+
+        Args:
+            texts: Texts of the upcoming documents
+            config: Analysis configuration (mode and language model)
+        """
+        config = config or DEFAULT_CONFIG
+        language_model = get_language_model_for(config, self.dimension_name)
+        sequences = []
+        for text in texts:
+            prepared = self._prepare_text(text, config, self.dimension_name)
+            if isinstance(prepared, list):
+                prepared = " ".join(sample_text for _, sample_text in prepared)
+            tokens = language_model.encode(re.sub(r"```[\s\S]*?```", "", prepared))
+            if len(tokens) >= 10:
+                sequences.append(tokens)
+        language_model.prefetch(sequences)
 
     def _aggregate_gltr_metrics(self, sample_metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -448,7 +513,9 @@ class PredictabilityDimension(DimensionStrategy):
             "gltr_likelihood": sum(likelihood_values) / len(likelihood_values),
         }
 
-    def _calculate_gltr_metrics(self, text: str) -> Dict:
+    def _calculate_gltr_metrics(
+        self, text: str, language_model: Optional[LanguageModelService] = None
+    ) -> Dict:
         """
         Calculate GLTR (Giant Language Model Test Room) metrics.
 
@@ -459,8 +526,10 @@ class PredictabilityDimension(DimensionStrategy):
         Performance (Story 1.4.14):
         - First call: 2-10s (model load) + analysis time
         - Subsequent calls: ~0.1-0.5s (cached model) + analysis time
-        - Model cached at module level with thread-safe loading
-        - 80-95% time reduction on repeated analyses
+        - Model shared process-wide with PerplexityDimension (utils.language_model)
+        - One forward pass per context window (see utils.gltr); no per-prefix
+          re-runs and no full-vocabulary sort per token
+        - Scored windows are cached, so perplexity over the same text reuses this pass
 
         NOTE: This method no longer truncates text - truncation/sampling
         is handled by caller via _prepare_text(). Call via
@@ -468,95 +537,32 @@ class PredictabilityDimension(DimensionStrategy):
 
         Args:
             text: Text to analyze (pre-truncated/sampled by caller)
+            language_model: Shared LM service (default: process default model)
 
         Returns:
             Dict with GLTR metrics
 
         Thread-safety:
-            Model loading protected by _model_lock (double-checked locking pattern).
+            Model loading is lock-protected inside the shared service.
             Multiple threads can safely call this method concurrently.
 
         Research: 80% F1-score (IberLef-AuTexTification 2025).
         Performance degrades on GPT-4+ (31-50% vs 70-90% on GPT-3.5).
         """
         try:
-            global _perplexity_model, _perplexity_tokenizer
-
-            # Thread-safe lazy load model if not already loaded (Story 1.4.14)
-            if _perplexity_model is None:
-                with _model_lock:
-                    # Double-check after acquiring lock (another thread may have loaded it)
-                    if _perplexity_model is None:
-                        print(
-                            "Loading DistilGPT-2 model for GLTR analysis (one-time setup)...",
-                            file=sys.stderr,
-                        )
-                        _perplexity_model = AutoModelForCausalLM.from_pretrained("distilgpt2")
-                        _perplexity_tokenizer = AutoTokenizer.from_pretrained("distilgpt2")
-                        _perplexity_model.eval()
+            language_model = language_model or get_language_model()
 
             # Remove code blocks
             text = re.sub(r"```[\s\S]*?```", "", text)
 
-            # Tokenize (tokenizer is guaranteed to be loaded after model loading above)
-            assert _perplexity_tokenizer is not None
-            tokens = _perplexity_tokenizer.encode(text)
+            tokens = language_model.encode(text)
 
             if len(tokens) < 10:
                 return {}  # Not enough tokens for reliable analysis
 
-            ranks = []
-
-            # Performance optimization: Analyze up to 500 tokens per sample (fast, reliable)
-            # 500 tokens ≈ 2000-2500 chars ≈ 1 page per sample
-            MAX_TOKENS_PER_ANALYSIS = 500
-
-            # Analyze each token's rank in model prediction
-            for i in range(1, min(len(tokens), MAX_TOKENS_PER_ANALYSIS)):
-                input_ids = torch.tensor([tokens[:i]])
-
-                with torch.no_grad():
-                    outputs = _perplexity_model(input_ids)
-                    logits = outputs.logits[0, -1, :]
-                    probs = torch.softmax(logits, dim=-1)
-
-                    # Get rank of actual next token
-                    sorted_indices = torch.argsort(probs, descending=True)
-                    actual_token = tokens[i]
-                    rank = (sorted_indices == actual_token).nonzero(as_tuple=True)[0].item()
-                    ranks.append(rank)
-
-            if not ranks:
-                return {}
-
-            # Calculate GLTR metrics
-            top10_percentage = safe_ratio(sum(1 for r in ranks if r < 10), len(ranks), 0)
-            top100_percentage = safe_ratio(sum(1 for r in ranks if r < 100), len(ranks), 0)
-            top1000_percentage = safe_ratio(sum(1 for r in ranks if r < 1000), len(ranks), 0)
-            mean_rank = sum(ranks) / len(ranks)
-            rank_variance = statistics.variance(ranks) if len(ranks) > 1 else 0
-
-            # AI likelihood based on top-10 concentration
-            # Research: AI >70%, Human <55%
-            if top10_percentage > 0.70:
-                ai_likelihood = 0.90
-            elif top10_percentage > 0.65:
-                ai_likelihood = 0.75
-            elif top10_percentage > 0.60:
-                ai_likelihood = 0.60
-            elif top10_percentage < 0.50:
-                ai_likelihood = 0.20
-            else:
-                ai_likelihood = 0.50
+            scores = language_model.score_tokens(tokens)
 
-            return {
-                "gltr_top10_percentage": round(top10_percentage, 3),
-                "gltr_top100_percentage": round(top100_percentage, 3),
-                "gltr_top1000_percentage": round(top1000_percentage, 3),
-                "gltr_mean_rank": round(mean_rank, 2),
-                "gltr_rank_variance": round(rank_variance, 2),
-                "gltr_likelihood": round(ai_likelihood, 2),
-            }
+            return summarize_ranks(scores.ranks)
         except Exception as e:
             print(f"Warning: GLTR analysis failed: {e}", file=sys.stderr)
             return {}
@@ -568,15 +574,12 @@ class PredictabilityDimension(DimensionStrategy):
         issues = []
 
         try:
-            global _perplexity_model, _perplexity_tokenizer
+            language_model = self._language_model or get_language_model()
 
-            if _perplexity_model is None:
+            if not language_model.is_loaded:
                 # Model not loaded yet
                 return []
 
-            # Tokenizer is always loaded when model is loaded
-            assert _perplexity_tokenizer is not None
-
             # Analyze in 50-100 word chunks
             chunk_size = 75  # words
             current_chunk = []
@@ -601,7 +604,7 @@ class PredictabilityDimension(DimensionStrategy):
 
                         # Calculate GLTR for chunk
                         try:
-                            tokens = _perplexity_tokenizer.encode(
+                            tokens = language_model.tokenizer.encode(
                                 chunk_text, add_special_tokens=True
                             )
                             if len(tokens) < 10:
@@ -609,21 +612,9 @@ class PredictabilityDimension(DimensionStrategy):
                                 chunk_start_line = line_num + 1
                                 continue
 
-                            ranks = []
-                            for i in range(1, min(len(tokens), 100)):
-                                input_ids = torch.tensor([tokens[:i]])
-                                with torch.no_grad():
-                                    outputs = _perplexity_model(input_ids)
-                                    logits = outputs.logits[0, -1, :]
-                                    probs = torch.softmax(logits, dim=-1)
-                                    sorted_indices = torch.argsort(probs, descending=True)
-                                    actual_token = tokens[i]
-                                    rank = (
-                                        (sorted_indices == actual_token)
-                                        .nonzero(as_tuple=True)[0]
-                                        .item()
-                                    )
-                                    ranks.append(rank)
+                            ranks = compute_token_ranks(
+                                language_model.model, tokens, max_tokens=SEGMENT_MAX_TOKENS
+                            )
 
                             if ranks:
                                 top10_pct = sum(1 for r in ranks if r < 10) / len(ranks)
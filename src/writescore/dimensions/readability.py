@@ -24,12 +24,15 @@ import re
 import sys
 from typing import Any, Dict, List, Optional, Tuple
 
-# Required imports
-import textstat
-
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.document_context import DocumentContext
+from writescore.core.segmentation import segment_text
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
+from writescore.utils.lazy_import import lazy_import
+
+# Required imports (loaded on first analysis)
+textstat = lazy_import("textstat")
 
 
 class ReadabilityDimension(DimensionStrategy):
@@ -111,6 +114,7 @@ class ReadabilityDimension(DimensionStrategy):
         """
         config = config or DEFAULT_CONFIG
         total_text_length = len(text)
+        document = kwargs.get("document")
 
         # Prepare text based on mode (FAST/ADAPTIVE/SAMPLING/FULL)
         prepared = self._prepare_text(text, config, self.dimension_name)
@@ -121,7 +125,7 @@ class ReadabilityDimension(DimensionStrategy):
             sample_results = []
 
             for _position, sample_text in samples:
-                readability = self._analyze_readability_patterns(sample_text)
+                readability = self._analyze_readability_patterns(sample_text, document)
                 sample_results.append(readability)
 
             # Aggregate metrics from all samples
@@ -132,7 +136,7 @@ class ReadabilityDimension(DimensionStrategy):
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            readability = self._analyze_readability_patterns(analyzed_text)
+            readability = self._analyze_readability_patterns(analyzed_text, document)
             aggregated = readability
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
@@ -267,7 +271,9 @@ class ReadabilityDimension(DimensionStrategy):
     # HELPER METHODS
     # ========================================================================
 
-    def _analyze_readability_patterns(self, text: str) -> Dict:
+    def _analyze_readability_patterns(
+        self, text: str, document: Optional[DocumentContext] = None
+    ) -> Dict:
         """
         Analyze readability patterns using textstat.
 
@@ -298,23 +304,24 @@ class ReadabilityDimension(DimensionStrategy):
             result["smog_index"] = textstat.smog_index(text)
 
             # Calculate basic statistics
-            words = re.findall(r"\b\w+\b", text)
+            word_spans = segment_text(text, document).word_spans
+            word_count = len(word_spans)
             sentences = re.split(r"[.!?]+", text)
             sentences = [s for s in sentences if s.strip()]  # Remove empty
 
-            if words:
-                total_chars = sum(len(word) for word in words)
-                result["avg_word_length"] = round(total_chars / len(words), 2)
+            if word_count:
+                total_chars = int((word_spans[:, 1] - word_spans[:, 0]).sum())
+                result["avg_word_length"] = round(total_chars / word_count, 2)
 
-            if sentences and words:
-                result["avg_sentence_length"] = round(len(words) / len(sentences), 2)
+            if sentences and word_count:
+                result["avg_sentence_length"] = round(word_count / len(sentences), 2)
 
             # Calculate syllables (for additional context)
             try:
                 syllable_count = textstat.syllable_count(text)
                 result["syllable_count"] = syllable_count
-                if words:
-                    result["avg_syllables_per_word"] = round(syllable_count / len(words), 2)
+                if word_count:
+                    result["avg_syllables_per_word"] = round(syllable_count / word_count, 2)
             except Exception:
                 pass
 
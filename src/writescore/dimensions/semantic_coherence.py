@@ -22,6 +22,7 @@ Performance optimizations:
 - Sentence sampling for documents >500 sentences
 - Batch processing for embedding generation (batch_size=32)
 - Lazy model loading with LRU cache
+- Similarities from matrix products over L2-normalized embeddings
 
 Installation:
     pip install ai-pattern-analyzer[semantic]  # With semantic coherence
@@ -37,13 +38,65 @@ Version History:
 
 import re
 from functools import lru_cache
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from writescore.core.analysis_config import AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.document_context import DocumentContext
+from writescore.core.segmentation import segment_text
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
+from writescore.utils.embeddings import (
+    get_embedding_service,
+    get_embedding_store_for,
+    unit_rows,
+)
+
+# ============================================================================
+# SIMILARITY KERNELS
+# ============================================================================
+
+
+def adjacent_similarities(unit: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of each row with the next (row-wise dot of shifted rows).
+
+    Args:
+        unit: Unit-row embedding matrix
+
+    Returns:
+        Array of len(unit) - 1 similarities
+    """
+    if len(unit) < 2:
+        return np.empty(0, dtype=unit.dtype)
+    return np.einsum("ij,ij->i", unit[:-1], unit[1:])
+
+
+def block_similarity_means(unit: np.ndarray, block_sizes: Sequence[int]) -> List[float]:
+    """
+    Mean pairwise cosine similarity within consecutive row blocks.
+
+    Each block's similarities are the upper triangle of its diagonal Gram
+    sub-matrix. Blocks with fewer than two rows have no pairs and are skipped.
+
+    Args:
+        unit: Unit-row embedding matrix
+        block_sizes: Rows per block, in order (blocks may run past the last row)
+
+    Returns:
+        Mean similarity of every block with at least two rows
+    """
+    means = []
+    offset = 0
+    for size in block_sizes:
+        block = unit[offset : offset + size]
+        offset += size
+        if len(block) < 2:
+            continue
+        gram = block @ block.T
+        means.append(gram[np.triu_indices(len(block), k=1)].mean())
+    return means
 
 
 class SemanticCoherenceDimension(DimensionStrategy):
@@ -74,6 +127,7 @@ class SemanticCoherenceDimension(DimensionStrategy):
     MAX_SENTENCES_BEFORE_SAMPLING = 500
     SAMPLE_SIZE = 50
     BATCH_SIZE = 32
+    BATCHES_PER_DEADLINE_CHECK = 4
 
     # Coherence thresholds (calibrated based on sentence-transformer research)
     # Research shows typical human writing has 0.40-0.60 sentence similarity within paragraphs
@@ -219,6 +273,16 @@ class SemanticCoherenceDimension(DimensionStrategy):
             "analysis when available, falls back to lexical coherence otherwise."
         )
 
+    @property
+    def analysis_cost(self) -> int:
+        """Return relative analysis cost (sentence-transformer embeddings)."""
+        return 5
+
+    @property
+    def uses_torch(self) -> bool:
+        """Return True (runs torch models)."""
+        return True
+
     # ========================================================================
     # OPTIONAL DEPENDENCY MANAGEMENT
     # ========================================================================
@@ -256,33 +320,93 @@ class SemanticCoherenceDimension(DimensionStrategy):
             return None
 
         try:
-            from sentence_transformers import SentenceTransformer
-
-            # Use validated model from Story 2.3.0 research
-            model = SentenceTransformer("all-MiniLM-L6-v2")
+            # Shared with figurative language (validated model from Story 2.3.0 research)
+            model = get_embedding_service().model
             cls._model = model
             return model
         except Exception:
             # Model loading failed (network, disk, etc.)
             return None
 
+    @classmethod
+    def clear_model_cache(cls):
+        """Forget the cached model (the embedding service owns and releases it)."""
+        cls.load_model.cache_clear()
+        cls._model = None
+
+    def prefetch(self, texts: List[str], config: Optional[AnalysisConfig] = None) -> None:
+        """
+        Embed the sentences of every text in one encoder call.
+
+        Short documents have fewer sentences than an encoder batch; embedding
+        a batch of documents together fills the batches, and analyze() of
+        each document finds its sentences in the embedding cache.
+
+        Args:
+            texts: Texts of the upcoming documents
+            config: Analysis configuration (FAST mode limit, embedding store)
+        """
+        if not self.check_availability() or self.load_model() is None:
+            return
+
+        capacity = get_embedding_service().cache_size
+        sentences: List[str] = []
+        for text in texts:
+            if config is not None:
+                effective_limit = config.get_effective_limit(self.dimension_name, len(text))
+                if effective_limit is not None:
+                    text = text[:effective_limit]
+            paragraphs, document_sentences, _ = self._split_paragraph_sentences(text)
+            if len(paragraphs) < 2:
+                continue
+            if len(document_sentences) > self.MAX_SENTENCES_BEFORE_SAMPLING:
+                document_sentences = self._sample_sentences(document_sentences)
+            # Embeddings beyond the in-memory cache would be evicted before use
+            if len(sentences) + len(document_sentences) > capacity:
+                break
+            sentences.extend(document_sentences)
+
+        if sentences:
+            self._generate_embeddings(sentences, config=config)
+
     # ========================================================================
     # TEXT SPLITTING UTILITIES
     # ========================================================================
 
-    def _split_paragraphs(self, text: str) -> List[str]:
+    def _split_paragraphs(self, text: str, document: Optional[DocumentContext] = None) -> List[str]:
         """
         Split text into paragraphs.
 
         Args:
             text: Full document text
+            document: Per-analysis DocumentContext sharing the segmentation
 
         Returns:
             List of paragraph strings (non-empty)
         """
         # Split on double newlines, strip whitespace, filter empty
-        paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text)]
-        return [p for p in paragraphs if p]
+        return segment_text(text, document).paragraphs
+
+    def _split_paragraph_sentences(
+        self, text: str, document: Optional[DocumentContext] = None
+    ) -> Tuple[List[str], List[str], List[int]]:
+        """
+        Split text into paragraphs and the sentences of each paragraph.
+
+        Args:
+            text: Full document text
+            document: Per-analysis DocumentContext sharing the segmentation
+
+        Returns:
+            Tuple of (paragraphs, sentences of all paragraphs in order,
+            sentence count of each paragraph)
+        """
+        segments = segment_text(text, document)
+        paragraphs = segments.paragraphs
+        sentences_per_paragraph = np.bincount(
+            segments.sentence_paragraphs, minlength=len(paragraphs)
+        ).tolist()
+        return paragraphs, segments.sentences, sentences_per_paragraph
 
     def _split_sentences(self, text: str) -> List[str]:
         """
@@ -311,31 +435,47 @@ class SemanticCoherenceDimension(DimensionStrategy):
         Returns:
             Sampled sentence list (evenly distributed)
         """
+        return [sentences[i] for i in self._sample_indices(len(sentences), max_count)]
+
+    def _sample_indices(self, count: int, max_count: Optional[int] = None) -> List[int]:
+        """
+        Get indices of evenly distributed sentences to keep.
+
+        Args:
+            count: Number of sentences
+            max_count: Maximum sentences to keep (default: SAMPLE_SIZE)
+
+        Returns:
+            Sorted sentence indices (all indices if count <= max_count)
+        """
         if max_count is None:
             max_count = self.SAMPLE_SIZE
 
-        if len(sentences) <= max_count:
-            return sentences
+        if count <= max_count:
+            return list(range(count))
 
         # Sample evenly distributed sentences
-        step = len(sentences) // max_count
-        return sentences[::step][:max_count]
+        step = count // max_count
+        return list(range(0, count, step))[:max_count]
 
     # ========================================================================
     # FALLBACK: BASIC LEXICAL COHERENCE
     # ========================================================================
 
-    def _analyze_basic_coherence(self, text: str) -> Dict[str, Any]:
+    def _analyze_basic_coherence(
+        self, text: str, document: Optional[DocumentContext] = None
+    ) -> Dict[str, Any]:
         """
         Fallback analysis using word overlap (no sentence-transformers).
 
         Args:
             text: Full document text
+            document: Per-analysis DocumentContext sharing the segmentation
 
         Returns:
             Dict with basic coherence metrics and neutral score
         """
-        paragraphs = self._split_paragraphs(text)
+        paragraphs = self._split_paragraphs(text, document)
 
         if len(paragraphs) < 2:
             return {
@@ -371,31 +511,40 @@ class SemanticCoherenceDimension(DimensionStrategy):
     # ========================================================================
 
     def _generate_embeddings(
-        self, texts: List[str], batch_size: Optional[int] = None
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        config: Optional[AnalysisConfig] = None,
     ) -> Optional[np.ndarray]:
         """
         Generate embeddings for text list using batch processing.
 
+        Sentences embedded before (in this process, or in an earlier run when
+        the result cache is enabled) are not encoded again.
+
         Args:
             texts: List of text strings to embed
             batch_size: Batch size for processing (default: BATCH_SIZE)
+            config: Analysis configuration (selects the on-disk embedding cache)
 
         Returns:
             numpy array of shape (len(texts), 384) or None on error
         """
-        model = self.load_model()
-        if model is None:
+        if self.load_model() is None:
             return None
 
         if batch_size is None:
             batch_size = self.BATCH_SIZE
 
         try:
-            # Batch encode for performance (5-10× speedup)
-            embeddings: np.ndarray = model.encode(
-                texts, batch_size=batch_size, show_progress_bar=False, convert_to_numpy=True
+            # Batch encode for performance (5-10× speedup), a few batches per
+            # call so the analysis deadline is checked between calls
+            return get_embedding_service().encode(
+                texts,
+                batch_size=batch_size,
+                store=get_embedding_store_for(config),
+                batches_per_deadline_check=self.BATCHES_PER_DEADLINE_CHECK,
             )
-            return embeddings
         except Exception:
             # Encoding failed
             return None
@@ -417,32 +566,9 @@ class SemanticCoherenceDimension(DimensionStrategy):
         Returns:
             float: Mean cohesion score [0.0, 1.0]
         """
-        cohesion_scores = []
-        offset = 0
-
-        for count in sentences_per_paragraph:
-            if count < 2:
-                offset += count
-                continue
-
-            # Get embeddings for this paragraph
-            para_embeddings = paragraph_embeddings[offset : offset + count]
-
-            # Calculate pairwise cosine similarities
-            similarities = []
-            for i in range(len(para_embeddings)):
-                for j in range(i + 1, len(para_embeddings)):
-                    vec_a = para_embeddings[i]
-                    vec_b = para_embeddings[j]
-                    # Cosine similarity
-                    sim = np.dot(vec_a, vec_b) / (np.linalg.norm(vec_a) * np.linalg.norm(vec_b))
-                    similarities.append(sim)
-
-            if similarities:
-                cohesion_scores.append(np.mean(similarities))
-
-            offset += count
-
+        cohesion_scores = block_similarity_means(
+            unit_rows(paragraph_embeddings), sentences_per_paragraph
+        )
         return float(np.mean(cohesion_scores)) if cohesion_scores else 0.0
 
     def _calculate_topic_consistency(self, paragraph_embeddings: List[np.ndarray]) -> float:
@@ -457,17 +583,20 @@ class SemanticCoherenceDimension(DimensionStrategy):
         """
         if len(paragraph_embeddings) < 2:
             return 0.0
+        return self._topic_consistency_score(adjacent_similarities(unit_rows(paragraph_embeddings)))
+
+    def _topic_consistency_score(self, similarities: np.ndarray) -> float:
+        """
+        Score topic consistency from adjacent paragraph similarities.
 
-        # Calculate similarity between adjacent paragraphs
-        similarities = []
-        for i in range(len(paragraph_embeddings) - 1):
-            vec_a = paragraph_embeddings[i]
-            vec_b = paragraph_embeddings[i + 1]
-            sim = np.dot(vec_a, vec_b) / (np.linalg.norm(vec_a) * np.linalg.norm(vec_b))
-            similarities.append(sim)
+        Args:
+            similarities: Similarity of each paragraph with the next
 
+        Returns:
+            float: Weighted consistency score [0.0, 1.0]
+        """
         # Guard against empty similarities
-        if not similarities:
+        if len(similarities) == 0:
             return 0.0
 
         # Compute consistency (mean) and smoothness (inverse std)
@@ -491,24 +620,28 @@ class SemanticCoherenceDimension(DimensionStrategy):
         """
         if len(paragraph_embeddings) < 2:
             return 0.0
+        return self._discourse_flow_score(adjacent_similarities(unit_rows(paragraph_embeddings)))
+
+    def _discourse_flow_score(self, similarities: np.ndarray) -> float:
+        """
+        Score discourse flow from adjacent paragraph similarities.
+
+        Args:
+            similarities: Similarity of each paragraph with the next
+
+        Returns:
+            float: Proportion of transitions in the ideal range [0.0, 1.0]
+        """
+        if len(similarities) == 0:
+            return 0.0
 
         # Use general domain thresholds for metric calculation
         ideal_min = self.THRESHOLDS["general"]["discourse_flow"]["ideal_min"]
         ideal_max = self.THRESHOLDS["general"]["discourse_flow"]["ideal_max"]
 
-        # Calculate transition similarities
-        similarities = []
-        for i in range(len(paragraph_embeddings) - 1):
-            vec_a = paragraph_embeddings[i]
-            vec_b = paragraph_embeddings[i + 1]
-            sim = np.dot(vec_a, vec_b) / (np.linalg.norm(vec_a) * np.linalg.norm(vec_b))
-            similarities.append(sim)
-
         # Score based on ideal range
-        in_range_count = sum(1 for s in similarities if ideal_min <= s <= ideal_max)
-        proportion_in_range = in_range_count / len(similarities)
-
-        return float(proportion_in_range)
+        in_range_count = np.count_nonzero((similarities >= ideal_min) & (similarities <= ideal_max))
+        return float(in_range_count / len(similarities))
 
     def _calculate_conceptual_depth(
         self, paragraph_embeddings: List[np.ndarray], document_embedding: np.ndarray
@@ -523,19 +656,23 @@ class SemanticCoherenceDimension(DimensionStrategy):
         Returns:
             float: Weighted depth score [0.0, 1.0]
         """
-        if not paragraph_embeddings:
+        if len(paragraph_embeddings) == 0:
             return 0.0
+        alignment = unit_rows(paragraph_embeddings) @ unit_rows(document_embedding)[0]
+        return self._conceptual_depth_score(alignment)
 
-        # Calculate paragraph-to-document similarities
-        similarities = []
-        for para_emb in paragraph_embeddings:
-            sim = np.dot(para_emb, document_embedding) / (
-                np.linalg.norm(para_emb) * np.linalg.norm(document_embedding)
-            )
-            similarities.append(sim)
+    def _conceptual_depth_score(self, similarities: np.ndarray) -> float:
+        """
+        Score conceptual depth from paragraph-to-document similarities.
+
+        Args:
+            similarities: Similarity of each paragraph with the document
 
-        # Guard against empty similarities (shouldn't happen due to check above, but defensive)
-        if not similarities:
+        Returns:
+            float: Weighted depth score [0.0, 1.0]
+        """
+        # Guard against empty similarities
+        if len(similarities) == 0:
             return 0.0
 
         # Compute depth (mean similarity) and consistency (inverse std)
@@ -554,7 +691,7 @@ class SemanticCoherenceDimension(DimensionStrategy):
     def _collect_evidence(
         self,
         paragraphs: List[str],
-        paragraph_embeddings: List[np.ndarray],
+        transition_similarities: np.ndarray,
         sentences_per_paragraph: List[int],
         paragraph_cohesion: float,
         topic_consistency: float,
@@ -566,7 +703,7 @@ class SemanticCoherenceDimension(DimensionStrategy):
 
         Args:
             paragraphs: List of paragraph texts
-            paragraph_embeddings: List of paragraph embeddings
+            transition_similarities: Similarity of each paragraph with the next
             sentences_per_paragraph: Sentence counts per paragraph
             paragraph_cohesion: Overall cohesion score
             topic_consistency: Overall consistency score
@@ -597,12 +734,8 @@ class SemanticCoherenceDimension(DimensionStrategy):
                     break
 
         # Collect topic shifts (adjacent paragraphs with low similarity)
-        if topic_consistency < 0.55 and len(paragraph_embeddings) >= 2:
-            for i in range(min(len(paragraph_embeddings) - 1, 10)):
-                vec_a = paragraph_embeddings[i]
-                vec_b = paragraph_embeddings[i + 1]
-                sim = np.dot(vec_a, vec_b) / (np.linalg.norm(vec_a) * np.linalg.norm(vec_b))
-
+        if topic_consistency < 0.55 and len(transition_similarities) >= 1:
+            for i, sim in enumerate(transition_similarities[:10]):
                 # Identify significant topic shifts (similarity < 0.45)
                 if sim < 0.45:
                     para_preview = (
@@ -620,15 +753,11 @@ class SemanticCoherenceDimension(DimensionStrategy):
                     break
 
         # Collect weak transitions (flow outside ideal range)
-        if discourse_flow < 0.50 and len(paragraph_embeddings) >= 2:
+        if discourse_flow < 0.50 and len(transition_similarities) >= 1:
             ideal_min = self.THRESHOLDS["general"]["discourse_flow"]["ideal_min"]
             ideal_max = self.THRESHOLDS["general"]["discourse_flow"]["ideal_max"]
 
-            for i in range(min(len(paragraph_embeddings) - 1, 10)):
-                vec_a = paragraph_embeddings[i]
-                vec_b = paragraph_embeddings[i + 1]
-                sim = np.dot(vec_a, vec_b) / (np.linalg.norm(vec_a) * np.linalg.norm(vec_b))
-
+            for i, sim in enumerate(transition_similarities[:10]):
                 # Identify transitions outside ideal range
                 if sim < ideal_min or sim > ideal_max:
                     issue_type = "too disconnected" if sim < ideal_min else "too repetitive"
@@ -644,18 +773,25 @@ class SemanticCoherenceDimension(DimensionStrategy):
     # MAIN ANALYSIS
     # ========================================================================
 
-    def _analyze_semantic_coherence(self, text: str) -> Dict[str, Any]:
+    def _analyze_semantic_coherence(
+        self,
+        text: str,
+        config: Optional[AnalysisConfig] = None,
+        document: Optional[DocumentContext] = None,
+    ) -> Dict[str, Any]:
         """
         Full semantic coherence analysis using sentence embeddings.
 
         Args:
             text: Full document text
+            config: Analysis configuration (selects the on-disk embedding cache)
+            document: Per-analysis DocumentContext sharing the segmentation
 
         Returns:
             Dict with all coherence metrics
         """
         # Split text
-        paragraphs = self._split_paragraphs(text)
+        paragraphs = self._split_paragraphs(text, document)
         if len(paragraphs) < 2:
             return {
                 "method": "semantic",
@@ -665,12 +801,7 @@ class SemanticCoherenceDimension(DimensionStrategy):
             }
 
         # Split into sentences and track paragraph structure
-        all_sentences = []
-        sentences_per_paragraph = []
-        for para in paragraphs:
-            sentences = self._split_sentences(para)
-            all_sentences.extend(sentences)
-            sentences_per_paragraph.append(len(sentences))
+        _, all_sentences, sentences_per_paragraph = self._split_paragraph_sentences(text, document)
 
         # Track if sampling was needed
         original_sentence_count = len(all_sentences)
@@ -681,11 +812,40 @@ class SemanticCoherenceDimension(DimensionStrategy):
             all_sentences = self._sample_sentences(all_sentences)
 
         # Generate embeddings
-        sentence_embeddings = self._generate_embeddings(all_sentences)
+        sentence_embeddings = self._generate_embeddings(all_sentences, config=config)
         if sentence_embeddings is None:
             # Fall back to basic analysis
-            return self._analyze_basic_coherence(text)
+            return self._analyze_basic_coherence(text, document)
+
+        return self._coherence_from_embeddings(
+            paragraphs,
+            sentences_per_paragraph,
+            sentence_embeddings,
+            original_sentence_count,
+            was_sampled,
+        )
 
+    def _coherence_from_embeddings(
+        self,
+        paragraphs: List[str],
+        sentences_per_paragraph: List[int],
+        sentence_embeddings: np.ndarray,
+        original_sentence_count: int,
+        was_sampled: bool,
+    ) -> Dict[str, Any]:
+        """
+        Calculate coherence metrics and evidence from sentence embeddings.
+
+        Args:
+            paragraphs: Paragraph texts
+            sentences_per_paragraph: Sentence count per paragraph
+            sentence_embeddings: Embeddings of the (possibly sampled) sentences
+            original_sentence_count: Sentence count before sampling
+            was_sampled: Whether sentences were sampled
+
+        Returns:
+            Dict with all coherence metrics
+        """
         # Generate paragraph embeddings (mean of sentence embeddings)
         paragraph_embeddings = []
         offset = 0
@@ -707,20 +867,23 @@ class SemanticCoherenceDimension(DimensionStrategy):
             }
         document_embedding = np.mean(paragraph_embeddings, axis=0)
 
+        # Normalize once; every similarity below is a matrix product
+        unit_paragraphs = unit_rows(paragraph_embeddings)
+        transitions = adjacent_similarities(unit_paragraphs)
+        alignment = unit_paragraphs @ unit_rows(document_embedding)[0]
+
         # Calculate all 4 metrics
         paragraph_cohesion = self._calculate_paragraph_cohesion(
             sentence_embeddings, sentences_per_paragraph
         )
-        topic_consistency = self._calculate_topic_consistency(paragraph_embeddings)
-        discourse_flow = self._calculate_discourse_flow(paragraph_embeddings)
-        conceptual_depth = self._calculate_conceptual_depth(
-            paragraph_embeddings, document_embedding
-        )
+        topic_consistency = self._topic_consistency_score(transitions)
+        discourse_flow = self._discourse_flow_score(transitions)
+        conceptual_depth = self._conceptual_depth_score(alignment)
 
         # Collect evidence for low-scoring areas
         evidence = self._collect_evidence(
             paragraphs,
-            paragraph_embeddings,
+            transitions,
             sentences_per_paragraph,
             paragraph_cohesion,
             topic_consistency,
@@ -777,11 +940,16 @@ class SemanticCoherenceDimension(DimensionStrategy):
                 text = text[:effective_limit]
 
         # Check model availability and route to appropriate analysis
+        document = kwargs.get("document")
         if self.check_availability() and self.load_model() is not None:
-            result = self._analyze_semantic_coherence(text)
+            result = self._analyze_semantic_coherence(text, config, document)
         else:
-            result = self._analyze_basic_coherence(text)
+            result = self._analyze_basic_coherence(text, document)
+
+        return self._finalize_result(result)
 
+    def _finalize_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add score, tier mapping and recommendations to analysis metrics."""
         # Calculate score
         score = self.calculate_score(result)
         result["score"] = score
@@ -794,6 +962,102 @@ class SemanticCoherenceDimension(DimensionStrategy):
 
         return result
 
+    # ========================================================================
+    # INCREMENTAL ANALYSIS - sentence embeddings are per section
+    # ========================================================================
+
+    def supports_incremental(self, text: str, config: Optional[AnalysisConfig] = None) -> bool:
+        """Incremental analysis applies to untruncated text with the embedding model."""
+        if config is not None:
+            effective_limit = config.get_effective_limit(self.dimension_name, len(text))
+            if effective_limit is not None and effective_limit < len(text):
+                return False
+        return self.check_availability() and self.load_model() is not None
+
+    def summarize_section(
+        self, section: str, config: Optional[AnalysisConfig] = None
+    ) -> Dict[str, Any]:
+        """
+        Summarize one section as its paragraphs and sentence embeddings.
+
+        Args:
+            section: Section text
+            config: Analysis configuration (selects the on-disk embedding cache)
+
+        Returns:
+            Dict with paragraphs, sentences_per_paragraph and embeddings
+            (or an "error" key if embedding failed)
+        """
+        paragraphs, sentences, sentences_per_paragraph = self._split_paragraph_sentences(section)
+
+        embeddings = (
+            self._generate_embeddings(sentences, config=config) if sentences else np.zeros((0, 0))
+        )
+        if embeddings is None:
+            return {"error": "Embedding generation failed"}
+
+        return {
+            "paragraphs": paragraphs,
+            "sentences_per_paragraph": sentences_per_paragraph,
+            "embeddings": embeddings,
+        }
+
+    def merge_section_summaries(
+        self,
+        summaries: List[Dict[str, Any]],
+        text: str,
+        config: Optional[AnalysisConfig] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Compute document coherence from per-section sentence embeddings.
+
+        Sentence sampling for long documents selects the same sentences as
+        analyze(), from the concatenated embeddings.
+
+        Args:
+            summaries: summarize_section() output for each section, in order
+            text: Full text
+            config: Analysis configuration
+            **kwargs: Additional parameters (unused)
+
+        Returns:
+            Dict identical to analyze() on the full text
+        """
+        if any(summary.get("error") for summary in summaries):
+            return self.analyze(text, config=config, **kwargs)
+
+        paragraphs = [p for summary in summaries for p in summary["paragraphs"]]
+        if len(paragraphs) < 2:
+            return self._finalize_result(
+                {
+                    "method": "semantic",
+                    "available": True,
+                    "error": "Insufficient paragraphs",
+                    "paragraph_count": len(paragraphs),
+                }
+            )
+
+        sentences_per_paragraph = [
+            count for summary in summaries for count in summary["sentences_per_paragraph"]
+        ]
+        embedded = [summary["embeddings"] for summary in summaries if len(summary["embeddings"])]
+        # No sentences anywhere: same "no valid paragraph embeddings" result as analyze()
+        sentence_embeddings = np.concatenate(embedded) if embedded else np.zeros((0, 0))
+        original_sentence_count = len(sentence_embeddings)
+        was_sampled = original_sentence_count > self.MAX_SENTENCES_BEFORE_SAMPLING
+        if was_sampled:
+            sentence_embeddings = sentence_embeddings[self._sample_indices(original_sentence_count)]
+
+        result = self._coherence_from_embeddings(
+            paragraphs,
+            sentences_per_paragraph,
+            sentence_embeddings,
+            original_sentence_count,
+            was_sampled,
+        )
+        return self._finalize_result(result)
+
     def _get_tier_mapping(self, score: float) -> str:
         """Map score to tier label."""
         tiers = self.get_tiers()
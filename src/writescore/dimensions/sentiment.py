@@ -12,12 +12,14 @@ while human writing shows natural emotional range (variance > 0.15).
 Refactored in Story 1.4 to use DimensionStrategy pattern with self-registration.
 """
 
+import re
 import statistics
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
+from writescore.utils.deadline import check_deadline
 
 # Lazy load transformers
 _sentiment_pipeline = None
@@ -40,6 +42,115 @@ def get_sentiment_pipeline():
     return _sentiment_pipeline
 
 
+def clear_sentiment_pipeline():
+    """Forget the sentiment analysis pipeline (frees model RAM)."""
+    global _sentiment_pipeline
+    _sentiment_pipeline = None
+
+
+# Fallback token limit when neither tokenizer nor model declares one (BERT family)
+DEFAULT_MAX_TOKENS = 512
+
+# Chunks shorter than this (after stripping) carry too little sentiment signal
+MIN_CHUNK_CHARS = 20
+
+
+def _split_with_offsets(text: str, separator: str) -> List[Tuple[int, str]]:
+    """
+    Split text on a regex like re.split(), keeping each stripped piece's offset.
+
+    Args:
+        text: Text to split
+        separator: Separator regex
+
+    Returns:
+        List of (offset, piece) tuples for pieces longer than MIN_CHUNK_CHARS
+    """
+    pieces = []
+    start = 0
+    for match in [*re.finditer(separator, text), None]:
+        end = match.start() if match else len(text)
+        piece = text[start:end]
+        stripped = piece.strip()
+        if len(stripped) > MIN_CHUNK_CHARS:
+            pieces.append((start + len(piece) - len(piece.lstrip()), stripped))
+        if match:
+            start = match.end()
+    return pieces
+
+
+def _max_tokens(tokenizer, model) -> int:
+    """Longest input the classifier accepts, in tokens."""
+    limits = [
+        getattr(tokenizer, "model_max_length", None),
+        getattr(model.config, "max_position_embeddings", None),
+    ]
+    # Tokenizers without a declared limit report a huge sentinel value
+    limits = [limit for limit in limits if isinstance(limit, int) and 0 < limit < 100_000]
+    return min(limits) if limits else DEFAULT_MAX_TOKENS
+
+
+def score_sentiment_batched(
+    tokenizer,
+    model,
+    chunks: Sequence[Tuple[int, str]],
+    batch_size: int = 16,
+) -> List[Tuple[int, float]]:
+    """
+    Score sentiment polarity of text chunks in padded batches.
+
+    All chunks are tokenized together (truncated to the model's token limit),
+    sorted by token length so each batch pads to similar lengths, and run
+    batch_size at a time. Results match running the sentiment pipeline on each
+    chunk: the top label's probability, negated for NEGATIVE.
+
+    Args:
+        tokenizer: HuggingFace tokenizer of a sequence classification model
+        model: HuggingFace sequence classification model (POSITIVE/NEGATIVE labels)
+        chunks: List of (offset, chunk_text) tuples
+        batch_size: Chunks per forward pass
+
+    Returns:
+        List of (offset, polarity) tuples in chunk order, polarity in [-1, 1]
+
+    Raises:
+        DeadlineExceeded: If the active analysis deadline passes between batches
+    """
+    import torch
+
+    if not chunks:
+        return []
+
+    encodings = tokenizer(
+        [chunk for _, chunk in chunks],
+        truncation=True,
+        max_length=_max_tokens(tokenizer, model),
+    )
+    input_ids = encodings["input_ids"]
+    order = sorted(range(len(chunks)), key=lambda i: len(input_ids[i]))
+    id2label = model.config.id2label
+    device = next(model.parameters()).device
+
+    polarities: List[float] = [0.0] * len(chunks)
+    for start in range(0, len(order), batch_size):
+        check_deadline()
+        batch = order[start : start + batch_size]
+        padded = tokenizer.pad(
+            {"input_ids": [input_ids[i] for i in batch]},
+            return_tensors="pt",
+        )
+        with torch.no_grad():
+            logits = model(
+                input_ids=padded["input_ids"].to(device),
+                attention_mask=padded["attention_mask"].to(device),
+            ).logits
+        probabilities, labels = logits.float().softmax(dim=-1).max(dim=-1)
+        for i, probability, label in zip(batch, probabilities.tolist(), labels.tolist()):
+            polarities[i] = -probability if id2label[label] == "NEGATIVE" else probability
+
+    return [(offset, polarity) for (offset, _), polarity in zip(chunks, polarities)]
+
+
 class SentimentDimension(DimensionStrategy):
     """
     Analyzes sentiment dimension - emotional variation and flatness.
@@ -83,6 +194,21 @@ class SentimentDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes emotional variation patterns and sentiment flatness detection"
 
+    @property
+    def analysis_cost(self) -> int:
+        """Return relative analysis cost (transformer classifier per chunk)."""
+        return 8
+
+    @property
+    def uses_torch(self) -> bool:
+        """Return True (runs torch models)."""
+        return True
+
+    @staticmethod
+    def clear_model_cache():
+        """Release the shared sentiment pipeline (DistilBERT, ~250MB)."""
+        clear_sentiment_pipeline()
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -118,7 +244,7 @@ class SentimentDimension(DimensionStrategy):
             sample_results = []
 
             for _position, sample_text in samples:
-                sentiment_results = self._analyze_sentiment_variance(sample_text)
+                sentiment_results = self._analyze_sentiment_variance(sample_text, config)
                 sample_results.append({"sentiment": sentiment_results})
 
             # Aggregate metrics from all samples
@@ -129,7 +255,7 @@ class SentimentDimension(DimensionStrategy):
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            sentiment_results = self._analyze_sentiment_variance(analyzed_text)
+            sentiment_results = self._analyze_sentiment_variance(analyzed_text, config)
             aggregated = {"sentiment": sentiment_results}
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
@@ -290,49 +416,61 @@ class SentimentDimension(DimensionStrategy):
     # HELPER METHODS
     # ========================================================================
 
-    def _analyze_sentiment_variance(self, text: str) -> Dict:
+    def _split_chunks(self, text: str, config: AnalysisConfig) -> List[Tuple[int, str]]:
         """
-        Analyze sentiment variance across text chunks.
+        Split text into the chunks whose sentiment is compared.
 
-        AI writing shows emotional flatness (low variance).
-        Human writing shows natural emotional range (high variance).
+        Paragraphs are more meaningful than sentences; sentences are used when
+        there are fewer than 3 paragraphs.
+
+        Args:
+            text: Text to split
+            config: Analysis configuration (sentiment_max_paragraphs/sentences)
+
+        Returns:
+            List of (offset, chunk_text) tuples
         """
-        pipeline = get_sentiment_pipeline()
+        paragraphs = _split_with_offsets(text, r"\n\n")
+        if len(paragraphs) >= 3:
+            return paragraphs[: config.sentiment_max_paragraphs]
 
-        # Split into paragraphs (more meaningful than sentences)
-        paragraphs = [p.strip() for p in text.split("\n\n") if len(p.strip()) > 20]
+        sentences = _split_with_offsets(text, r"[.!?]+")
+        return sentences[: config.sentiment_max_sentences]
 
-        if len(paragraphs) < 3:
-            # Fallback to sentences if too few paragraphs
-            import re
+    def _analyze_sentiment_variance(
+        self, text: str, config: Optional[AnalysisConfig] = None
+    ) -> Dict:
+        """
+        Analyze sentiment variance across text chunks.
 
-            sentences = [s.strip() for s in re.split(r"[.!?]+", text) if len(s.strip()) > 20]
-            chunks = sentences[:50]  # Limit for performance
-        else:
-            chunks = paragraphs[:30]  # Limit for performance
+        AI writing shows emotional flatness (low variance).
+        Human writing shows natural emotional range (high variance).
+        """
+        config = config or DEFAULT_CONFIG
+        chunks = self._split_chunks(text, config)
 
         if len(chunks) < 3:
             # Not enough text to analyze variance
             return {"variance": 0.0, "mean": 0.0, "count": len(chunks), "emotionally_flat": True}
 
-        # Analyze sentiment for each chunk
-        # Pipeline returns: [{'label': 'POSITIVE', 'score': 0.9998}]
-        sentiments = []
-        for chunk in chunks:
-            try:
-                # Truncate long chunks to avoid token limit
-                chunk_text = chunk[:512]
-                result = pipeline(chunk_text)[0]
-
-                # Convert to numeric: POSITIVE = +score, NEGATIVE = -score
-                score = result["score"]
-                if result["label"] == "NEGATIVE":
-                    score = -score
-
-                sentiments.append(score)
-            except Exception:
-                # Skip problematic chunks
-                continue
+        pipeline = get_sentiment_pipeline()
+        try:
+            scored = score_sentiment_batched(
+                pipeline.tokenizer, pipeline.model, chunks, config.sentiment_batch_size
+            )
+        except Exception:
+            # A batch failed: score chunks one at a time, skipping problematic ones
+            scored = []
+            for offset, chunk in chunks:
+                try:
+                    scored.extend(
+                        score_sentiment_batched(
+                            pipeline.tokenizer, pipeline.model, [(offset, chunk)]
+                        )
+                    )
+                except Exception:
+                    continue
+        sentiments = [polarity for _, polarity in scored]
 
         if len(sentiments) < 3:
             return {
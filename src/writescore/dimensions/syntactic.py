@@ -22,11 +22,10 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.document_context import DocumentContext, parse_document
 from writescore.core.results import SyntacticIssue
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
-from writescore.utils import load_spacy_model
-
-nlp_spacy = load_spacy_model("en_core_web_sm")
+from writescore.utils import get_spacy_model
 
 
 class SyntacticDimension(DimensionStrategy):
@@ -72,6 +71,16 @@ class SyntacticDimension(DimensionStrategy):
         """Return dimension description."""
         return "Analyzes syntactic complexity, dependency depth, and structural patterns"
 
+    @property
+    def analysis_cost(self) -> int:
+        """Return relative analysis cost (spaCy parse)."""
+        return 3
+
+    @property
+    def shared_resources(self) -> Tuple[str, ...]:
+        """Return resources shared with other dimensions (spaCy parse)."""
+        return ("spacy_doc",)
+
     # ========================================================================
     # ANALYSIS METHODS
     # ========================================================================
@@ -96,7 +105,8 @@ class SyntacticDimension(DimensionStrategy):
             text: Full text content
             lines: Text split into lines (optional)
             config: Analysis configuration (None = ADAPTIVE)
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters including:
+                document (DocumentContext): Shared parse cache for this analysis
 
         Returns:
             Dict with syntactic analysis results + metadata:
@@ -114,6 +124,7 @@ class SyntacticDimension(DimensionStrategy):
             - coverage_percentage: % of document analyzed
         """
         config = config or DEFAULT_CONFIG
+        document = kwargs.get("document")
         total_text_length = len(text)
 
         # Prepare text based on mode (FAST/ADAPTIVE/SAMPLING/FULL)
@@ -125,7 +136,7 @@ class SyntacticDimension(DimensionStrategy):
             sample_results = []
 
             for _position, sample_text in samples:
-                syntactic_metrics = self._analyze_syntactic_patterns(sample_text)
+                syntactic_metrics = self._analyze_syntactic_patterns(sample_text, document)
                 sample_results.append(syntactic_metrics)
 
             # Aggregate metrics from all samples
@@ -136,7 +147,7 @@ class SyntacticDimension(DimensionStrategy):
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            syntactic_metrics = self._analyze_syntactic_patterns(analyzed_text)
+            syntactic_metrics = self._analyze_syntactic_patterns(analyzed_text, document)
             aggregated = syntactic_metrics
             analyzed_length = len(analyzed_text)
             samples_analyzed = 1
@@ -300,7 +311,9 @@ class SyntacticDimension(DimensionStrategy):
     # HELPER METHODS
     # ========================================================================
 
-    def _analyze_syntactic_patterns(self, text: str) -> Dict:
+    def _analyze_syntactic_patterns(
+        self, text: str, document: Optional[DocumentContext] = None
+    ) -> Dict:
         """
         Enhanced syntactic analysis using spaCy.
 
@@ -315,6 +328,7 @@ class SyntacticDimension(DimensionStrategy):
 
         Args:
             text: Text to analyze (pre-truncated/sampled by caller)
+            document: Shared parse cache (parses directly when None)
 
         Returns:
             Dict with syntactic metrics
@@ -323,8 +337,8 @@ class SyntacticDimension(DimensionStrategy):
             # Remove code blocks
             text = re.sub(r"```[\s\S]*?```", "", text)
 
-            # Process with spaCy (now processes full text, pre-truncated/sampled by caller)
-            doc = nlp_spacy(text)
+            # Process with spaCy (parse shared with other dimensions via document)
+            doc = parse_document(text, document)
 
             # Extract sentence structures (POS patterns)
             sentence_structures = []
@@ -462,6 +476,7 @@ class SyntacticDimension(DimensionStrategy):
         issues = []
 
         try:
+            nlp = get_spacy_model("en_core_web_sm")
             for line_num, line in enumerate(lines, start=1):
                 stripped = line.strip()
 
@@ -477,7 +492,7 @@ class SyntacticDimension(DimensionStrategy):
                     continue
 
                 # Parse sentences on this line
-                doc = nlp_spacy(stripped)
+                doc = nlp(stripped)
 
                 for sent in doc.sents:
                     sent_text = sent.text.strip()
@@ -37,8 +37,10 @@ from typing import Any, Dict, List, Optional, Tuple
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
 from writescore.core.results import TransitionInstance
+from writescore.core.segmentation import segment_text
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
 from writescore.utils.pattern_matching import FORMULAIC_TRANSITIONS
+from writescore.utils.pattern_set import PatternSet
 
 
 class TransitionMarkerDimension(DimensionStrategy):
@@ -60,6 +62,17 @@ class TransitionMarkerDimension(DimensionStrategy):
     Focuses on structural transition markers that distinguish AI from human writing.
     """
 
+    # Basic markers and formulaic transitions, scanned together (formulaic
+    # patterns are named by their own regex)
+    TRANSITION_PATTERNS = PatternSet(
+        {
+            "however": r"\bhowever\b",
+            "moreover": r"\bmoreover\b",
+            **{pattern: pattern for pattern in FORMULAIC_TRANSITIONS},
+        },
+        re.IGNORECASE,
+    )
+
     # ========================================================================
     # SCORING THRESHOLDS - Research-backed baselines
     # ========================================================================
@@ -371,11 +384,14 @@ class TransitionMarkerDimension(DimensionStrategy):
         # Calculate word count once (used by both methods)
         total_words = kwargs.get("word_count")
         if total_words is None:
-            total_words = len(re.findall(r"\b\w+\b", text))
+            total_words = segment_text(text, kwargs.get("document")).word_count
 
-        # Run both analyses
-        basic = self._analyze_basic_transitions(text, word_count=total_words)
-        formulaic = self._analyze_formulaic_transitions(text, word_count=total_words)
+        # Scan once for all markers, then run both analyses on the matches
+        matches = self.TRANSITION_PATTERNS.findall(text)
+        basic = self._analyze_basic_transitions(text, word_count=total_words, matches=matches)
+        formulaic = self._analyze_formulaic_transitions(
+            text, word_count=total_words, matches=matches
+        )
 
         # Calculate combined metric
         words_in_thousands = total_words / 1000 if total_words > 0 else 1
@@ -399,15 +415,18 @@ class TransitionMarkerDimension(DimensionStrategy):
         - Raw counts of each marker
         - Frequency per 1k words
         - Total combined marker frequency
+
+        Accepts pre-computed TRANSITION_PATTERNS matches as the ``matches`` kwarg.
         """
         result: Dict[str, Any] = {}
 
         # Count AI-specific markers: however and moreover
-        however_pattern = re.compile(r"\bhowever\b", re.IGNORECASE)
-        moreover_pattern = re.compile(r"\bmoreover\b", re.IGNORECASE)
+        matches = kwargs.get("matches")
+        if matches is None:
+            matches = self.TRANSITION_PATTERNS.findall(text)
 
-        however_count = len(however_pattern.findall(text))
-        moreover_count = len(moreover_pattern.findall(text))
+        however_count = len(matches["however"])
+        moreover_count = len(matches["moreover"])
 
         # Calculate per 1k words
         # Use pre-calculated word_count if provided, otherwise calculate
@@ -447,7 +466,8 @@ class TransitionMarkerDimension(DimensionStrategy):
 
         Args:
             text: Text to analyze
-            **kwargs: Additional parameters (word_count if pre-calculated)
+            **kwargs: Additional parameters (word_count if pre-calculated, matches
+                if TRANSITION_PATTERNS was already scanned)
 
         Returns:
             Dict with:
@@ -455,12 +475,14 @@ class TransitionMarkerDimension(DimensionStrategy):
             - transitions: List of transition instances (first 15)
             - per_1k: Transitions per 1000 words
         """
-        transitions_found = []
+        matches = kwargs.get("matches")
+        if matches is None:
+            matches = self.TRANSITION_PATTERNS.findall(text)
 
-        # Detect all formulaic transitions from shared patterns
+        # Collect formulaic transitions from shared patterns, in pattern order
+        transitions_found = []
         for pattern in FORMULAIC_TRANSITIONS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            transitions_found.extend([m.group() for m in matches])
+            transitions_found.extend(matches[pattern])
 
         # Calculate per 1k words
         total_words = kwargs.get("word_count")
@@ -483,9 +505,8 @@ class TransitionMarkerDimension(DimensionStrategy):
         """Detect AI-specific stylometric markers (however, moreover, clustering)."""
         issues = []
 
-        # Track "however" and "moreover" usage
+        # Track "however" usage for clustering
         however_pattern = re.compile(r"\bhowever\b", re.IGNORECASE)
-        moreover_pattern = re.compile(r"\bmoreover\b", re.IGNORECASE)
 
         # Count total words for frequency calculation
         total_words = sum(len(re.findall(r"\b\w+\b", line)) for line in lines)
@@ -500,9 +521,11 @@ class TransitionMarkerDimension(DimensionStrategy):
             if stripped.startswith("#") or stripped.startswith("```"):
                 continue
 
+            # One scan per line for every marker
+            matches = self.TRANSITION_PATTERNS.findall(line)
+
             # Check for "however" (AI: 5-10 per 1k, Human: 1-3 per 1k)
-            however_matches = list(however_pattern.finditer(line))
-            for _match in however_matches:
+            for _match in matches["however"]:
                 context = line.strip()
                 issues.append(
                     TransitionInstance(
@@ -517,8 +540,7 @@ class TransitionMarkerDimension(DimensionStrategy):
                 )
 
             # Check for "moreover" (AI: 3-7 per 1k, Human: 0-1 per 1k)
-            moreover_matches = list(moreover_pattern.finditer(line))
-            for _match in moreover_matches:
+            for _match in matches["moreover"]:
                 context = line.strip()
                 issues.append(
                     TransitionInstance(
@@ -534,9 +556,7 @@ class TransitionMarkerDimension(DimensionStrategy):
 
             # Check for formulaic transitions
             for pattern in FORMULAIC_TRANSITIONS:
-                matches = list(re.finditer(pattern, line, re.IGNORECASE))
-                for match in matches:
-                    transition = match.group()
+                for transition in matches[pattern]:
                     context = line.strip()
                     issues.append(
                         TransitionInstance(
@@ -17,6 +17,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from writescore.core.analysis_config import DEFAULT_CONFIG, AnalysisConfig
 from writescore.core.dimension_registry import DimensionRegistry
+from writescore.core.document_context import DocumentContext
+from writescore.core.segmentation import segment_text
 from writescore.dimensions.base_strategy import DimensionStrategy, DimensionTier
 from writescore.scoring.dual_score import THRESHOLDS
 
@@ -98,6 +100,7 @@ class VoiceDimension(DimensionStrategy):
         """
         config = config or DEFAULT_CONFIG
         total_text_length = len(text)
+        document = kwargs.get("document")
 
         # Prepare text based on mode (FAST/ADAPTIVE/SAMPLING/FULL)
         prepared = self._prepare_text(text, config, self.dimension_name)
@@ -108,7 +111,7 @@ class VoiceDimension(DimensionStrategy):
             sample_results = []
 
             for _position, sample_text in samples:
-                voice = self._analyze_voice(sample_text)
+                voice = self._analyze_voice(sample_text, document)
                 technical = self._analyze_technical_depth(sample_text)
                 sample_results.append({"voice": voice, "technical_depth": technical})
 
@@ -120,7 +123,7 @@ class VoiceDimension(DimensionStrategy):
         # Handle direct analysis (returns string - truncated or full text)
         else:
             analyzed_text = prepared
-            voice = self._analyze_voice(analyzed_text)
+            voice = self._analyze_voice(analyzed_text, document)
             technical = self._analyze_technical_depth(analyzed_text)
             aggregated = {
                 "voice": voice,
@@ -332,7 +335,7 @@ class VoiceDimension(DimensionStrategy):
     # HELPER METHODS
     # ========================================================================
 
-    def _analyze_voice(self, text: str) -> Dict:
+    def _analyze_voice(self, text: str, document: Optional[DocumentContext] = None) -> Dict:
         """Analyze voice and authenticity markers."""
         first_person = len(
             re.findall(
@@ -353,8 +356,7 @@ class VoiceDimension(DimensionStrategy):
         )
 
         # Calculate actual word count for accurate ratio calculation
-        words = re.findall(r"\b\w+\b", text)
-        total_words = len(words)
+        total_words = segment_text(text, document).word_count
 
         return {
             "first_person": first_person,
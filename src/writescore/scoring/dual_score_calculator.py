@@ -147,34 +147,7 @@ def _build_dimension_scores(
     dimensions = DimensionRegistry.get_all()
 
     # STORY 2.4.1 Task 10.5: Ensure weights sum to exactly 100.0
-    # Use WeightMediator to validate and rescale weights if needed
-    mediator = WeightMediator(tolerance=0.1)
-    effective_weights = {}  # Stores actual weights to use (rescaled or original)
-
-    if not mediator.is_valid:
-        # Weights don't sum to 100.0, get rescaling suggestions
-        rescaled_weights = mediator.suggest_rebalancing()
-        total_before = mediator.get_total_weight()
-
-        # Store rescaled weights in effective_weights dict
-        # Note: dimension.weight property remains unchanged (read-only)
-        for dim in dimensions:
-            if dim.dimension_name in rescaled_weights:
-                effective_weights[dim.dimension_name] = rescaled_weights[dim.dimension_name]
-                logger.debug(
-                    f"Rescaled {dim.dimension_name}: {dim.weight:.2f} → {effective_weights[dim.dimension_name]:.10f}"
-                )
-            else:
-                effective_weights[dim.dimension_name] = dim.weight
-
-        logger.info(
-            f"Weight rescaling applied: {total_before:.2f}% → 100.0000000000% "
-            f"(Task 10.5: ensuring exact sum for precision)"
-        )
-    else:
-        # Weights already sum to 100.0, use original weights
-        for dim in dimensions:
-            effective_weights[dim.dimension_name] = dim.weight
+    effective_weights = get_effective_weights(dimensions)
 
     for dim in dimensions:
         dim_name = dim.dimension_name
@@ -268,6 +241,48 @@ def _build_dimension_scores(
     return dimension_scores
 
 
+def get_effective_weights(dimensions: List[Any]) -> Dict[str, float]:
+    """
+    Get the weights dimension scores are scaled to (summing to exactly 100.0).
+
+    Args:
+        dimensions: Registered dimension instances
+
+    Returns:
+        Dict mapping dimension name to its effective (rescaled or original) weight
+    """
+    # Use WeightMediator to validate and rescale weights if needed
+    mediator = WeightMediator(tolerance=0.1)
+    effective_weights = {}  # Stores actual weights to use (rescaled or original)
+
+    if not mediator.is_valid:
+        # Weights don't sum to 100.0, get rescaling suggestions
+        rescaled_weights = mediator.suggest_rebalancing()
+        total_before = mediator.get_total_weight()
+
+        # Store rescaled weights in effective_weights dict
+        # Note: dimension.weight property remains unchanged (read-only)
+        for dim in dimensions:
+            if dim.dimension_name in rescaled_weights:
+                effective_weights[dim.dimension_name] = rescaled_weights[dim.dimension_name]
+                logger.debug(
+                    f"Rescaled {dim.dimension_name}: {dim.weight:.2f} → {effective_weights[dim.dimension_name]:.10f}"
+                )
+            else:
+                effective_weights[dim.dimension_name] = dim.weight
+
+        logger.info(
+            f"Weight rescaling applied: {total_before:.2f}% → 100.0000000000% "
+            f"(Task 10.5: ensuring exact sum for precision)"
+        )
+    else:
+        # Weights already sum to 100.0, use original weights
+        for dim in dimensions:
+            effective_weights[dim.dimension_name] = dim.weight
+
+    return effective_weights
+
+
 def _build_score_categories(
     dimension_scores: List[Tuple[Any, ScoreDimension]],
 ) -> List[ScoreCategory]:
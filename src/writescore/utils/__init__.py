@@ -2,6 +2,6 @@
 Shared utilities module.
 """
 
-from writescore.utils.spacy_loader import load_spacy_model
+from writescore.utils.spacy_loader import get_spacy_model, load_spacy_model
 
-__all__: list[str] = ["load_spacy_model"]
+__all__: list[str] = ["get_spacy_model", "load_spacy_model"]
@@ -0,0 +1,112 @@
+"""
+Cooperative analysis deadlines.
+
+AIPatternAnalyzer enforces AnalysisConfig.max_analysis_time_seconds by
+activating a Deadline for the duration of an analysis. Long-running loops
+(language model windows, embedding batches, spaCy pipeline components,
+sentiment chunks) call check_deadline() between units of work; once the
+deadline has passed it raises DeadlineExceeded, and the analyzer reports the
+dimension as skipped instead of waiting for it.
+
+DeadlineExceeded derives from BaseException (like asyncio.CancelledError), so
+the broad ``except Exception`` fallbacks inside dimensions do not swallow it.
+
+The active deadline is a context variable: it applies to the thread that
+activated it (worker threads must activate their own), and code running
+outside an analysis never times out.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+class DeadlineExceeded(BaseException):
+    """Raised at a cancellation point once the active deadline has passed."""
+
+
+class Deadline:
+    """
+    Point in time after which analysis work should stop.
+
+    Attributes:
+        seconds: Time budget the deadline was created with (None = no limit)
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Start a deadline.
+
+        Args:
+            seconds: Time budget from now (None or 0 = never expires)
+        """
+        self.seconds = seconds or None
+        self._expires_at = time.monotonic() + seconds if seconds else None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None without a limit."""
+        if self._expires_at is None:
+            return None
+        return max(0.0, self._expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self._expires_at is not None and time.monotonic() >= self._expires_at
+
+    def check(self) -> None:
+        """
+        Cancellation point.
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed
+        """
+        if self.expired:
+            raise DeadlineExceeded(f"analysis deadline of {self.seconds:g}s exceeded")
+
+    def earliest(self, other: Optional["Deadline"]) -> "Deadline":
+        """Return whichever of self and other expires first."""
+        if other is None or other._expires_at is None:
+            return self
+        if self._expires_at is None or other._expires_at < self._expires_at:
+            return other
+        return self
+
+
+_active_deadline: ContextVar[Optional[Deadline]] = ContextVar("writescore_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    Make deadline the active deadline for the current context.
+
+    Args:
+        deadline: Deadline to activate (None = no deadline inside the scope)
+
+    Yields:
+        The activated deadline
+    """
+    token = _active_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _active_deadline.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the active deadline, or None outside an analysis."""
+    return _active_deadline.get()
+
+
+def check_deadline() -> None:
+    """
+    Cancellation point for the active deadline (no-op without one).
+
+    Raises:
+        DeadlineExceeded: If the active deadline has passed
+    """
+    deadline = _active_deadline.get()
+    if deadline is not None:
+        deadline.check()
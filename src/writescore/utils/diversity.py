@@ -0,0 +1,277 @@
+"""
+Lexical diversity kernels over interned token sequences.
+
+A TokenSequence interns a document's tokens once into integer IDs (indices
+into its sorted vocabulary). Every metric then works on the ID array:
+
+- MTLD: forward and backward factor passes. Whether a token is new to the
+  current factor only depends on where its type last occurred, so the
+  running type-token ratio of a factor is a cumulative sum over a
+  "previous occurrence" array instead of a growing Python set.
+- MATTR: the type count of each sliding window follows from the previous
+  window by one addition and one removal; all windows are one cumulative
+  sum (linear in the number of tokens, independent of the window size).
+- RTTR and TTR: type counts of the whole sequence or a token subset.
+- Stemmed TTR: stems are computed once per vocabulary type through a
+  memoized stem table, never per token.
+
+Type-level predicates (alphabetic, stop word) are likewise evaluated once
+per type and broadcast to the tokens with select().
+"""
+
+from functools import lru_cache
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+
+from writescore.utils.lazy_import import lazy_import
+
+# Loaded on first stemmed calculation
+nltk = lazy_import("nltk")
+
+# Standard MTLD factor threshold (McCarthy & Jarvis, 2010)
+MTLD_THRESHOLD = 0.72
+
+# Tokens examined per step when searching for the end of an MTLD factor
+_FACTOR_CHUNK = 64
+
+
+@lru_cache(maxsize=1)
+def _porter_stemmer():
+    """Shared NLTK Porter stemmer."""
+    return nltk.stem.PorterStemmer()
+
+
+@lru_cache(maxsize=65536)
+def porter_stem(word: str) -> str:
+    """
+    Porter stem of a word, memoized across documents.
+
+    Args:
+        word: Lowercase word
+
+    Returns:
+        Stem
+    """
+    return _porter_stemmer().stem(word)
+
+
+def previous_occurrence(ids: np.ndarray) -> np.ndarray:
+    """
+    Index of the previous token with the same ID.
+
+    Args:
+        ids: Token IDs
+
+    Returns:
+        int64 array, -1 where the token's type has not occurred before
+    """
+    order = np.argsort(ids, kind="stable")
+    same = ids[order[1:]] == ids[order[:-1]]
+    previous = np.full(len(ids), -1, dtype=np.int64)
+    previous[order[1:][same]] = order[:-1][same]
+    return previous
+
+
+def next_occurrence(previous: np.ndarray) -> np.ndarray:
+    """
+    Index of the next token with the same ID.
+
+    Args:
+        previous: Output of previous_occurrence()
+
+    Returns:
+        int64 array, len(previous) where the type does not occur again
+    """
+    following = np.full(len(previous), len(previous), dtype=np.int64)
+    repeats = np.flatnonzero(previous >= 0)
+    following[previous[repeats]] = repeats
+    return following
+
+
+def _mtld_pass(ids: np.ndarray, threshold: float) -> float:
+    """
+    MTLD in one direction: tokens per factor.
+
+    A factor ends at the first token where its type-token ratio drops
+    below threshold; the remainder counts as a partial factor.
+
+    Args:
+        ids: Token IDs in reading order (or reversed)
+        threshold: Factor threshold
+
+    Returns:
+        Mean factor length
+    """
+    n = len(ids)
+    previous = previous_occurrence(ids)
+    factors = 0.0
+    start = 0
+    width = _FACTOR_CHUNK
+    while start < n:
+        end = min(n, start + width)
+        # A token opens a new type in this factor if its type last occurred before it
+        types = np.cumsum(previous[start:end] < start)
+        ratios = types / np.arange(1, end - start + 1)
+        below = np.flatnonzero(ratios < threshold)
+        if below.size:
+            factors += 1
+            start += int(below[0]) + 1
+            width = _FACTOR_CHUNK
+        elif end == n:
+            factors += (1 - ratios[-1]) / (1 - threshold)
+            break
+        else:
+            width *= 2
+    return n / factors if factors > 0 else float(n)
+
+
+class TokenSequence:
+    """
+    A document's tokens interned as integer IDs.
+
+    Attributes:
+        vocabulary: Sorted distinct tokens (ID -> token)
+        ids: Token IDs in document order
+    """
+
+    def __init__(self, tokens: Sequence[str]):
+        """
+        Intern tokens.
+
+        Args:
+            tokens: Normalized (e.g. lowercased) tokens
+        """
+        if len(tokens):
+            vocabulary, ids = np.unique(np.asarray(tokens, dtype=str), return_inverse=True)
+        else:
+            vocabulary, ids = np.array([], dtype=str), np.array([], dtype=np.int64)
+        self.vocabulary: np.ndarray = vocabulary
+        self.ids: np.ndarray = ids.astype(np.int64, copy=False).ravel()
+
+    @classmethod
+    def _from_ids(cls, vocabulary: np.ndarray, ids: np.ndarray) -> "TokenSequence":
+        """Build a sequence over an existing vocabulary."""
+        sequence = cls.__new__(cls)
+        sequence.vocabulary = vocabulary
+        sequence.ids = ids
+        return sequence
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def tokens(self) -> int:
+        """Number of tokens."""
+        return len(self.ids)
+
+    @property
+    def types(self) -> int:
+        """Number of distinct types occurring in the sequence."""
+        if not len(self.ids):
+            return 0
+        return int(np.count_nonzero(np.bincount(self.ids, minlength=len(self.vocabulary))))
+
+    def type_mask(self, predicate: Callable[[str], bool]) -> np.ndarray:
+        """
+        Evaluate a predicate once per vocabulary type.
+
+        Args:
+            predicate: Test of a token string
+
+        Returns:
+            Boolean array indexed by ID
+        """
+        return np.fromiter(
+            (predicate(word) for word in self.vocabulary.tolist()),
+            dtype=bool,
+            count=len(self.vocabulary),
+        )
+
+    def select(self, predicate: Callable[[str], bool]) -> "TokenSequence":
+        """
+        Keep the tokens whose type satisfies a predicate.
+
+        Args:
+            predicate: Test of a token string (evaluated once per type)
+
+        Returns:
+            TokenSequence of the kept tokens (same vocabulary)
+        """
+        return self._from_ids(self.vocabulary, self.ids[self.type_mask(predicate)[self.ids]])
+
+    def map_types(self, function: Callable[[str], str]) -> "TokenSequence":
+        """
+        Map every type to a new type (e.g. its stem), merging types that collide.
+
+        Args:
+            function: Type mapping (evaluated once per type)
+
+        Returns:
+            TokenSequence over the mapped vocabulary
+        """
+        if not len(self.vocabulary):
+            return self._from_ids(self.vocabulary, self.ids)
+        mapped = [function(word) for word in self.vocabulary.tolist()]
+        vocabulary, type_ids = np.unique(np.asarray(mapped, dtype=str), return_inverse=True)
+        return self._from_ids(vocabulary, type_ids.astype(np.int64).ravel()[self.ids])
+
+    def ttr(self) -> float:
+        """Type-token ratio (0.0 for an empty sequence)."""
+        return self.types / self.tokens if self.tokens else 0.0
+
+    def rttr(self) -> float:
+        """Root type-token ratio: types / sqrt(tokens) (0.0 for an empty sequence)."""
+        return self.types / self.tokens**0.5 if self.tokens else 0.0
+
+    def stemmed_ttr(self, stem: Callable[[str], str] = porter_stem) -> float:
+        """
+        Type-token ratio of the stemmed tokens.
+
+        Args:
+            stem: Stemmer (default: memoized Porter stemmer)
+
+        Returns:
+            Stemmed TTR (0.0 for an empty sequence)
+        """
+        return self.map_types(stem).ttr()
+
+    def mtld(self, threshold: float = MTLD_THRESHOLD) -> float:
+        """
+        MTLD: mean of the forward and backward factor lengths.
+
+        Args:
+            threshold: Factor threshold
+
+        Returns:
+            MTLD (0.0 for an empty sequence)
+        """
+        if not self.tokens:
+            return 0.0
+        forward = _mtld_pass(self.ids, threshold)
+        backward = _mtld_pass(self.ids[::-1], threshold)
+        return float((forward + backward) / 2)
+
+    def mattr(self, window: int) -> Optional[float]:
+        """
+        Moving-average type-token ratio over all windows of a fixed size.
+
+        Args:
+            window: Tokens per window
+
+        Returns:
+            MATTR (0-1), or None if the sequence is shorter than window
+        """
+        n = self.tokens
+        if window <= 0 or n < window:
+            return None
+        previous = previous_occurrence(self.ids)
+        following = next_occurrence(previous)
+        first = int(np.count_nonzero(previous[:window] < 0))
+        # Sliding from window i to i + 1: token i + window adds a type unless it
+        # occurred in [i + 1, i + window); token i removes one unless it recurs there
+        starts = np.arange(n - window)
+        added = previous[window:] <= starts
+        removed = following[: n - window] >= starts + window
+        types = first + np.concatenate(([0], np.cumsum(added.astype(np.int64) - removed)))
+        return float(types.mean()) / window
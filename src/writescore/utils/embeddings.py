@@ -0,0 +1,510 @@
+"""
+Shared sentence-embedding service with a content-addressed embedding cache.
+
+SemanticCoherenceDimension and FigurativeLanguageDimension both embed text with
+all-MiniLM-L6-v2. Instead of each dimension loading its own copy of the model,
+they request the process-wide EmbeddingService, which:
+
+- Loads the SentenceTransformer once (thread-safe, lazy)
+- Keys every embedding by a hash of its text, so texts embedded earlier in the
+  process (in-memory LRU) or in an earlier run (optional EmbeddingStore on disk)
+  are not encoded again
+- Encodes only the missing texts, in batches, checking the analysis deadline
+  between batches
+
+Re-scoring a revised document therefore only runs the encoder on the sentences
+that changed.
+
+The on-disk store is one append-only file per model: a 16-byte header followed
+by fixed-size records (16-byte BLAKE2b digest of the text, float16 vector).
+Reads go through a memory map with an in-memory digest index. Each append is a
+single O_APPEND write, so batch workers in several processes can share a store.
+When the file would exceed its size limit it is replaced by an empty one.
+"""
+
+import hashlib
+import os
+import re
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from writescore.core.result_cache import default_cache_dir
+from writescore.utils.deadline import check_deadline
+
+# Default model shared by semantic coherence and figurative language
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Embeddings kept in memory per service (~30 MB for 384-dim vectors)
+DEFAULT_CACHE_SIZE = 20000
+
+# Maximum on-disk store size per model before it is reset
+DEFAULT_STORE_MAX_BYTES = 256 * 1024 * 1024
+
+EMBEDDINGS_DIRNAME = "embeddings"
+
+DIGEST_SIZE = 16
+
+_MAGIC = b"WSEMB001"
+_HEADER = struct.Struct("<8sI4x")  # magic, vector dimension, padding (16 bytes)
+
+
+def text_digest(text: str) -> bytes:
+    """
+    Content hash identifying a text's embedding.
+
+    Args:
+        text: Embedded text
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=DIGEST_SIZE).digest()
+
+
+def unit_rows(embeddings) -> np.ndarray:
+    """
+    L2-normalize embedding rows, so dot products are cosine similarities.
+
+    Args:
+        embeddings: Embedding matrix (or list of vectors), one row per text
+
+    Returns:
+        2-D array of unit rows (zero or NaN rows become NaN, like 0/0 cosines)
+    """
+    matrix = np.atleast_2d(np.asarray(embeddings))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+def _record_dtype(dim: int) -> np.dtype:
+    """Record layout of the on-disk store for dim-dimensional vectors."""
+    return np.dtype([("key", f"V{DIGEST_SIZE}"), ("vector", "<f2", (dim,))])
+
+
+class EmbeddingStore:
+    """
+    Memory-mapped on-disk float16 embedding matrix with a digest index.
+
+    Safe to share between threads and between processes: records are only
+    appended, and readers index records appended by other processes when the
+    file grows.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_STORE_MAX_BYTES):
+        """
+        Open a store (the file is created on the first add()).
+
+        Args:
+            path: Store file
+            max_bytes: File size at which the store is reset
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        """Forget the mapped file (after it was replaced or removed)."""
+        self._dim: Optional[int] = None
+        self._records: Optional[np.memmap] = None
+        self._index: Dict[bytes, int] = {}
+        self._file_id: Optional[tuple] = None
+        self._indexed_bytes = 0
+
+    def _refresh(self) -> None:
+        """Map and index records appended since the last refresh (lock held)."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset_state()
+            return
+
+        file_id = (stat.st_dev, stat.st_ino)
+        if file_id != self._file_id:
+            self._reset_state()
+            self._file_id = file_id
+        if stat.st_size == self._indexed_bytes or stat.st_size < _HEADER.size:
+            return
+
+        if self._dim is None:
+            with open(self.path, "rb") as f:
+                magic, dim = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or dim <= 0:
+                self._indexed_bytes = stat.st_size
+                return
+            self._dim = dim
+
+        dtype = _record_dtype(self._dim)
+        count = (stat.st_size - _HEADER.size) // dtype.itemsize
+        indexed = len(self._index)
+        if count > indexed:
+            self._records = np.memmap(
+                self.path, dtype=dtype, mode="r", offset=_HEADER.size, shape=(count,)
+            )
+            keys = self._records["key"][indexed:count].tobytes()
+            for row in range(count - indexed):
+                key = keys[row * DIGEST_SIZE : (row + 1) * DIGEST_SIZE]
+                self._index.setdefault(key, indexed + row)
+        self._indexed_bytes = stat.st_size
+
+    def lookup(self, digests: Sequence[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        Look up stored embeddings.
+
+        Args:
+            digests: Text digests from text_digest()
+
+        Returns:
+            float32 embeddings for the digests found
+        """
+        with self._lock:
+            try:
+                self._refresh()
+            except (OSError, ValueError) as e:
+                print(f"Warning: embedding cache unreadable: {e}", file=sys.stderr)
+                return {}
+            rows = [(d, self._index[d]) for d in digests if d in self._index]
+            if not rows or self._records is None:
+                return {}
+            vectors = self._records["vector"][[row for _, row in rows]].astype(np.float32)
+        return {digest: vectors[i] for i, (digest, _) in enumerate(rows)}
+
+    def add(self, digests: Sequence[bytes], vectors: np.ndarray) -> None:
+        """
+        Append embeddings not already stored.
+
+        Args:
+            digests: Text digests from text_digest()
+            vectors: Embeddings, one row per digest
+        """
+        vectors = np.asarray(vectors)
+        if len(digests) == 0 or vectors.ndim != 2:
+            return
+        dim = vectors.shape[1]
+        dtype = _record_dtype(dim)
+
+        with self._lock:
+            try:
+                self._refresh()
+                size = self._indexed_bytes
+                if self._dim is not None and self._dim != dim:
+                    return
+                new = [i for i, d in enumerate(digests) if d not in self._index]
+                capacity = (self.max_bytes - _HEADER.size) // dtype.itemsize
+                new = new[:capacity]
+                if not new:
+                    return
+                # A torn record from an interrupted write would misalign every
+                # later one, so start over rather than append after it
+                misaligned = (size - _HEADER.size) % dtype.itemsize != 0
+                full = size + len(new) * dtype.itemsize > self.max_bytes
+                if self._file_id is None:
+                    self._create(dim)
+                elif self._dim is None or misaligned or full:
+                    self._replace_empty(dim)
+
+                records = np.empty(len(new), dtype=dtype)
+                records["key"] = [np.void(digests[i]) for i in new]
+                records["vector"] = vectors[new]
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+                try:
+                    os.write(fd, records.tobytes())
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                print(f"Warning: could not update embedding cache: {e}", file=sys.stderr)
+
+    def _empty_file(self, dim: int) -> Path:
+        """Write a store file holding only the header, next to the store."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, dim))
+        return tmp
+
+    def _create(self, dim: int) -> None:
+        """Create the store file with its header, unless another process did."""
+        tmp = self._empty_file(dim)
+        try:
+            # Linking fails if the store exists, so the header is never torn
+            os.link(tmp, self.path)
+        except FileExistsError:
+            pass
+        finally:
+            tmp.unlink()
+
+    def _replace_empty(self, dim: int) -> None:
+        """Atomically replace the store with an empty one (readers keep their map)."""
+        os.replace(self._empty_file(dim), self.path)
+        self._reset_state()
+
+    def clear(self) -> int:
+        """
+        Remove the store file.
+
+        Returns:
+            Number of embeddings removed
+        """
+        with self._lock:
+            try:
+                self._refresh()
+                count = len(self._index)
+                self.path.unlink()
+            except FileNotFoundError:
+                count = 0
+            self._reset_state()
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dict with path, entries, total_bytes, max_bytes
+        """
+        with self._lock:
+            self._refresh()
+            return {
+                "path": str(self.path),
+                "entries": len(self._index),
+                "total_bytes": self._indexed_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class EmbeddingService:
+    """
+    Lazily loaded SentenceTransformer with content-addressed embedding caching.
+
+    Obtain instances via get_embedding_service() so that all dimensions in the
+    process share one model per name.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Create a service (model is not loaded until first use).
+
+        Args:
+            model_name: sentence-transformers model name
+            cache_size: Number of embeddings kept in memory
+        """
+        self.model_name = model_name
+        self.cache_size = cache_size
+
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self.encoded_count = 0  # Texts run through the encoder (cache misses)
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model has been loaded."""
+        return self._model is not None
+
+    @property
+    def model(self):
+        """SentenceTransformer (loaded on first access)."""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    from sentence_transformers import SentenceTransformer
+
+                    self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def unload(self) -> None:
+        """Release the model and cached embeddings."""
+        with self._load_lock:
+            self._model = None
+        with self._cache_lock:
+            self._cache.clear()
+
+    def encode(
+        self,
+        texts: Sequence[str],
+        batch_size: int = 32,
+        store: Optional[EmbeddingStore] = None,
+        batches_per_deadline_check: int = 4,
+    ) -> np.ndarray:
+        """
+        Embed texts, encoding only those not already cached.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Encoder batch size
+            store: Optional on-disk store consulted and updated after the
+                in-memory cache (embeddings are stored at float16 precision)
+            batches_per_deadline_check: Encoder batches between deadline checks
+
+        Returns:
+            float32 array of shape (len(texts), dimension)
+        """
+        digests = [text_digest(text) for text in texts]
+        vectors: Dict[bytes, np.ndarray] = {}
+        with self._cache_lock:
+            for digest in digests:
+                cached = self._cache.get(digest)
+                if cached is not None:
+                    self._cache.move_to_end(digest)
+                    vectors[digest] = cached
+
+        missing: Dict[bytes, str] = {}
+        for digest, text in zip(digests, texts):
+            if digest not in vectors:
+                missing.setdefault(digest, text)
+
+        if missing and store is not None:
+            stored = store.lookup(list(missing))
+            vectors.update(stored)
+            self._remember(stored)
+            for digest in stored:
+                del missing[digest]
+
+        if missing:
+            encoded = self._encode_uncached(
+                list(missing.values()), batch_size, batches_per_deadline_check
+            )
+            if store is not None:
+                store.add(list(missing), encoded)
+                # Match the precision of embeddings later read from the store
+                encoded = encoded.astype(np.float16).astype(np.float32)
+            fresh = dict(zip(missing, encoded))
+            vectors.update(fresh)
+            self._remember(fresh)
+
+        if not digests:
+            return np.zeros((0, self.model.get_sentence_embedding_dimension()), dtype=np.float32)
+        return np.stack([vectors[digest] for digest in digests])
+
+    def _encode_uncached(
+        self, texts: List[str], batch_size: int, batches_per_deadline_check: int
+    ) -> np.ndarray:
+        """Run the encoder, checking the analysis deadline between chunks of batches."""
+        model = self.model
+        chunk_size = batch_size * max(1, batches_per_deadline_check)
+        chunks = []
+        for start in range(0, len(texts), chunk_size):
+            check_deadline()
+            chunks.append(
+                model.encode(
+                    texts[start : start + chunk_size],
+                    batch_size=batch_size,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                )
+            )
+        self.encoded_count += len(texts)
+        encoded = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+        return np.asarray(encoded, dtype=np.float32)
+
+    def _remember(self, vectors: Dict[bytes, np.ndarray]) -> None:
+        """Add embeddings to the in-memory LRU."""
+        with self._cache_lock:
+            for digest, vector in vectors.items():
+                self._cache[digest] = vector
+                self._cache.move_to_end(digest)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+
+# ============================================================================
+# PROCESS-WIDE PROVIDERS
+# ============================================================================
+
+_services: Dict[str, EmbeddingService] = {}
+_stores: Dict[str, EmbeddingStore] = {}
+_providers_lock = threading.Lock()
+
+
+def get_embedding_service(model_name: Optional[str] = None) -> EmbeddingService:
+    """
+    Get the process-wide service for a model, creating it on first request.
+
+    Args:
+        model_name: sentence-transformers model name (default: DEFAULT_EMBEDDING_MODEL)
+
+    Returns:
+        Shared EmbeddingService (model loads lazily on first use)
+    """
+    model_name = model_name or DEFAULT_EMBEDDING_MODEL
+    with _providers_lock:
+        service = _services.get(model_name)
+        if service is None:
+            service = EmbeddingService(model_name)
+            _services[model_name] = service
+    return service
+
+
+def embedding_store_path(cache_dir: Optional[Path], model_name: Optional[str] = None) -> Path:
+    """
+    Get the store file for a model.
+
+    Args:
+        cache_dir: Cache directory (default: default_cache_dir())
+        model_name: sentence-transformers model name (default: DEFAULT_EMBEDDING_MODEL)
+
+    Returns:
+        <cache_dir>/embeddings/<model>.f16
+    """
+    base = Path(cache_dir) if cache_dir else default_cache_dir()
+    safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", model_name or DEFAULT_EMBEDDING_MODEL)
+    return base / EMBEDDINGS_DIRNAME / f"{safe_name}.f16"
+
+
+def get_embedding_store(
+    cache_dir: Optional[Path] = None, model_name: Optional[str] = None
+) -> EmbeddingStore:
+    """
+    Get the process-wide on-disk store for a model in a cache directory.
+
+    Args:
+        cache_dir: Cache directory (default: default_cache_dir())
+        model_name: sentence-transformers model name (default: DEFAULT_EMBEDDING_MODEL)
+
+    Returns:
+        Shared EmbeddingStore
+    """
+    path = embedding_store_path(cache_dir, model_name).resolve()
+    with _providers_lock:
+        store = _stores.get(str(path))
+        if store is None:
+            store = EmbeddingStore(path)
+            _stores[str(path)] = store
+    return store
+
+
+def get_embedding_store_for(config) -> Optional[EmbeddingStore]:
+    """
+    Get the on-disk store configured by config, if result caching is enabled.
+
+    Embeddings are cached next to the analysis results (result_cache_dir), so
+    --no-cache disables both.
+
+    Args:
+        config: AnalysisConfig (None = no on-disk store)
+
+    Returns:
+        EmbeddingStore, or None if config.use_result_cache is False
+    """
+    if config is None or not config.use_result_cache:
+        return None
+    return get_embedding_store(config.result_cache_dir)
+
+
+def clear_embedding_services() -> None:
+    """Unload and forget all shared embedding models (frees model RAM)."""
+    with _providers_lock:
+        for service in _services.values():
+            service.unload()
+        _services.clear()
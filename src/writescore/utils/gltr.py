@@ -0,0 +1,292 @@
+"""
+GLTR rank engine.
+
+Computes the rank of every token in the model's next-token distribution from
+a single causal forward pass per context window, instead of re-running the
+model on each growing prefix.
+
+Rank is computed by comparison: the number of vocabulary logits strictly
+greater than the logit of the actual token. This is the same 0-based rank
+that sorting the distribution would produce, without the O(V log V) sort.
+
+Texts longer than the model's context length are scored with overlapping
+sliding windows, so every token after the first is ranked exactly once and
+each window keeps (context - stride) tokens of left context.
+
+Research: "GLTR: Statistical Detection and Visualization of Generated Text"
+"""
+
+import statistics
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from writescore.utils.deadline import check_deadline
+from writescore.utils.lazy_import import lazy_import
+from writescore.utils.text_processing import safe_ratio
+
+if TYPE_CHECKING:
+    import torch
+else:
+    torch = lazy_import("torch")
+
+# GPT-2 family context length, used when the model config does not declare one
+DEFAULT_CONTEXT_LENGTH = 1024
+
+
+def get_context_length(model) -> int:
+    """
+    Get the maximum context length (in tokens) of a causal language model.
+
+    Args:
+        model: HuggingFace causal LM
+
+    Returns:
+        Context length from model config (n_positions / max_position_embeddings),
+        or DEFAULT_CONTEXT_LENGTH if not declared
+    """
+    config = getattr(model, "config", None)
+    for attr in ("n_positions", "max_position_embeddings"):
+        value = getattr(config, attr, None)
+        if isinstance(value, int) and value > 1:
+            return value
+    return DEFAULT_CONTEXT_LENGTH
+
+
+def iter_windows(num_tokens: int, context_length: int, stride: Optional[int] = None):
+    """
+    Yield sliding windows that cover every target token exactly once.
+
+    Args:
+        num_tokens: Total number of tokens in the sequence
+        context_length: Maximum tokens per forward pass
+        stride: New tokens scored per window after the first
+                (default: context_length // 2)
+
+    Yields:
+        Tuples of (window_start, window_end, first_target) where tokens
+        [first_target, window_end) are scored from window [window_start, window_end)
+    """
+    if num_tokens < 2:
+        return
+
+    if context_length < 2:
+        raise ValueError("context_length must be at least 2")
+
+    stride = stride or max(1, context_length // 2)
+    stride = min(stride, context_length - 1)
+    overlap = context_length - stride
+
+    start = 0
+    first_target = 1
+    while first_target < num_tokens:
+        end = min(start + context_length, num_tokens)
+        yield start, end, first_target
+        if end >= num_tokens:
+            break
+        first_target = end
+        start = end - overlap
+
+
+def ranks_from_logits(logits: "torch.Tensor", targets: "torch.Tensor") -> "torch.Tensor":
+    """
+    Rank each target token against its row of logits by comparison.
+
+    Args:
+        logits: Tensor [num_targets, vocab_size] of next-token logits
+        targets: Tensor [num_targets] of actual next-token ids
+
+    Returns:
+        Tensor [num_targets] of 0-based ranks (0 = model's top prediction)
+    """
+    target_logits = logits.gather(1, targets.unsqueeze(1))
+    return (logits > target_logits).sum(dim=1)
+
+
+def compute_token_scores(
+    model,
+    token_ids: Sequence[int],
+    context_length: Optional[int] = None,
+    stride: Optional[int] = None,
+    device=None,
+    first_target: int = 1,
+) -> Tuple[List[int], List[float]]:
+    """
+    Compute rank and log-probability of every token from one pass per window.
+
+    For texts within the context length this is a single forward pass over
+    the whole sequence. Both GLTR ranks and perplexity (mean NLL) derive
+    from the returned values.
+
+    Args:
+        model: HuggingFace causal LM (eval mode)
+        token_ids: Token ids of the text
+        context_length: Tokens per forward pass (default: model context length)
+        stride: New tokens per window after the first (default: context_length // 2)
+        device: Device for input tensors (default: model's device)
+        first_target: Skip windows whose targets all precede this index
+                      (used to resume after an already-scored first window)
+
+    Returns:
+        Tuple of (ranks, log_probs) for tokens scored from windows ending
+        after first_target; for first_target=1 that is one entry per token
+        in token_ids[1:]
+    """
+    num_tokens = len(token_ids)
+    if num_tokens < 2:
+        return [], []
+
+    context_length = context_length or get_context_length(model)
+    if device is None:
+        device = getattr(model, "device", None)
+
+    ids = torch.tensor(list(token_ids), dtype=torch.long)
+    ranks: List[int] = []
+    log_probs: List[float] = []
+
+    for start, end, window_target in iter_windows(num_tokens, context_length, stride):
+        if end <= first_target:
+            continue
+        check_deadline()
+
+        window = ids[start:end].unsqueeze(0)
+        if device is not None:
+            window = window.to(device)
+
+        with torch.no_grad():
+            logits = model(window).logits[0]
+
+        # Row i of logits predicts token start + i + 1
+        rows = logits[window_target - start - 1 : end - start - 1].float()
+        targets = window[0, window_target - start : end - start]
+        ranks.extend(ranks_from_logits(rows, targets).tolist())
+        log_probs.extend(
+            torch.log_softmax(rows, dim=-1).gather(1, targets.unsqueeze(1)).squeeze(1).tolist()
+        )
+
+    return ranks, log_probs
+
+
+def compute_batch_scores(
+    model, sequences: Sequence[Sequence[int]], device=None
+) -> List[Tuple[List[int], List[float]]]:
+    """
+    Score several single-window sequences with one padded forward pass.
+
+    Sequences are right-padded. A causal model's outputs at real positions
+    only depend on the (real) tokens before them, so each row's scores equal
+    those of a separate pass over that sequence.
+
+    Args:
+        model: HuggingFace causal LM (eval mode)
+        sequences: Token ids of each text, each within the context length
+        device: Device for input tensors (default: model's device)
+
+    Returns:
+        (ranks, log_probs) per sequence, one entry per token after the first
+    """
+    lengths = [len(sequence) for sequence in sequences]
+    width = max(lengths, default=0)
+    if width < 2:
+        return [([], []) for _ in sequences]
+    if device is None:
+        device = getattr(model, "device", None)
+
+    ids = torch.zeros((len(sequences), width), dtype=torch.long)
+    mask = torch.zeros((len(sequences), width), dtype=torch.long)
+    for row, sequence in enumerate(sequences):
+        ids[row, : lengths[row]] = torch.tensor(list(sequence), dtype=torch.long)
+        mask[row, : lengths[row]] = 1
+    if device is not None:
+        ids = ids.to(device)
+        mask = mask.to(device)
+
+    check_deadline()
+    with torch.no_grad():
+        logits = model(ids, attention_mask=mask).logits
+
+    results: List[Tuple[List[int], List[float]]] = []
+    for row, length in enumerate(lengths):
+        if length < 2:
+            results.append(([], []))
+            continue
+        # Row i of logits predicts token i + 1
+        rows = logits[row, : length - 1].float()
+        targets = ids[row, 1:length]
+        log_probs = torch.log_softmax(rows, dim=-1).gather(1, targets.unsqueeze(1)).squeeze(1)
+        results.append((ranks_from_logits(rows, targets).tolist(), log_probs.tolist()))
+    return results
+
+
+def compute_token_ranks(
+    model,
+    token_ids: Sequence[int],
+    context_length: Optional[int] = None,
+    stride: Optional[int] = None,
+    device=None,
+    max_tokens: Optional[int] = None,
+) -> List[int]:
+    """
+    Compute the GLTR rank of every token after the first.
+
+    One forward pass is made per window; for texts within the context length
+    that is a single pass over the whole sequence.
+
+    Args:
+        model: HuggingFace causal LM (eval mode)
+        token_ids: Token ids of the text
+        context_length: Tokens per forward pass (default: model context length)
+        stride: New tokens per window after the first (default: context_length // 2)
+        device: Device for input tensors (default: model's device)
+        max_tokens: Optional cap on number of tokens considered
+
+    Returns:
+        List of 0-based ranks, one per token in token_ids[1:]
+    """
+    if max_tokens is not None:
+        token_ids = token_ids[:max_tokens]
+
+    ranks, _ = compute_token_scores(model, token_ids, context_length, stride, device)
+    return ranks
+
+
+def summarize_ranks(ranks: Sequence[int]) -> Dict[str, Any]:
+    """
+    Convert token ranks into GLTR metrics.
+
+    Args:
+        ranks: 0-based token ranks from compute_token_ranks()
+
+    Returns:
+        Dict with gltr_top10/top100/top1000 percentages, mean rank,
+        rank variance and AI likelihood, or empty dict if no ranks
+    """
+    if not ranks:
+        return {}
+
+    total = len(ranks)
+    top10_percentage = safe_ratio(sum(1 for r in ranks if r < 10), total, 0)
+    top100_percentage = safe_ratio(sum(1 for r in ranks if r < 100), total, 0)
+    top1000_percentage = safe_ratio(sum(1 for r in ranks if r < 1000), total, 0)
+    mean_rank = sum(ranks) / total
+    rank_variance = statistics.variance(ranks) if total > 1 else 0
+
+    # AI likelihood based on top-10 concentration
+    # Research: AI >70%, Human <55%
+    if top10_percentage > 0.70:
+        ai_likelihood = 0.90
+    elif top10_percentage > 0.65:
+        ai_likelihood = 0.75
+    elif top10_percentage > 0.60:
+        ai_likelihood = 0.60
+    elif top10_percentage < 0.50:
+        ai_likelihood = 0.20
+    else:
+        ai_likelihood = 0.50
+
+    return {
+        "gltr_top10_percentage": round(top10_percentage, 3),
+        "gltr_top100_percentage": round(top100_percentage, 3),
+        "gltr_top1000_percentage": round(top1000_percentage, 3),
+        "gltr_mean_rank": round(mean_rank, 2),
+        "gltr_rank_variance": round(rank_variance, 2),
+        "gltr_likelihood": round(ai_likelihood, 2),
+    }
@@ -0,0 +1,451 @@
+"""
+Shared causal language model service.
+
+PerplexityDimension and PredictabilityDimension both need a causal LM. Instead
+of each dimension loading its own model into module globals, they request a
+process-wide LanguageModelService by model name. The service:
+
+- Loads the model and tokenizer once (thread-safe, lazy)
+- Applies configurable device, dtype and torch thread count
+- Scores each token window once, returning per-token GLTR ranks and
+  log-probabilities from the same forward pass
+- Caches recent encodings and scores, so the second dimension asking about
+  the same text (or a prefix of it within the first window) does not
+  re-tokenize or re-run the model
+- Prefetches the first windows of many documents in padded batches, so a
+  corpus of short documents takes a few large forward passes instead of one
+  small pass per document
+
+Perplexity (exp of mean NLL) and GLTR ranks are both derived from TokenScores.
+"""
+
+import math
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from writescore.utils.gltr import compute_batch_scores, compute_token_scores, get_context_length
+from writescore.utils.lazy_import import lazy_import
+
+# Imported when a model is first loaded
+if TYPE_CHECKING:
+    import torch
+else:
+    torch = lazy_import("torch")
+transformers = lazy_import("transformers")
+
+# Default model shared by perplexity and predictability
+DEFAULT_LANGUAGE_MODEL = "gpt2"
+
+# Number of recent encodings / scored sequences kept per service
+DEFAULT_CACHE_SIZE = 8
+
+# Padded tokens per batched forward pass in prefetch() (bounds the logits tensor)
+DEFAULT_BATCH_TOKENS = 2048
+
+# Supported dtype names (torch attribute names)
+_DTYPES = ("float32", "float16", "bfloat16")
+
+
+@dataclass
+class TokenScores:
+    """Per-token scores from one causal LM pass over a token sequence."""
+
+    token_ids: Tuple[int, ...]
+    ranks: List[int] = field(default_factory=list)  # 0-based GLTR rank per token after the first
+    log_probs: List[float] = field(default_factory=list)  # log P(token | left context)
+
+    @property
+    def token_count(self) -> int:
+        """Number of tokens in the scored sequence."""
+        return len(self.token_ids)
+
+    @property
+    def mean_nll(self) -> float:
+        """Mean negative log-likelihood over scored tokens."""
+        if not self.log_probs:
+            return 0.0
+        return -sum(self.log_probs) / len(self.log_probs)
+
+    @property
+    def perplexity(self) -> float:
+        """Perplexity = exp(mean NLL)."""
+        return math.exp(self.mean_nll)
+
+    def head(self, num_tokens: int) -> "TokenScores":
+        """Scores for the first num_tokens tokens."""
+        return TokenScores(
+            token_ids=self.token_ids[:num_tokens],
+            ranks=self.ranks[: max(0, num_tokens - 1)],
+            log_probs=self.log_probs[: max(0, num_tokens - 1)],
+        )
+
+
+def resolve_device(device: Optional[str] = None) -> "torch.device":
+    """
+    Resolve a device name to a torch.device.
+
+    Priority order when device is None or "auto":
+    1. MPS (Apple Silicon Metal Performance Shaders)
+    2. CUDA (NVIDIA GPU)
+    3. CPU (fallback)
+
+    Args:
+        device: Explicit device name ("cpu", "cuda", "mps", "cuda:1"), or None/"auto"
+
+    Returns:
+        torch.device for model inference
+    """
+    if device and device != "auto":
+        return torch.device(device)
+    if hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
+        return torch.device("mps")
+    if torch.cuda.is_available():
+        return torch.device("cuda")
+    return torch.device("cpu")
+
+
+def resolve_dtype(dtype: Optional[str] = None) -> Optional["torch.dtype"]:
+    """
+    Resolve a dtype name ("float32", "float16", "bfloat16") to a torch.dtype.
+
+    Args:
+        dtype: dtype name, or None for the model's default
+
+    Returns:
+        torch.dtype or None
+
+    Raises:
+        ValueError: If dtype name is not supported
+    """
+    if dtype is None:
+        return None
+    if dtype not in _DTYPES:
+        raise ValueError(f"Unsupported language model dtype '{dtype}'. Valid: {list(_DTYPES)}")
+    return getattr(torch, dtype)
+
+
+class LanguageModelService:
+    """
+    Lazily loaded causal LM with per-sequence score caching.
+
+    Obtain instances via get_language_model() so that all dimensions in the
+    process share one model per name.
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_LANGUAGE_MODEL,
+        device: Optional[str] = None,
+        dtype: Optional[str] = None,
+        num_threads: Optional[int] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Create a service (model is not loaded until first use).
+
+        Args:
+            model_name: HuggingFace model name (e.g., "gpt2", "distilgpt2")
+            device: Device name or None/"auto" for MPS > CUDA > CPU
+            dtype: Optional dtype name ("float32", "float16", "bfloat16")
+            num_threads: Optional torch intra-op thread count, applied on load
+            cache_size: Number of recent encodings / scored sequences to keep
+        """
+        self.model_name = model_name
+        self.device_name = device
+        self.dtype = resolve_dtype(dtype)
+        self.num_threads = num_threads
+        self.cache_size = cache_size
+
+        self._model = None
+        self._tokenizer = None
+        self._device: Optional[torch.device] = None
+        self._load_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._encode_cache: OrderedDict[str, List[int]] = OrderedDict()
+        self._score_cache: OrderedDict[Tuple[int, ...], TokenScores] = OrderedDict()
+
+    # ========================================================================
+    # MODEL LOADING
+    # ========================================================================
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model has been loaded."""
+        return self._model is not None
+
+    @property
+    def device(self) -> "torch.device":
+        """Device used for inference."""
+        if self._device is None:
+            self._device = resolve_device(self.device_name)
+        return self._device
+
+    @property
+    def model(self):
+        """Causal LM (loaded on first access)."""
+        if self._model is None:
+            with self._load_lock:
+                # Double-check after acquiring lock
+                if self._model is None:
+                    if self.num_threads:
+                        torch.set_num_threads(self.num_threads)
+                    print(
+                        f"Loading {self.model_name} language model (one-time setup)...",
+                        file=sys.stderr,
+                    )
+                    transformers.logging.set_verbosity_error()
+                    model = transformers.AutoModelForCausalLM.from_pretrained(self.model_name)
+                    model.eval()
+                    if self.dtype is not None:
+                        model.to(dtype=self.dtype)
+                    model.to(self.device)
+                    self._model = model
+        return self._model
+
+    @property
+    def tokenizer(self):
+        """Tokenizer (loaded on first access)."""
+        if self._tokenizer is None:
+            with self._load_lock:
+                if self._tokenizer is None:
+                    transformers.logging.set_verbosity_error()
+                    self._tokenizer = transformers.AutoTokenizer.from_pretrained(self.model_name)
+        return self._tokenizer
+
+    @property
+    def context_length(self) -> int:
+        """Maximum tokens per forward pass."""
+        return get_context_length(self.model)
+
+    def unload(self) -> None:
+        """Release model, tokenizer and cached scores."""
+        with self._load_lock:
+            self._model = None
+            self._tokenizer = None
+            self._device = None
+        with self._cache_lock:
+            self._encode_cache.clear()
+            self._score_cache.clear()
+
+    # ========================================================================
+    # TOKENIZATION AND SCORING
+    # ========================================================================
+
+    def encode(self, text: str) -> List[int]:
+        """
+        Tokenize text (cached for recently seen texts).
+
+        Args:
+            text: Text to tokenize
+
+        Returns:
+            List of token ids
+        """
+        with self._cache_lock:
+            cached = self._encode_cache.get(text)
+            if cached is not None:
+                self._encode_cache.move_to_end(text)
+                return list(cached)
+
+        token_ids = list(self.tokenizer.encode(text))
+
+        with self._cache_lock:
+            self._encode_cache[text] = token_ids
+            while len(self._encode_cache) > self.cache_size:
+                self._encode_cache.popitem(last=False)
+        return list(token_ids)
+
+    def score_tokens(self, token_ids: Sequence[int]) -> TokenScores:
+        """
+        Score a token sequence, reusing any cached pass over the same first window.
+
+        A causal model's outputs for the first window depend only on that
+        window's tokens, so a cached pass over a sequence sharing the first
+        window (either a prefix or an extension) supplies those scores and
+        only later windows are computed.
+
+        Args:
+            token_ids: Token ids to score
+
+        Returns:
+            TokenScores for the sequence
+        """
+        key = tuple(token_ids)
+        model = self.model
+        context_length = get_context_length(model)
+        head_length = min(len(key), context_length)
+        head = key[:head_length]
+
+        with self._cache_lock:
+            if key in self._score_cache:
+                self._score_cache.move_to_end(key)
+                return self._score_cache[key]
+            reused = self._cached_head(head)
+
+        if reused is not None and head_length == len(key):
+            scores = reused
+        else:
+            first_target = head_length if reused is not None else 1
+            ranks, log_probs = compute_token_scores(
+                model, key, context_length=context_length, first_target=first_target
+            )
+            if reused is not None:
+                ranks = reused.ranks + ranks
+                log_probs = reused.log_probs + log_probs
+            scores = TokenScores(token_ids=key, ranks=ranks, log_probs=log_probs)
+
+        with self._cache_lock:
+            self._score_cache[key] = scores
+            while len(self._score_cache) > self.cache_size:
+                self._score_cache.popitem(last=False)
+        return scores
+
+    def _cached_head(self, head: Tuple[int, ...]) -> Optional[TokenScores]:
+        """Scores of a first window from any cached sequence starting with it (lock held)."""
+        for cached_key, cached in self._score_cache.items():
+            if len(cached_key) >= len(head) and cached_key[: len(head)] == head:
+                return cached.head(len(head))
+        return None
+
+    def prefetch(
+        self,
+        token_sequences: Sequence[Sequence[int]],
+        max_batch_tokens: int = DEFAULT_BATCH_TOKENS,
+    ) -> int:
+        """
+        Score the first window of several sequences in batched forward passes.
+
+        The scores are cached, so score_tokens() on any of these sequences
+        afterwards only runs the model on windows after the first (sequences
+        within the context length are not run again at all). The score cache
+        grows to hold every prefetched sequence.
+
+        Args:
+            token_sequences: Token ids of the texts that will be scored
+            max_batch_tokens: Padded tokens per forward pass
+
+        Returns:
+            Number of first windows scored (cached ones are skipped)
+        """
+        model = self.model
+        context_length = get_context_length(model)
+
+        heads: Dict[Tuple[int, ...], None] = {}
+        with self._cache_lock:
+            for token_ids in token_sequences:
+                head = tuple(token_ids[:context_length])
+                if len(head) >= 2 and head not in heads and self._cached_head(head) is None:
+                    heads[head] = None
+            self.cache_size = max(self.cache_size, len(heads) + DEFAULT_CACHE_SIZE)
+
+        # Ascending length: each batch pads to its last (longest) sequence
+        batch: List[Tuple[int, ...]] = []
+        for head in sorted(heads, key=len):
+            if batch and (len(batch) + 1) * len(head) > max_batch_tokens:
+                self._score_batch(model, batch)
+                batch = []
+            batch.append(head)
+        if batch:
+            self._score_batch(model, batch)
+        return len(heads)
+
+    def _score_batch(self, model, heads: List[Tuple[int, ...]]) -> None:
+        """Score single-window sequences in one forward pass and cache them."""
+        results = compute_batch_scores(model, heads)
+        with self._cache_lock:
+            for head, (ranks, log_probs) in zip(heads, results):
+                self._score_cache[head] = TokenScores(
+                    token_ids=head, ranks=ranks, log_probs=log_probs
+                )
+                self._score_cache.move_to_end(head)
+            while len(self._score_cache) > self.cache_size:
+                self._score_cache.popitem(last=False)
+
+    def score_text(self, text: str, max_tokens: Optional[int] = None) -> TokenScores:
+        """
+        Tokenize and score text.
+
+        Args:
+            text: Text to score
+            max_tokens: Optional cap on number of tokens scored
+
+        Returns:
+            TokenScores for the (possibly truncated) token sequence
+        """
+        token_ids = self.encode(text)
+        if max_tokens is not None:
+            token_ids = token_ids[:max_tokens]
+        return self.score_tokens(token_ids)
+
+
+# ============================================================================
+# PROCESS-WIDE PROVIDER
+# ============================================================================
+
+_services: Dict[Tuple[str, Optional[str], Optional[str]], LanguageModelService] = {}
+_services_lock = threading.Lock()
+
+
+def get_language_model(
+    model_name: Optional[str] = None,
+    device: Optional[str] = None,
+    dtype: Optional[str] = None,
+    num_threads: Optional[int] = None,
+) -> LanguageModelService:
+    """
+    Get the process-wide service for a model, creating it on first request.
+
+    Args:
+        model_name: HuggingFace model name (default: DEFAULT_LANGUAGE_MODEL)
+        device: Device name or None/"auto"
+        dtype: Optional dtype name
+        num_threads: Optional torch intra-op thread count
+
+    Returns:
+        Shared LanguageModelService (model loads lazily on first use)
+    """
+    model_name = model_name or DEFAULT_LANGUAGE_MODEL
+    key = (model_name, device, dtype)
+    service = _services.get(key)
+    if service is None:
+        with _services_lock:
+            service = _services.get(key)
+            if service is None:
+                service = LanguageModelService(
+                    model_name, device=device, dtype=dtype, num_threads=num_threads
+                )
+                _services[key] = service
+    return service
+
+
+def get_language_model_for(config, dimension_name: str) -> LanguageModelService:
+    """
+    Get the shared service configured for a dimension.
+
+    Uses config.language_model_* settings, with an optional per-dimension
+    model via config.dimension_overrides[dimension_name]["model_name"].
+
+    Args:
+        config: AnalysisConfig
+        dimension_name: Requesting dimension (e.g., "perplexity")
+
+    Returns:
+        Shared LanguageModelService
+    """
+    return get_language_model(
+        config.get_language_model_name(dimension_name),
+        device=config.language_model_device,
+        dtype=config.language_model_dtype,
+        num_threads=config.language_model_threads,
+    )
+
+
+def clear_language_models() -> None:
+    """Unload and forget all shared language models (frees model RAM)."""
+    with _services_lock:
+        for service in _services.values():
+            service.unload()
+        _services.clear()
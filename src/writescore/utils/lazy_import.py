@@ -0,0 +1,83 @@
+"""
+Deferred imports for heavy optional libraries.
+
+spaCy, torch, transformers, NLTK, textstat, scipy and textacy each take from
+hundreds of milliseconds to several seconds to import. Dimension modules and
+utilities bind them at module level with lazy_import() instead of ``import``,
+so importing writescore (or running a CLI command that never analyzes text)
+does not pay for them; the library is imported on first attribute access.
+
+    spacy = lazy_import("spacy")
+    ...
+    nlp = spacy.load(name)  # spacy is imported here
+
+Attribute writes and deletes are forwarded to the real module, so
+``unittest.mock.patch("pkg.module.spacy.load")`` patches the library itself,
+exactly as with a plain import.
+"""
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Any, List
+
+_import_lock = threading.RLock()
+
+
+class LazyModule(ModuleType):
+    """Module placeholder that imports the named module on first use."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> ModuleType:
+        """Import the module (once) and return it."""
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with _import_lock:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the module has been imported."""
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the placeholder itself does not have
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._load(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._load(), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Get a module that is imported on first attribute access.
+
+    Args:
+        name: Absolute module name (e.g. "scipy.stats")
+
+    Returns:
+        The module itself if it is already imported, otherwise a LazyModule
+        (an ImportError for a missing module surfaces on first use)
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
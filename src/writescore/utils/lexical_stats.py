@@ -0,0 +1,175 @@
+"""
+Lexical statistics computed from word frequency spectra.
+
+HD-D, Yule's K, Maas and vocabulary concentration depend only on a text's
+frequency spectrum: for each frequency m, the number of word types that
+occur exactly m times. FrequencySpectrum counts word types once and
+computes every metric with closed-form expressions vectorized over the
+distinct frequencies, so the cost grows with the number of distinct
+frequencies (a few dozen for a chapter), not with the vocabulary size.
+
+Spectra are mergeable: merge() folds in another text's type counts, so
+sampled and streamed analyses can compute the metrics exactly over all
+their windows instead of averaging per-window values.
+"""
+
+import math
+from collections import Counter
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from writescore.utils.lazy_import import lazy_import
+
+# Loaded on first HD-D calculation
+special = lazy_import("scipy.special")
+
+# Standard HD-D sample size (McCarthy & Jarvis, 2007)
+HDD_SAMPLE_SIZE = 42
+
+
+class FrequencySpectrum:
+    """
+    Word type counts of a text and the metrics derived from them.
+
+    The spectrum (distinct frequencies and how many types have each) is
+    built on first use and rebuilt only after the counts change.
+    """
+
+    def __init__(self, counts: Optional[Counter] = None):
+        """
+        Args:
+            counts: Type -> token count (taken over, not copied)
+        """
+        self.counts: Counter = counts if counts is not None else Counter()
+        self._spectrum: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def from_tokens(cls, tokens: Iterable[str]) -> "FrequencySpectrum":
+        """
+        Count the types of a token sequence.
+
+        Args:
+            tokens: Word tokens (already normalized, e.g. lowercased)
+
+        Returns:
+            FrequencySpectrum
+        """
+        return cls(Counter(tokens))
+
+    def update(self, tokens: Iterable[str]) -> None:
+        """Add tokens."""
+        self.counts.update(tokens)
+        self._spectrum = None
+
+    def merge(self, other: "FrequencySpectrum") -> None:
+        """
+        Fold in another spectrum's type counts.
+
+        The result equals the spectrum of both texts' tokens together.
+
+        Args:
+            other: Spectrum to add
+        """
+        self.counts.update(other.counts)
+        self._spectrum = None
+
+    def spectrum(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the frequency spectrum.
+
+        Returns:
+            Tuple of (distinct frequencies m in ascending order, number of
+            types occurring exactly m times), both int64 arrays
+        """
+        if self._spectrum is None:
+            frequencies = np.fromiter(self.counts.values(), dtype=np.int64, count=len(self.counts))
+            self._spectrum = np.unique(frequencies, return_counts=True)
+        return self._spectrum
+
+    @property
+    def tokens(self) -> int:
+        """Number of tokens (N)."""
+        frequencies, types = self.spectrum()
+        return int(np.dot(frequencies, types))
+
+    @property
+    def types(self) -> int:
+        """Number of types (V)."""
+        return len(self.counts)
+
+    def hdd(self, sample_size: int = HDD_SAMPLE_SIZE) -> Optional[float]:
+        """
+        HD-D (Hypergeometric Distribution D).
+
+        Sum over types of the probability that a random sample of
+        sample_size tokens contains the type at least once, divided by
+        sample_size. A type occurring m times of N is missing from the
+        sample with probability C(N - m, s) / C(N, s) (the hypergeometric
+        pmf at 0), evaluated with log-gamma once per distinct frequency.
+
+        Args:
+            sample_size: Tokens per hypothetical sample
+
+        Returns:
+            HD-D (0-1), or None if the text has fewer than sample_size tokens
+        """
+        n = self.tokens
+        if n == 0 or sample_size > n:
+            return None
+
+        frequencies, types = self.spectrum()
+        remaining = n - frequencies
+        # Types with more than N - s tokens are always drawn (C(N - m, s) = 0)
+        possible = remaining >= sample_size
+        remaining = np.where(possible, remaining, sample_size).astype(np.float64)
+        log_not_drawn = (
+            special.gammaln(remaining + 1)
+            - special.gammaln(remaining - sample_size + 1)
+            - special.gammaln(n + 1)
+            + special.gammaln(n - sample_size + 1)
+        )
+        not_drawn = np.where(possible, np.exp(log_not_drawn), 0.0)
+        return float(np.dot(types, 1.0 - not_drawn)) / sample_size
+
+    def yules_k(self) -> Optional[float]:
+        """
+        Yule's K as WriteScore defines it: 10^4 * (M2 - M1) / M1^2, with
+        M1 = N and M2 = sum over types of f * (f - 1).
+
+        Returns:
+            Yule's K (lower = more diverse), or None for an empty text
+        """
+        n = self.tokens
+        if n == 0:
+            return None
+        frequencies, types = self.spectrum()
+        m2 = int(np.dot(types, frequencies * (frequencies - 1)))
+        return 10000 * (m2 - n) / n**2
+
+    def maas(self) -> Optional[float]:
+        """
+        Maas index: (log N - log V) / log(N)^2.
+
+        Returns:
+            Maas (lower = more diverse), or None for fewer than two tokens
+        """
+        n = self.tokens
+        if n < 2:
+            return None
+        return (math.log(n) - math.log(self.types)) / (math.log(n) ** 2)
+
+    def concentration(self) -> Optional[float]:
+        """
+        Share of tokens belonging to the most frequent 10% of types.
+
+        Returns:
+            Concentration (0-1), or None for an empty text
+        """
+        n = self.tokens
+        if n == 0:
+            return None
+        top_types = max(1, self.types // 10)
+        frequencies, types = self.spectrum()
+        top_frequencies = np.repeat(frequencies[::-1], types[::-1])[:top_types]
+        return int(top_frequencies.sum()) / n
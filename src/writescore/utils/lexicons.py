@@ -7,109 +7,51 @@ Provides access to:
 - Dynamic/action verb classifications
 - Abstract concept word lists
 
-Uses lazy loading with caching for performance.
-Falls back to curated subset if full datasets unavailable.
+The norms ship compiled (data/*.lex, built from the CSVs by
+compile_lexicons()): a sorted table of fixed-width UTF-8 words followed by a
+float32 score per word. Loading memory-maps the file instead of parsing a
+CSV, lookup_concreteness()/lookup_dominance() score a whole token list with
+one vectorized search, and threshold word sets are computed once per
+threshold.
+
+Falls back to parsing the CSV if a compiled lexicon is missing, and to a
+curated subset if neither is available.
 """
 
 import csv
-from functools import lru_cache
+import os
+import struct
+import sys
+from array import array
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Sequence
+
+import numpy as np
 
 # Package data directory
 DATA_DIR = Path(__file__).parent.parent / "data"
 
-# Lazy-loaded lexicon caches
-_concreteness_cache: Optional[Dict[str, float]] = None
-_dominance_cache: Optional[Dict[str, float]] = None
-
-
-def get_data_dir() -> Path:
-    """Get or create the data directory for lexicon files."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    return DATA_DIR
-
-
-@lru_cache(maxsize=1)
-def load_concreteness_norms() -> Dict[str, float]:
-    """
-    Load Brysbaert concreteness norms.
-
-    Returns dict mapping lowercase word -> concreteness score (1.0-5.0).
-    Higher scores = more concrete (e.g., "apple" ~4.8).
-    Lower scores = more abstract (e.g., "freedom" ~1.9).
-
-    Falls back to curated abstract words list if CSV unavailable.
-    """
-    csv_path = get_data_dir() / "brysbaert_concreteness.csv"
-
-    if csv_path.exists():
-        norms = {}
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                word = row.get("Word", "").lower().strip()
-                try:
-                    conc = float(row.get("Conc.M", 3.0))
-                    if word:
-                        norms[word] = conc
-                except (ValueError, TypeError):
-                    continue
-        return norms
-
-    # Fallback: return empty dict, use hardcoded abstract words
-    return {}
-
-
-@lru_cache(maxsize=1)
-def load_dominance_norms() -> Dict[str, float]:
-    """
-    Load Warriner dominance norms for power word detection.
-
-    Returns dict mapping lowercase word -> dominance score (1.0-9.0).
-    Higher scores = more dominant/powerful (e.g., "conquer" ~7.0).
-    Lower scores = more submissive (e.g., "surrender" ~3.0).
-
-    Falls back to curated power words list if CSV unavailable.
-    """
-    csv_path = get_data_dir() / "warriner_affective.csv"
-
-    if csv_path.exists():
-        norms = {}
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                word = row.get("Word", "").lower().strip()
-                try:
-                    dom = float(row.get("D.Mean.Sum", 5.0))
-                    if word:
-                        norms[word] = dom
-                except (ValueError, TypeError):
-                    continue
-        return norms
-
-    # Fallback: return empty dict, use hardcoded power words
-    return {}
-
-
-def get_abstract_words(threshold: float = 2.5) -> Set[str]:
-    """
-    Get set of abstract words (low concreteness).
-
-    Args:
-        threshold: Concreteness score below which words are considered abstract.
-                  Default 2.5 (mid-point of 1-5 scale).
-
-    Returns:
-        Set of abstract words (lowercase).
-    """
-    norms = load_concreteness_norms()
-
-    if norms:
-        return {word for word, score in norms.items() if score < threshold}
-
-    # Fallback: curated abstract words from research
-    return {
+# Compiled lexicon layout (little-endian): header (magic, format version,
+# word count, word width), count NUL-padded words of width bytes in sorted
+# order, padding to a 4-byte boundary, then count float32 scores
+LEXICON_MAGIC = b"WSLEX\0"
+LEXICON_FORMAT_VERSION = 1
+LEXICON_SUFFIX = ".lex"
+_HEADER = struct.Struct("<6sHII")
+
+CONCRETENESS_LEXICON = "brysbaert_concreteness"
+DOMINANCE_LEXICON = "warriner_affective"
+
+# Lexicon name -> (CSV score column, score used when the column is missing)
+LEXICON_SOURCES = {
+    CONCRETENESS_LEXICON: ("Conc.M", 3.0),
+    DOMINANCE_LEXICON: ("D.Mean.Sum", 5.0),
+}
+
+# Curated abstract words from research (used when concreteness norms are unavailable)
+FALLBACK_ABSTRACT_WORDS: FrozenSet[str] = frozenset(
+    {
         # Conceptual terms
         "concept",
         "idea",
@@ -175,26 +117,12 @@ def get_abstract_words(threshold: float = 2.5) -> Set[str]:
         "rationale",
         "justification",
     }
+)
 
-
-def get_power_words(threshold: float = 6.5) -> Set[str]:
-    """
-    Get set of power words (high dominance).
-
-    Args:
-        threshold: Dominance score above which words are considered powerful.
-                  Default 6.5 (upper third of 1-9 scale).
-
-    Returns:
-        Set of power words (lowercase).
-    """
-    norms = load_dominance_norms()
-
-    if norms:
-        return {word for word, score in norms.items() if score > threshold}
-
-    # Fallback: curated power words from marketing/psychology research
-    return {
+# Curated power words from marketing/psychology research (used when
+# dominance norms are unavailable)
+FALLBACK_POWER_WORDS: FrozenSet[str] = frozenset(
+    {
         # Urgency
         "now",
         "immediately",
@@ -277,21 +205,12 @@ def get_power_words(threshold: float = 6.5) -> Set[str]:
         "official",
         "secure",
     }
+)
 
-
-def get_dynamic_verbs() -> Set[str]:
-    """
-    Get set of dynamic/action verbs (high energy).
-
-    Based on verb semantics research - verbs implying motion,
-    force, change, or impact.
-
-    Returns:
-        Set of dynamic verb lemmas (lowercase).
-    """
-    # These are based on VerbNet motion/force classes
-    # and psycholinguistic research on verb imageability
-    return {
+# Dynamic/action verbs, based on VerbNet motion/force classes
+# and psycholinguistic research on verb imageability
+DYNAMIC_VERBS: FrozenSet[str] = frozenset(
+    {
         # Motion verbs
         "accelerate",
         "bolt",
@@ -396,18 +315,11 @@ def get_dynamic_verbs() -> Set[str]:
         "unleash",
         "win",
     }
+)
 
-
-def get_static_verbs() -> Set[str]:
-    """
-    Get set of static/stative verbs (low energy).
-
-    Verbs that describe states rather than actions.
-
-    Returns:
-        Set of static verb lemmas (lowercase).
-    """
-    return {
+# Static/stative verbs (describe states rather than actions)
+STATIC_VERBS: FrozenSet[str] = frozenset(
+    {
         # Be verbs
         "be",
         "is",
@@ -462,6 +374,371 @@ def get_static_verbs() -> Set[str]:
         "involve",
         "require",
     }
+)
+
+
+def get_data_dir() -> Path:
+    """Get or create the data directory for lexicon files."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    return DATA_DIR
+
+
+# ============================================================================
+# COMPILED LEXICON TABLES
+# ============================================================================
+
+
+class LexiconTable:
+    """
+    Word -> score table over a sorted array of fixed-width words.
+
+    words is a NumPy bytes array (dtype S<width>) of UTF-8 encoded lowercase
+    words in sorted order and scores the matching float32 scores. Both may
+    be memory-mapped views of a compiled lexicon file.
+    """
+
+    def __init__(self, words: np.ndarray, scores: np.ndarray):
+        self.words = words
+        self.scores = scores
+        self.width = words.dtype.itemsize
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    @classmethod
+    def from_norms(cls, norms: Dict[str, float]) -> "LexiconTable":
+        """
+        Build a table in memory.
+
+        Args:
+            norms: Dict mapping lowercase word -> score
+
+        Returns:
+            LexiconTable
+        """
+        entries = sorted((word.encode("utf-8"), score) for word, score in norms.items())
+        width = max((len(word) for word, _ in entries), default=1)
+        words = np.array([word for word, _ in entries], dtype=f"S{width}")
+        scores = np.array([score for _, score in entries], dtype=np.float32)
+        return cls(words, scores)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["LexiconTable"]:
+        """
+        Memory-map a compiled lexicon.
+
+        Args:
+            path: Compiled lexicon file (see write_lexicon())
+
+        Returns:
+            LexiconTable, or None if the file is missing, truncated or of
+            another format version
+        """
+        try:
+            with open(path, "rb") as f:
+                magic, version, count, width = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != LEXICON_MAGIC or version != LEXICON_FORMAT_VERSION or width < 1:
+                return None
+            if count == 0:
+                return cls(np.empty(0, dtype=f"S{width}"), np.empty(0, dtype=np.float32))
+            words = np.memmap(
+                path, dtype=f"S{width}", mode="r", offset=_HEADER.size, shape=(count,)
+            )
+            scores = np.memmap(
+                path, dtype="<f4", mode="r", offset=_scores_offset(count, width), shape=(count,)
+            )
+        except (OSError, ValueError, struct.error):
+            return None
+        return cls(words, scores)
+
+    def get(self, word: str) -> Optional[float]:
+        """
+        Look up one word.
+
+        Args:
+            word: Lowercase word
+
+        Returns:
+            Score, or None if the word is not in the lexicon
+        """
+        key = word.encode("utf-8")
+        if not len(self.words) or len(key) > self.width:
+            return None
+        index = int(np.searchsorted(self.words, key))
+        if index < len(self.words) and self.words[index] == key:
+            return float(self.scores[index])
+        return None
+
+    def lookup(self, words: Sequence[str]) -> np.ndarray:
+        """
+        Look up a whole token list at once.
+
+        Each distinct word is searched once, in one vectorized binary search
+        over the sorted table.
+
+        Args:
+            words: Lowercase words
+
+        Returns:
+            float32 array aligned with words, NaN where a word is not in
+            the lexicon
+        """
+        if not len(words) or not len(self.words):
+            return np.full(len(words), np.nan, dtype=np.float32)
+
+        unique, inverse = np.unique(np.asarray(words, dtype=str), return_inverse=True)
+        keys = np.char.encode(unique, "utf-8")
+        # Longer words cannot be in the table (and would be truncated below)
+        fits = np.char.str_len(keys) <= self.width
+        keys = keys.astype(self.words.dtype)
+
+        positions = np.minimum(np.searchsorted(self.words, keys), len(self.words) - 1)
+        found = fits & (self.words[positions] == keys)
+        unique_scores = np.where(found, self.scores[positions], np.nan).astype(np.float32)
+        return unique_scores[inverse.reshape(-1)]
+
+    def words_where(self, mask: np.ndarray) -> FrozenSet[str]:
+        """
+        Get the words selected by a boolean mask over the table.
+
+        Args:
+            mask: Boolean array aligned with the table (e.g. scores < 2.5)
+
+        Returns:
+            Frozen set of words
+        """
+        return frozenset(word.decode("utf-8") for word in self.words[mask].tolist())
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Get the table as a dict.
+
+        Returns:
+            Dict mapping word -> score
+        """
+        words = (word.decode("utf-8") for word in self.words.tolist())
+        return dict(zip(words, self.scores.tolist()))
+
+
+def _scores_offset(count: int, width: int) -> int:
+    """Byte offset of the score array (4-byte aligned)."""
+    end_of_words = _HEADER.size + count * width
+    return end_of_words + (-end_of_words % 4)
+
+
+def read_norms_csv(
+    csv_path: Path, column: str, default: float, word_column: str = "Word"
+) -> Dict[str, float]:
+    """
+    Parse a norms CSV.
+
+    Args:
+        csv_path: CSV with a word column and a score column
+        column: Score column
+        default: Score used for rows without the score column
+        word_column: Word column
+
+    Returns:
+        Dict mapping lowercase word -> score (rows with invalid scores skipped)
+    """
+    norms = {}
+    with open(csv_path, encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            word = row.get(word_column, "").lower().strip()
+            try:
+                score = float(row.get(column, default))
+                if word:
+                    norms[word] = score
+            except (ValueError, TypeError):
+                continue
+    return norms
+
+
+def write_lexicon(path: Path, norms: Dict[str, float]) -> None:
+    """
+    Write a compiled lexicon.
+
+    Args:
+        path: Output file
+        norms: Dict mapping lowercase word -> score
+    """
+    entries = sorted((word.encode("utf-8"), score) for word, score in norms.items())
+    width = max((len(word) for word, _ in entries), default=1)
+    words = b"".join(word.ljust(width, b"\0") for word, _ in entries)
+    scores = array("f", (score for _, score in entries))
+    if sys.byteorder != "little":
+        scores.byteswap()
+
+    header = _HEADER.pack(LEXICON_MAGIC, LEXICON_FORMAT_VERSION, len(entries), width)
+    padding = b"\0" * (_scores_offset(len(entries), width) - _HEADER.size - len(words))
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(header + words + padding + scores.tobytes())
+    os.replace(tmp, path)
+
+
+def compile_lexicons(data_dir: Optional[Path] = None) -> List[Path]:
+    """
+    Compile every norms CSV in the data directory into its .lex file.
+
+    Run when the CSVs change (``python -m writescore.utils.lexicons``).
+
+    Args:
+        data_dir: Directory holding the CSVs (default: package data directory)
+
+    Returns:
+        Paths of the compiled lexicons written
+    """
+    data_dir = Path(data_dir) if data_dir else get_data_dir()
+    written = []
+    for name, (column, default) in LEXICON_SOURCES.items():
+        csv_path = data_dir / f"{name}.csv"
+        if csv_path.exists():
+            path = data_dir / f"{name}{LEXICON_SUFFIX}"
+            write_lexicon(path, read_norms_csv(csv_path, column, default))
+            written.append(path)
+    return written
+
+
+@cache
+def load_lexicon(name: str) -> LexiconTable:
+    """
+    Load a lexicon by name (cached).
+
+    Memory-maps the compiled lexicon; parses the CSV if it is missing.
+
+    Args:
+        name: Lexicon name (a key of LEXICON_SOURCES)
+
+    Returns:
+        LexiconTable (empty if neither file is available)
+    """
+    data_dir = get_data_dir()
+    table = LexiconTable.load(data_dir / f"{name}{LEXICON_SUFFIX}")
+    if table is not None:
+        return table
+
+    csv_path = data_dir / f"{name}.csv"
+    if csv_path.exists():
+        column, default = LEXICON_SOURCES[name]
+        return LexiconTable.from_norms(read_norms_csv(csv_path, column, default))
+    return LexiconTable.from_norms({})
+
+
+def load_concreteness_table() -> LexiconTable:
+    """Get the Brysbaert concreteness lexicon (1.0-5.0, higher = more concrete)."""
+    return load_lexicon(CONCRETENESS_LEXICON)
+
+
+def load_dominance_table() -> LexiconTable:
+    """Get the Warriner dominance lexicon (1.0-9.0, higher = more dominant)."""
+    return load_lexicon(DOMINANCE_LEXICON)
+
+
+# ============================================================================
+# NORMS AND WORD SETS
+# ============================================================================
+
+
+@lru_cache(maxsize=1)
+def load_concreteness_norms() -> Dict[str, float]:
+    """
+    Load Brysbaert concreteness norms.
+
+    Returns dict mapping lowercase word -> concreteness score (1.0-5.0).
+    Higher scores = more concrete (e.g., "apple" ~4.8).
+    Lower scores = more abstract (e.g., "freedom" ~1.9).
+
+    Returns an empty dict if the lexicon is unavailable (callers then
+    use the curated abstract words list).
+    """
+    return load_concreteness_table().to_dict()
+
+
+@lru_cache(maxsize=1)
+def load_dominance_norms() -> Dict[str, float]:
+    """
+    Load Warriner dominance norms for power word detection.
+
+    Returns dict mapping lowercase word -> dominance score (1.0-9.0).
+    Higher scores = more dominant/powerful (e.g., "conquer" ~7.0).
+    Lower scores = more submissive (e.g., "surrender" ~3.0).
+
+    Returns an empty dict if the lexicon is unavailable (callers then
+    use the curated power words list).
+    """
+    return load_dominance_table().to_dict()
+
+
+@lru_cache(maxsize=16)
+def get_abstract_words(threshold: float = 2.5) -> FrozenSet[str]:
+    """
+    Get set of abstract words (low concreteness).
+
+    Computed once per threshold.
+
+    Args:
+        threshold: Concreteness score below which words are considered abstract.
+                  Default 2.5 (mid-point of 1-5 scale).
+
+    Returns:
+        Set of abstract words (lowercase).
+    """
+    table = load_concreteness_table()
+    if len(table):
+        return table.words_where(table.scores < threshold)
+    return FALLBACK_ABSTRACT_WORDS
+
+
+@lru_cache(maxsize=16)
+def get_power_words(threshold: float = 6.5) -> FrozenSet[str]:
+    """
+    Get set of power words (high dominance).
+
+    Computed once per threshold.
+
+    Args:
+        threshold: Dominance score above which words are considered powerful.
+                  Default 6.5 (upper third of 1-9 scale).
+
+    Returns:
+        Set of power words (lowercase).
+    """
+    table = load_dominance_table()
+    if len(table):
+        return table.words_where(table.scores > threshold)
+    return FALLBACK_POWER_WORDS
+
+
+def get_dynamic_verbs() -> FrozenSet[str]:
+    """
+    Get set of dynamic/action verbs (high energy).
+
+    Based on verb semantics research - verbs implying motion,
+    force, change, or impact.
+
+    Returns:
+        Set of dynamic verb lemmas (lowercase).
+    """
+    return DYNAMIC_VERBS
+
+
+def get_static_verbs() -> FrozenSet[str]:
+    """
+    Get set of static/stative verbs (low energy).
+
+    Verbs that describe states rather than actions.
+
+    Returns:
+        Set of static verb lemmas (lowercase).
+    """
+    return STATIC_VERBS
+
+
+# ============================================================================
+# SINGLE-WORD LOOKUP
+# ============================================================================
 
 
 def get_word_concreteness(word: str) -> Optional[float]:
@@ -474,8 +751,7 @@ def get_word_concreteness(word: str) -> Optional[float]:
     Returns:
         Concreteness score (1.0-5.0) or None if not in lexicon.
     """
-    norms = load_concreteness_norms()
-    return norms.get(word.lower().strip())
+    return load_concreteness_table().get(word.lower().strip())
 
 
 def get_word_dominance(word: str) -> Optional[float]:
@@ -488,8 +764,7 @@ def get_word_dominance(word: str) -> Optional[float]:
     Returns:
         Dominance score (1.0-9.0) or None if not in lexicon.
     """
-    norms = load_dominance_norms()
-    return norms.get(word.lower().strip())
+    return load_dominance_table().get(word.lower().strip())
 
 
 def is_abstract(word: str, threshold: float = 2.5) -> bool:
@@ -528,3 +803,77 @@ def is_power_word(word: str, threshold: float = 6.5) -> bool:
 
     # Fallback: check hardcoded set
     return word.lower().strip() in get_power_words()
+
+
+# ============================================================================
+# TOKEN-LIST LOOKUP
+# ============================================================================
+
+
+def lookup_concreteness(words: Sequence[str]) -> np.ndarray:
+    """
+    Get concreteness scores for a token list.
+
+    Args:
+        words: Lowercase words
+
+    Returns:
+        float32 array aligned with words, NaN where not in the lexicon
+    """
+    return load_concreteness_table().lookup(words)
+
+
+def lookup_dominance(words: Sequence[str]) -> np.ndarray:
+    """
+    Get dominance scores for a token list.
+
+    Args:
+        words: Lowercase words
+
+    Returns:
+        float32 array aligned with words, NaN where not in the lexicon
+    """
+    return load_dominance_table().lookup(words)
+
+
+def abstract_mask(words: Sequence[str], threshold: float = 2.5) -> np.ndarray:
+    """
+    Apply is_abstract() to a token list.
+
+    Args:
+        words: Lowercase words
+        threshold: Concreteness score threshold
+
+    Returns:
+        Boolean array aligned with words
+    """
+    table = load_concreteness_table()
+    if len(table):
+        return np.less(table.lookup(words), threshold)  # NaN (not in lexicon) -> False
+    return np.fromiter(
+        (word in FALLBACK_ABSTRACT_WORDS for word in words), dtype=bool, count=len(words)
+    )
+
+
+def power_word_mask(words: Sequence[str], threshold: float = 6.5) -> np.ndarray:
+    """
+    Apply is_power_word() to a token list.
+
+    Args:
+        words: Lowercase words
+        threshold: Dominance score threshold
+
+    Returns:
+        Boolean array aligned with words
+    """
+    table = load_dominance_table()
+    if len(table):
+        return np.greater(table.lookup(words), threshold)  # NaN (not in lexicon) -> False
+    return np.fromiter(
+        (word in FALLBACK_POWER_WORDS for word in words), dtype=bool, count=len(words)
+    )
+
+
+if __name__ == "__main__":
+    for compiled_path in compile_lexicons():
+        print(f"Compiled {compiled_path}")
@@ -8,50 +8,17 @@ AI-generated content markers.
 import re
 from typing import Dict, List, Optional
 
+from writescore.utils.vocabulary_index import AI_VOCABULARY_INDEX
+
 # ============================================================================
 # AI VOCABULARY PATTERNS
 # ============================================================================
 
+# Built from the shared vocabulary index (utils/vocabulary_index.py): one
+# case-insensitive pattern per canonical word, matching any of its forms
 AI_VOCABULARY = [
-    # Tier 1 - Extremely High AI Association
-    r"\bdelv(e|es|ing)\b",
-    r"\brobust(ness)?\b",
-    r"\bleverag(e|es|ing)\b",
-    r"\bharness(es|ing)?\b",
-    r"\bunderscore[sd]?\b",
-    r"\bunderscoring\b",
-    r"\bfacilitate[sd]?\b",
-    r"\bfacilitating\b",
-    r"\bpivotal\b",
-    r"\bholistic(ally)?\b",
-    # Tier 2 - High AI Association
-    r"\bseamless(ly)?\b",
-    r"\bcomprehensive(ly)?\b",
-    r"\boptimiz(e|es|ation|ing)\b",
-    r"\bstreamlin(e|ed|ing)\b",
-    r"\bparamount\b",
-    r"\bquintessential\b",
-    r"\bmyriad\b",
-    r"\bplethora\b",
-    r"\butiliz(e|es|ation|ing)\b",
-    r"\bcommence[sd]?\b",
-    r"\bendeavor[sd]?\b",
-    # Tier 3 - Context-Dependent
-    r"\binnovative\b",
-    r"\bcutting-edge\b",
-    r"\brevolutionary\b",
-    r"\bgame-changing\b",
-    r"\btransformative\b",
-    # Additional AI markers
-    r"\bdive deep\b",
-    r"\bdeep dive\b",
-    r"\bunpack(s|ing)?\b",
-    r"\bat the end of the day\b",
-    r"\bsynerg(y|istic)\b",
-    r"\becosystem\b",
-    r"\blandscape\b",
-    r"\bspace\s+\(",
-    r"\bparadigm\s+shift\b",
+    r"\b(?:" + "|".join(re.escape(form).replace(r"\ ", r"\s+") for form in entry.forms) + r")\b"
+    for entry in AI_VOCABULARY_INDEX.entries
 ]
 
 # Formulaic transitions (from ai-detection-patterns.md)
@@ -102,25 +69,7 @@ DOMAIN_TERMS_DEFAULT = [
 
 # AI vocabulary replacement suggestions
 AI_VOCAB_REPLACEMENTS = {
-    "delve": ["explore", "examine", "investigate", "study"],
-    "robust": ["strong", "solid", "reliable", "effective"],
-    "leverage": ["use", "apply", "employ", "utilize"],
-    "harness": ["use", "apply", "employ"],
-    "underscore": ["emphasize", "highlight", "stress", "show"],
-    "facilitate": ["enable", "help", "allow", "support"],
-    "pivotal": ["key", "crucial", "important", "critical"],
-    "holistic": ["complete", "comprehensive", "full", "overall"],
-    "seamless": ["smooth", "integrated", "unified"],
-    "comprehensive": ["complete", "thorough", "full"],
-    "optimize": ["improve", "enhance", "refine"],
-    "streamline": ["simplify", "improve", "refine"],
-    "paramount": ["essential", "critical", "vital"],
-    "quintessential": ["classic", "typical", "ideal"],
-    "myriad": ["many", "numerous", "countless"],
-    "plethora": ["abundance", "many", "numerous"],
-    "utilize": ["use", "employ", "apply"],
-    "commence": ["start", "begin"],
-    "endeavor": ["effort", "attempt", "try"],
+    entry.word: list(entry.suggestions) for entry in AI_VOCABULARY_INDEX.entries
 }
 
 
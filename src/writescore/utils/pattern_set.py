@@ -0,0 +1,224 @@
+"""
+Single-pass matching of a set of named regular expressions.
+
+Several dimensions count dozens to hundreds of small regexes (hedges, certainty
+markers, transitions, AI vocabulary) by calling findall() once per pattern,
+i.e. one full pass over the text per pattern. A PatternSet compiles all of
+them into two combined expressions:
+
+- a candidate scan, the alternation of every pattern inside a lookahead, which
+  finds each position where at least one pattern matches in a single pass
+  (a leading \\b shared by every pattern is hoisted out of the alternation, so
+  only word boundaries are tried);
+- a per-position probe with one optional named-group lookahead per pattern,
+  which reports every pattern matching at a candidate position.
+
+Matches are then dispatched to their patterns, dropping matches that overlap
+the previous match of the same pattern. The result is the same as running
+finditer() for each pattern separately: the same matches, in the same order,
+including patterns whose matches overlap each other's.
+
+Patterns must not match the empty string or use numbered backreferences; flags
+are applied per pattern, so case-sensitive and case-insensitive patterns can
+share a set.
+"""
+
+import re
+from typing import Dict, List, Mapping, Optional, Pattern, Tuple, Union
+
+# Flags that can be scoped to one pattern with an inline (?flags:...) group
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+
+_NUMBERED_BACKREFERENCE = re.compile(r"(?<!\\)\\[1-9]")
+
+
+def _split_alternatives(source: str) -> List[str]:
+    """
+    Split a regex source on its top-level "|" (outside groups and classes).
+
+    Args:
+        source: Regex source
+
+    Returns:
+        Top-level alternatives (one item if there is no top-level alternation)
+    """
+    alternatives = []
+    depth = 0
+    in_class = False
+    start = 0
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A "]" straight after "[" or "[^" is a literal member
+            if source[i + 1 : i + 2] == "^":
+                i += 1
+            if source[i + 1 : i + 2] == "]":
+                i += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            alternatives.append(source[start:i])
+            start = i + 1
+        i += 1
+    alternatives.append(source[start:])
+    return alternatives
+
+
+def _scoped(source: str, flags: int) -> str:
+    """
+    Wrap a pattern source so its flags apply only to it.
+
+    Args:
+        source: Regex source
+        flags: re flags the pattern was compiled with
+
+    Returns:
+        Source wrapped in a (?flags:...) or (?:...) group
+
+    Raises:
+        ValueError: If the pattern uses flags that cannot be scoped
+    """
+    inline = ""
+    for flag, letter in _INLINE_FLAGS:
+        if flags & flag:
+            inline += letter
+            flags &= ~flag
+    if flags & ~re.UNICODE:
+        raise ValueError(f"Pattern flags cannot be combined into a pattern set: {source!r}")
+    return f"(?{inline}:{source})"
+
+
+class PatternSet:
+    """
+    A fixed set of named regexes scanned together.
+
+    Attributes:
+        names: Pattern names, in the order they were given
+    """
+
+    def __init__(self, patterns: Mapping[str, Union[str, Pattern[str]]], flags: int = 0):
+        """
+        Prepare a pattern set (expressions are compiled on first use).
+
+        Args:
+            patterns: Name -> regex source or compiled pattern
+            flags: re flags for patterns given as source strings (compiled
+                patterns keep their own flags)
+
+        Raises:
+            ValueError: If a pattern uses numbered backreferences or unsupported flags
+        """
+        self.names: Tuple[str, ...] = tuple(patterns)
+        sources = []
+        for pattern in patterns.values():
+            if isinstance(pattern, str):
+                pattern = re.compile(pattern, flags)
+            if _NUMBERED_BACKREFERENCE.search(pattern.pattern):
+                raise ValueError(
+                    f"Numbered backreferences are not supported in a pattern set: "
+                    f"{pattern.pattern!r}"
+                )
+            sources.append((pattern.pattern, pattern.flags))
+        self._sources = sources
+        self._candidates: Optional[Pattern[str]] = None
+        self._probe: Optional[Pattern[str]] = None
+        self._groups: Tuple[int, ...] = ()
+
+    def _compile(self) -> None:
+        """Build the candidate scan and the per-position probe."""
+        # Hoist a leading \b out of the candidate alternation when every
+        # top-level alternative of every pattern starts with one
+        bounded = []
+        for source, flags in self._sources:
+            alternatives = _split_alternatives(source)
+            if flags & re.VERBOSE or not all(alt.startswith(r"\b") for alt in alternatives):
+                bounded = None
+                break
+            bounded.append(_scoped("|".join(alt[2:] for alt in alternatives), flags))
+        if bounded is not None:
+            candidates = r"\b(?=" + "|".join(bounded) + ")"
+        else:
+            candidates = "(?=" + "|".join(_scoped(s, f) for s, f in self._sources) + ")"
+
+        probe = "".join(
+            f"(?:(?=(?P<_pattern{i}>{_scoped(source, flags)}))|)"
+            for i, (source, flags) in enumerate(self._sources)
+        )
+        compiled_probe = re.compile(probe)
+        self._groups = tuple(
+            compiled_probe.groupindex[f"_pattern{i}"] for i in range(len(self._sources))
+        )
+        self._probe = compiled_probe
+        self._candidates = re.compile(candidates)
+
+    def spans(self, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Find the matches of every pattern.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Name -> (start, end) spans in text order, for every pattern (the
+            spans each pattern's own finditer() would produce)
+        """
+        if self._candidates is None:
+            self._compile()
+        probe = self._probe
+        groups = self._groups
+
+        found: List[List[Tuple[int, int]]] = [[] for _ in groups]
+        last_end = [0] * len(groups)
+        for candidate in self._candidates.finditer(text):
+            match = probe.match(text, candidate.start())
+            for index, group in enumerate(groups):
+                start = match.start(group)
+                # Like finditer(), a pattern's next match starts after its previous one
+                if start != -1 and start >= last_end[index]:
+                    end = match.end(group)
+                    found[index].append((start, end))
+                    last_end[index] = end
+        return dict(zip(self.names, found))
+
+    def counts(self, text: str) -> Dict[str, int]:
+        """
+        Count the matches of every pattern.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Name -> number of matches (len(findall()) for each pattern)
+        """
+        return {name: len(spans) for name, spans in self.spans(text).items()}
+
+    def findall(self, text: str) -> Dict[str, List[str]]:
+        """
+        Collect the matched text of every pattern.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Name -> matched strings in text order (match.group() per match)
+        """
+        return {
+            name: [text[start:end] for start, end in spans]
+            for name, spans in self.spans(text).items()
+        }
@@ -0,0 +1,265 @@
+"""
+Single-pass multi-phrase matching (Aho-Corasick automaton).
+
+FigurativeLanguageDimension looks for thousands of idioms and cliché phrases.
+Testing each phrase with a substring search costs lexicon size x text length;
+a PhraseMatcher compiles the whole lexicon into one automaton and reports
+every occurrence of every phrase, with positions, in a single pass over the
+text. Adding phrases to a lexicon makes the automaton bigger but does not make
+scanning slower.
+
+Matching is case-insensitive (phrases and text are lowercased) and, like
+``phrase in text``, not restricted to word boundaries; use is_word_bounded()
+to filter occurrences that must be whole words.
+
+Compiled automata are shared per lexicon within a process (get_phrase_matcher())
+and can be cached on disk, keyed by a digest of the phrase list, so a lexicon
+is compiled once per version rather than once per run.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Bump when the pickled automaton layout changes
+FORMAT_VERSION = 1
+
+MATCHERS_DIRNAME = "matchers"
+
+
+def lexicon_digest(phrases: Sequence[str]) -> str:
+    """
+    Identify a lexicon version by its (lowercased, ordered) phrases.
+
+    Args:
+        phrases: Lexicon phrases
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    hasher = hashlib.sha256(f"v{FORMAT_VERSION}".encode())
+    for phrase in phrases:
+        hasher.update(b"\0" + phrase.lower().encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def is_word_bounded(text: str, start: int, end: int) -> bool:
+    """
+    Check that an occurrence is not part of a longer word (like regex \\b...\\b
+    around a phrase that starts and ends with word characters).
+
+    Args:
+        text: Scanned text
+        start: Occurrence start
+        end: Occurrence end (exclusive)
+
+    Returns:
+        True if the characters before and after are not word characters
+    """
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    return not (before.isalnum() or before == "_" or after.isalnum() or after == "_")
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over a fixed list of phrases.
+
+    Attributes:
+        phrases: Distinct lowercased phrases, indexed by phrase id
+        digest: lexicon_digest() of the phrases the matcher was built from
+    """
+
+    def __init__(self, phrases: Sequence[str]):
+        """
+        Compile phrases into an automaton.
+
+        Args:
+            phrases: Phrases to find (case-insensitive; duplicates and empty
+                phrases are ignored)
+        """
+        self.digest = lexicon_digest(phrases)
+        self.phrases: Tuple[str, ...] = tuple(
+            dict.fromkeys(phrase.lower() for phrase in phrases if phrase)
+        )
+
+        # Trie: goto[node][char] -> node; node 0 is the root
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[int, ...]] = [()]
+        for phrase_id, phrase in enumerate(self.phrases):
+            node = 0
+            for char in phrase:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    outputs.append(())
+                node = next_node
+            outputs[node] = (phrase_id,)
+
+        # Failure links (longest proper suffix that is a trie prefix), breadth first,
+        # so each node also reports the phrases ending at its failure node
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                outputs[child] = outputs[child] + outputs[fail[child]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    @property
+    def node_count(self) -> int:
+        """Number of automaton states."""
+        return len(self._goto)
+
+    def find_all(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Find every occurrence of every phrase, overlapping ones included.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            (start, end, phrase_id) per occurrence, ordered by end position;
+            positions index the original text
+        """
+        lowered = text.lower()
+        starts: Optional[List[int]] = None
+        if len(lowered) == len(text):
+            chars = enumerate(lowered)
+        else:
+            # A few characters lowercase to several (e.g. "İ"); scan the
+            # lowercased characters but report positions in the original text
+            chars = ((pos, c) for pos, char in enumerate(text) for c in char.lower())
+            starts = [pos for pos, char in enumerate(text) for _ in char.lower()]
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        lengths = [len(phrase) for phrase in self.phrases]
+        matches = []
+        node = 0
+        for index, (pos, char) in enumerate(chars):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for phrase_id in outputs[node]:
+                first = index + 1 - lengths[phrase_id]
+                start = first if starts is None else starts[first]
+                matches.append((start, pos + 1, phrase_id))
+        return matches
+
+    def occurrences(self, text: str) -> Dict[str, List[Tuple[int, int]]]:
+        """
+        Group occurrences by phrase.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Lowercased phrase -> (start, end) spans in text order, for phrases found
+        """
+        found: Dict[str, List[Tuple[int, int]]] = {}
+        for start, end, phrase_id in self.find_all(text):
+            found.setdefault(self.phrases[phrase_id], []).append((start, end))
+        return found
+
+    # ========================================================================
+    # ON-DISK CACHE
+    # ========================================================================
+
+    def save(self, path: Path) -> None:
+        """
+        Write the compiled automaton to disk (atomically).
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = (FORMAT_VERSION, self.digest, self.phrases, self._goto, self._fail, self._outputs)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path, digest: Optional[str] = None) -> Optional["PhraseMatcher"]:
+        """
+        Read a compiled automaton written by save().
+
+        Args:
+            path: Cached automaton file
+            digest: Expected lexicon digest (None = accept any)
+
+        Returns:
+            PhraseMatcher, or None if the file is missing, stale or unreadable
+        """
+        try:
+            with open(path, "rb") as f:
+                version, cached_digest, phrases, goto, fail, outputs = pickle.load(f)
+        except Exception:
+            # Missing, truncated or written by an incompatible version
+            return None
+        if version != FORMAT_VERSION or (digest is not None and cached_digest != digest):
+            return None
+
+        matcher = cls.__new__(cls)
+        matcher.digest = cached_digest
+        matcher.phrases = phrases
+        matcher._goto = goto
+        matcher._fail = fail
+        matcher._outputs = outputs
+        return matcher
+
+
+# ============================================================================
+# PROCESS-WIDE PROVIDER
+# ============================================================================
+
+_matchers: Dict[str, PhraseMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_phrase_matcher(phrases: Sequence[str], cache_dir: Optional[Path] = None) -> PhraseMatcher:
+    """
+    Get the compiled matcher for a lexicon, compiling it at most once per version.
+
+    Args:
+        phrases: Lexicon phrases
+        cache_dir: Directory for compiled automata (None = compile in memory only)
+
+    Returns:
+        Shared PhraseMatcher
+    """
+    digest = lexicon_digest(phrases)
+    with _matchers_lock:
+        matcher = _matchers.get(digest)
+        if matcher is not None:
+            return matcher
+
+        path = Path(cache_dir) / MATCHERS_DIRNAME / f"{digest}.pickle" if cache_dir else None
+        matcher = PhraseMatcher.load(path, digest) if path is not None else None
+        if matcher is None:
+            matcher = PhraseMatcher(phrases)
+            if path is not None:
+                try:
+                    matcher.save(path)
+                except OSError as e:
+                    print(f"Warning: could not cache phrase matcher: {e}", file=sys.stderr)
+        _matchers[digest] = matcher
+    return matcher
@@ -6,13 +6,51 @@ import json
 import shutil
 import subprocess
 import sys
+import threading
 import urllib.request
 from pathlib import Path
+from typing import Any, Dict
 
-import spacy
+from writescore.utils.lazy_import import lazy_import
+
+# Imported on first model load (spacy pulls in thinc and torch)
+spacy = lazy_import("spacy")
 
 COMPAT_URL = "https://raw.githubusercontent.com/explosion/spacy-models/master/compatibility.json"
 
+# Shared model handles (one per model name per process)
+_models: Dict[str, Any] = {}
+_models_lock = threading.Lock()
+
+
+def get_spacy_model(model_name: str = "en_core_web_sm"):
+    """
+    Get the process-wide shared spacy model, loading it on first request.
+
+    All dimensions should use this instead of load_spacy_model() so that
+    the model is held in memory once.
+
+    Args:
+        model_name: Name of the spacy model (default: en_core_web_sm)
+
+    Returns:
+        Shared spacy Language model
+    """
+    nlp = _models.get(model_name)
+    if nlp is None:
+        with _models_lock:
+            nlp = _models.get(model_name)
+            if nlp is None:
+                nlp = load_spacy_model(model_name)
+                _models[model_name] = nlp
+    return nlp
+
+
+def clear_spacy_models() -> None:
+    """Forget all shared spacy models (frees model RAM)."""
+    with _models_lock:
+        _models.clear()
+
 
 def load_spacy_model(model_name: str = "en_core_web_sm"):
     """
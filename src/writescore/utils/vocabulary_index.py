@@ -0,0 +1,456 @@
+"""
+AI vocabulary index: one versioned lexicon for detection and suggestions.
+
+The AI vocabulary lexicon lists each canonical word with its tier, every
+surface form it is detected in (inflections and derived forms, all
+lowercase) and its human-friendly replacement suggestions:
+
+- Tier 1-3 words are scored by AiVocabularyDimension (3x/2x/1x weight).
+- Untiered words (tier None) are only reported in detailed mode.
+
+VocabularyIndex compiles the lexicon into a dict keyed by lowercase token
+(multi-word and hyphenated forms are keyed by their first token). scan()
+walks the text's word tokens once, producing the word count and every
+vocabulary hit together; scan_lines() maps one scan of a document back to
+line numbers for detailed mode.
+
+Bump VOCABULARY_VERSION whenever the lexicon changes: it is part of the
+result cache key, so cached analyses from an older lexicon are not reused.
+"""
+
+import bisect
+import re
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+VOCABULARY_VERSION = 1
+
+# Word tokens (same boundaries as regex \b...\b)
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Separators inside multi-word forms ("cutting-edge", "deep dive")
+_SEPARATOR_PATTERN = re.compile(r"\W+")
+
+
+class VocabEntry(NamedTuple):
+    """A canonical AI vocabulary word."""
+
+    word: str
+    tier: Optional[int]
+    forms: Tuple[str, ...]
+    suggestions: Tuple[str, ...]
+
+
+class VocabHit(NamedTuple):
+    """One occurrence of a vocabulary form."""
+
+    start: int
+    end: int
+    entry: VocabEntry
+
+
+class VocabularyScan(NamedTuple):
+    """Result of scanning a text once."""
+
+    hits: List[VocabHit]
+    word_count: int
+
+
+AI_VOCABULARY_LEXICON: Tuple[VocabEntry, ...] = (
+    # Tier 1 - Extremely High AI Association (3x weight)
+    VocabEntry(
+        "delve",
+        1,
+        ("delve", "delves", "delving"),
+        ("explore", "examine", "investigate", "look into"),
+    ),
+    VocabEntry("robust", 1, ("robust", "robustness"), ("strong", "reliable", "sturdy", "solid")),
+    VocabEntry(
+        "leverage",
+        1,
+        ("leverage", "leverages", "leveraging"),
+        ("use", "apply", "employ", "utilize"),
+    ),
+    VocabEntry(
+        "harness",
+        1,
+        ("harness", "harnesses", "harnessing"),
+        ("use", "employ", "channel", "direct"),
+    ),
+    VocabEntry(
+        "underscore",
+        1,
+        ("underscore", "underscores", "underscored", "underscoring"),
+        ("emphasize", "highlight", "stress", "show"),
+    ),
+    VocabEntry(
+        "holistic",
+        1,
+        ("holistic", "holistically"),
+        ("comprehensive", "complete", "integrated", "whole"),
+    ),
+    VocabEntry("myriad", 1, ("myriad",), ("many", "countless", "numerous", "various")),
+    VocabEntry("plethora", 1, ("plethora",), ("many", "abundance", "wealth", "plenty")),
+    VocabEntry(
+        "quintessential",
+        1,
+        ("quintessential",),
+        ("typical", "classic", "perfect example", "ideal"),
+    ),
+    VocabEntry("paramount", 1, ("paramount",), ("critical", "essential", "crucial", "vital")),
+    VocabEntry(
+        "foster",
+        1,
+        ("foster", "fosters", "fostered", "fostering"),
+        ("encourage", "promote", "support", "develop"),
+    ),
+    VocabEntry("realm", 1, ("realm", "realms"), ("area", "field", "domain", "sphere")),
+    VocabEntry(
+        "tapestry",
+        1,
+        ("tapestry", "tapestries"),
+        ("collection", "mixture", "blend", "combination"),
+    ),
+    VocabEntry(
+        "embark",
+        1,
+        ("embark", "embarks", "embarked", "embarking"),
+        ("start", "begin", "undertake", "initiate"),
+    ),
+    # Tier 2 - High AI Association (2x weight)
+    VocabEntry(
+        "revolutionize",
+        2,
+        ("revolutionize", "revolutionizes", "revolutionized", "revolutionizing"),
+        ("transform", "change", "improve", "reshape"),
+    ),
+    VocabEntry(
+        "game-changing",
+        2,
+        ("game-changing",),
+        ("significant", "major", "important", "transformative"),
+    ),
+    VocabEntry("cutting-edge", 2, ("cutting-edge",), ("advanced", "modern", "latest", "new")),
+    VocabEntry("pivotal", 2, ("pivotal",), ("key", "crucial", "important", "critical")),
+    VocabEntry(
+        "intricate",
+        2,
+        ("intricate", "intricately"),
+        ("complex", "detailed", "elaborate", "complicated"),
+    ),
+    VocabEntry("nuanced", 2, ("nuance", "nuanced"), ("subtle", "refined", "detailed", "complex")),
+    VocabEntry(
+        "multifaceted",
+        2,
+        ("multifaceted",),
+        ("complex", "varied", "diverse", "many-sided"),
+    ),
+    VocabEntry(
+        "comprehensive",
+        2,
+        ("comprehensive", "comprehensively"),
+        ("complete", "thorough", "full", "extensive"),
+    ),
+    VocabEntry(
+        "innovative",
+        2,
+        ("innovative", "innovatively"),
+        ("new", "creative", "novel", "original"),
+    ),
+    VocabEntry(
+        "transformative",
+        2,
+        ("transformative", "transformatively"),
+        ("significant", "major", "powerful", "impactful"),
+    ),
+    VocabEntry(
+        "seamless",
+        2,
+        ("seamless", "seamlessly"),
+        ("smooth", "easy", "straightforward", "effortless"),
+    ),
+    VocabEntry(
+        "dynamic",
+        2,
+        ("dynamic", "dynamically", "dynamics"),
+        ("changing", "active", "energetic", "flexible"),
+    ),
+    # Tier 3 - Moderate AI Association (1x weight)
+    VocabEntry(
+        "optimize",
+        3,
+        ("optimize", "optimizes", "optimization", "optimizing"),
+        ("improve", "enhance", "fine-tune", "refine"),
+    ),
+    VocabEntry(
+        "streamline",
+        3,
+        ("streamline", "streamlined", "streamlining"),
+        ("simplify", "improve", "make efficient", "refine"),
+    ),
+    VocabEntry(
+        "facilitate",
+        3,
+        ("facilitate", "facilitates", "facilitated", "facilitating"),
+        ("enable", "help", "make easier", "support"),
+    ),
+    VocabEntry(
+        "enhance",
+        3,
+        ("enhance", "enhances", "enhanced", "enhancement", "enhancing"),
+        ("improve", "strengthen", "boost", "increase"),
+    ),
+    VocabEntry(
+        "mitigate",
+        3,
+        ("mitigate", "mitigates", "mitigated", "mitigating", "mitigation"),
+        ("reduce", "lessen", "minimize", "address"),
+    ),
+    VocabEntry(
+        "navigate",
+        3,
+        ("navigate", "navigates", "navigated", "navigating", "navigation"),
+        ("move through", "handle", "deal with", "manage"),
+    ),
+    VocabEntry(
+        "ecosystem",
+        3,
+        ("ecosystem", "ecosystems"),
+        ("environment", "system", "network", "platform"),
+    ),
+    VocabEntry("landscape", 3, ("landscape", "landscapes"), ("field", "area", "space", "domain")),
+    # Untiered - reported in detailed mode, not scored
+    VocabEntry(
+        "utilize",
+        None,
+        ("utilize", "utilizes", "utilization", "utilizing"),
+        ("use", "employ", "apply", "work with"),
+    ),
+    VocabEntry(
+        "unpack",
+        None,
+        ("unpack", "unpacks", "unpacking"),
+        ("explain", "explore", "break down", "examine", "analyze"),
+    ),
+    VocabEntry(
+        "revolutionary",
+        None,
+        ("revolutionary",),
+        ("groundbreaking", "major", "significant", "transformative", "game-changing"),
+    ),
+    VocabEntry(
+        "dive deep",
+        None,
+        ("dive deep",),
+        ("explore thoroughly", "examine closely", "investigate", "look closely at", "study"),
+    ),
+    VocabEntry(
+        "deep dive",
+        None,
+        ("deep dive",),
+        (
+            "thorough look",
+            "detailed examination",
+            "close look",
+            "in-depth analysis",
+            "careful study",
+        ),
+    ),
+    VocabEntry(
+        "paradigm shift",
+        None,
+        ("paradigm shift",),
+        ("major change", "fundamental shift", "big change", "transformation", "sea change"),
+    ),
+    VocabEntry(
+        "synergy",
+        None,
+        ("synergy", "synergistic"),
+        ("cooperation", "collaboration", "combined effect", "teamwork", "partnership"),
+    ),
+    VocabEntry(
+        "commence",
+        None,
+        ("commence", "commences", "commenced"),
+        ("start", "begin", "initiate", "launch", "kick off"),
+    ),
+    VocabEntry(
+        "endeavor",
+        None,
+        ("endeavor", "endeavors"),
+        ("effort", "project", "attempt", "undertaking", "initiative"),
+    ),
+    VocabEntry(
+        "at the end of the day",
+        None,
+        ("at the end of the day",),
+        ("ultimately", "in the end", "finally"),
+    ),
+)
+
+
+class VocabularyIndex:
+    """
+    Compiled lookup from lowercase tokens to vocabulary entries.
+
+    Attributes:
+        entries: Lexicon entries, in lexicon order
+        version: Lexicon version
+    """
+
+    def __init__(self, entries: Sequence[VocabEntry], version: int = VOCABULARY_VERSION):
+        """
+        Compile a lexicon.
+
+        Args:
+            entries: Lexicon entries
+            version: Lexicon version
+
+        Raises:
+            ValueError: If two entries share a form
+        """
+        self.entries: Tuple[VocabEntry, ...] = tuple(entries)
+        self.version = version
+        self._by_word: Dict[str, VocabEntry] = {entry.word: entry for entry in self.entries}
+
+        # Single-token forms, and multi-token forms keyed by their first token
+        self._tokens: Dict[str, VocabEntry] = {}
+        self._phrases: Dict[str, List[Tuple[Tuple[str, ...], Tuple[str, ...], VocabEntry]]] = {}
+        seen = set()
+        for entry in self.entries:
+            for form in entry.forms:
+                if form in seen:
+                    raise ValueError(f"Vocabulary form listed twice: {form!r}")
+                seen.add(form)
+                tokens = _TOKEN_PATTERN.findall(form)
+                if len(tokens) == 1:
+                    self._tokens[tokens[0]] = entry
+                else:
+                    separators = tuple(_SEPARATOR_PATTERN.findall(form))
+                    self._phrases.setdefault(tokens[0], []).append(
+                        (tuple(tokens[1:]), separators, entry)
+                    )
+
+    def entry(self, word: str) -> Optional[VocabEntry]:
+        """
+        Look up a canonical word.
+
+        Args:
+            word: Canonical word
+
+        Returns:
+            Its entry, or None if the word is not in the lexicon
+        """
+        return self._by_word.get(word)
+
+    def tier_words(self, tier: Optional[int]) -> List[str]:
+        """
+        List the canonical words of a tier.
+
+        Args:
+            tier: Tier number (None = untiered words)
+
+        Returns:
+            Canonical words in lexicon order
+        """
+        return [entry.word for entry in self.entries if entry.tier == tier]
+
+    def scan(self, text: str) -> VocabularyScan:
+        """
+        Tokenize text once, finding vocabulary hits and counting words.
+
+        Matching is case-insensitive and whole-token. Hyphens inside a form
+        must appear literally; spaces match any run of whitespace.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            VocabularyScan with hits in text order and the word count
+            (tokens made only of ASCII letters, as count_words() counts them)
+        """
+        tokens = list(_TOKEN_PATTERN.finditer(text))
+        tokens_lookup = self._tokens
+        phrases = self._phrases
+        hits: List[VocabHit] = []
+        word_count = 0
+        for index, match in enumerate(tokens):
+            token = match.group()
+            if token.isascii() and token.isalpha():
+                word_count += 1
+            lowered = token.lower()
+            entry = tokens_lookup.get(lowered)
+            if entry is not None:
+                hits.append(VocabHit(match.start(), match.end(), entry))
+            for rest, separators, phrase_entry in phrases.get(lowered, ()):
+                end = self._match_phrase(text, tokens, index, rest, separators)
+                if end is not None:
+                    hits.append(VocabHit(match.start(), end, phrase_entry))
+        return VocabularyScan(hits, word_count)
+
+    @staticmethod
+    def _match_phrase(
+        text: str,
+        tokens: List["re.Match[str]"],
+        index: int,
+        rest: Tuple[str, ...],
+        separators: Tuple[str, ...],
+    ) -> Optional[int]:
+        """
+        Check whether the tokens after tokens[index] complete a multi-token form.
+
+        Returns:
+            End offset of the form, or None if it does not match here
+        """
+        if index + len(rest) >= len(tokens):
+            return None
+        previous = tokens[index]
+        for offset, (expected, separator) in enumerate(zip(rest, separators), start=1):
+            current = tokens[index + offset]
+            gap = text[previous.end() : current.start()]
+            if separator.isspace():
+                if not gap.isspace():
+                    return None
+            elif gap != separator:
+                return None
+            if current.group().lower() != expected:
+                return None
+            previous = current
+        return previous.end()
+
+    def scan_lines(
+        self, lines: Sequence[str], skip_line: Optional[Callable[[str], bool]] = None
+    ) -> Iterator[Tuple[int, str, VocabHit]]:
+        """
+        Scan a document once and locate each hit by line.
+
+        Args:
+            lines: Document lines
+            skip_line: Predicate for lines whose hits are ignored (e.g. headings)
+
+        Yields:
+            (1-based line number, line, hit with offsets within the line), in
+            document order; forms spanning a line break are not reported
+        """
+        starts = []
+        offset = 0
+        for line in lines:
+            starts.append(offset)
+            offset += len(line) + 1
+
+        for hit in self.scan("\n".join(lines)).hits:
+            line_index = bisect.bisect_right(starts, hit.start) - 1
+            line = lines[line_index]
+            line_start = starts[line_index]
+            if hit.end > line_start + len(line):
+                continue
+            if skip_line is not None and skip_line(line):
+                continue
+            yield (
+                line_index + 1,
+                line,
+                VocabHit(hit.start - line_start, hit.end - line_start, hit.entry),
+            )
+
+
+# Shared compiled index for the built-in lexicon
+AI_VOCABULARY_INDEX = VocabularyIndex(AI_VOCABULARY_LEXICON)
@@ -375,3 +375,18 @@ def clear_dimension_registry():
     yield
     # Optional: cleanup after test as well
     DimensionRegistry.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_result_cache(tmp_path, monkeypatch):
+    """
+    Point the analysis result cache at a per-test directory.
+
+    Keeps CLI runs from writing to ~/.cache/writescore and prevents cached
+    results from one test being reused by another.
+    """
+    from writescore.core import result_cache
+
+    cache_dir = tmp_path / "writescore-cache"
+    monkeypatch.setattr(result_cache, "default_cache_dir", lambda: cache_dir)
+    yield
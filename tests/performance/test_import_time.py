@@ -0,0 +1,111 @@
+"""
+Import-time budget tests.
+
+Heavy libraries (spaCy, torch, transformers, NLTK, sentence-transformers,
+textacy, scipy, textstat) and their models must load only on first actual
+use. Importing the package, the CLI or any dimension module, and running
+commands that never analyze text, must not import them.
+
+Each check runs in a fresh interpreter, since the test session itself has
+already imported everything.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = [
+    "nltk",
+    "scipy",
+    "sentence_transformers",
+    "spacy",
+    "textacy",
+    "textstat",
+    "torch",
+    "transformers",
+]
+
+# Cumulative import time budgets (-X importtime, excludes interpreter startup).
+# Measured locally at ~20ms and ~350ms; CI runners are 2-3x slower.
+IMPORT_BUDGETS_MS = {
+    "writescore": 300,
+    "writescore.cli.main": 1500,
+}
+
+DIMENSION_MODULES = sorted(
+    f"writescore.dimensions.{path.stem}"
+    for path in (Path(__file__).parents[2] / "src" / "writescore" / "dimensions").glob("*.py")
+    if path.stem != "__init__"
+)
+
+
+def heavy_modules_after(code: str):
+    """Run code in a fresh interpreter and list the heavy modules it imported."""
+    probe = f"{code}\nimport json, sys\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, timeout=120, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_time_ms(module: str) -> float:
+    """Cumulative import time of module in a fresh interpreter (best of 3)."""
+    times = []
+    for _ in range(3):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=True,
+        )
+        for line in result.stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == module:
+                times.append(int(fields[1]) / 1000)
+    return min(times)
+
+
+class TestNoHeavyImports:
+    """Tests that heavy libraries are not imported until used."""
+
+    @pytest.mark.parametrize("module", ["writescore", "writescore.cli.main"])
+    def test_package_and_cli(self, module):
+        """Test importing the package or CLI loads no heavy library."""
+        assert heavy_modules_after(f"import {module}") == []
+
+    @pytest.mark.parametrize("module", DIMENSION_MODULES)
+    def test_dimension_modules(self, module):
+        """Test importing (and self-registering) a dimension loads no heavy library or model."""
+        assert heavy_modules_after(f"import {module}") == []
+
+    def test_analyzer_construction(self):
+        """Test creating an analyzer loads dimensions without heavy libraries."""
+        code = (
+            "from writescore.core.analyzer import AIPatternAnalyzer\n"
+            "assert AIPatternAnalyzer().dimensions"
+        )
+        assert heavy_modules_after(code) == []
+
+    @pytest.mark.parametrize("args", [["--help"], ["versions"], ["validate-config"]])
+    def test_non_analysis_commands(self, args):
+        """Test commands that do not analyze text load no heavy library."""
+        code = (
+            "from click.testing import CliRunner\n"
+            "from writescore.cli.main import cli\n"
+            f"assert CliRunner().invoke(cli, {args!r}).exit_code == 0"
+        )
+        assert heavy_modules_after(code) == []
+
+
+class TestImportBudget:
+    """Tests that import times stay within budget."""
+
+    @pytest.mark.parametrize("module,budget_ms", sorted(IMPORT_BUDGETS_MS.items()))
+    def test_import_within_budget(self, module, budget_ms):
+        """Test cumulative import time of module is under its budget."""
+        elapsed = import_time_ms(module)
+        assert elapsed < budget_ms, f"import {module} took {elapsed:.0f}ms (budget {budget_ms}ms)"
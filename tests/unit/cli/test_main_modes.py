@@ -53,6 +53,39 @@ class TestCreateAnalysisConfig:
 
         assert config.mode == AnalysisMode.FULL
 
+    def test_create_config_streaming_mode(self):
+        """Test creating config for STREAMING mode."""
+        config = create_analysis_config("streaming", 5, 2000, "even")
+
+        assert config.mode == AnalysisMode.STREAMING
+
+    def test_create_config_result_cache(self):
+        """Test use_cache enables the result cache (off by default)."""
+        assert not create_analysis_config("fast", 5, 2000, "even").use_result_cache
+        config = create_analysis_config("fast", 5, 2000, "even", use_cache=True)
+
+        assert config.use_result_cache
+
+    def test_create_config_max_time(self):
+        """Test the time limit default, override and 0 = no limit."""
+        assert create_analysis_config("adaptive", 5, 2000, "even").max_analysis_time_seconds == 300
+        assert (
+            create_analysis_config("full", 5, 2000, "even", max_time=60).max_analysis_time_seconds
+            == 60
+        )
+        assert (
+            create_analysis_config("full", 5, 2000, "even", max_time=0).max_analysis_time_seconds
+            is None
+        )
+
+    def test_create_config_streaming_has_no_default_limit(self):
+        """Test STREAMING mode runs to the end of the document unless limited."""
+        streaming = create_analysis_config("streaming", 5, 2000, "even")
+        limited = create_analysis_config("streaming", 5, 2000, "even", max_time=900)
+
+        assert streaming.max_analysis_time_seconds is None
+        assert limited.max_analysis_time_seconds == 900
+
 
 class TestShowDryRunConfig:
     """Test dry-run configuration display."""
@@ -215,6 +248,26 @@ class TestShowDryRunConfig:
         assert "Warning" in output
         assert "VERY SLOW" in output
 
+    @patch("os.path.getsize")
+    @patch("builtins.print")
+    def test_dry_run_streaming_mode(self, mock_print, mock_getsize):
+        """Test dry-run for STREAMING mode shows window count and full coverage."""
+        mock_getsize.return_value = 1000000
+
+        config = AnalysisConfig(mode=AnalysisMode.STREAMING, streaming_window_chars=20000)
+
+        show_dry_run_config("test.md", config, False, False)
+
+        output = " ".join(
+            [
+                str(call.args[0]) if call.args else str(call.kwargs.get("", ""))
+                for call in mock_print.call_args_list
+            ]
+        )
+        assert "STREAMING" in output
+        assert "~50 windows" in output
+        assert "100%" in output
+
     @patch("os.path.getsize")
     @patch("builtins.print")
     def test_dry_run_shows_additional_features(self, mock_print, mock_getsize):
@@ -417,6 +470,109 @@ class TestRunSingleFileAnalysis:
         # Coverage should be displayed
         assert mock_show_coverage.called
 
+    @patch("writescore.cli.main.find_daemon")
+    @patch("writescore.cli.main.AIPatternAnalyzer")
+    @patch("builtins.print")
+    def test_single_file_uses_running_daemon(
+        self, mock_print, mock_analyzer_class, mock_find_daemon, tmp_path
+    ):
+        """Test a running daemon analyzes the file instead of this process."""
+        doc = tmp_path / "test.md"
+        doc.write_text("# Title\n\nSome text.\n")
+        result = MagicMock()
+        result.metadata = {}
+        mock_find_daemon.return_value.analyze.return_value = result
+
+        results, _ = run_single_file_analysis(
+            file=str(doc),
+            mode="fast",
+            profile="balanced",
+            samples=5,
+            sample_size=2000,
+            sample_strategy="even",
+            dry_run=False,
+            show_coverage=False,
+            detection_target=30.0,
+            quality_target=85.0,
+            history_notes="",
+            no_track_history=True,
+            no_score_summary=True,
+            format="json",
+            use_daemon=True,
+        )
+
+        assert results == [result]
+        text, config = mock_find_daemon.return_value.analyze.call_args[0]
+        assert text == "# Title\n\nSome text.\n"
+        assert config.mode == AnalysisMode.FAST
+        mock_analyzer_class.return_value.analyze_file.assert_not_called()
+
+    @patch("writescore.cli.main.find_daemon")
+    @patch("writescore.cli.main.AIPatternAnalyzer")
+    @patch("builtins.print")
+    def test_single_file_falls_back_when_daemon_fails(
+        self, mock_print, mock_analyzer_class, mock_find_daemon, tmp_path
+    ):
+        """Test an unavailable daemon falls back to in-process analysis."""
+        from writescore.core.daemon import DaemonBusyError
+
+        doc = tmp_path / "test.md"
+        doc.write_text("# Title\n\nSome text.\n")
+        mock_find_daemon.return_value.analyze.side_effect = DaemonBusyError("full")
+        result = MagicMock()
+        result.metadata = {}
+        mock_analyzer_class.return_value.analyze_file.return_value = result
+
+        results, _ = run_single_file_analysis(
+            file=str(doc),
+            mode="fast",
+            profile="balanced",
+            samples=5,
+            sample_size=2000,
+            sample_strategy="even",
+            dry_run=False,
+            show_coverage=False,
+            detection_target=30.0,
+            quality_target=85.0,
+            history_notes="",
+            no_track_history=True,
+            no_score_summary=True,
+            format="json",
+            use_daemon=True,
+        )
+
+        assert results == [result]
+        mock_analyzer_class.return_value.analyze_file.assert_called_once()
+
+    @patch("writescore.cli.main.find_daemon")
+    @patch("writescore.cli.main.AIPatternAnalyzer")
+    @patch("builtins.print")
+    def test_streaming_mode_skips_daemon(self, mock_print, mock_analyzer_class, mock_find_daemon):
+        """Test STREAMING mode always reads the file in this process."""
+        result = MagicMock()
+        result.metadata = {}
+        mock_analyzer_class.return_value.analyze_file.return_value = result
+
+        run_single_file_analysis(
+            file="test.md",
+            mode="streaming",
+            profile="balanced",
+            samples=5,
+            sample_size=2000,
+            sample_strategy="even",
+            dry_run=False,
+            show_coverage=False,
+            detection_target=30.0,
+            quality_target=85.0,
+            history_notes="",
+            no_track_history=True,
+            no_score_summary=True,
+            format="json",
+            use_daemon=True,
+        )
+
+        mock_find_daemon.assert_not_called()
+
 
 class TestRunBatchAnalysis:
     """Test batch analysis with mode configuration."""
@@ -501,6 +657,52 @@ class TestRunBatchAnalysis:
 
         assert len(results) == 2
 
+    @patch("writescore.cli.main.iter_batch_results")
+    @patch("writescore.cli.main.plan_workers", return_value=2)
+    @patch("pathlib.Path.glob")
+    @patch("pathlib.Path.is_dir")
+    @patch("writescore.cli.main.AIPatternAnalyzer")
+    @patch("builtins.print")
+    def test_batch_analysis_parallel(
+        self, mock_print, mock_analyzer_class, mock_is_dir, mock_glob, mock_plan, mock_iter
+    ):
+        """Test parallel batch returns results in file order and skips failures."""
+        from writescore.core.batch import BatchFileResult
+
+        mock_is_dir.return_value = True
+        mock_glob.return_value = [
+            Path("test_dir/b.md"),
+            Path("test_dir/a.md"),
+            Path("test_dir/c.md"),
+        ]
+
+        # Completion order differs from file order; one file fails
+        mock_iter.return_value = iter(
+            [
+                BatchFileResult(path="test_dir/c.md", result="result_c"),
+                BatchFileResult(path="test_dir/b.md", error="boom"),
+                BatchFileResult(path="test_dir/a.md", result="result_a"),
+            ]
+        )
+
+        results, dual_score = run_batch_analysis(
+            batch_dir="test_dir/",
+            mode="fast",
+            profile="balanced",
+            samples=5,
+            sample_size=2000,
+            sample_strategy="even",
+            dry_run=False,
+            jobs=4,
+        )
+
+        assert results == ["result_a", "result_c"]
+        assert dual_score is None
+        mock_analyzer_class.return_value.analyze_file.assert_not_called()
+        args = mock_iter.call_args[0]
+        assert [str(p) for p in args[0]] == ["test_dir/a.md", "test_dir/b.md", "test_dir/c.md"]
+        assert args[2] == 2
+
 
 # Coverage: These tests cover all major functionality of CLI refactoring
 # - Configuration creation from individual parameters (Click style)
@@ -11,16 +11,23 @@ Tests cover:
 - History tracking (load/save)
 - Detailed analysis mode
 - Overall assessment
+- Analysis deadline (cost-ordered scheduling, skipped dimensions)
 """
 
+import time
 from pathlib import Path
 
 import pytest
 
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
 from writescore.core.analyzer import AIPatternAnalyzer
+from writescore.core.result_cache import ResultCache
 from writescore.core.results import AnalysisResults, DetailedAnalysis
+from writescore.core.streaming import WindowFoldAccumulator
+from writescore.dimensions.burstiness import BurstinessDimension
 from writescore.history.tracker import ScoreHistory
 from writescore.scoring.dual_score import DualScore
+from writescore.utils.deadline import check_deadline
 
 
 @pytest.fixture
@@ -179,6 +186,51 @@ class TestAnalyzeFile:
         assert results.sentence_mean_length >= 0
 
 
+class TestAnalyzeText:
+    """Tests for in-memory analyze_text method."""
+
+    def test_analyze_text_basic(self, analyzer):
+        """Test text analysis reports the default source name."""
+        results = analyzer.analyze_text("# Title\n\nSome text to analyze. It has two sentences.")
+
+        assert isinstance(results, AnalysisResults)
+        assert results.file_path == "<text>"
+        assert results.total_words > 0
+
+    def test_analyze_text_source_name(self, analyzer):
+        """Test source_name is reported as the result's file_path."""
+        results = analyzer.analyze_text("Some text to analyze.", source_name="buffer-1")
+
+        assert results.file_path == "buffer-1"
+
+    def test_analyze_text_does_not_touch_disk(self, analyzer, monkeypatch):
+        """Test analysis runs without creating temporary files."""
+        import tempfile
+
+        def fail(*args, **kwargs):
+            raise AssertionError("analyze_text must not create temp files")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", fail)
+        monkeypatch.setattr(tempfile, "mkstemp", fail)
+
+        assert analyzer.analyze_text("Some text to analyze.").total_words > 0
+
+    def test_analyze_file_matches_analyze_text(self, analyzer, sample_markdown_file):
+        """Test analyze_file is a thin reader over analyze_text."""
+        from_file = analyzer.analyze_file(sample_markdown_file)
+        from_text = analyzer.analyze_text(
+            Path(sample_markdown_file).read_text(encoding="utf-8"),
+            source_name=sample_markdown_file,
+        )
+
+        assert from_file.file_path == from_text.file_path
+        assert from_file.total_words == from_text.total_words
+        assert from_file.total_sentences == from_text.total_sentences
+        assert from_file.ai_vocabulary_list == from_text.ai_vocabulary_list
+        assert from_file.sentence_lengths == from_text.sentence_lengths
+        assert from_file.overall_assessment == from_text.overall_assessment
+
+
 # ============================================================================
 # Preprocessing Tests
 # ============================================================================
@@ -792,3 +844,90 @@ Tiny.
         # Should skip short paragraphs (Lines 709-710 covered)
         # Uniform paragraphs list may be empty or contain only the long one
         assert isinstance(detailed.uniform_paragraphs, list)
+
+
+class SlowDimension(BurstinessDimension):
+    """Expensive dimension that works until the analysis deadline stops it."""
+
+    calls = 0
+
+    @property
+    def analysis_cost(self) -> int:
+        return 10
+
+    def analyze(self, text, lines=None, config=None, **kwargs):
+        SlowDimension.calls += 1
+        while True:
+            check_deadline()
+            time.sleep(0.01)
+
+    def create_stream_accumulator(self, config):
+        return WindowFoldAccumulator(self, config)
+
+
+class TestAnalysisDeadline:
+    """Tests for enforcing max_analysis_time_seconds."""
+
+    TEXT = "A short sentence. Then a considerably longer sentence follows it here.\n\n" * 5
+
+    @pytest.fixture
+    def analyzer(self):
+        SlowDimension.calls = 0
+        analyzer = AIPatternAnalyzer()
+        analyzer.dimensions = {
+            "slow": SlowDimension(),
+            "burstiness": BurstinessDimension(),
+            "slower": SlowDimension(),
+        }
+        return analyzer
+
+    def test_cheapest_dimensions_first(self, analyzer):
+        """Test scheduling by analysis_cost, stable for equal costs."""
+        assert analyzer._schedule_dimensions() == ["burstiness", "slow", "slower"]
+
+    def test_partial_results_after_deadline(self, analyzer):
+        """Test the running dimension stops and later ones are skipped."""
+        config = AnalysisConfig(mode=AnalysisMode.FULL, max_analysis_time_seconds=0.2)
+        start = time.monotonic()
+        results = analyzer.analyze_text(self.TEXT, config=config)
+
+        assert time.monotonic() - start < 5
+        assert SlowDimension.calls == 1
+        assert results.deadline_exceeded
+        assert results.skipped_dimensions == ["slow", "slower"]
+        assert list(results.dimension_results) == ["slow", "burstiness", "slower"]
+        assert results.dimension_results["burstiness"]["available"]
+        assert results.dimension_results["slower"]["skipped"]
+        assert results.dimension_results["slower"]["available"] is False
+
+    def test_partial_results_not_cached(self, analyzer, tmp_path):
+        """Test skipped dimensions are retried on the next run."""
+        config = AnalysisConfig(
+            mode=AnalysisMode.FULL,
+            max_analysis_time_seconds=0.1,
+            use_result_cache=True,
+            result_cache_dir=str(tmp_path),
+        )
+        analyzer.analyze_text(self.TEXT, config=config)
+        assert ResultCache(tmp_path).stats()["entries"] == 0
+
+    def test_complete_results(self):
+        """Test results within the deadline are not marked partial."""
+        analyzer = AIPatternAnalyzer()
+        analyzer.dimensions = {"burstiness": BurstinessDimension()}
+        results = analyzer.analyze_text(self.TEXT, config=AnalysisConfig(mode=AnalysisMode.FULL))
+
+        assert not results.deadline_exceeded
+        assert results.skipped_dimensions == []
+
+    def test_streaming_stops_reading(self, analyzer):
+        """Test STREAMING mode reports the windows analyzed before the deadline."""
+        analyzer.dimensions = {"burstiness": BurstinessDimension(), "slow": SlowDimension()}
+        config = AnalysisConfig(
+            mode=AnalysisMode.STREAMING, streaming_window_chars=100, max_analysis_time_seconds=0.1
+        )
+        results = analyzer.analyze_text(self.TEXT * 10, config=config)
+
+        assert results.deadline_exceeded
+        assert results.skipped_dimensions == ["slow"]
+        assert results.dimension_results["burstiness"]["samples_analyzed"] == 1
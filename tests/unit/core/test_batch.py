@@ -0,0 +1,383 @@
+"""Unit tests for parallel batch analysis.
+
+Tests cover:
+- Memory size parsing
+- Worker planning (job count, file count, memory budget)
+- Resident memory measurement
+- Worker-side analysis with per-file error isolation and memory guard
+- Pool restarts after a worker dies
+- Dataset document batches (prefetch, per-dimension error isolation)
+- End-to-end process pool runs (slow)
+"""
+
+import sys
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import DEFAULT, MagicMock, patch
+
+import pytest
+
+from writescore.core import batch
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
+from writescore.core.batch import (
+    BatchFileResult,
+    analyze_documents,
+    iter_batch_results,
+    iter_document_metrics,
+    parse_memory_size,
+    plan_workers,
+)
+
+
+class TestParseMemorySize:
+    """Tests for parse_memory_size()."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("1024", 1024),
+            ("2K", 2048),
+            ("1500M", 1500 * 1024**2),
+            ("2G", 2 * 1024**3),
+            ("2gb", 2 * 1024**3),
+            ("1.5G", int(1.5 * 1024**3)),
+        ],
+    )
+    def test_valid_sizes(self, value, expected):
+        """Test sizes with and without unit suffixes."""
+        assert parse_memory_size(value) == expected
+
+    @pytest.mark.parametrize("value", ["", "abc", "2T", "-1G", "0"])
+    def test_invalid_sizes(self, value):
+        """Test malformed or non-positive sizes are rejected."""
+        with pytest.raises(ValueError):
+            parse_memory_size(value)
+
+
+class TestPlanWorkers:
+    """Tests for plan_workers()."""
+
+    def test_capped_by_file_count(self):
+        """Test no more workers than files."""
+        assert plan_workers(8, 3) == 3
+
+    def test_at_least_one_worker(self):
+        """Test empty batches still plan one worker."""
+        assert plan_workers(4, 0) == 1
+
+    def test_capped_by_memory_budget(self):
+        """Test available memory / budget limits worker count."""
+        with patch.object(batch, "available_memory", return_value=5 * 1024**3):
+            assert plan_workers(8, 100, max_memory_per_worker=2 * 1024**3) == 2
+
+    def test_memory_budget_keeps_one_worker(self):
+        """Test a budget larger than available memory still runs one worker."""
+        with patch.object(batch, "available_memory", return_value=1024**3):
+            assert plan_workers(8, 100, max_memory_per_worker=4 * 1024**3) == 1
+
+    def test_unknown_memory_ignores_budget(self):
+        """Test budget is ignored when available memory is unknown."""
+        with patch.object(batch, "available_memory", return_value=None):
+            assert plan_workers(4, 100, max_memory_per_worker=1024) == 4
+
+
+class TestCurrentMemory:
+    """Tests for current_memory() without psutil."""
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+    def test_reads_current_rss_on_linux(self):
+        """Test current (not peak) resident memory is read from /proc."""
+        with patch.dict(sys.modules, {"psutil": None}):
+            used = batch.current_memory()
+        assert used is not None and used > 0
+
+    def test_unmeasurable_returns_none(self):
+        """Test None (guard skipped) when current RSS cannot be read."""
+        with patch.dict(sys.modules, {"psutil": None}), patch("builtins.open", side_effect=OSError):
+            assert batch.current_memory() is None
+
+
+class FakeExecutor:
+    """
+    In-process stand-in for ProcessPoolExecutor.
+
+    Items run in submission order. An item raising BrokenProcessPool breaks
+    the pool: it, the max_workers - 1 items still in flight before it and
+    every later item fail with BrokenProcessPool.
+    """
+
+    pools = 0
+    current = None
+
+    def __init__(self, max_workers, **kwargs):
+        FakeExecutor.pools += 1
+        FakeExecutor.current = self
+        self.max_workers = max_workers
+        self.queue = []
+        self.broken = False
+
+    def submit(self, fn, item):
+        future = Future()
+        self.queue.append((future, fn, item))
+        if self.max_workers == 1:
+            self.run()
+        return future
+
+    def run(self):
+        in_flight = []
+        for future, fn, item in self.queue:
+            if self.broken:
+                future.set_exception(BrokenProcessPool("pool broken"))
+                continue
+            try:
+                in_flight.append((future, fn(item)))
+            except BrokenProcessPool as e:
+                self.broken = True
+                for pending, _ in in_flight:
+                    pending.set_exception(e)
+                future.set_exception(e)
+                in_flight = []
+                continue
+            if len(in_flight) >= self.max_workers:
+                pending, result = in_flight.pop(0)
+                pending.set_result(result)
+        for pending, result in in_flight:
+            pending.set_result(result)
+        self.queue = []
+
+    def shutdown(self, **kwargs):
+        pass
+
+
+def fake_as_completed(futures):
+    """Run the current FakeExecutor's queue, then return its futures."""
+    FakeExecutor.current.run()
+    return list(futures)
+
+
+class TestPoolRestart:
+    """Tests for isolating the item that killed a worker."""
+
+    @pytest.fixture(autouse=True)
+    def executor(self):
+        FakeExecutor.pools = 0
+        with patch.multiple(
+            batch, ProcessPoolExecutor=FakeExecutor, as_completed=fake_as_completed
+        ):
+            yield
+
+    def run(self, crashes, items="abcdefgh", jobs=2):
+        """Run items; crashes[item] = pools the item breaks before succeeding."""
+
+        def work(item):
+            if crashes.get(item, 0) > 0:
+                crashes[item] -= 1
+                raise BrokenProcessPool("worker killed")
+            return item.upper()
+
+        return sorted(batch._iter_pool(jobs, None, (), work, list(items)))
+
+    def test_transient_crash_loses_nothing(self):
+        """Test items failed by a broken pool run again and succeed."""
+        results = self.run({"c": 1})
+        assert results == [(i, item.upper(), None) for i, item in enumerate("abcdefgh")]
+
+    def test_only_crashing_item_reported(self):
+        """Test an item that keeps breaking the pool fails alone, not the queue behind it."""
+        results = self.run({"c": 99})
+        failed = [index for index, _, error in results if error]
+        assert failed == [2]
+        assert results[2][2].startswith("worker failed")
+        assert [result for _, result, _ in results if result] == list("ABDEFGH")
+
+    def test_two_crashing_items(self):
+        """Test several crashing items are each reported, the rest finish."""
+        results = self.run({"b": 99, "g": 99}, jobs=1)
+        assert [index for index, _, error in results if error] == [1, 6]
+        assert len(results) == 8
+
+    def test_batch_results_report_failed_file(self):
+        """Test iter_batch_results reports a file whose worker keeps dying."""
+        with patch.object(
+            batch, "_analyze_in_worker", side_effect=BrokenProcessPool("worker killed")
+        ):
+            results = list(iter_batch_results(["x.md"], AnalysisConfig(), jobs=1))
+        assert [(r.path, r.ok) for r in results] == [("x.md", False)]
+
+
+class TestWorker:
+    """Tests for worker-side analysis."""
+
+    @pytest.fixture(autouse=True)
+    def worker_state(self):
+        """Install a mock analyzer as the worker's analyzer."""
+        analyzer = MagicMock()
+        config = AnalysisConfig()
+        with patch.multiple(
+            batch, _worker_analyzer=analyzer, _worker_config=config, _worker_memory_limit=None
+        ):
+            yield analyzer
+
+    def test_success(self, worker_state):
+        """Test successful analysis returns the result."""
+        worker_state.analyze_file.return_value = "result"
+        outcome = batch._analyze_in_worker("a.md")
+        assert outcome.ok
+        assert outcome.result == "result"
+        assert outcome.path == "a.md"
+
+    def test_error_isolated_to_file(self, worker_state):
+        """Test an exception becomes an error result instead of propagating."""
+        worker_state.analyze_file.side_effect = RuntimeError("boom")
+        outcome = batch._analyze_in_worker("bad.md")
+        assert not outcome.ok
+        assert outcome.error == "boom"
+        assert outcome.result is None
+
+    def test_memory_guard_releases_models(self, worker_state):
+        """Test worker over budget releases cached models."""
+        with patch.multiple(
+            batch,
+            _worker_memory_limit=1024,
+            current_memory=MagicMock(return_value=2048),
+            _release_models=DEFAULT,
+        ) as mocks:
+            batch._analyze_in_worker("a.md")
+        mocks["_release_models"].assert_called_once()
+
+    def test_memory_guard_within_budget(self, worker_state):
+        """Test worker within budget keeps its models."""
+        with patch.multiple(
+            batch,
+            _worker_memory_limit=4096,
+            current_memory=MagicMock(return_value=2048),
+            _release_models=DEFAULT,
+        ) as mocks:
+            batch._analyze_in_worker("a.md")
+        mocks["_release_models"].assert_not_called()
+
+    def test_memory_guard_releases_again_after_recovering(self, worker_state):
+        """Test a worker that gets back under budget keeps its guard."""
+        with patch.multiple(
+            batch,
+            _worker_memory_limit=1024,
+            current_memory=MagicMock(side_effect=[2048, 512, 2048, 512]),
+            _release_models=DEFAULT,
+        ) as mocks:
+            batch._analyze_in_worker("a.md")
+            batch._analyze_in_worker("b.md")
+        assert mocks["_release_models"].call_count == 2
+
+    def test_memory_guard_disabled_when_release_does_not_help(self, worker_state):
+        """Test a worker still over budget after releasing stops reloading models."""
+        with patch.multiple(
+            batch,
+            _worker_memory_limit=1024,
+            current_memory=MagicMock(return_value=2048),
+            _release_models=DEFAULT,
+        ) as mocks:
+            batch._analyze_in_worker("a.md")
+            batch._analyze_in_worker("b.md")
+            assert batch._worker_memory_limit is None
+        mocks["_release_models"].assert_called_once()
+
+    def test_release_frees_all_shared_models(self):
+        """Test the guard releases every shared model, not only language models."""
+        with patch("writescore.core.daemon.release_models") as release_models:
+            batch._release_models()
+        release_models.assert_called_once()
+
+
+class TestAnalyzeDocuments:
+    """Tests for analyzing batches of dataset documents."""
+
+    @pytest.fixture
+    def dimensions(self):
+        """Two mock dimensions; "b" fails on texts containing "bad"."""
+        a, b = MagicMock(), MagicMock()
+        a.analyze.side_effect = lambda text, lines, **kwargs: {"length": len(text)}
+
+        def analyze_b(text, lines, **kwargs):
+            if "bad" in text:
+                raise ValueError("bad text")
+            return {"lines": len(lines)}
+
+        b.analyze.side_effect = analyze_b
+        return {"a": a, "b": b}
+
+    def test_prefetch_gets_each_dimensions_batch(self, dimensions):
+        """Test each dimension prefetches the texts it will analyze, before analyzing."""
+        config = AnalysisConfig()
+        tasks = [("d1", "one", ["a", "b"]), ("d2", "two", ["b"])]
+        analyze_documents(dimensions, tasks, config)
+
+        dimensions["a"].prefetch.assert_called_once_with(["one"], config)
+        dimensions["b"].prefetch.assert_called_once_with(["one", "two"], config)
+        # Both documents analyzed with the config and one shared document context each
+        kwargs = dimensions["b"].analyze.call_args_list[0].kwargs
+        assert kwargs["config"] is config
+        assert kwargs["document"] is dimensions["a"].analyze.call_args.kwargs["document"]
+
+    def test_errors_isolated_to_document_and_dimension(self, dimensions):
+        """Test a failing dimension leaves other dimensions and documents intact."""
+        dimensions["a"].prefetch.side_effect = RuntimeError("no model")
+        outcomes = analyze_documents(
+            dimensions,
+            [("d1", "bad\ntext", ["a", "b", "c"]), ("d2", "good", ["a", "b"])],
+        )
+
+        assert [o.doc_id for o in outcomes] == ["d1", "d2"]
+        assert outcomes[0].metrics == {"a": {"length": 8}}
+        assert outcomes[0].errors == {"b": "bad text", "c": "dimension not loaded"}
+        assert outcomes[1].metrics == {"a": {"length": 4}, "b": {"lines": 1}}
+        assert outcomes[1].errors == {}
+
+
+class TestBatchFileResult:
+    """Tests for BatchFileResult."""
+
+    def test_ok(self):
+        """Test ok reflects absence of an error."""
+        assert BatchFileResult(path="a.md", result=object()).ok
+        assert not BatchFileResult(path="a.md", error="failed").ok
+
+
+@pytest.mark.slow
+class TestIterBatchResults:
+    """End-to-end process pool run (spawns real workers)."""
+
+    def test_pool_analyzes_files_and_isolates_errors(self, tmp_path):
+        """Test every file yields one result and a missing file fails alone."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"doc_{i}.md"
+            path.write_text(
+                f"# Document {i}\n\nThis is a short document. It has a few sentences.\n"
+            )
+            paths.append(str(path))
+        paths.append(str(tmp_path / "missing.md"))
+
+        config = AnalysisConfig(mode=AnalysisMode.FAST, dimension_profile="fast")
+        outcomes = {o.path: o for o in iter_batch_results(paths, config, jobs=2)}
+
+        assert set(outcomes) == set(paths)
+        assert not outcomes[paths[-1]].ok
+        assert all(outcomes[p].ok for p in paths[:-1])
+
+    def test_pool_analyzes_document_batches(self):
+        """Test every document task comes back once, across batches and workers."""
+        tasks = [
+            (f"doc_{i}", f"Sentence number {i}. Another sentence here.", ["formatting"])
+            for i in range(5)
+        ]
+        config = AnalysisConfig(mode=AnalysisMode.FAST)
+        outcomes = [
+            outcome
+            for batch_outcomes in iter_document_metrics(
+                tasks, ["formatting"], config, jobs=2, batch_size=2
+            )
+            for outcome in batch_outcomes
+        ]
+
+        assert sorted(o.doc_id for o in outcomes) == [f"doc_{i}" for i in range(5)]
+        assert all(set(o.metrics) == {"formatting"} and not o.errors for o in outcomes)
@@ -0,0 +1,393 @@
+"""
+Tests for the long-lived analysis daemon (writescore serve).
+"""
+
+import json
+import threading
+import time
+from dataclasses import asdict
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
+from writescore.core.analyzer import AIPatternAnalyzer
+from writescore.core.daemon import (
+    AnalysisDaemon,
+    DaemonBusyError,
+    DaemonClient,
+    DaemonError,
+    _UnixHTTPConnection,
+    config_from_dict,
+    config_to_dict,
+    daemon_info_path,
+    find_daemon,
+    release_models,
+    serve,
+)
+from writescore.core.results import AnalysisResults, EmptyFileError
+
+TEXT = """# Daemon Test
+
+The daemon keeps models loaded between requests. Each request sends the text
+and the analysis configuration, and gets back the same JSON document the CLI
+prints. Short sentences help. Longer ones, with a clause or two, help too.
+
+A second paragraph gives the paragraph-level metrics something to compare.
+"""
+
+CONFIG = AnalysisConfig(dimensions_to_load=["burstiness", "structure"])
+
+
+def local_json(text=TEXT, config=CONFIG, source_name="doc.md"):
+    """In-process result in --format json form."""
+    data = asdict(AIPatternAnalyzer(config=config).analyze_text(text, config, source_name))
+    data["analysis_mode"] = config.mode.value
+    return data
+
+
+class BlockingAnalyzer:
+    """Analyzer stand-in whose analyze_text waits until released."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def analyze_text(self, text, config=None, source_name=""):
+        self.started.set()
+        self.release.wait(10)
+        return AnalysisResults.from_dict(local_json())
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    """Serve a daemon on a Unix socket in tmp_path; yields (daemon, client)."""
+    daemon = AnalysisDaemon(idle_timeout=0)
+    listening = threading.Event()
+    thread = threading.Thread(
+        target=serve,
+        args=(daemon,),
+        kwargs={
+            "socket_path": str(tmp_path / "daemon.sock"),
+            "cache_dir": str(tmp_path),
+            "ready": lambda address: listening.set(),
+        },
+        daemon=True,
+    )
+    thread.start()
+    assert listening.wait(10)
+    client = find_daemon(str(tmp_path))
+    assert client is not None
+    yield daemon, client
+    client.shutdown()
+    thread.join(10)
+    assert not thread.is_alive()
+
+
+class TestConfigSerialization:
+    """Tests for config_to_dict / config_from_dict."""
+
+    def test_round_trip(self):
+        """Test a config survives JSON serialization unchanged."""
+        config = AnalysisConfig(
+            mode=AnalysisMode.FULL,
+            dimension_profile="full",
+            dimension_overrides={"perplexity": {"model_name": "distilgpt2"}},
+            use_result_cache=True,
+        )
+        data = json.loads(json.dumps(config_to_dict(config)))
+        assert config_from_dict(data) == config
+
+    def test_missing_fields_take_defaults(self):
+        """Test omitted fields fall back to AnalysisConfig defaults."""
+        assert config_from_dict({"mode": "fast"}) == AnalysisConfig(mode=AnalysisMode.FAST)
+
+    def test_unknown_field_rejected(self):
+        """Test unknown fields raise ValueError."""
+        with pytest.raises(ValueError, match="bogus"):
+            config_from_dict({"bogus": 1})
+
+    def test_path_fields_dropped(self):
+        """Test requests cannot choose where the daemon writes its cache."""
+        config = config_from_dict({"result_cache_dir": "/etc", "use_result_cache": True})
+        assert config.result_cache_dir is None
+        assert config.use_result_cache
+
+    @pytest.mark.parametrize(
+        "name", ["/opt/models/gpt2", "../models", "~/gpt2", "a/b/c", "C:\\models", "./gpt2"]
+    )
+    def test_local_model_paths_rejected(self, name):
+        """Test model names must be Hub ids, not local directories."""
+        with pytest.raises(ValueError, match="Hub id"):
+            config_from_dict({"language_model_name": name})
+        with pytest.raises(ValueError, match="Hub id"):
+            config_from_dict({"dimension_overrides": {"perplexity": {"model_name": name}}})
+
+    def test_hub_model_names_accepted(self):
+        """Test plain and organization-scoped Hub ids are accepted."""
+        assert config_from_dict({"language_model_name": "gpt2"}).language_model_name == "gpt2"
+        config = config_from_dict({"language_model_name": "openai-community/gpt2"})
+        assert config.language_model_name == "openai-community/gpt2"
+
+    def test_results_round_trip(self):
+        """Test AnalysisResults.from_dict rebuilds results from their JSON form."""
+        result = AIPatternAnalyzer(config=CONFIG).analyze_text(TEXT, CONFIG)
+        data = json.loads(json.dumps(asdict(result)))
+        assert AnalysisResults.from_dict(data) == result
+
+
+class TestAnalysisDaemon:
+    """Tests for request handling, queuing and idle model release."""
+
+    def test_analyze_matches_in_process(self):
+        """Test daemon results equal the in-process --format json document."""
+        data, attributes = AnalysisDaemon().analyze(TEXT, CONFIG, "doc.md")
+        assert data == local_json()
+        assert "incremental" in attributes
+
+    def test_analyzer_reused_per_config(self):
+        """Test one analyzer is built per distinct config."""
+        daemon = AnalysisDaemon()
+        with patch("writescore.core.analyzer.AIPatternAnalyzer") as analyzer_class:
+            analyzer_class.return_value.analyze_text.return_value = AnalysisResults.from_dict(
+                local_json()
+            )
+            daemon.analyze(TEXT, CONFIG)
+            daemon.analyze(TEXT, CONFIG)
+            daemon.analyze(TEXT, AnalysisConfig(mode=AnalysisMode.FAST))
+        assert analyzer_class.call_count == 2
+
+    def test_full_queue_refused(self):
+        """Test requests beyond max_concurrent + max_queue are refused."""
+        daemon = AnalysisDaemon(max_concurrent=1, max_queue=0)
+        analyzer = BlockingAnalyzer()
+        with patch.object(daemon, "_get_analyzer", return_value=analyzer):
+            worker = threading.Thread(target=daemon.analyze, args=(TEXT, CONFIG))
+            worker.start()
+            assert analyzer.started.wait(10)
+
+            with pytest.raises(DaemonBusyError):
+                daemon.analyze(TEXT, CONFIG)
+            assert daemon.status()["running"] == 1
+            assert daemon.status()["refused"] == 1
+
+            analyzer.release.set()
+            worker.join(10)
+        assert daemon.status()["served"] == 1
+
+    def test_queued_request_waits_for_slot(self):
+        """Test a request within the queue limit runs after the running one."""
+        daemon = AnalysisDaemon(max_concurrent=1, max_queue=1)
+        analyzer = BlockingAnalyzer()
+        with patch.object(daemon, "_get_analyzer", return_value=analyzer):
+            workers = [threading.Thread(target=daemon.analyze, args=(TEXT, CONFIG)) for _ in "ab"]
+            for worker in workers:
+                worker.start()
+            assert analyzer.started.wait(10)
+            deadline = time.monotonic() + 10
+            while daemon.status()["queued"] < 1 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            status = daemon.status()
+            assert (status["running"], status["queued"]) == (1, 1)
+
+            analyzer.release.set()
+            for worker in workers:
+                worker.join(10)
+        assert daemon.status()["served"] == 2
+
+    @patch("writescore.core.daemon.release_models")
+    def test_unload_waits_for_running_analysis(self, mock_release):
+        """Test models are not released while an analysis is running."""
+        daemon = AnalysisDaemon()
+        analyzer = BlockingAnalyzer()
+        with patch.object(daemon, "_get_analyzer", return_value=analyzer):
+            worker = threading.Thread(target=daemon.analyze, args=(TEXT, CONFIG))
+            worker.start()
+            assert analyzer.started.wait(10)
+            assert daemon.unload() is False
+            mock_release.assert_not_called()
+
+            analyzer.release.set()
+            worker.join(10)
+        assert daemon.unload() is True
+        mock_release.assert_called_once()
+        assert daemon.status()["models_loaded"] is False
+
+    @patch("writescore.core.daemon.release_models")
+    def test_unload_if_idle(self, mock_release):
+        """Test idle release happens only after idle_timeout with models loaded."""
+        daemon = AnalysisDaemon(idle_timeout=60)
+        assert daemon.unload_if_idle() is False  # Nothing loaded yet
+
+        daemon.analyze(TEXT, CONFIG)
+        assert daemon.unload_if_idle() is False  # Not idle long enough
+
+        daemon._last_activity -= 61
+        assert daemon.unload_if_idle() is True
+        mock_release.assert_called_once()
+
+    @patch("writescore.core.daemon.release_models")
+    def test_idle_timeout_zero_keeps_models(self, mock_release):
+        """Test idle_timeout=0 never releases models."""
+        daemon = AnalysisDaemon(idle_timeout=0)
+        daemon.analyze(TEXT, CONFIG)
+        daemon._last_activity -= 10**6
+        assert daemon.unload_if_idle() is False
+        mock_release.assert_not_called()
+
+    def test_invalid_limits(self):
+        """Test invalid concurrency and queue limits are rejected."""
+        with pytest.raises(ValueError):
+            AnalysisDaemon(max_concurrent=0)
+        with pytest.raises(ValueError):
+            AnalysisDaemon(max_queue=-1)
+
+
+class TestReleaseModels:
+    """Tests for release_models()."""
+
+    @patch("writescore.utils.spacy_loader.clear_spacy_models")
+    @patch("writescore.utils.embeddings.clear_embedding_services")
+    @patch("writescore.utils.language_model.clear_language_models")
+    def test_clears_shared_and_dimension_models(self, mock_lm, mock_embeddings, mock_spacy):
+        """Test shared services and every registered dimension release models."""
+        dimension = MagicMock()
+        with patch(
+            "writescore.core.dimension_registry.DimensionRegistry.get_all",
+            return_value=[dimension],
+        ):
+            release_models()
+        dimension.clear_model_cache.assert_called_once()
+        mock_lm.assert_called_once()
+        mock_embeddings.assert_called_once()
+        mock_spacy.assert_called_once()
+
+
+class TestHTTPTransport:
+    """Tests for the HTTP API over a Unix socket."""
+
+    def test_health(self, running_daemon):
+        """Test /health reports version and queue state."""
+        _, client = running_daemon
+        status = client.health()
+        assert status["status"] == "ok"
+        assert status["running"] == 0
+
+    def test_analyze_round_trip(self, running_daemon):
+        """Test client results equal in-process results, including extra attributes."""
+        _, client = running_daemon
+        result = client.analyze(TEXT, CONFIG, source_name="doc.md")
+        local = AIPatternAnalyzer(config=CONFIG).analyze_text(TEXT, CONFIG, "doc.md")
+        assert result == local
+        assert result.incremental == local.incremental
+
+    def test_analysis_error_propagates(self, running_daemon):
+        """Test analysis errors are raised client-side with their type."""
+        daemon, client = running_daemon
+        analyzer = MagicMock()
+        analyzer.analyze_text.side_effect = EmptyFileError("No analyzable content")
+        with (
+            patch.object(daemon, "_get_analyzer", return_value=analyzer),
+            pytest.raises(EmptyFileError, match="No analyzable content"),
+        ):
+            client.analyze(TEXT, CONFIG)
+
+    def test_busy_daemon_refuses(self, running_daemon):
+        """Test a full queue answers 503 (DaemonBusyError)."""
+        daemon, client = running_daemon
+        with (
+            patch.object(daemon, "analyze", side_effect=DaemonBusyError("full")),
+            pytest.raises(DaemonBusyError),
+        ):
+            client.analyze(TEXT, CONFIG)
+
+    @pytest.mark.parametrize(
+        "content_type", [None, "text/plain", "application/x-www-form-urlencoded"]
+    )
+    def test_post_requires_json_content_type(self, running_daemon, content_type):
+        """Test POSTs a web page could send without a preflight are refused."""
+        daemon, client = running_daemon
+        connection = _UnixHTTPConnection(client.socket_path, timeout=10)
+        headers = {"Content-Type": content_type} if content_type else {}
+        connection.request("POST", "/shutdown", headers=headers)
+        response = connection.getresponse()
+        response.read()
+        connection.close()
+        assert response.status == 415
+        assert client.health()["status"] == "ok"
+
+    @pytest.mark.parametrize("host", ["evil.example", "evil.example:8765", "192.168.1.10"])
+    def test_non_loopback_host_refused(self, running_daemon, host):
+        """Test requests naming another host (DNS rebinding) are refused."""
+        _, client = running_daemon
+        connection = _UnixHTTPConnection(client.socket_path, timeout=10)
+        connection.request("GET", "/health", headers={"Host": host})
+        response = connection.getresponse()
+        response.read()
+        connection.close()
+        assert response.status == 403
+
+    @pytest.mark.parametrize("host", ["localhost", "127.0.0.1:8765", "[::1]:8765"])
+    def test_loopback_host_accepted(self, running_daemon, host):
+        """Test loopback Host headers, with or without a port, are served."""
+        _, client = running_daemon
+        connection = _UnixHTTPConnection(client.socket_path, timeout=10)
+        connection.request("GET", "/health", headers={"Host": host})
+        response = connection.getresponse()
+        response.read()
+        connection.close()
+        assert response.status == 200
+
+    def test_unload_over_http(self, running_daemon):
+        """Test the client's bodiless POSTs pass the Content-Type check."""
+        _, client = running_daemon
+        assert client.unload() is True
+
+    def test_shutdown_removes_socket_and_info(self, tmp_path):
+        """Test stopping the daemon cleans up its socket and daemon.json."""
+        listening = threading.Event()
+        thread = threading.Thread(
+            target=serve,
+            args=(AnalysisDaemon(),),
+            kwargs={"cache_dir": str(tmp_path), "ready": lambda address: listening.set()},
+            daemon=True,
+        )
+        thread.start()
+        assert listening.wait(10)
+        assert daemon_info_path(str(tmp_path)).exists()
+
+        find_daemon(str(tmp_path)).shutdown()
+        thread.join(10)
+        assert not thread.is_alive()
+        assert not daemon_info_path(str(tmp_path)).exists()
+        assert not (tmp_path / "daemon.sock").exists()
+
+    def test_second_daemon_refused(self, running_daemon, tmp_path):
+        """Test starting a daemon on a socket that is in use fails."""
+        with pytest.raises(DaemonError, match="already listening"):
+            serve(AnalysisDaemon(), socket_path=str(tmp_path / "daemon.sock"))
+
+
+class TestFindDaemon:
+    """Tests for daemon discovery."""
+
+    def test_no_daemon(self, tmp_path):
+        """Test None when no daemon.json exists."""
+        assert find_daemon(str(tmp_path)) is None
+
+    def test_stale_info(self, tmp_path):
+        """Test None when daemon.json points at a dead socket."""
+        daemon_info_path(str(tmp_path)).write_text(
+            json.dumps({"pid": 1, "socket": str(tmp_path / "gone.sock")})
+        )
+        assert find_daemon(str(tmp_path)) is None
+
+    def test_other_version_ignored(self, running_daemon, tmp_path):
+        """Test a daemon of another writescore version is not used."""
+        with patch.object(DaemonClient, "health", return_value={"version": "0.0.0"}):
+            assert find_daemon(str(tmp_path)) is None
+
+    def test_client_requires_address(self):
+        """Test a client needs a socket path or port."""
+        with pytest.raises(ValueError):
+            DaemonClient()
@@ -17,6 +17,7 @@ from writescore.core.deployment import (
     ParameterVersionManager,
     format_version_list,
     generate_deployment_checklist,
+    get_active_parameter_version,
 )
 from writescore.core.parameter_loader import ParameterLoader
 from writescore.core.parameters import (
@@ -238,6 +239,18 @@ class TestParameterVersionManager:
 
         assert current == "1.0"
 
+    def test_get_current_version_reflects_new_deploy(self, temp_dirs, sample_params):
+        """Test the cached active version is refreshed when the file changes."""
+        params_dir, archive_dir, active_file = temp_dirs
+        manager = ParameterVersionManager(params_dir, archive_dir, active_file)
+
+        ParameterLoader.save(sample_params, active_file)
+        assert get_active_parameter_version(active_file) == "1.0"
+
+        sample_params.version = "1.10"
+        ParameterLoader.save(sample_params, active_file)
+        assert manager.get_current_version() == "1.10"
+
     def test_get_version_path(self, temp_dirs, sample_params):
         """Test finding version path."""
         params_dir, archive_dir, active_file = temp_dirs
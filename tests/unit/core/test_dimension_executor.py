@@ -0,0 +1,180 @@
+"""Unit tests for concurrent dimension execution.
+
+Tests cover:
+- Chaining dimensions that share resources
+- Torch intra-op thread budgeting
+- Concurrent execution (context propagation, chained dimensions run in order)
+- Analyzer integration (same results as sequential execution)
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
+from writescore.core.analyzer import AIPatternAnalyzer
+from writescore.core.dimension_executor import (
+    plan_chains,
+    run_concurrently,
+    torch_thread_budget,
+    torch_threads,
+)
+from writescore.dimensions.burstiness import BurstinessDimension
+from writescore.dimensions.formatting import FormattingDimension
+from writescore.dimensions.structure import StructureDimension
+from writescore.utils.deadline import Deadline, current_deadline, deadline_scope
+
+
+def fake(cost=1, resources=(), uses_torch=False):
+    """Dimension stand-in declaring only scheduling metadata."""
+    return SimpleNamespace(analysis_cost=cost, shared_resources=resources, uses_torch=uses_torch)
+
+
+DIMENSIONS = {
+    "regex": fake(),
+    "syntax": fake(3, ("spacy_doc",)),
+    "energy": fake(3, ("spacy_doc",)),
+    "perplexity": fake(10, ("language_model",), uses_torch=True),
+    "predictability": fake(10, ("language_model",), uses_torch=True),
+    "sentiment": fake(8, uses_torch=True),
+}
+ORDER = ["regex", "syntax", "energy", "sentiment", "perplexity", "predictability"]
+
+
+class TestPlanChains:
+    """Tests for plan_chains()."""
+
+    def test_groups_shared_resources(self):
+        """Test dimensions sharing a resource form one chain, longest first."""
+        assert plan_chains(DIMENSIONS, ORDER) == [
+            ["perplexity", "predictability"],
+            ["sentiment"],
+            ["syntax", "energy"],
+            ["regex"],
+        ]
+
+    def test_transitive_sharing(self):
+        """Test a dimension using two resources joins both chains in order."""
+        dimensions = {
+            "a": fake(resources=("x",)),
+            "b": fake(resources=("y",)),
+            "c": fake(resources=("x", "y")),
+        }
+        assert plan_chains(dimensions, ["b", "a", "c"]) == [["b", "a", "c"]]
+
+    def test_undeclared_metadata(self):
+        """Test dimensions without scheduling metadata are independent."""
+        dimensions = {"a": object(), "b": object()}
+        assert plan_chains(dimensions, ["a", "b"]) == [["a"], ["b"]]
+
+
+class TestTorchThreadBudget:
+    """Tests for torch_thread_budget() and torch_threads()."""
+
+    def test_divides_cores_between_model_chains(self):
+        """Test cores are shared by the model chains that can run at once."""
+        chains = plan_chains(DIMENSIONS, ORDER)
+        assert torch_thread_budget(chains, DIMENSIONS, workers=4, cpu_count=8) == 4
+        assert torch_thread_budget(chains, DIMENSIONS, workers=1, cpu_count=8) == 8
+        assert torch_thread_budget(chains, DIMENSIONS, workers=4, cpu_count=1) == 1
+
+    def test_no_model_chains(self):
+        """Test no budget without torch dimensions."""
+        dimensions = {"regex": fake()}
+        assert torch_thread_budget([["regex"]], dimensions, workers=4) is None
+
+    def test_threads_restored(self):
+        """Test the previous thread count is restored."""
+        before = torch.get_num_threads()
+        with torch_threads(1):
+            assert torch.get_num_threads() == 1
+        assert torch.get_num_threads() == before
+
+
+class TestRunConcurrently:
+    """Tests for run_concurrently()."""
+
+    def test_independent_dimensions_overlap(self):
+        """Test independent dimensions run at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+        dimensions = {"a": fake(), "b": fake()}
+
+        def run_dimension(name):
+            barrier.wait()
+            return {"available": True, "name": name}
+
+        results = run_concurrently(dimensions, ["a", "b"], run_dimension, workers=2)
+        assert results == {
+            "a": {"available": True, "name": "a"},
+            "b": {"available": True, "name": "b"},
+        }
+
+    def test_chained_dimensions_run_in_order(self):
+        """Test dimensions sharing a resource run one after another."""
+        calls = []
+
+        def run_dimension(name):
+            calls.append((name, threading.current_thread().name))
+            return {}
+
+        run_concurrently(DIMENSIONS, ORDER, run_dimension, workers=4)
+        chain = [call for call in calls if call[0] in ("perplexity", "predictability")]
+        assert [name for name, _ in chain] == ["perplexity", "predictability"]
+        assert chain[0][1] == chain[1][1]
+        assert chain[0][1].startswith("writescore-dimension")
+
+    def test_deadline_propagates_to_workers(self):
+        """Test workers see the caller's active deadline."""
+        deadline = Deadline(60)
+        seen = []
+
+        def run_dimension(name):
+            seen.append(current_deadline())
+            return {}
+
+        with deadline_scope(deadline):
+            run_concurrently(DIMENSIONS, ORDER, run_dimension, workers=3)
+        assert seen == [deadline] * len(ORDER)
+
+    def test_torch_threads_budgeted_in_workers(self):
+        """Test model chains run with the divided thread count."""
+        seen = {}
+
+        def run_dimension(name):
+            seen[name] = torch.get_num_threads()
+            return {}
+
+        before = torch.get_num_threads()
+        run_concurrently(DIMENSIONS, ORDER, run_dimension, workers=2)
+        expected = torch_thread_budget(plan_chains(DIMENSIONS, ORDER), DIMENSIONS, 2)
+        assert seen["perplexity"] == seen["sentiment"] == expected
+        assert torch.get_num_threads() == before
+
+
+class TestAnalyzerConcurrency:
+    """Tests for dimension_workers in AIPatternAnalyzer."""
+
+    @pytest.fixture
+    def analyzer(self):
+        analyzer = AIPatternAnalyzer()
+        analyzer.dimensions = {
+            "burstiness": BurstinessDimension(),
+            "formatting": FormattingDimension(),
+            "structure": StructureDimension(),
+        }
+        return analyzer
+
+    def test_same_results_as_sequential(self, analyzer, sample_human_text):
+        """Test concurrent execution does not change results or their order."""
+        sequential = analyzer.analyze_text(
+            sample_human_text, config=AnalysisConfig(mode=AnalysisMode.FULL)
+        )
+        concurrent = analyzer.analyze_text(
+            sample_human_text,
+            config=AnalysisConfig(mode=AnalysisMode.FULL, dimension_workers=3),
+        )
+
+        assert list(concurrent.dimension_results) == list(sequential.dimension_results)
+        assert concurrent.dimension_results == sequential.dimension_results
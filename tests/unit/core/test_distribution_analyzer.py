@@ -10,6 +10,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
 from writescore.core.dataset import Document, ValidationDataset
 from writescore.core.dimension_registry import DimensionRegistry
 from writescore.core.distribution_analyzer import (
@@ -372,7 +373,7 @@ class TestDistributionAnalyzer:
         mock_dimension.weight = 5.0
         # Return different values for human vs AI
         mock_dimension.analyze = Mock(
-            side_effect=lambda text, lines: {"metric": 10.0 if "human" in text else 5.0}
+            side_effect=lambda text, lines, **kwargs: {"metric": 10.0 if "human" in text else 5.0}
         )
 
         DimensionRegistry.register(mock_dimension, allow_overwrite=True)
@@ -401,3 +402,89 @@ class TestDistributionAnalyzer:
         assert human_stats.count == 1
         assert ai_stats.count == 1
         assert combined_stats.count == 2
+
+
+class TestResumableAnalysis:
+    """Test batched, checkpointed dataset analysis."""
+
+    @pytest.fixture
+    def dataset(self):
+        """Dataset with two human and one AI document."""
+        dataset = ValidationDataset(version="v1.0", created="2025-11-24T10:00:00Z")
+        for doc_id, label, text in [
+            ("h1", "human", "human text one"),
+            ("h2", "human", "human text number two"),
+            ("a1", "ai", "ai text"),
+        ]:
+            ai_model = "gpt-4" if label == "ai" else None
+            dataset.add_document(
+                Document(id=doc_id, text=text, label=label, ai_model=ai_model, word_count=3)
+            )
+        return dataset
+
+    @pytest.fixture
+    def dimension(self):
+        """Registered mock dimension measuring text length."""
+        mock_dimension = Mock()
+        mock_dimension.dimension_name = "test"
+        mock_dimension.tier = DimensionTier.CORE
+        mock_dimension.weight = 5.0
+        mock_dimension.analyze = Mock(
+            side_effect=lambda text, lines, **kwargs: {"length": float(len(text))}
+        )
+        DimensionRegistry.register(mock_dimension, allow_overwrite=True)
+        return mock_dimension
+
+    def test_dimensions_get_config_and_batches(self, dataset, dimension):
+        """Test documents are prefetched in batches and analyzed with the config."""
+        config = AnalysisConfig(mode=AnalysisMode.FULL)
+        analyzer = DistributionAnalyzer(registry=DimensionRegistry, config=config, batch_size=2)
+        analyzer.analyze_dataset(dataset, dimension_names=["test"])
+
+        assert [c.args[0] for c in dimension.prefetch.call_args_list] == [
+            ["human text one", "human text number two"],
+            ["ai text"],
+        ]
+        assert all(c.kwargs["config"] is config for c in dimension.analyze.call_args_list)
+
+    def test_resume_reuses_checkpointed_analyses(self, dataset, dimension, tmp_path):
+        """Test a second run analyzes only documents missing from the checkpoint."""
+        checkpoint = tmp_path / "checkpoint.sqlite3"
+        analyzer = DistributionAnalyzer(registry=DimensionRegistry)
+
+        # First run is interrupted after the first batch
+        dimension.analyze.side_effect = [{"length": 14.0}, KeyboardInterrupt()]
+        analyzer.batch_size = 1
+        with pytest.raises(KeyboardInterrupt):
+            analyzer.analyze_dataset(dataset, ["test"], checkpoint_path=checkpoint)
+
+        dimension.analyze.reset_mock()
+        dimension.analyze.side_effect = lambda text, lines, **kwargs: {"length": float(len(text))}
+        analysis = analyzer.analyze_dataset(dataset, ["test"], checkpoint_path=checkpoint)
+
+        assert [c.args[0] for c in dimension.analyze.call_args_list] == [
+            "human text number two",
+            "ai text",
+        ]
+        assert analysis.get_dimension_stats("test", "human").values == [14.0, 21.0]
+        assert analysis.get_dimension_stats("test", "combined").count == 3
+
+        # Complete checkpoint: nothing is analyzed again
+        dimension.analyze.reset_mock()
+        again = analyzer.analyze_dataset(dataset, ["test"], checkpoint_path=checkpoint)
+        dimension.analyze.assert_not_called()
+        assert again.get_dimension_stats("test", "ai").values == [7.0]
+
+    def test_changed_config_invalidates_checkpoint(self, dataset, dimension, tmp_path):
+        """Test analyses recorded under another config are redone."""
+        checkpoint = tmp_path / "checkpoint.sqlite3"
+        DistributionAnalyzer(registry=DimensionRegistry).analyze_dataset(
+            dataset, ["test"], checkpoint_path=checkpoint
+        )
+        dimension.analyze.reset_mock()
+
+        analyzer = DistributionAnalyzer(
+            registry=DimensionRegistry, config=AnalysisConfig(mode=AnalysisMode.FULL)
+        )
+        analyzer.analyze_dataset(dataset, ["test"], checkpoint_path=checkpoint)
+        assert dimension.analyze.call_count == 3
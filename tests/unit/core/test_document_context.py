@@ -0,0 +1,179 @@
+"""Unit tests for DocumentContext (shared per-document spaCy parses).
+
+Uses a blank spaCy pipeline wrapped in a call counter, so no model
+download is needed.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import spacy
+
+from writescore.core.analyzer import AIPatternAnalyzer
+from writescore.core.document_context import (
+    DocumentContext,
+    normalize_text,
+    parse_document,
+    run_pipeline,
+)
+from writescore.utils.deadline import Deadline, DeadlineExceeded, deadline_scope
+
+
+class CountingNLP:
+    """Blank English pipeline that records every parse."""
+
+    def __init__(self):
+        self.nlp = spacy.blank("en")
+        self.calls = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return self.nlp(text)
+
+
+@pytest.fixture
+def nlp():
+    """Counting blank pipeline."""
+    return CountingNLP()
+
+
+@pytest.fixture
+def shared_model(nlp):
+    """Install the counting pipeline as the shared spaCy model."""
+    with patch("writescore.core.document_context.get_spacy_model", return_value=nlp):
+        yield nlp
+
+
+TEXT = "The cat sat on the mat.\n\n```python\nprint('code')\n```\n\nIt was happy."
+
+
+class TestNormalizeText:
+    """Tests for normalize_text()."""
+
+    def test_removes_code_blocks(self):
+        """Test fenced code blocks are removed."""
+        assert "print" not in normalize_text(TEXT)
+
+    def test_removes_html_comments(self):
+        """Test HTML comment metadata is removed."""
+        assert normalize_text("Hello <!-- meta --> world") == "Hello  world"
+
+    def test_plain_text_unchanged(self):
+        """Test text without markup is unchanged."""
+        assert normalize_text("Plain sentence.") == "Plain sentence."
+
+
+class TestDocumentContext:
+    """Tests for DocumentContext caching."""
+
+    def test_lazy(self, shared_model):
+        """Test nothing is parsed until requested."""
+        context = DocumentContext(TEXT)
+        assert context.parsed_count == 0
+        assert shared_model.calls == []
+
+    def test_parses_once_for_repeated_requests(self, shared_model):
+        """Test repeated requests return the same Doc from one parse."""
+        context = DocumentContext(TEXT)
+        first = context.get_doc()
+        second = context.get_doc(TEXT)
+        assert first is second
+        assert len(shared_model.calls) == 1
+
+    def test_prenormalized_text_shares_parse(self, shared_model):
+        """Test raw and already code-stripped text map to one parse."""
+        context = DocumentContext(TEXT)
+        raw = context.get_doc(TEXT)
+        stripped = context.get_doc(normalize_text(TEXT))
+        assert raw is stripped
+        assert context.parsed_count == 1
+
+    def test_distinct_texts_parsed_separately(self, shared_model):
+        """Test each sample gets its own Doc."""
+        context = DocumentContext(TEXT)
+        context.get_doc("First sample.")
+        context.get_doc("Second sample.")
+        context.get_doc("First sample.")
+        assert context.parsed_count == 2
+        assert len(shared_model.calls) == 2
+
+    def test_explicit_nlp_used(self, shared_model, nlp):
+        """Test a caller-supplied pipeline is used for parsing."""
+        other = CountingNLP()
+        DocumentContext(TEXT).get_doc(nlp=other)
+        assert len(other.calls) == 1
+        assert shared_model.calls == []
+
+    def test_segments_shared_per_text(self, shared_model):
+        """Test each exact text gets one segmentation, without parsing."""
+        context = DocumentContext(TEXT)
+        segments = context.get_segments()
+        assert context.get_segments(TEXT) is segments
+        assert segments.text == TEXT
+        assert context.get_segments("Sample.") is not segments
+        assert shared_model.calls == []
+
+
+class TestParseDocument:
+    """Tests for parse_document()."""
+
+    def test_uses_context_when_given(self, shared_model):
+        """Test parses go through the context cache."""
+        context = DocumentContext(TEXT)
+        assert parse_document(TEXT, context) is parse_document(TEXT, context)
+        assert len(shared_model.calls) == 1
+
+    def test_without_context_parses_normalized_text(self, nlp):
+        """Test direct parse without a context normalizes first."""
+        doc = parse_document(TEXT, None, nlp)
+        assert "print" not in doc.text
+        assert nlp.calls == [normalize_text(TEXT)]
+
+
+class TestRunPipeline:
+    """Tests for run_pipeline()."""
+
+    @pytest.fixture
+    def sentencizer(self):
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        return nlp
+
+    def test_same_as_calling_pipeline(self, sentencizer):
+        """Test component-wise parsing equals nlp(text)."""
+        text = "One sentence. Another one here."
+        expected = [sent.text for sent in sentencizer(text).sents]
+        assert [sent.text for sent in run_pipeline(sentencizer, text).sents] == expected
+
+    def test_expired_deadline_stops_parse(self, sentencizer):
+        """Test an expired analysis deadline raises instead of parsing."""
+        deadline = Deadline(1)
+        deadline._expires_at -= 2
+        with deadline_scope(deadline), pytest.raises(DeadlineExceeded):
+            run_pipeline(sentencizer, "Text.")
+
+    def test_plain_callable(self, nlp):
+        """Test callables without a spaCy pipeline are called directly."""
+        run_pipeline(nlp, "Text.")
+        assert nlp.calls == ["Text."]
+
+
+class TestAnalyzerSharesContext:
+    """Tests that the analyzer passes one context to every dimension."""
+
+    def test_same_context_for_all_dimensions(self, tmp_path):
+        """Test every dimension receives the same DocumentContext."""
+        path = tmp_path / "doc.md"
+        path.write_text("# Title\n\nSome text here. Another sentence follows.\n")
+
+        analyzer = AIPatternAnalyzer()
+        dims = {"a": MagicMock(), "b": MagicMock()}
+        for dim in dims.values():
+            dim.analyze.return_value = {}
+        analyzer.dimensions = dims
+
+        analyzer.analyze_file(str(path))
+
+        contexts = [dim.analyze.call_args.kwargs["document"] for dim in dims.values()]
+        assert isinstance(contexts[0], DocumentContext)
+        assert contexts[0] is contexts[1]
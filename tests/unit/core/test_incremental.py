@@ -0,0 +1,265 @@
+"""Unit tests for incremental per-section re-analysis.
+
+Tests cover:
+- Heading-delimited section splitting
+- Merged section summaries equal whole-document analysis (burstiness,
+  semantic coherence with a deterministic fake embedding model)
+- Section summary reuse through the result cache
+- Analyzer integration
+"""
+
+import hashlib
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
+from writescore.core.analyzer import AIPatternAnalyzer
+from writescore.core.incremental import analyze_sections, split_sections
+from writescore.core.result_cache import ResultCache
+from writescore.dimensions.burstiness import BurstinessDimension
+from writescore.dimensions.semantic_coherence import SemanticCoherenceDimension
+from writescore.utils.embeddings import EmbeddingService
+
+FULL = AnalysisConfig(mode=AnalysisMode.FULL)
+
+DOCUMENT = """Intro paragraph before any heading. It has two sentences.
+
+# Chapter One
+
+The first section starts here. It is short.
+Another line in the same paragraph continues the thought for a while longer.
+
+A second paragraph follows with a handful of words. Then a much longer sentence
+that keeps going and going to make sure the lengths vary quite a bit overall.
+
+## Details
+Heading directly followed by text. Still section two's subsection.
+
+```python
+# not a heading
+
+# also not a heading
+print("code")
+```
+
+## Summary
+
+- A list item. With a sentence.
+- Another item here.
+
+Closing paragraph with enough words to pass the ten word minimum for the CV check.
+"""
+
+
+class FakeEncoder:
+    """Deterministic sentence encoder (embedding derived from a hash of the text)."""
+
+    def encode(self, texts, **kwargs):
+        vectors = []
+        for text in texts:
+            seed = int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+            vectors.append(np.random.default_rng(seed).random(8))
+        return np.array(vectors)
+
+
+@pytest.fixture
+def fake_embeddings():
+    """Make SemanticCoherenceDimension use the fake encoder."""
+    service = EmbeddingService()
+    service._model = FakeEncoder()
+    patch_service = patch(
+        "writescore.dimensions.semantic_coherence.get_embedding_service", return_value=service
+    )
+    patch_dimension = patch.multiple(
+        SemanticCoherenceDimension,
+        check_availability=lambda *args: True,
+        load_model=lambda *args: service.model,
+    )
+    with patch_service, patch_dimension:
+        yield
+
+
+class TestSplitSections:
+    """Tests for split_sections()."""
+
+    def test_roundtrip(self):
+        """Test sections concatenate back to the original text."""
+        assert "".join(split_sections(DOCUMENT)) == DOCUMENT
+
+    def test_splits_at_headings_after_blank_lines(self):
+        """Test sections start at headings preceded by an empty line."""
+        starts = [section.splitlines()[0] for section in split_sections(DOCUMENT)]
+        assert starts == [
+            "Intro paragraph before any heading. It has two sentences.",
+            "# Chapter One",
+            "## Details",
+            "## Summary",
+        ]
+
+    def test_ignores_headings_in_code_fences(self):
+        """Test '#' lines inside fenced code never start a section."""
+        for section in split_sections(DOCUMENT):
+            assert not section.startswith("# not a heading")
+            assert not section.startswith("# also not")
+
+    def test_heading_without_blank_line_not_split(self):
+        """Test a heading directly after text stays in the same section."""
+        assert split_sections("Text line.\n# Heading\nMore.\n") == [
+            "Text line.\n# Heading\nMore.\n"
+        ]
+
+    def test_empty_text(self):
+        """Test empty text has no sections."""
+        assert split_sections("") == []
+
+
+class TestBurstinessIncremental:
+    """Tests for BurstinessDimension section summaries."""
+
+    @pytest.fixture
+    def dimension(self):
+        return BurstinessDimension()
+
+    @pytest.mark.parametrize("fixture_name", ["sample_ai_text", "sample_human_text"])
+    def test_merge_equals_analyze(self, dimension, request, fixture_name):
+        """Test merged summaries reproduce whole-document analysis exactly."""
+        text = request.getfixturevalue(fixture_name)
+        merged, _ = analyze_sections(dimension, text, split_sections(text), FULL)
+        assert merged == dimension.analyze(text, config=FULL)
+
+    def test_merge_equals_analyze_with_code_and_lists(self, dimension):
+        """Test fences, lists and unsplit headings merge exactly."""
+        merged, _ = analyze_sections(dimension, DOCUMENT, split_sections(DOCUMENT), FULL)
+        assert merged == dimension.analyze(DOCUMENT, config=FULL)
+
+    def test_supported_only_for_full_text(self, dimension):
+        """Test truncated or sampled analysis is not incremental."""
+        long_text = DOCUMENT * 200
+        assert dimension.supports_incremental(long_text, FULL)
+        assert not dimension.supports_incremental(long_text, AnalysisConfig(mode=AnalysisMode.FAST))
+        assert not dimension.supports_incremental(
+            long_text, AnalysisConfig(mode=AnalysisMode.SAMPLING)
+        )
+
+
+class TestSemanticCoherenceIncremental:
+    """Tests for SemanticCoherenceDimension section summaries."""
+
+    @pytest.fixture
+    def dimension(self, fake_embeddings):
+        return SemanticCoherenceDimension()
+
+    def test_merge_equals_analyze(self, dimension, sample_mixed_text):
+        """Test per-section embeddings reproduce whole-document metrics."""
+        text = sample_mixed_text
+        merged, _ = analyze_sections(dimension, text, split_sections(text), FULL)
+        expected = dimension.analyze(text, config=FULL)
+
+        assert merged["paragraph_count"] == expected["paragraph_count"]
+        assert merged["topic_shifts"] == expected["topic_shifts"]
+        for name, value in expected["metrics"].items():
+            assert merged["metrics"][name] == pytest.approx(value)
+        assert merged["score"] == pytest.approx(expected["score"])
+
+    def test_merge_matches_sentence_sampling(self, dimension):
+        """Test long documents sample the same sentences as analyze()."""
+        dimension.MAX_SENTENCES_BEFORE_SAMPLING = 10
+        dimension.SAMPLE_SIZE = 4
+        merged, _ = analyze_sections(dimension, DOCUMENT, split_sections(DOCUMENT), FULL)
+        expected = dimension.analyze(DOCUMENT, config=FULL)
+
+        assert merged["sampled"] and expected["sampled"]
+        assert merged["sentence_count"] == expected["sentence_count"]
+        # Sampled embeddings no longer line up with paragraphs, so some metrics
+        # are NaN in analyze(); the merge must reproduce them all the same
+        for name, value in expected["metrics"].items():
+            assert merged["metrics"][name] == pytest.approx(value, nan_ok=True)
+
+    def test_merge_without_sentence_embeddings(self, dimension):
+        """Test sections without sentences merge to an unscored result, not an error."""
+        summaries = [
+            {"paragraphs": [p], "sentences_per_paragraph": [0], "embeddings": np.zeros((0, 0))}
+            for p in ("First paragraph", "Second paragraph")
+        ]
+        merged = dimension.merge_section_summaries(summaries, "", FULL)
+
+        assert merged["available"] is True
+        assert merged["error"] == "No valid paragraph embeddings generated"
+        assert merged["paragraph_count"] == 2
+        assert merged["score"] == dimension.calculate_score(merged)
+
+    def test_not_supported_without_model(self):
+        """Test the lexical fallback is analyzed on the whole document."""
+        with patch.object(SemanticCoherenceDimension, "check_availability", return_value=False):
+            assert not SemanticCoherenceDimension().supports_incremental(DOCUMENT, FULL)
+
+
+class TestSectionReuse:
+    """Tests for reusing cached section summaries."""
+
+    def test_unchanged_sections_reused(self, tmp_path):
+        """Test only the edited section is summarized again."""
+        dimension = BurstinessDimension()
+        cache = ResultCache(tmp_path)
+        sections = split_sections(DOCUMENT)
+
+        _, reused = analyze_sections(dimension, DOCUMENT, sections, FULL, cache)
+        assert reused == 0
+
+        edited = DOCUMENT.replace("It is short.", "It is short and now edited.")
+        with patch.object(
+            dimension, "summarize_section", wraps=dimension.summarize_section
+        ) as summarize:
+            result, reused = analyze_sections(
+                dimension, edited, split_sections(edited), FULL, cache
+            )
+
+        assert reused == len(sections) - 1
+        assert summarize.call_count == 1
+        assert result == dimension.analyze(edited, config=FULL)
+
+    def test_error_summaries_not_cached(self, tmp_path, fake_embeddings):
+        """Test failed section summaries are recomputed next time."""
+        dimension = SemanticCoherenceDimension()
+        cache = ResultCache(tmp_path)
+        with patch.object(dimension, "_generate_embeddings", return_value=None):
+            analyze_sections(dimension, DOCUMENT, split_sections(DOCUMENT), FULL, cache)
+        assert cache.stats()["entries"] == 0
+
+
+class TestAnalyzerIncremental:
+    """Tests for incremental mode in AIPatternAnalyzer."""
+
+    def test_reports_reused_sections(self, tmp_path):
+        """Test second run of an edited document reuses unchanged sections."""
+        analyzer = AIPatternAnalyzer()
+        analyzer.dimensions = {"burstiness": BurstinessDimension()}
+        config = AnalysisConfig(
+            mode=AnalysisMode.FULL,
+            use_result_cache=True,
+            result_cache_dir=str(tmp_path),
+            incremental_analysis=True,
+        )
+
+        first = analyzer.analyze_text(DOCUMENT, config=config)
+        edited = analyzer.analyze_text(DOCUMENT + "\nOne more closing line.\n", config=config)
+
+        sections = len(split_sections(DOCUMENT))
+        assert first.incremental == {"sections": sections, "reused": {"burstiness": 0}}
+        assert edited.incremental["reused"]["burstiness"] == sections - 1
+
+    def test_same_scores_as_whole_document(self):
+        """Test incremental mode does not change results."""
+        analyzer = AIPatternAnalyzer()
+        analyzer.dimensions = {"burstiness": BurstinessDimension()}
+
+        whole = analyzer.analyze_text(DOCUMENT, config=FULL)
+        incremental = analyzer.analyze_text(
+            DOCUMENT, config=AnalysisConfig(mode=AnalysisMode.FULL, incremental_analysis=True)
+        )
+
+        assert incremental.sentence_lengths == whole.sentence_lengths
+        assert incremental.burstiness_score == whole.burstiness_score
+        assert whole.incremental is None
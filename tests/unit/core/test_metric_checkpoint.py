@@ -0,0 +1,41 @@
+"""Unit tests for the dataset analysis checkpoint."""
+
+from writescore.core.metric_checkpoint import MetricCheckpoint
+
+
+class TestMetricCheckpoint:
+    """Tests for recording and resuming analyses."""
+
+    def test_records_persist_across_runs(self, tmp_path):
+        """Test analyses recorded by one run are found by the next."""
+        path = tmp_path / "run" / "checkpoint.sqlite3"
+        with MetricCheckpoint(path) as checkpoint:
+            recorded = checkpoint.record(
+                [
+                    ("d1", "lexical", "k1", {"type_token_ratio": 0.5, "tags": ["x"]}),
+                    ("d1", "voice", "k2", {"available": False, "error": "no model"}),
+                ]
+            )
+        assert recorded == 1
+
+        with MetricCheckpoint(path) as checkpoint:
+            keys = {("d1", "lexical"): "k1", ("d1", "voice"): "k2"}
+            assert list(checkpoint.completed(keys)) == [
+                ("d1", "lexical", {"type_token_ratio": 0.5, "tags": ["x"]})
+            ]
+            assert len(checkpoint) == 1
+
+    def test_stale_analyses_are_not_completed(self, tmp_path):
+        """Test rows whose key changed (text or config) or is not requested are skipped."""
+        with MetricCheckpoint(tmp_path / "checkpoint.sqlite3") as checkpoint:
+            checkpoint.record(
+                [("d1", "lexical", "old", {"x": 1}), ("d2", "lexical", "k", {"x": 2})]
+            )
+            assert list(checkpoint.completed({("d1", "lexical"): "new"})) == []
+
+            # Re-analysis replaces the stale row
+            checkpoint.record([("d1", "lexical", "new", {"x": 3})])
+            assert list(checkpoint.completed({("d1", "lexical"): "new"})) == [
+                ("d1", "lexical", {"x": 3})
+            ]
+            assert len(checkpoint) == 2
@@ -0,0 +1,87 @@
+"""Unit tests for the columnar raw-metric store."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from writescore.core.metric_store import MetricStore, MetricTable, flatten_metrics
+
+METRICS = {
+    "available": True,
+    "samples_analyzed": 3,
+    "lexical_diversity": {"unique": 120, "diversity": 0.61, "mtld_score": 84.5},
+    "analysis_mode": "adaptive",
+    "examples": ["a", "b"],
+    "missing": None,
+}
+
+
+class TestFlattening:
+    """Tests for splitting metrics into columns."""
+
+    def test_flatten_metrics(self):
+        """Test nested numeric leaves become dotted columns with their kinds."""
+        numeric, kinds, other = flatten_metrics(METRICS)
+        assert numeric["lexical_diversity.mtld_score"] == 84.5
+        assert kinds == {
+            "available": "bool",
+            "samples_analyzed": "int",
+            "lexical_diversity.unique": "int",
+            "lexical_diversity.diversity": "float",
+            "lexical_diversity.mtld_score": "float",
+        }
+        assert other == {"analysis_mode": "adaptive", "examples": ["a", "b"], "missing": None}
+
+    def test_numpy_scalars_are_numeric(self):
+        """Test numpy scalars are stored as columns."""
+        metrics = {"a": np.float32(1.5), "b": np.int64(2), "c": np.bool_(1)}
+        _, kinds, other = flatten_metrics(metrics)
+        assert kinds == {"a": "float", "b": "int", "c": "bool"}
+        assert not other
+
+
+class TestMetricTable:
+    """Tests for per-dimension tables."""
+
+    def test_rows_round_trip(self, tmp_path):
+        """Test saved tables rebuild the original metrics dicts, types included."""
+        rows = {"b.md": METRICS, "a.md": {"lexical_diversity": {"diversity": 0.4}}}
+        path = tmp_path / "lexical.npz"
+        MetricTable.from_rows("lexical", rows).save(path)
+        table = MetricTable.load(path)
+
+        assert table.doc_ids.tolist() == ["a.md", "b.md"]
+        assert table.row(1) == METRICS
+        assert table.row(0) == {"lexical_diversity": {"diversity": 0.4}}
+        assert isinstance(table.row(1)["lexical_diversity"]["unique"], int)
+        assert np.isnan(table.column("lexical_diversity.mtld_score")[0])
+
+    def test_rejects_foreign_files(self, tmp_path):
+        """Test files of another format version are not read as tables."""
+        path = tmp_path / "x.npz"
+        np.savez(path, meta=np.array('{"format_version": 99}'))
+        with pytest.raises(ValueError):
+            MetricTable.load(path)
+
+
+class TestMetricStore:
+    """Tests for the store directory."""
+
+    def test_save_merges_and_replaces(self, tmp_path):
+        """Test later saves add documents and replace re-analyzed ones."""
+        store = MetricStore(tmp_path / "store")
+        store.add("a.md", {"lexical": {"score": 40.0}, "burstiness": {"score": 60.0}})
+        store.save()
+
+        store.add("a.md", {"lexical": {"score": 45.0}})
+        store.add_results(SimpleNamespace(file_path="b.md", dimension_results={"lexical": {}}))
+        store.save()
+
+        assert store.dimensions() == ["burstiness", "lexical"]
+        assert store.doc_ids().tolist() == ["a.md", "b.md"]
+        lexical = store.load("lexical")
+        assert lexical.column("score")[0] == 45.0
+        assert lexical.row(1) == {}
+        assert store.load("burstiness").doc_ids.tolist() == ["a.md"]
+        assert store.load("voice") is None
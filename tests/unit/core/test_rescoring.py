@@ -0,0 +1,219 @@
+"""Unit tests for re-scoring stored metrics."""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from writescore.core.analysis_config import AnalysisConfig
+from writescore.core.analyzer import AIPatternAnalyzer
+from writescore.core.metric_store import ENRICHMENT_KEYS, MetricStore
+from writescore.core.parameters import (
+    DimensionParameters,
+    GaussianParameters,
+    MonotonicParameters,
+    ParameterValue,
+    PercentileParameters,
+    PercentileSource,
+    ScoringType,
+    ThresholdParameters,
+)
+from writescore.core.rescoring import load_parameters, rescore, score_values
+from writescore.dimensions.base_strategy import DimensionStrategy
+from writescore.dimensions.burstiness import BurstinessDimension
+from writescore.dimensions.lexical import LexicalDimension
+from writescore.scoring.dual_score_calculator import _build_dimension_scores
+
+
+def value(number):
+    return ParameterValue(number, PercentileSource.LITERATURE)
+
+
+def dimension_params(name, scoring_type, parameters):
+    return DimensionParameters(
+        dimension_name=name, scoring_type=scoring_type, parameters=parameters
+    )
+
+
+DOCUMENTS = {
+    "a.md": {
+        "lexical": {"lexical_diversity": {"unique": 200, "diversity": 0.55, "mtld_score": 72.0}},
+        "burstiness": {"available": True, "sentence_burstiness": {"stdev": 7.5, "mean": 18.0}},
+    },
+    "b.md": {
+        "lexical": {"lexical_diversity": {"unique": 80, "diversity": 0.38, "mtld_score": 41.0}},
+        "burstiness": {"available": False},
+    },
+    "c.md": {"lexical": {"lexical_diversity": {"unique": 0, "diversity": 0.0}}},
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A store with lexical and burstiness metrics of three documents."""
+    LexicalDimension()
+    BurstinessDimension()
+    store = MetricStore(tmp_path)
+    for doc_id, dimension_results in DOCUMENTS.items():
+        store.add(doc_id, dimension_results)
+    store.save()
+    return store
+
+
+class TestScoreValues:
+    """Tests for vectorized parameter scoring."""
+
+    VALUES = np.array([-5.0, 0.0, 55.0, 60.0, 75.0, 80.0, 100.0, 140.0, np.nan])
+
+    @pytest.mark.parametrize("increasing", [True, False])
+    def test_monotonic_matches_scalar(self, increasing):
+        """Test column scoring equals DimensionStrategy._monotonic_score()."""
+        params = dimension_params(
+            "lexical",
+            ScoringType.MONOTONIC,
+            MonotonicParameters(
+                value(60.0), value(100.0), "increasing" if increasing else "decreasing"
+            ),
+        )
+        scores = score_values(self.VALUES, params)
+        for x, score in zip(self.VALUES[:-1], scores[:-1]):
+            expected = DimensionStrategy._monotonic_score(None, x, 60.0, 100.0, increasing)
+            assert score == pytest.approx(expected)
+        assert np.isnan(scores[-1])
+
+    def test_gaussian_matches_scalar(self):
+        """Test column scoring equals DimensionStrategy._gaussian_score()."""
+        params = dimension_params(
+            "burstiness", ScoringType.GAUSSIAN, GaussianParameters(value(70.0), value(15.0))
+        )
+        scores = score_values(self.VALUES[:-1], params)
+        expected = [
+            DimensionStrategy._gaussian_score(None, x, 70.0, 15.0) for x in self.VALUES[:-1]
+        ]
+        assert scores == pytest.approx(expected)
+
+    def test_threshold_categories(self):
+        """Test each value gets the score of its category."""
+        params = dimension_params(
+            "formatting",
+            ScoringType.THRESHOLD,
+            ThresholdParameters([value(1.0), value(3.0)], ["good", "fair", "poor"], [90, 50, 10]),
+        )
+        scores = score_values(np.array([0.5, 1.0, 2.0, 3.0, 9.0]), params)
+        assert scores.tolist() == [90, 50, 50, 10, 10]
+
+
+class TestRescore:
+    """Tests for re-scoring a metric store."""
+
+    @pytest.mark.parametrize("normalize", [True, False])
+    def test_builtin_scoring_matches_dual_score(self, store, normalize):
+        """Test scores without parameters equal calculate_dual_score() on the same metrics."""
+        result = rescore(store, enable_normalization=normalize)
+        config = SimpleNamespace(enable_score_normalization=normalize)
+
+        for index, doc_id in enumerate(result.doc_ids.tolist()):
+            results = SimpleNamespace(dimension_results=DOCUMENTS[doc_id])
+            expected = sum(s.score for _, s in _build_dimension_scores(results, config))
+            assert result.quality_score[index] == pytest.approx(round(expected, 1))
+
+        # Unavailable and missing dimensions are not scored
+        scores = result.document_scores()
+        assert set(scores["a.md"]) == {"lexical", "burstiness"}
+        assert set(scores["b.md"]) == set(scores["c.md"]) == {"lexical"}
+
+    def test_parameters_replace_dimension_scoring(self, store):
+        """Test dimensions with parameters are scored from their primary metric."""
+        params = PercentileParameters(
+            version="2.0", timestamp=datetime.now().isoformat(), validation_dataset_version="t"
+        )
+        # lexical has no top-level numeric metric: stays on calculate_score()
+        params.add_dimension(
+            dimension_params(
+                "lexical", ScoringType.MONOTONIC, MonotonicParameters(value(0.3), value(0.6))
+            )
+        )
+        params.add_dimension(
+            dimension_params(
+                "burstiness", ScoringType.GAUSSIAN, GaussianParameters(value(1.0), value(0.5))
+            )
+        )
+        builtin = rescore(store, enable_normalization=False)
+        result = rescore(store, params, enable_normalization=False)
+
+        assert result.parameters_version == "2.0"
+        assert result.parameterized == ["burstiness"]
+        # burstiness' first top-level numeric metric is "available" (1.0 = target)
+        assert result.dimension_scores["burstiness"][0] == pytest.approx(100.0)
+        assert np.isnan(result.dimension_scores["burstiness"][1:]).all()
+        np.testing.assert_array_equal(
+            result.dimension_scores["lexical"], builtin.dimension_scores["lexical"]
+        )
+        assert result.to_dict()["dual_scores"]["a.md"]["quality_score"] > 0
+
+    def test_analyzed_results_follow_parameters(self, tmp_path):
+        """Test scores of stored AnalysisResults change with the parameter set."""
+        text = (
+            "# Notes\n\nShort sentences help. Longer ones, with a clause or two and a "
+            "little more detail than strictly needed, help too. Some are tiny.\n\n"
+            "A second paragraph gives the paragraph metrics something to compare. "
+            "It has two sentences.\n"
+        ) * 3
+        config = AnalysisConfig(dimensions_to_load=["burstiness", "structure"])
+        results = AIPatternAnalyzer(config=config).analyze_text(text, config, "a.md")
+        analysis_score = results.dimension_results["burstiness"]["score"]
+
+        store = MetricStore(tmp_path)
+        store.add_results(results)
+        store.save()
+        assert not ENRICHMENT_KEYS & set(store.load("burstiness").columns)
+
+        def burstiness_params(version, target):
+            params = PercentileParameters(
+                version=version,
+                timestamp=datetime.now().isoformat(),
+                validation_dataset_version="t",
+            )
+            params.add_dimension(
+                dimension_params(
+                    "burstiness",
+                    ScoringType.GAUSSIAN,
+                    GaussianParameters(value(target), value(0.5)),
+                )
+            )
+            return params
+
+        on_target = rescore(store, burstiness_params("2.0", 1.0), enable_normalization=False)
+        off_target = rescore(store, burstiness_params("2.1", 0.0), enable_normalization=False)
+
+        # burstiness' parameters apply to its first top-level numeric metric ("available")
+        assert on_target.parameterized == off_target.parameterized == ["burstiness"]
+        assert on_target.dimension_scores["burstiness"][0] == pytest.approx(100.0)
+        assert off_target.dimension_scores["burstiness"][0] == pytest.approx(100.0 * np.exp(-2.0))
+        assert on_target.dimension_scores["burstiness"][0] != pytest.approx(analysis_score)
+        assert on_target.quality_score[0] > off_target.quality_score[0]
+
+    def test_load_parameters_by_version(self, tmp_path):
+        """Test parameter sets are found by file path or deployed version."""
+        from writescore.core.deployment import ParameterVersionManager
+
+        params = PercentileParameters(
+            version="3.1", timestamp=datetime.now().isoformat(), validation_dataset_version="t"
+        )
+        params.add_dimension(
+            dimension_params(
+                "burstiness", ScoringType.GAUSSIAN, GaussianParameters(value(1.0), value(0.5))
+            )
+        )
+        manager = ParameterVersionManager(
+            params_dir=tmp_path / "params",
+            archive_dir=tmp_path / "archive",
+            active_file=tmp_path / "active.yaml",
+        )
+        manager.deploy(params)
+
+        assert load_parameters("v3.1", manager).version == "3.1"
+        assert load_parameters(str(tmp_path / "active.yaml"), manager).version == "3.1"
+        with pytest.raises(FileNotFoundError):
+            load_parameters("v9.9", manager)
@@ -0,0 +1,262 @@
+"""Unit tests for the on-disk analysis result cache.
+
+Tests cover:
+- Cache key sensitivity (text, config, dimensions, parameter and vocabulary version)
+- Get/put roundtrip, hit/miss counters and LRU eviction
+- Stats and clear
+- Analyzer integration (dimensions skipped on a hit)
+- CLI cache commands
+"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from writescore.cli.main import cli
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
+from writescore.core.analyzer import AIPatternAnalyzer
+from writescore.core.result_cache import (
+    ResultCache,
+    compute_cache_key,
+    default_cache_dir,
+    get_result_cache,
+    is_cacheable,
+)
+from writescore.utils.embeddings import EmbeddingStore, embedding_store_path, text_digest
+
+DIMS = ["perplexity", "burstiness"]
+RESULTS = {"perplexity": {"score": 42.0}, "burstiness": {"variance": 1.5}}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Empty cache in a temporary directory."""
+    return ResultCache(tmp_path / "cache")
+
+
+class TestComputeCacheKey:
+    """Tests for compute_cache_key()."""
+
+    def test_deterministic(self):
+        """Test identical inputs give identical keys."""
+        config = AnalysisConfig()
+        assert compute_cache_key("text", config, DIMS, "1.0") == compute_cache_key(
+            "text", AnalysisConfig(), list(reversed(DIMS)), "1.0"
+        )
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"text": "other text"},
+            {"config": AnalysisConfig(mode=AnalysisMode.FULL)},
+            {"config": AnalysisConfig(sampling_sections=9)},
+            {"dims": ["perplexity"]},
+            {"version": "2.0"},
+        ],
+    )
+    def test_sensitive_to_inputs(self, changes):
+        """Test text, config, dimensions and parameter version change the key."""
+        base = {"text": "text", "config": AnalysisConfig(), "dims": DIMS, "version": "1.0"}
+        changed = {**base, **changes}
+        assert compute_cache_key(*base.values()) != compute_cache_key(*changed.values())
+
+    def test_sensitive_to_vocabulary_version(self, monkeypatch):
+        """Test a new AI vocabulary lexicon version changes the key."""
+        before = compute_cache_key("text", AnalysisConfig(), DIMS, "1.0")
+        monkeypatch.setattr("writescore.core.result_cache.VOCABULARY_VERSION", -1)
+        assert compute_cache_key("text", AnalysisConfig(), DIMS, "1.0") != before
+
+    def test_ignores_runtime_settings(self):
+        """Test settings that don't change results don't change the key."""
+        assert compute_cache_key("text", AnalysisConfig(), DIMS) == compute_cache_key(
+            "text", AnalysisConfig(language_model_threads=2, use_result_cache=True), DIMS
+        )
+
+
+class TestIsCacheable:
+    """Tests for is_cacheable()."""
+
+    def test_complete_results(self):
+        """Test results without errors are cacheable."""
+        assert is_cacheable(RESULTS)
+
+    def test_results_with_error(self):
+        """Test results with a failed dimension are not cacheable."""
+        assert not is_cacheable({**RESULTS, "syntactic": {"available": False, "error": "x"}})
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_miss_then_hit(self, cache):
+        """Test a stored result is returned and counters track lookups."""
+        assert cache.get("k") is None
+        cache.put("k", RESULTS)
+        assert cache.get("k") == RESULTS
+
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_persists_across_instances(self, cache):
+        """Test entries are visible to another cache on the same directory."""
+        cache.put("k", RESULTS)
+        assert ResultCache(cache.cache_dir).get("k") == RESULTS
+
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over the size bound."""
+        probe = ResultCache(tmp_path / "probe")
+        probe.put("p", {"blob": "x" * 100})
+        entry_size = probe.stats()["total_bytes"]
+
+        cache = ResultCache(tmp_path / "cache", max_bytes=entry_size * 2)
+        cache.put("a", {"blob": "x" * 100})
+        cache.put("b", {"blob": "x" * 100})
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", {"blob": "x" * 100})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_corrupt_entry_is_miss(self, cache):
+        """Test an unreadable entry is dropped and treated as a miss."""
+        cache.put("k", RESULTS)
+        conn = cache._connect()
+        conn.execute("UPDATE results SET payload = ? WHERE key = ?", (b"garbage", "k"))
+        conn.commit()
+        conn.close()
+
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_unpicklable_results_skipped(self, cache, capsys):
+        """Test results that cannot be serialized are not stored."""
+        cache.put("k", {"dim": lambda: None})
+        assert cache.stats()["entries"] == 0
+        assert "could not cache" in capsys.readouterr().err
+
+    def test_clear(self, cache):
+        """Test clear removes entries and resets counters."""
+        cache.put("a", RESULTS)
+        cache.put("b", RESULTS)
+        cache.get("a")
+
+        assert cache.clear() == 2
+        stats = cache.stats()
+        assert stats["entries"] == 0
+        assert stats["hits"] == 0
+
+
+class TestGetResultCache:
+    """Tests for get_result_cache()."""
+
+    def test_disabled_by_default(self):
+        """Test library default does not cache."""
+        assert get_result_cache(AnalysisConfig()) is None
+
+    def test_shared_instance(self, tmp_path):
+        """Test one cache instance per directory."""
+        config = AnalysisConfig(use_result_cache=True, result_cache_dir=str(tmp_path))
+        assert get_result_cache(config) is get_result_cache(config)
+        assert get_result_cache(config).cache_dir == tmp_path
+
+    def test_default_dir_from_environment(self, tmp_path, monkeypatch):
+        """Test XDG_CACHE_HOME overrides the default location."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "writescore"
+
+
+class TestAnalyzerCache:
+    """Tests for result caching in AIPatternAnalyzer.analyze_text()."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Analyzer with two mock dimensions returning plain dicts."""
+        analyzer = AIPatternAnalyzer()
+        dims = {"a": MagicMock(), "b": MagicMock()}
+        for dim in dims.values():
+            dim.analyze.return_value = {"value": 1.0}
+        analyzer.dimensions = dims
+        return analyzer
+
+    TEXT = "# Title\n\nSome text here. Another sentence follows.\n"
+
+    def test_hit_skips_dimensions(self, analyzer, tmp_path):
+        """Test a second analysis of unchanged text reuses cached results."""
+        config = AnalysisConfig(use_result_cache=True, result_cache_dir=str(tmp_path))
+        analyzer.analyze_text(self.TEXT, config=config)
+        analyzer.analyze_text(self.TEXT, config=config)
+
+        for dim in analyzer.dimensions.values():
+            assert dim.analyze.call_count == 1
+
+    def test_changed_text_misses(self, analyzer, tmp_path):
+        """Test changed text re-runs dimensions."""
+        config = AnalysisConfig(use_result_cache=True, result_cache_dir=str(tmp_path))
+        analyzer.analyze_text(self.TEXT, config=config)
+        analyzer.analyze_text(self.TEXT + "\nMore.\n", config=config)
+
+        for dim in analyzer.dimensions.values():
+            assert dim.analyze.call_count == 2
+
+    def test_disabled_always_runs(self, analyzer):
+        """Test dimensions always run when caching is off."""
+        analyzer.analyze_text(self.TEXT)
+        analyzer.analyze_text(self.TEXT)
+
+        for dim in analyzer.dimensions.values():
+            assert dim.analyze.call_count == 2
+
+    def test_errors_not_cached(self, analyzer, tmp_path):
+        """Test results with a failed dimension are recomputed next time."""
+        analyzer.dimensions["b"].analyze.side_effect = RuntimeError("model missing")
+        config = AnalysisConfig(use_result_cache=True, result_cache_dir=str(tmp_path))
+        analyzer.analyze_text(self.TEXT, config=config)
+        analyzer.analyze_text(self.TEXT, config=config)
+
+        assert analyzer.dimensions["a"].analyze.call_count == 2
+
+
+class TestCacheCommands:
+    """Tests for 'writescore cache stats|clear'."""
+
+    def test_stats_json(self, tmp_path):
+        """Test stats reports entries as JSON."""
+        import json
+
+        ResultCache(tmp_path).put("k", RESULTS)
+        result = CliRunner().invoke(cli, ["cache", "stats", "--cache-dir", str(tmp_path), "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["entries"] == 1
+
+    def test_stats_text(self, tmp_path):
+        """Test stats text output includes the hit rate."""
+        result = CliRunner().invoke(cli, ["cache", "stats", "--cache-dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Hit rate:  n/a" in result.output
+
+    def test_clear(self, tmp_path):
+        """Test clear empties the cache."""
+        ResultCache(tmp_path).put("k", RESULTS)
+        result = CliRunner().invoke(cli, ["cache", "clear", "--cache-dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "Removed 1" in result.output
+        assert ResultCache(tmp_path).stats()["entries"] == 0
+
+    def test_clear_removes_embeddings(self, tmp_path):
+        """Test clear also empties the sentence-embedding store."""
+        store = EmbeddingStore(embedding_store_path(tmp_path))
+        store.add([text_digest("a sentence")], np.ones((1, 4)))
+        result = CliRunner().invoke(cli, ["cache", "clear", "--cache-dir", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert "and 1 cached embedding(s)" in result.output
+        assert not store.path.exists()
@@ -0,0 +1,92 @@
+"""Unit tests for shared document segmentation."""
+
+import random
+import re
+
+import numpy as np
+
+from writescore.core.document_context import DocumentContext
+from writescore.core.segmentation import SegmentedDocument, segment_text
+
+TEXT = "# Title\n\nFirst sentence. Second one!\nSame paragraph?  \n \n  Last words...\n"
+
+TOKENS = ["word", "It", "é", "x_y", "don't", ".", "!", "?", "...", "\n", "\n\n", " \n \n", "\t"]
+
+
+class TestSegmentedDocument:
+    """Tests for SegmentedDocument spans and views."""
+
+    def test_lazy(self):
+        """Test nothing is split until requested."""
+        segments = SegmentedDocument(TEXT)
+        assert segments._paragraph_spans is None
+        assert segments._word_spans is None
+
+    def test_paragraphs(self):
+        """Test paragraphs are blank-line separated, stripped and non-empty."""
+        segments = SegmentedDocument(TEXT)
+        assert segments.paragraphs == [
+            "# Title",
+            "First sentence. Second one!\nSame paragraph?",
+            "Last words...",
+        ]
+        for (start, end), paragraph in zip(segments.paragraph_spans, segments.paragraphs):
+            assert TEXT[start:end] == paragraph
+
+    def test_sentences_per_paragraph(self):
+        """Test sentences are split within paragraphs and mapped to them."""
+        segments = SegmentedDocument(TEXT)
+        assert segments.paragraph_sentences(1) == [
+            "First sentence",
+            "Second one",
+            "Same paragraph?",
+        ]
+        assert segments.sentence_paragraphs.tolist() == [0, 1, 1, 1, 2]
+        assert segments.sentences[-1] == "Last words..."
+
+    def test_words(self):
+        """Test word tokens are \\w+ runs."""
+        segments = SegmentedDocument("Don't stop_now, 42 times.")
+        assert segments.word_count == 5
+        assert segments.word_spans.tolist() == [[0, 3], [4, 5], [6, 14], [16, 18], [19, 24]]
+
+    def test_line_numbers(self):
+        """Test offsets map to 1-based line numbers."""
+        segments = SegmentedDocument(TEXT)
+        starts = segments.paragraph_spans[:, 0]
+        assert segments.line_numbers(starts).tolist() == [1, 3, 6]
+        assert segments.line_number(len(TEXT)) == 7
+
+    def test_empty_text(self):
+        """Test empty text has no segments."""
+        segments = SegmentedDocument("")
+        assert segments.paragraph_spans.shape == (0, 2)
+        assert segments.sentences == []
+        assert segments.word_count == 0
+
+    def test_same_splits_as_regexes(self):
+        """Test segments match the regex splits dimensions used before."""
+        rng = random.Random(0)
+        for _ in range(100):
+            text = "".join(rng.choice(TOKENS) + rng.choice([" ", ""]) for _ in range(60))
+            segments = SegmentedDocument(text)
+            paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+            assert segments.paragraphs == paragraphs
+            assert segments.sentences == [
+                s.strip() for p in paragraphs for s in re.split(r"[.!?]+\s+", p) if s.strip()
+            ]
+            assert segments.word_count == len(re.findall(r"\b\w+\b", text))
+            assert isinstance(segments.word_spans, np.ndarray)
+
+
+class TestSegmentText:
+    """Tests for segment_text()."""
+
+    def test_uses_context_when_given(self):
+        """Test segmentations are shared through the context."""
+        context = DocumentContext(TEXT)
+        assert segment_text(TEXT, context) is context.get_segments(TEXT)
+
+    def test_without_context(self):
+        """Test text is segmented directly without a context."""
+        assert segment_text(TEXT).paragraphs == SegmentedDocument(TEXT).paragraphs
@@ -0,0 +1,367 @@
+"""Unit tests for STREAMING analysis mode.
+
+Tests cover:
+- Window splitting (HTML comments, paragraph and fence boundaries)
+- Online accumulators (Welford statistics, distinct-count sketch, metric folding)
+- Exact streaming accumulators for burstiness and (advanced) lexical diversity
+- Analyzer integration (progress reporting, failures, no caching)
+"""
+
+import random
+import re
+import statistics
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
+from writescore.core.analyzer import AIPatternAnalyzer
+from writescore.core.result_cache import ResultCache
+from writescore.core.streaming import (
+    DistinctSketch,
+    LineSource,
+    MetricFolder,
+    RunningStats,
+    StreamAccumulator,
+    iter_windows,
+)
+from writescore.dimensions.advanced_lexical import AdvancedLexicalDimension
+from writescore.dimensions.burstiness import BurstinessDimension
+from writescore.dimensions.lexical import LexicalDimension
+
+FULL = AnalysisConfig(mode=AnalysisMode.FULL)
+STREAMING = AnalysisConfig(mode=AnalysisMode.STREAMING, streaming_window_chars=200)
+
+# Metadata keys that legitimately differ between FULL and STREAMING results
+METADATA = {"analysis_mode", "samples_analyzed"}
+
+DOCUMENT = """# Title
+
+<!-- metadata
+spanning lines -->
+First paragraph has a few sentences. They vary in length quite a lot, which is
+the point of the burstiness dimension. Short one.
+
+```python
+def example():
+
+    return "blank line inside the fence"
+```
+
+Second paragraph <!-- inline --> with an inline comment. It keeps going for a while
+so that the windows have to split somewhere sensible. Another sentence here.
+
+- A list item. With two sentences.
+- Another item.
+
+Final paragraph with enough words to count for the coefficient of variation check.
+"""
+
+
+def strip_comments(text):
+    return re.sub(r"<!--.*?-->", "", text, flags=re.DOTALL)
+
+
+def stream(dimension, text, config=STREAMING):
+    """Feed text to a dimension's stream accumulator window by window."""
+    accumulator = dimension.create_stream_accumulator(config)
+    for window in iter_windows(LineSource.from_text(text), config.streaming_window_chars):
+        accumulator.add(window)
+    return accumulator.result()
+
+
+def without_metadata(result):
+    return {key: value for key, value in result.items() if key not in METADATA}
+
+
+class TestIterWindows:
+    """Tests for iter_windows()."""
+
+    @pytest.mark.parametrize("window_chars", [1, 50, 200, 100000])
+    def test_windows_join_to_comment_stripped_text(self, window_chars):
+        """Test windows concatenate to the text without HTML comments."""
+        windows = list(iter_windows(LineSource.from_text(DOCUMENT), window_chars))
+        assert "".join(windows) == strip_comments(DOCUMENT)
+
+    def test_windows_end_at_blank_lines(self):
+        """Test windows end at paragraph boundaries."""
+        windows = list(iter_windows(LineSource.from_text(DOCUMENT), 120))
+        assert len(windows) > 1
+        for window in windows[:-1]:
+            assert window.endswith("\n\n")
+
+    def test_fenced_code_not_split(self):
+        """Test a blank line inside fenced code is not a window boundary."""
+        windows = list(iter_windows(LineSource.from_text(DOCUMENT), 40))
+        assert len(windows) > 3
+        for window in windows:
+            assert window.count("```") in (0, 2)
+
+    def test_window_size_bounded(self):
+        """Test text without blank lines is cut at twice the window size."""
+        text = "word " * 10 + "\n"
+        windows = list(iter_windows(LineSource.from_text(text * 100), 100))
+        assert max(len(window) for window in windows) < 200 + len(text)
+        assert "".join(windows) == text * 100
+
+    def test_unclosed_comment_drops_rest(self):
+        """Test an unclosed comment hides the rest of the text, like the regex."""
+        text = "Kept.\n<!-- never closed\nHidden.\n"
+        assert "".join(iter_windows(LineSource.from_text(text))) == "Kept.\n"
+
+    def test_empty_text(self):
+        """Test empty text produces no windows."""
+        assert list(iter_windows(LineSource.from_text(""))) == []
+
+
+class TestLineSource:
+    """Tests for LineSource."""
+
+    def test_file_progress_in_bytes(self, tmp_path):
+        """Test consumed bytes reach the file size."""
+        path = tmp_path / "doc.md"
+        path.write_bytes("Café line.\r\nSecond line.\r\n".encode())
+        source = LineSource.from_file(str(path))
+
+        assert list(source) == ["Café line.\n", "Second line.\n"]
+        assert source.consumed == source.total == path.stat().st_size
+
+
+class TestRunningStats:
+    """Tests for RunningStats (Welford)."""
+
+    def test_matches_statistics(self):
+        """Test mean and sample stdev match the statistics module."""
+        rng = random.Random(3)
+        values = [rng.randint(1, 60) for _ in range(500)]
+        stats = RunningStats()
+        stats.update(values)
+
+        assert stats.count == len(values)
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.stdev == pytest.approx(statistics.stdev(values))
+        assert (stats.min, stats.max) == (min(values), max(values))
+
+    def test_merge_equals_sequential(self):
+        """Test merging two accumulators equals adding all values to one."""
+        left, right, whole = RunningStats(), RunningStats(), RunningStats()
+        left.update([1, 5, 9])
+        right.update([2, 30, 4, 4])
+        whole.update([1, 5, 9, 2, 30, 4, 4])
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert left.mean == pytest.approx(whole.mean)
+        assert left.variance == pytest.approx(whole.variance)
+        assert (left.min, left.max) == (1, 30)
+
+    def test_single_value_has_zero_variance(self):
+        """Test fewer than two values give zero variance."""
+        stats = RunningStats()
+        stats.add(7)
+        assert stats.variance == 0.0
+
+
+class TestDistinctSketch:
+    """Tests for DistinctSketch."""
+
+    def test_exact_below_size(self):
+        """Test counts are exact until k distinct items are seen."""
+        sketch = DistinctSketch(k=100)
+        sketch.update(["a", "b", "a", "c"] * 10)
+        assert sketch.estimate() == 3
+
+    def test_estimate_above_size(self):
+        """Test large distinct counts are estimated within a few percent."""
+        sketch = DistinctSketch(k=1024)
+        sketch.update(f"word{i % 20000}" for i in range(60000))
+        assert sketch.estimate() == pytest.approx(20000, rel=0.1)
+
+    def test_merge_counts_union(self):
+        """Test merged sketches count the union of their items."""
+        left, right = DistinctSketch(k=64), DistinctSketch(k=64)
+        left.update(["a", "b"])
+        right.update(["b", "c"])
+        left.merge(right)
+        assert left.estimate() == 3
+
+
+class TestMetricFolder:
+    """Tests for MetricFolder."""
+
+    def test_matches_sampled_aggregation(self):
+        """Test folding equals DimensionStrategy._aggregate_sampled_metrics()."""
+        samples = [
+            {"score": 85, "vocab": ["delve"], "flag": True, "label": "x", "nested": {"n": 1}},
+            {"score": 90, "vocab": ["robust", "delve"], "flag": False, "label": "y"},
+            {"score": 88, "vocab": ["leverage"], "flag": False, "label": "x", "nested": {"n": 3}},
+            {"score": None, "extra": None},
+        ]
+        folder = MetricFolder()
+        for sample in samples:
+            folder.add(sample)
+
+        assert folder.result() == BurstinessDimension()._aggregate_sampled_metrics(samples)
+
+    def test_lists_capped(self):
+        """Test list metrics keep at most max_list_items entries."""
+        folder = MetricFolder(max_list_items=3)
+        folder.add({"items": [1, 2]})
+        folder.add({"items": [3, 4, 5]})
+        assert folder.result() == {"items": [1, 2, 3]}
+
+
+class TestStreamAccumulator:
+    """Tests for the accumulator base class."""
+
+    def test_subclasses_must_implement_add_and_result(self):
+        """Test an accumulator without _add()/_result() cannot be created."""
+
+        class Incomplete(StreamAccumulator):
+            def _add(self, window, **kwargs):
+                pass
+
+        with pytest.raises(TypeError):
+            Incomplete(MagicMock(), AnalysisConfig())
+
+
+class TestBurstinessStreaming:
+    """Tests for streaming burstiness."""
+
+    @pytest.mark.parametrize("fixture_name", ["sample_ai_text", "sample_human_text"])
+    def test_equals_full_analysis(self, request, fixture_name):
+        """Test streamed statistics equal FULL analysis of the whole text."""
+        text = request.getfixturevalue(fixture_name)
+        dimension = BurstinessDimension()
+        streamed = stream(dimension, text)
+
+        assert streamed["samples_analyzed"] > 1
+        assert streamed["analysis_mode"] == "streaming"
+        assert without_metadata(streamed) == without_metadata(dimension.analyze(text, config=FULL))
+
+    def test_lengths_capped(self):
+        """Test the stored sentence length list is bounded."""
+        text = "One short sentence here. Another one follows.\n\n" * 1000
+        with patch("writescore.dimensions.burstiness.DEFAULT_MAX_LIST_ITEMS", 10):
+            streamed = stream(BurstinessDimension(), text)
+
+        burstiness = streamed["sentence_burstiness"]
+        assert burstiness["total_sentences"] == 2000
+        assert len(burstiness["lengths"]) == 10
+
+
+class TestLexicalStreaming:
+    """Tests for streaming lexical diversity."""
+
+    @pytest.fixture
+    def simple_tokens(self):
+        """Tokenize by whitespace (no NLTK data needed)."""
+        with patch.object(
+            LexicalDimension,
+            "_nltk_words",
+            lambda self, text: [w for w in text.lower().split() if w.isalnum()],
+        ):
+            yield
+
+    def test_ttr_equals_full_analysis(self, simple_tokens, sample_mixed_text):
+        """Test unique words, TTR and stemmed diversity match FULL analysis."""
+        dimension = LexicalDimension()
+        streamed = stream(dimension, sample_mixed_text)["lexical_diversity"]
+        expected = dimension.analyze(sample_mixed_text, config=FULL)["lexical_diversity"]
+
+        assert streamed["unique"] == expected["unique"]
+        assert streamed["diversity"] == expected["diversity"]
+        assert streamed["stemmed_diversity"] == expected["stemmed_diversity"]
+
+    def test_mtld_independent_of_window_size(self, simple_tokens, sample_human_text):
+        """Test the online MTLD state carries across windows."""
+        dimension = LexicalDimension()
+        small = stream(dimension, sample_human_text)["lexical_diversity"]
+        whole = stream(
+            dimension,
+            sample_human_text,
+            AnalysisConfig(mode=AnalysisMode.STREAMING, streaming_window_chars=10**6),
+        )["lexical_diversity"]
+
+        assert small["mtld_score"] == whole["mtld_score"] > 0
+
+
+class TestAdvancedLexicalStreaming:
+    """Tests for streaming advanced lexical diversity."""
+
+    SPECTRUM_METRICS = ("hdd_score", "yules_k", "maas_score", "vocab_concentration")
+
+    @pytest.fixture
+    def no_window_metrics(self):
+        """Skip the MATTR/RTTR metrics (not under test)."""
+        with patch.object(
+            AdvancedLexicalDimension,
+            "_calculate_mattr_rttr",
+            lambda self, text: {},
+        ):
+            yield
+
+    def test_spectrum_metrics_equal_full_analysis(self, no_window_metrics, sample_human_text):
+        """Test merged window spectra give the whole-document metrics."""
+        text = strip_comments(sample_human_text) * 3
+        dimension = AdvancedLexicalDimension()
+        streamed = stream(dimension, text)
+        expected = dimension.analyze(text, config=FULL)
+
+        assert streamed["samples_analyzed"] > 1
+        for key in self.SPECTRUM_METRICS:
+            assert expected[key] is not None
+            assert streamed[key] == expected[key]
+
+
+class TestAnalyzerStreaming:
+    """Tests for STREAMING mode in AIPatternAnalyzer."""
+
+    @pytest.fixture
+    def analyzer(self):
+        analyzer = AIPatternAnalyzer()
+        analyzer.dimensions = {"burstiness": BurstinessDimension()}
+        return analyzer
+
+    def test_analyze_file_streams(self, analyzer, tmp_path, sample_human_text):
+        """Test STREAMING analyze_file() matches FULL analysis with progress."""
+        path = tmp_path / "doc.md"
+        path.write_text(sample_human_text)
+        progress = MagicMock()
+
+        streamed = analyzer.analyze_stream(str(path), config=STREAMING, progress=progress)
+        full = analyzer.analyze_file(str(path), config=FULL)
+
+        assert streamed.file_path == str(path)
+        assert streamed.total_words == full.total_words
+        assert streamed.sentence_stdev == full.sentence_stdev
+        assert streamed.burstiness_score == full.burstiness_score
+        assert progress.call_count > 1
+        assert progress.call_args.args == (path.stat().st_size, path.stat().st_size)
+
+    def test_analyze_text_streaming_mode(self, analyzer):
+        """Test analyze_text() honors STREAMING mode."""
+        result = analyzer.analyze_text(DOCUMENT, config=STREAMING)
+        assert result.dimension_results["burstiness"]["analysis_mode"] == "streaming"
+        assert result.total_words == analyzer._count_words(strip_comments(DOCUMENT))
+
+    def test_failed_dimension_unavailable(self, analyzer):
+        """Test a dimension failing mid-stream is reported unavailable."""
+        broken = MagicMock()
+        broken.create_stream_accumulator.return_value.add.side_effect = RuntimeError("boom")
+        analyzer.dimensions["broken"] = broken
+
+        result = analyzer.analyze_text(DOCUMENT, config=STREAMING)
+
+        assert result.dimension_results["broken"]["available"] is False
+        assert result.dimension_results["broken"]["error"] == "boom"
+        assert broken.create_stream_accumulator.return_value.add.call_count == 1
+        assert result.dimension_results["burstiness"]["available"]
+
+    def test_streamed_results_not_cached(self, analyzer, tmp_path):
+        """Test streaming bypasses the result cache."""
+        config = AnalysisConfig(
+            mode=AnalysisMode.STREAMING, use_result_cache=True, result_cache_dir=str(tmp_path)
+        )
+        analyzer.analyze_text(DOCUMENT, config=config)
+        assert ResultCache(tmp_path).stats()["entries"] == 0
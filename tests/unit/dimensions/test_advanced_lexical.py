@@ -3,8 +3,6 @@ Tests for AdvancedLexicalDimension - HDD, Yule's K, MATTR, RTTR analysis.
 Story 1.4.5 - New dimension split from AdvancedDimension.
 """
 
-from unittest.mock import Mock, patch
-
 import pytest
 
 from writescore.core.dimension_registry import DimensionRegistry
@@ -347,50 +345,40 @@ class TestAdvancedLexicalDiversityCalculation:
         assert isinstance(result, dict)
 
 
-class TestTextacyLexicalDiversityCalculation:
-    """Tests for _calculate_textacy_lexical_diversity() helper method."""
-
-    @patch("writescore.dimensions.advanced_lexical.nlp_spacy")
-    def test_mattr_calculation(self, mock_nlp, dimension):
-        """Test MATTR calculation."""
-        # Mock spacy doc with iterable tokens for RTTR calculation
-        mock_token1 = Mock()
-        mock_token1.is_alpha = True
-        mock_token1.is_stop = False
-        mock_token1.text = "sample"
-
-        mock_token2 = Mock()
-        mock_token2.is_alpha = True
-        mock_token2.is_stop = False
-        mock_token2.text = "text"
+class TestMattrRttrCalculation:
+    """Tests for _calculate_mattr_rttr() helper method."""
 
-        mock_doc = Mock()
-        mock_doc.__iter__ = Mock(return_value=iter([mock_token1, mock_token2]))
-        mock_nlp.return_value = mock_doc
+    def test_mattr_calculation(self, dimension):
+        """Test MATTR over 100-word windows."""
+        # 50 distinct words repeated: every 100-word window has 50 types
+        text = " ".join(f"word{i % 50}" for i in range(300))
+        result = dimension._calculate_mattr_rttr(text)
 
-        with patch(
-            "writescore.dimensions.advanced_lexical.diversity.segmented_ttr", return_value=0.72
-        ):
-            result = dimension._calculate_textacy_lexical_diversity("Sample text")
+        assert result["available"] is True
+        assert result["mattr"] == 0.5
+        assert result["mattr_assessment"] == "POOR"
 
-            assert "mattr" in result
-            assert result["mattr"] == 0.72
+    def test_mattr_short_text_uses_smaller_window(self, dimension):
+        """Test texts shorter than 100 words fall back to 50-word windows."""
+        text = " ".join(f"word{i}" for i in range(60))
+        assert dimension._calculate_mattr_rttr(text)["mattr"] == 1.0
 
     def test_rttr_calculation(self, dimension):
-        """Test RTTR (Root Type-Token Ratio) calculation."""
-        text = " ".join([f"word{i}" for i in range(100)])
-        result = dimension._calculate_textacy_lexical_diversity(text)
+        """Test RTTR counts alphabetic non-stop words only."""
+        words = ["apple", "banana", "cherry", "date"] * 4 + ["the", "and", "42"] * 10
+        result = dimension._calculate_mattr_rttr(" ".join(words))
 
-        assert "rttr" in result
-        if result.get("rttr", 0) > 0:
-            assert result["rttr"] > 0
+        assert result["tokens"] == 16
+        assert result["types"] == 4
+        assert result["rttr"] == 1.0
 
     def test_handles_errors_gracefully(self, dimension):
-        """Test error handling when textacy fails."""
-        result = dimension._calculate_textacy_lexical_diversity("")
+        """Test empty text."""
+        result = dimension._calculate_mattr_rttr("")
 
         assert "available" in result
-        assert "mattr" in result
+        assert result["mattr"] == 0.0
+        assert result["rttr"] == 0.0
 
 
 class TestLogitGaussianScoring:
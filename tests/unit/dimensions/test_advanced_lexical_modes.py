@@ -5,6 +5,8 @@ Tests FAST, ADAPTIVE, SAMPLING, and FULL modes for advanced lexical analysis.
 Story 1.4.8: Optimize Heavy Dimensions for Full Documents
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
@@ -89,6 +91,28 @@ class TestAdvancedLexicalModes:
         # Each sample ~10k chars, so total ~70k analyzed
         assert 60000 <= result["analyzed_text_length"] <= 80000
 
+    def test_sampling_mode_pools_sample_spectra(self, dim):
+        """Test SAMPLING mode computes HDD/Yule's K over all sampled words, not a mean."""
+        config = AnalysisConfig(
+            mode=AnalysisMode.SAMPLING, sampling_sections=3, sampling_chars_per_section=2000
+        )
+        paragraphs = [
+            f"Section {i} discusses topic{i} with distinct vocabulary{i} and shared words. " * 20
+            for i in range(6)
+        ]
+        text = "\n\n".join(paragraphs)
+
+        with patch.object(dim, "_calculate_mattr_rttr", return_value={}):
+            result = dim.analyze(text, config=config)
+        samples = dim._prepare_text(text, config, dim.dimension_name)
+        pooled = dim._calculate_advanced_lexical_diversity(
+            " ".join(sample for _, sample in samples)
+        )
+
+        assert result["samples_analyzed"] == 3
+        assert result["hdd_score"] == pooled["hdd_score"]
+        assert result["yules_k"] == pooled["yules_k"]
+
     def test_aggregate_lexical_metrics_uses_base_aggregation(self, dim):
         """Test lexical aggregation uses base _aggregate_sampled_metrics (mean)."""
         # Create sample metrics with known values
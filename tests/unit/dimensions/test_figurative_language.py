@@ -13,11 +13,18 @@ Covers:
 """
 
 import time
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
+from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
 from writescore.core.dimension_registry import DimensionRegistry
-from writescore.dimensions.figurative_language import FigurativeLanguageDimension
+from writescore.dimensions.figurative_language import (
+    FigurativeLanguageDimension,
+    semantic_gap_confidences,
+)
+from writescore.utils.embeddings import EmbeddingService
 
 
 @pytest.fixture
@@ -164,6 +171,101 @@ class TestMetaphorDetection:
         assert not dimension._is_potential_metaphor("xyzabc", "test context")
 
 
+class RecordingEncoder:
+    """Sentence encoder with fixed embeddings, recording each encode() batch."""
+
+    VECTORS = {
+        "drowning in": [1.0, 0.0, 0.0],
+        "choking on": [0.0, 1.0, 0.0],
+        "sea of": [0.9, 0.1, 0.0],
+        "be submerged in water": [0.2, 0.1, 1.0],
+        "have trouble breathing": [0.0, 0.8, 0.3],
+    }
+
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts, **kwargs):
+        self.batches.append(list(texts))
+        return np.array([self.VECTORS[text] for text in texts])
+
+
+class TestBatchedMetaphorScoring:
+    """Tests for phase-separated, batched metaphor scoring."""
+
+    CANDIDATES = [
+        ("drowning in", "be submerged in water"),
+        ("choking on", "have trouble breathing"),
+        ("drowning in", "be submerged in water"),
+        ("sea of", "be submerged in water"),
+    ]
+
+    @pytest.fixture
+    def encoder(self, dimension):
+        encoder = RecordingEncoder()
+        service = EmbeddingService()
+        service._model = encoder
+        dimension.model = encoder
+        with patch(
+            "writescore.dimensions.figurative_language.get_embedding_service",
+            return_value=service,
+        ):
+            yield encoder
+
+    def test_semantic_gap_confidences(self):
+        """Test row-wise confidences match 1 - cosine below the literal threshold."""
+        contextual = np.array([[1.0, 0.0], [1.0, 1.0], [0.0, 3.0]])
+        literal = np.array([[0.0, 1.0], [1.0, 1.0], [2.0, 1.0]])
+        np.testing.assert_allclose(
+            semantic_gap_confidences(contextual, literal), [1.0, 0.0, 1.0 - 1.0 / np.sqrt(5.0)]
+        )
+
+    def test_unique_texts_encoded_in_one_batch_each(self, dimension, encoder):
+        """Test phrases and definitions are deduplicated and encoded once."""
+        confidences = dimension._metaphor_confidences(self.CANDIDATES)
+
+        assert encoder.batches == [
+            ["drowning in", "choking on", "sea of"],
+            ["be submerged in water", "have trouble breathing"],
+        ]
+        assert len(confidences) == len(self.CANDIDATES)
+        assert confidences[0] == confidences[2]
+
+    def test_matches_pairwise_scoring(self, dimension, encoder):
+        """Test batched scores equal scoring each candidate on its own."""
+        batched = dimension._metaphor_confidences(self.CANDIDATES)
+        pairwise = []
+        for phrase, definition in self.CANDIDATES:
+            a = np.array(RecordingEncoder.VECTORS[phrase])
+            b = np.array(RecordingEncoder.VECTORS[definition])
+            similarity = a @ b / (np.linalg.norm(a) * np.linalg.norm(b))
+            pairwise.append(max(0.0, min(1.0, 1.0 - similarity if similarity < 0.7 else 0.0)))
+        np.testing.assert_allclose(batched, pairwise, rtol=1e-6)
+
+    def test_no_candidates(self, dimension, encoder):
+        """Test no encoder calls without candidates."""
+        assert dimension._metaphor_confidences([]) == []
+        assert encoder.batches == []
+
+    @pytest.mark.parametrize(
+        ("config", "expected"),
+        [
+            (AnalysisConfig(), 50),
+            (AnalysisConfig(metaphor_max_sentences=200), 200),
+            (AnalysisConfig(mode=AnalysisMode.FULL), None),
+        ],
+    )
+    def test_sentence_limit(self, dimension, encoder, config, expected):
+        """Test the sentence limit comes from config and FULL mode scans everything."""
+        with patch.object(
+            dimension, "_collect_metaphor_candidates", return_value=self.CANDIDATES
+        ) as collect:
+            metaphors = dimension._detect_metaphors_embedding("text", config)
+
+        assert collect.call_args.args == ("text", expected)
+        assert [m["phrase"] for m in metaphors] == ["drowning in", "drowning in", "sea of"]
+
+
 class TestIdiomDetection:
     """Tests for idiom detection (Subtask 4.4)."""
 
@@ -201,6 +303,30 @@ class TestIdiomDetection:
         )
         assert confidence_lit < confidence_fig
 
+    def test_idiom_context_from_matcher_spans(self, dimension):
+        """Test context checking from matcher positions equals searching the text."""
+        text = 'It was a Piece of Cake, like always. Some call it "piece of cake".'
+        spans = dimension.idiom_matcher.occurrences(text)["piece of cake"]
+
+        assert len(spans) == 2
+        from_spans = dimension._check_idiom_context(text, "piece of cake", "core", spans)
+        assert from_spans == dimension._check_idiom_context(text, "piece of cake", "core")
+        # The quoted (metalinguistic) second occurrence lowers the confidence
+        assert from_spans < dimension._check_idiom_context(text, "piece of cake", "core", spans[:1])
+
+    def test_idioms_found_in_one_pass(self, dimension):
+        """Test detection does not search the text once per lexicon entry."""
+        text = "Don't put all your eggs in one basket. That would be a piece of cake to fix."
+        with patch.object(
+            dimension.idiom_matcher, "occurrences", wraps=dimension.idiom_matcher.occurrences
+        ) as scan:
+            result = dimension._detect_idioms_lexicon(text)
+
+        assert scan.call_count == 1
+        assert {"piece of cake", "put all your eggs in one basket"} <= {
+            idiom["phrase"].lower() for idiom in result
+        }
+
     def test_idiom_detection_empty_text(self, dimension):
         """Test idiom detection on empty text."""
         result = dimension._detect_idioms_lexicon("")
@@ -9,6 +9,7 @@ import pytest
 
 from writescore.core.dimension_registry import DimensionRegistry
 from writescore.dimensions.predictability import PredictabilityDimension
+from writescore.utils.deadline import Deadline, DeadlineExceeded, check_deadline, deadline_scope
 
 
 @pytest.fixture
@@ -75,9 +76,7 @@ class TestDimensionMetadata:
 class TestAnalyzeMethod:
     """Tests for analyze() method - must ONLY collect GLTR metrics."""
 
-    @patch("writescore.dimensions.predictability._perplexity_model")
-    @patch("writescore.dimensions.predictability._perplexity_tokenizer")
-    def test_analyze_returns_gltr_metrics_only(self, mock_tokenizer, mock_model, dimension):
+    def test_analyze_returns_gltr_metrics_only(self, dimension):
         """Test analyze() collects ONLY GLTR metrics (no HDD, Yule's K, MATTR, etc.)."""
         # Mock GLTR calculation to return fake metrics
         with patch.object(
@@ -268,10 +267,9 @@ class TestGetTiers:
 class TestGLTRMetricCalculation:
     """Tests for _calculate_gltr_metrics() helper method."""
 
-    @patch("writescore.dimensions.predictability._perplexity_model", None)
-    @patch("writescore.dimensions.predictability._perplexity_tokenizer", None)
     def test_gltr_loads_model_lazily(self, dimension):
         """Test GLTR loads model on first use (lazy loading)."""
+        PredictabilityDimension.clear_model_cache()
         # This would trigger model loading in real scenario
         # For unit test, we just verify the pattern works
         result = dimension._calculate_gltr_metrics("Short text")
@@ -359,7 +357,7 @@ class TestTimeoutMechanism:
         # Mock _calculate_gltr_metrics to take longer than timeout
         import time
 
-        def slow_calculation(text):
+        def slow_calculation(text, language_model=None):
             time.sleep(2)  # Sleep longer than timeout
             return {"gltr_top10_percentage": 0.55}
 
@@ -382,7 +380,7 @@ class TestTimeoutMechanism:
     def test_timeout_handles_exceptions_gracefully(self, dimension):
         """Test timeout wrapper handles exceptions in worker thread."""
 
-        def failing_calculation(text):
+        def failing_calculation(text, language_model=None):
             raise ValueError("Test exception")
 
         with patch.object(dimension, "_calculate_gltr_metrics", side_effect=failing_calculation):
@@ -391,6 +389,37 @@ class TestTimeoutMechanism:
             # Should catch exception and return None
             assert result is None
 
+    def test_timeout_stops_worker(self, dimension):
+        """Test the worker stops at its next deadline check after a timeout."""
+        import time
+
+        windows = []
+
+        def cancellable_calculation(text, language_model=None):
+            while True:
+                check_deadline()
+                windows.append(1)
+                time.sleep(0.01)
+
+        with patch.object(
+            dimension, "_calculate_gltr_metrics", side_effect=cancellable_calculation
+        ):
+            assert dimension._calculate_gltr_metrics_with_timeout("test text", timeout=0.2) is None
+
+        time.sleep(0.1)
+        stopped_at = len(windows)
+        time.sleep(0.1)
+        assert len(windows) == stopped_at
+
+    def test_expired_analysis_deadline_propagates(self, dimension):
+        """Test the analysis deadline is raised, not reported as a GLTR timeout."""
+        deadline = Deadline(1)
+        deadline._expires_at -= 2
+
+        calculation = patch.object(dimension, "_calculate_gltr_metrics", return_value={})
+        with calculation, deadline_scope(deadline), pytest.raises(DeadlineExceeded):
+            dimension._calculate_gltr_metrics_with_timeout("test text", timeout=30)
+
     def test_analyze_uses_timeout_wrapper(self, dimension):
         """Test analyze() method uses timeout-protected version."""
         with patch.object(
@@ -429,34 +458,34 @@ class TestModelCaching:
         assert hasattr(PredictabilityDimension, "clear_model_cache")
         assert callable(PredictabilityDimension.clear_model_cache)
 
-    def test_clear_model_cache_resets_globals(self, dimension):
-        """Test clear_model_cache() clears global model variables."""
-        import writescore.dimensions.predictability as pred_module
+    def test_clear_model_cache_resets_shared_models(self, dimension):
+        """Test clear_model_cache() releases the shared language models."""
+        import writescore.utils.language_model as lm_module
 
-        # Set mock values
-        pred_module._perplexity_model = "mock_model"
-        pred_module._perplexity_tokenizer = "mock_tokenizer"
+        service = lm_module.get_language_model("distilgpt2")
+        service._model = "mock_model"
+        service._tokenizer = "mock_tokenizer"
 
         # Clear cache
         PredictabilityDimension.clear_model_cache()
 
-        # Should be None after clearing
-        assert pred_module._perplexity_model is None
-        assert pred_module._perplexity_tokenizer is None
+        # Service released and registry emptied
+        assert service._model is None
+        assert service._tokenizer is None
+        assert lm_module._services == {}
 
     def test_model_loading_is_thread_safe(self, dimension):
         """Test model loading uses lock for thread safety."""
         import threading
 
-        import writescore.dimensions.predictability as pred_module
+        from writescore.utils.language_model import get_language_model
 
-        # Verify lock exists
-        assert hasattr(pred_module, "_model_lock")
+        service = get_language_model()
         # Verify it's a threading.Lock object
-        assert isinstance(pred_module._model_lock, type(threading.Lock()))
+        assert isinstance(service._load_lock, type(threading.Lock()))
 
-    @patch("writescore.dimensions.predictability.AutoModelForCausalLM")
-    @patch("writescore.dimensions.predictability.AutoTokenizer")
+    @patch("transformers.AutoModelForCausalLM")
+    @patch("transformers.AutoTokenizer")
     def test_model_loads_only_once(self, mock_tokenizer_class, mock_model_class, dimension):
         """Test model is loaded only once and reused."""
 
@@ -482,6 +511,17 @@ class TestModelCaching:
         assert mock_model_class.from_pretrained.call_count == 1
         assert mock_tokenizer_class.from_pretrained.call_count == 1
 
+        PredictabilityDimension.clear_model_cache()
+
+    def test_model_shared_with_perplexity(self, dimension):
+        """Test predictability and perplexity request the same shared service."""
+        from writescore.core.analysis_config import DEFAULT_CONFIG
+        from writescore.utils.language_model import get_language_model_for
+
+        assert get_language_model_for(DEFAULT_CONFIG, "predictability") is (
+            get_language_model_for(DEFAULT_CONFIG, "perplexity")
+        )
+
 
 class TestPerformanceImprovement:
     """Performance tests for caching benefit (Story 1.4.14)."""
@@ -9,7 +9,12 @@ import numpy as np
 import pytest
 
 from writescore.core.dimension_registry import DimensionRegistry
-from writescore.dimensions.semantic_coherence import SemanticCoherenceDimension
+from writescore.dimensions.semantic_coherence import (
+    SemanticCoherenceDimension,
+    adjacent_similarities,
+    block_similarity_means,
+    unit_rows,
+)
 
 
 @pytest.fixture
@@ -496,6 +501,65 @@ class TestCoherenceMetrics:
         assert depth == 0.0
 
 
+def cosine(vec_a, vec_b):
+    """Reference cosine similarity."""
+    return np.dot(vec_a, vec_b) / (np.linalg.norm(vec_a) * np.linalg.norm(vec_b))
+
+
+class TestSimilarityKernels:
+    """Tests for the vectorized similarity kernels against pairwise cosines."""
+
+    @pytest.fixture
+    def embeddings(self):
+        return np.random.default_rng(7).normal(size=(12, 8))
+
+    def test_unit_rows(self, embeddings):
+        """Test rows are L2-normalized and zero rows become NaN."""
+        unit = unit_rows(np.vstack([embeddings, np.zeros(8)]))
+        assert np.linalg.norm(unit[:-1], axis=1) == pytest.approx(np.ones(12))
+        assert np.isnan(unit[-1]).all()
+
+    def test_adjacent_similarities(self, embeddings):
+        """Test shifted row-wise dots equal adjacent cosines."""
+        expected = [cosine(embeddings[i], embeddings[i + 1]) for i in range(11)]
+        assert adjacent_similarities(unit_rows(embeddings)) == pytest.approx(expected)
+        assert len(adjacent_similarities(unit_rows(embeddings[:1]))) == 0
+
+    def test_block_similarity_means(self, embeddings):
+        """Test Gram sub-matrix means equal mean pairwise cosines per block."""
+        blocks = [3, 1, 0, 4, 6]  # last block runs past the final row
+        expected = []
+        offset = 0
+        for size in blocks:
+            rows = embeddings[offset : offset + size]
+            pairs = [
+                cosine(rows[i], rows[j]) for i in range(len(rows)) for j in range(i + 1, len(rows))
+            ]
+            if pairs:
+                expected.append(np.mean(pairs))
+            offset += size
+
+        assert block_similarity_means(unit_rows(embeddings), blocks) == pytest.approx(expected)
+
+    def test_metrics_match_pairwise_definitions(self, dimension, embeddings):
+        """Test metrics equal their pairwise cosine definitions."""
+        document = embeddings.mean(axis=0)
+        transitions = [cosine(embeddings[i], embeddings[i + 1]) for i in range(11)]
+        alignment = [cosine(row, document) for row in embeddings]
+
+        assert dimension._calculate_topic_consistency(list(embeddings)) == pytest.approx(
+            np.mean(transitions) * 0.7 + (1.0 - min(np.std(transitions), 1.0)) * 0.3
+        )
+        assert dimension._calculate_conceptual_depth(list(embeddings), document) == pytest.approx(
+            np.mean(alignment) * 0.6 + (1.0 - min(np.std(alignment), 1.0)) * 0.4
+        )
+        flow = dimension.THRESHOLDS["general"]["discourse_flow"]
+        in_range = [flow["ideal_min"] <= sim <= flow["ideal_max"] for sim in transitions]
+        assert dimension._calculate_discourse_flow(list(embeddings)) == pytest.approx(
+            np.mean(in_range)
+        )
+
+
 # ============================================================================
 # SCORING TESTS
 # ============================================================================
@@ -3,11 +3,20 @@ Tests for SentimentDimension - Sentiment variance analysis.
 Story 1.4.6 - Adding missing test file for sentiment dimension.
 """
 
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 
 from writescore.core.analysis_config import AnalysisConfig, AnalysisMode
 from writescore.core.dimension_registry import DimensionRegistry
-from writescore.dimensions.sentiment import SentimentDimension
+from writescore.dimensions.sentiment import (
+    SentimentDimension,
+    _split_with_offsets,
+    score_sentiment_batched,
+)
+from writescore.utils.deadline import Deadline, DeadlineExceeded, deadline_scope
 
 
 @pytest.fixture
@@ -395,3 +404,142 @@ class TestGaussianScoring:
         # Scores should decrease as we move away from neutral (0.0)
         for i in range(len(scores) - 1):
             assert scores[i] > scores[i + 1], f"Score should decrease: {scores[i]} > {scores[i+1]}"
+
+
+VOCAB = "[PAD] [UNK] [CLS] [SEP] [MASK] the a is good bad great terrible day it was and i this very"
+
+
+@pytest.fixture(scope="module")
+def tiny_classifier(tmp_path_factory):
+    """Small random POSITIVE/NEGATIVE classifier with a 16-token limit (no download)."""
+    import torch
+    from transformers import (
+        BertTokenizerFast,
+        DistilBertConfig,
+        DistilBertForSequenceClassification,
+    )
+
+    vocab_file = tmp_path_factory.mktemp("vocab") / "vocab.txt"
+    vocab_file.write_text("\n".join(VOCAB.split()))
+    tokenizer = BertTokenizerFast(vocab_file=str(vocab_file), model_max_length=16)
+
+    torch.manual_seed(0)
+    config = DistilBertConfig(
+        vocab_size=len(VOCAB.split()),
+        dim=16,
+        hidden_dim=32,
+        n_layers=1,
+        n_heads=2,
+        max_position_embeddings=64,
+        id2label={0: "NEGATIVE", 1: "POSITIVE"},
+        label2id={"NEGATIVE": 0, "POSITIVE": 1},
+    )
+    model = DistilBertForSequenceClassification(config).eval()
+    return SimpleNamespace(tokenizer=tokenizer, model=model)
+
+
+CHUNKS = [
+    (0, "this is good"),
+    (20, "a bad day it was terrible and i was very very very bad and the day was terrible"),
+    (120, "great"),
+    (130, "the day was very good and great"),
+    (170, "it was a terrible day"),
+]
+
+
+class TestBatchedSentiment:
+    """Tests for score_sentiment_batched()."""
+
+    def test_matches_pipeline(self, tiny_classifier):
+        """Test batched polarities equal the per-chunk sentiment pipeline."""
+        from transformers import pipeline
+
+        classify = pipeline(
+            "sentiment-analysis",
+            model=tiny_classifier.model,
+            tokenizer=tiny_classifier.tokenizer,
+            device=-1,
+        )
+        expected = []
+        for _, chunk in CHUNKS:
+            result = classify(chunk, truncation=True)[0]
+            expected.append(-result["score"] if result["label"] == "NEGATIVE" else result["score"])
+
+        scored = score_sentiment_batched(
+            tiny_classifier.tokenizer, tiny_classifier.model, CHUNKS, batch_size=2
+        )
+
+        assert [offset for offset, _ in scored] == [offset for offset, _ in CHUNKS]
+        assert [polarity for _, polarity in scored] == pytest.approx(expected, abs=1e-5)
+
+    @pytest.mark.parametrize("batch_size", [1, 3, 64])
+    def test_independent_of_batch_size(self, tiny_classifier, batch_size):
+        """Test padding and length sorting do not change scores."""
+        unbatched = score_sentiment_batched(
+            tiny_classifier.tokenizer, tiny_classifier.model, CHUNKS, batch_size=1
+        )
+        batched = score_sentiment_batched(
+            tiny_classifier.tokenizer, tiny_classifier.model, CHUNKS, batch_size=batch_size
+        )
+        assert [p for _, p in batched] == pytest.approx([p for _, p in unbatched], abs=1e-5)
+
+    def test_long_chunks_truncated_to_token_limit(self, tiny_classifier):
+        """Test chunks longer than the model limit are truncated by tokens."""
+        long_chunk = [(0, "very " * 500 + "good")]
+        truncated = [(0, " ".join(["very"] * 14))]  # 16 tokens with [CLS]/[SEP]
+
+        assert score_sentiment_batched(
+            tiny_classifier.tokenizer, tiny_classifier.model, long_chunk
+        ) == pytest.approx(
+            score_sentiment_batched(tiny_classifier.tokenizer, tiny_classifier.model, truncated)
+        )
+
+    def test_empty(self, tiny_classifier):
+        """Test no chunks give no scores."""
+        assert score_sentiment_batched(tiny_classifier.tokenizer, tiny_classifier.model, []) == []
+
+    def test_deadline_between_batches(self, tiny_classifier):
+        """Test an expired analysis deadline stops scoring."""
+        deadline = Deadline(1)
+        deadline._expires_at -= 2
+        with deadline_scope(deadline), pytest.raises(DeadlineExceeded):
+            score_sentiment_batched(tiny_classifier.tokenizer, tiny_classifier.model, CHUNKS)
+
+
+class TestSentimentChunking:
+    """Tests for chunk splitting and configurable chunk limits."""
+
+    PARAGRAPHS = "\n\n".join(
+        f"  Paragraph number {i} has enough words to be scored.  " for i in range(40)
+    )
+
+    def test_offsets_point_at_chunks(self):
+        """Test each chunk is found at its offset, like re.split() + strip()."""
+        text = "Leading sentence that is long enough! Second sentence here, also long... end"
+        pieces = _split_with_offsets(text, r"[.!?]+")
+
+        expected = [p.strip() for p in re.split(r"[.!?]+", text) if len(p.strip()) > 20]
+        assert [chunk for _, chunk in pieces] == expected
+        for offset, chunk in pieces:
+            assert text[offset : offset + len(chunk)] == chunk
+
+    def test_default_paragraph_cap(self, dimension):
+        """Test the default configuration keeps the first 30 paragraphs."""
+        assert len(dimension._split_chunks(self.PARAGRAPHS, AnalysisConfig())) == 30
+
+    def test_uncapped_scores_every_paragraph(self, dimension, tiny_classifier):
+        """Test sentiment_max_paragraphs=None scores every paragraph."""
+        config = AnalysisConfig(mode=AnalysisMode.FULL, sentiment_max_paragraphs=None)
+        with patch(
+            "writescore.dimensions.sentiment.get_sentiment_pipeline",
+            return_value=tiny_classifier,
+        ):
+            result = dimension._analyze_sentiment_variance(self.PARAGRAPHS, config)
+
+        assert result["count"] == 40
+
+    def test_sentence_fallback_cap(self, dimension):
+        """Test sentences are capped by sentiment_max_sentences."""
+        text = "This sentence is long enough to be scored. " * 20
+        config = AnalysisConfig(sentiment_max_sentences=5)
+        assert len(dimension._split_chunks(text, config)) == 5
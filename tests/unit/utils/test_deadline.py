@@ -0,0 +1,84 @@
+"""
+Tests for cooperative analysis deadlines.
+"""
+
+import threading
+
+import pytest
+
+from writescore.utils.deadline import (
+    Deadline,
+    DeadlineExceeded,
+    check_deadline,
+    current_deadline,
+    deadline_scope,
+)
+
+
+class TestDeadline:
+    """Tests for Deadline."""
+
+    def test_no_limit_never_expires(self):
+        """Test None and 0 mean no deadline."""
+        for seconds in (None, 0):
+            deadline = Deadline(seconds)
+            assert deadline.remaining() is None
+            assert not deadline.expired
+            deadline.check()
+
+    def test_expired_deadline_raises(self):
+        """Test check() raises once the deadline has passed."""
+        deadline = Deadline(0.001)
+        deadline._expires_at -= 1
+        assert deadline.expired
+        assert deadline.remaining() == 0.0
+        with pytest.raises(DeadlineExceeded, match="deadline of 0.001s exceeded"):
+            deadline.check()
+
+    def test_not_swallowed_by_except_exception(self):
+        """Test dimension-level except Exception blocks do not catch it."""
+        assert not issubclass(DeadlineExceeded, Exception)
+
+    def test_earliest(self):
+        """Test earliest() picks the deadline expiring first."""
+        short, long, unlimited = Deadline(1), Deadline(60), Deadline()
+        assert long.earliest(short) is short
+        assert short.earliest(long) is short
+        assert unlimited.earliest(short) is short
+        assert short.earliest(unlimited) is short
+        assert short.earliest(None) is short
+
+
+class TestDeadlineScope:
+    """Tests for the active deadline."""
+
+    def test_check_without_deadline_is_noop(self):
+        """Test code outside an analysis never times out."""
+        assert current_deadline() is None
+        check_deadline()
+
+    def test_scope_activates_and_restores(self):
+        """Test the deadline is active only inside the scope."""
+        deadline = Deadline(60)
+        with deadline_scope(deadline):
+            assert current_deadline() is deadline
+            with deadline_scope(None):
+                assert current_deadline() is None
+            assert current_deadline() is deadline
+        assert current_deadline() is None
+
+    def test_check_raises_inside_expired_scope(self):
+        """Test check_deadline() uses the active deadline."""
+        deadline = Deadline(1)
+        deadline._expires_at -= 2
+        with deadline_scope(deadline), pytest.raises(DeadlineExceeded):
+            check_deadline()
+
+    def test_threads_do_not_inherit_deadline(self):
+        """Test worker threads must activate their own deadline."""
+        seen = []
+        with deadline_scope(Deadline(60)):
+            thread = threading.Thread(target=lambda: seen.append(current_deadline()))
+            thread.start()
+            thread.join()
+        assert seen == [None]
@@ -0,0 +1,85 @@
+"""Unit tests for the lexical diversity kernels."""
+
+import random
+import statistics
+
+import pytest
+
+from writescore.utils.diversity import TokenSequence, porter_stem
+
+
+def reference_mtld(words, threshold=0.72):
+    """MTLD with per-factor Python sets (the original implementation)."""
+
+    def direction(tokens):
+        factors, types, count = 0.0, set(), 0
+        for token in tokens:
+            count += 1
+            types.add(token)
+            if len(types) / count < threshold:
+                factors, types, count = factors + 1, set(), 0
+        if count:
+            factors += (1 - len(types) / count) / (1 - threshold)
+        return len(tokens) / factors if factors else len(tokens)
+
+    return (direction(words) + direction(words[::-1])) / 2
+
+
+@pytest.fixture
+def zipf_words():
+    """Word sequences with a skewed (Zipf-like) type distribution."""
+    rng = random.Random(7)
+    return [
+        [f"w{int(rng.paretovariate(1.2)) % vocabulary}" for _ in range(length)]
+        for vocabulary, length in [(5, 80), (40, 300), (300, 1200), (2000, 2500)]
+    ]
+
+
+class TestTokenSequence:
+    """Tests for interning and the diversity kernels."""
+
+    def test_interning(self):
+        """Test tokens map to IDs into a sorted vocabulary."""
+        sequence = TokenSequence(["b", "a", "b", "c"])
+        assert sequence.vocabulary.tolist() == ["a", "b", "c"]
+        assert sequence.ids.tolist() == [1, 0, 1, 2]
+        assert (sequence.tokens, sequence.types) == (4, 3)
+
+    def test_mtld_matches_reference(self, zipf_words):
+        """Test vectorized factor search gives the set-based MTLD exactly."""
+        for words in zipf_words:
+            assert TokenSequence(words).mtld() == pytest.approx(reference_mtld(words), abs=1e-9)
+
+    @pytest.mark.parametrize("window", [1, 50, 100])
+    def test_mattr_matches_reference(self, zipf_words, window):
+        """Test rolling window counts give the mean TTR of every window."""
+        for words in (words for words in zipf_words if len(words) >= window):
+            expected = statistics.mean(
+                len(set(words[i : i + window])) / window for i in range(len(words) - window + 1)
+            )
+            assert TokenSequence(words).mattr(window) == pytest.approx(expected, abs=1e-12)
+
+    def test_mattr_shorter_than_window(self):
+        """Test MATTR is unavailable when no full window fits."""
+        assert TokenSequence(["a"] * 99).mattr(100) is None
+
+    def test_select_and_rttr(self):
+        """Test type predicates filter tokens before counting."""
+        sequence = TokenSequence(["cat", "the", "dog", "cat", "42", "the"])
+        content = sequence.select(str.isalpha).select(lambda word: word != "the")
+        assert (content.tokens, content.types) == (3, 2)
+        assert content.rttr() == pytest.approx(2 / 3**0.5)
+
+    def test_stemmed_ttr(self):
+        """Test word variants merge into one stem type."""
+        sequence = TokenSequence(["run", "running", "runs", "walk"])
+        assert sequence.stemmed_ttr() == pytest.approx(2 / 4)
+        assert porter_stem("running") == "run"
+
+    def test_empty(self):
+        """Test empty sequences."""
+        sequence = TokenSequence([])
+        assert (sequence.tokens, sequence.types) == (0, 0)
+        assert sequence.ttr() == sequence.rttr() == sequence.mtld() == 0.0
+        assert sequence.mattr(50) is None
+        assert sequence.stemmed_ttr() == 0.0
@@ -0,0 +1,185 @@
+"""Unit tests for the shared sentence-embedding service and embedding store."""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+from writescore.core.analysis_config import AnalysisConfig
+from writescore.utils.deadline import Deadline, DeadlineExceeded, deadline_scope
+from writescore.utils.embeddings import (
+    EmbeddingService,
+    EmbeddingStore,
+    embedding_store_path,
+    get_embedding_service,
+    get_embedding_store_for,
+    text_digest,
+)
+
+
+class CountingEncoder:
+    """Deterministic sentence encoder recording which texts it embedded."""
+
+    def __init__(self, dim=8):
+        self.dim = dim
+        self.encoded = []
+
+    def encode(self, texts, **kwargs):
+        self.encoded.extend(texts)
+        vectors = []
+        for text in texts:
+            seed = int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+            vectors.append(np.random.default_rng(seed).standard_normal(self.dim))
+        return np.array(vectors)
+
+    def get_sentence_embedding_dimension(self):
+        return self.dim
+
+
+def make_service(cache_size=1000):
+    """Service with a counting encoder instead of the transformer model."""
+    service = EmbeddingService(cache_size=cache_size)
+    service._model = CountingEncoder()
+    return service
+
+
+SENTENCES = [f"Sentence number {i} talks about topic {i % 7}." for i in range(40)]
+
+
+class TestEmbeddingService:
+    """Tests for EmbeddingService.encode()."""
+
+    def test_encodes_each_text_once(self):
+        """Test repeated and previously seen texts are not re-encoded."""
+        service = make_service()
+        first = service.encode(SENTENCES[:10] + SENTENCES[:5])
+        second = service.encode(SENTENCES[5:15])
+
+        assert service._model.encoded == SENTENCES[:15]
+        assert first.shape == (15, 8)
+        np.testing.assert_array_equal(first[10:15], first[:5])
+        np.testing.assert_array_equal(second[:5], first[5:10])
+
+    def test_matches_direct_encoding(self):
+        """Test cached results equal the encoder output in input order."""
+        service = make_service()
+        service.encode(SENTENCES[::2])
+        result = service.encode(SENTENCES)
+        expected = CountingEncoder().encode(SENTENCES).astype(np.float32)
+        np.testing.assert_array_equal(result, expected)
+
+    def test_lru_bound(self):
+        """Test the in-memory cache keeps at most cache_size embeddings."""
+        service = make_service(cache_size=5)
+        service.encode(SENTENCES[:10])
+        assert len(service._cache) == 5
+        service.encode(SENTENCES[:1])
+        assert service._model.encoded.count(SENTENCES[0]) == 2
+
+    def test_empty_input(self):
+        """Test empty input returns an empty matrix of the model's width."""
+        assert make_service().encode([]).shape == (0, 8)
+
+    def test_deadline_checked_between_batches(self):
+        """Test an expired deadline stops encoding."""
+        service = make_service()
+        with deadline_scope(Deadline(1e-9)), pytest.raises(DeadlineExceeded):
+            service.encode(SENTENCES)
+        assert service._model.encoded == []
+
+    def test_shared_instance(self):
+        """Test dimensions get one service per model name."""
+        assert get_embedding_service() is get_embedding_service("all-MiniLM-L6-v2")
+
+
+class TestEmbeddingStore:
+    """Tests for the on-disk EmbeddingStore."""
+
+    def test_persists_across_processes(self, tmp_path):
+        """Test a revised document only encodes changed sentences in a new process."""
+        path = tmp_path / "model.f16"
+        first = make_service()
+        original = first.encode(SENTENCES, store=EmbeddingStore(path))
+
+        # Fresh service and store, as in a later run: 2 of 40 sentences changed
+        revised = SENTENCES[:]
+        revised[3] = "A rewritten sentence."
+        revised[30] = "Another rewritten sentence."
+        second = make_service()
+        result = second.encode(revised, store=EmbeddingStore(path))
+
+        assert second._model.encoded == [revised[3], revised[30]]
+        unchanged = [i for i in range(len(SENTENCES)) if i not in (3, 30)]
+        np.testing.assert_array_equal(result[unchanged], original[unchanged])
+
+    def test_float16_precision_is_consistent(self, tmp_path):
+        """Test freshly encoded and stored embeddings have the same values."""
+        path = tmp_path / "model.f16"
+        fresh = make_service().encode(SENTENCES, store=EmbeddingStore(path))
+        stored = make_service().encode(SENTENCES, store=EmbeddingStore(path))
+        np.testing.assert_array_equal(fresh, stored)
+        np.testing.assert_allclose(fresh, CountingEncoder().encode(SENTENCES), rtol=1e-3, atol=1e-3)
+
+    def test_sees_records_appended_by_another_writer(self, tmp_path):
+        """Test a store indexes records another process appended after it opened."""
+        path = tmp_path / "model.f16"
+        reader = EmbeddingStore(path)
+        assert reader.lookup([text_digest("a")]) == {}
+
+        EmbeddingStore(path).add([text_digest("a")], np.ones((1, 4)))
+        found = reader.lookup([text_digest("a"), text_digest("b")])
+        assert list(found) == [text_digest("a")]
+        np.testing.assert_array_equal(found[text_digest("a")], np.ones(4))
+
+    def test_no_duplicate_records(self, tmp_path):
+        """Test adding stored digests again does not grow the file."""
+        store = EmbeddingStore(tmp_path / "model.f16")
+        digests = [text_digest(text) for text in SENTENCES[:3]]
+        store.add(digests, np.ones((3, 4)))
+        before = store.stats()
+        store.add(digests, np.ones((3, 4)))
+        assert store.stats() == before
+        assert before["entries"] == 3
+
+    def test_reset_when_full(self, tmp_path):
+        """Test the store starts over instead of growing past max_bytes."""
+        record = 16 + 4 * 2
+        store = EmbeddingStore(tmp_path / "model.f16", max_bytes=16 + 5 * record)
+        store.add([text_digest(t) for t in SENTENCES[:4]], np.ones((4, 4)))
+        store.add([text_digest(t) for t in SENTENCES[4:7]], np.zeros((3, 4)))
+
+        stats = store.stats()
+        assert stats["entries"] == 3
+        assert stats["total_bytes"] <= store.max_bytes
+        assert list(store.lookup([text_digest(SENTENCES[0]), text_digest(SENTENCES[5])])) == [
+            text_digest(SENTENCES[5])
+        ]
+
+    def test_torn_record_discarded(self, tmp_path):
+        """Test a partially written record is dropped instead of misaligning appends."""
+        path = tmp_path / "model.f16"
+        EmbeddingStore(path).add([text_digest("a")], np.ones((1, 4)))
+        with open(path, "ab") as f:
+            f.write(b"\x00" * 7)
+
+        store = EmbeddingStore(path)
+        store.add([text_digest("b")], np.full((1, 4), 2.0))
+        found = store.lookup([text_digest("b")])
+        np.testing.assert_array_equal(found[text_digest("b")], np.full(4, 2.0))
+        assert store.stats()["entries"] == 1
+
+    def test_clear(self, tmp_path):
+        """Test clear() removes the store file."""
+        store = EmbeddingStore(tmp_path / "model.f16")
+        store.add([text_digest("a")], np.ones((1, 4)))
+        assert store.clear() == 1
+        assert not store.path.exists()
+        assert store.lookup([text_digest("a")]) == {}
+
+    def test_store_follows_result_cache_setting(self, tmp_path):
+        """Test the on-disk store is only used with the result cache enabled."""
+        assert get_embedding_store_for(AnalysisConfig()) is None
+        config = AnalysisConfig(use_result_cache=True, result_cache_dir=str(tmp_path))
+        store = get_embedding_store_for(config)
+        assert store.path == embedding_store_path(tmp_path).resolve()
+        assert store is get_embedding_store_for(config)
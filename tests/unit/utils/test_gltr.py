@@ -0,0 +1,199 @@
+"""
+Tests for the single-pass GLTR rank engine.
+
+Uses a tiny randomly initialised GPT-2 so no model download is needed.
+"""
+
+import pytest
+import torch
+from transformers import GPT2Config, GPT2LMHeadModel
+
+from writescore.utils.deadline import Deadline, DeadlineExceeded, deadline_scope
+from writescore.utils.gltr import (
+    compute_batch_scores,
+    compute_token_ranks,
+    compute_token_scores,
+    get_context_length,
+    iter_windows,
+    ranks_from_logits,
+    summarize_ranks,
+)
+
+
+@pytest.fixture(scope="module")
+def tiny_model():
+    """Small random GPT-2 with a 32-token context window."""
+    torch.manual_seed(0)
+    config = GPT2Config(
+        n_layer=2,
+        n_embd=32,
+        n_head=2,
+        vocab_size=128,
+        n_positions=32,
+        bos_token_id=0,
+        eos_token_id=0,
+    )
+    return GPT2LMHeadModel(config).eval()
+
+
+@pytest.fixture(scope="module")
+def token_ids():
+    """Deterministic token sequence."""
+    generator = torch.Generator().manual_seed(1)
+    return torch.randint(0, 128, (100,), generator=generator).tolist()
+
+
+def _prefix_loop_ranks(model, ids, start=0):
+    """Reference implementation: one forward pass per prefix plus argsort."""
+    ranks = []
+    for i in range(start + 1, len(ids)):
+        with torch.no_grad():
+            logits = model(torch.tensor([ids[start:i]])).logits[0, -1, :]
+        sorted_indices = torch.argsort(logits, descending=True)
+        ranks.append((sorted_indices == ids[i]).nonzero(as_tuple=True)[0].item())
+    return ranks
+
+
+class TestIterWindows:
+    """Tests for sliding window generation."""
+
+    def test_single_window_when_text_fits(self):
+        """Test text within context length uses one window."""
+        assert list(iter_windows(20, 32)) == [(0, 20, 1)]
+
+    def test_windows_cover_every_target_once(self):
+        """Test targets are contiguous and non-overlapping across windows."""
+        windows = list(iter_windows(100, 32, stride=16))
+        targets = [t for _, end, first in windows for t in range(first, end)]
+        assert targets == list(range(1, 100))
+
+    def test_windows_respect_context_length(self):
+        """Test no window exceeds the context length."""
+        for start, end, _ in iter_windows(100, 32, stride=10):
+            assert end - start <= 32
+
+    def test_short_sequence_yields_nothing(self):
+        """Test sequences shorter than two tokens produce no windows."""
+        assert list(iter_windows(1, 32)) == []
+
+    def test_invalid_context_length(self):
+        """Test context length below 2 is rejected."""
+        with pytest.raises(ValueError):
+            list(iter_windows(10, 1))
+
+
+class TestRanksFromLogits:
+    """Tests for rank-by-comparison."""
+
+    def test_rank_counts_greater_logits(self):
+        """Test rank equals number of strictly greater logits."""
+        logits = torch.tensor([[0.1, 0.5, 0.3, 0.9], [2.0, 1.0, 0.0, -1.0]])
+        targets = torch.tensor([2, 0])
+        assert ranks_from_logits(logits, targets).tolist() == [2, 0]
+
+
+class TestComputeTokenRanks:
+    """Tests for compute_token_ranks()."""
+
+    def test_matches_prefix_loop_within_context(self, tiny_model, token_ids):
+        """Test single pass matches the per-prefix reference exactly."""
+        ids = token_ids[:30]
+        assert compute_token_ranks(tiny_model, ids) == _prefix_loop_ranks(tiny_model, ids)
+
+    def test_one_rank_per_token_beyond_context(self, tiny_model, token_ids):
+        """Test sliding windows rank every token after the first."""
+        ranks = compute_token_ranks(tiny_model, token_ids)
+        assert len(ranks) == len(token_ids) - 1
+        assert all(0 <= r < 128 for r in ranks)
+
+    def test_first_window_matches_reference(self, tiny_model, token_ids):
+        """Test tokens in the first window are unaffected by windowing."""
+        ranks = compute_token_ranks(tiny_model, token_ids)
+        assert ranks[:31] == _prefix_loop_ranks(tiny_model, token_ids[:32])
+
+    def test_later_window_uses_overlapping_context(self, tiny_model, token_ids):
+        """Test second window ranks equal a prefix loop over its own window."""
+        ranks = compute_token_ranks(tiny_model, token_ids, stride=16)
+        # Second window is tokens [16, 48), scoring targets 32..47
+        reference = _prefix_loop_ranks(tiny_model, token_ids[:48], start=16)
+        assert ranks[31:47] == reference[15:]
+
+    def test_max_tokens_caps_sequence(self, tiny_model, token_ids):
+        """Test max_tokens limits the number of ranked tokens."""
+        assert len(compute_token_ranks(tiny_model, token_ids, max_tokens=20)) == 19
+
+    def test_short_input_returns_empty(self, tiny_model):
+        """Test a single token yields no ranks."""
+        assert compute_token_ranks(tiny_model, [5]) == []
+
+    def test_one_forward_pass_per_window(self, tiny_model, token_ids):
+        """Test the model is called once for text within the context length."""
+        calls = []
+        handle = tiny_model.register_forward_hook(lambda *args: calls.append(1))
+        try:
+            compute_token_ranks(tiny_model, token_ids[:30])
+        finally:
+            handle.remove()
+        assert len(calls) == 1
+
+    def test_context_length_from_config(self, tiny_model):
+        """Test context length is read from model config."""
+        assert get_context_length(tiny_model) == 32
+
+
+class TestComputeBatchScores:
+    """Tests for padded multi-sequence scoring."""
+
+    def test_rows_match_separate_passes(self, tiny_model, token_ids):
+        """Test each padded row scores like its own forward pass."""
+        sequences = [token_ids[:30], token_ids[5:12], token_ids[:1], token_ids[40:60]]
+        results = compute_batch_scores(tiny_model, sequences)
+
+        assert results[2] == ([], [])
+        for sequence, (ranks, log_probs) in zip(sequences, results):
+            if len(sequence) < 2:
+                continue
+            expected_ranks, expected_log_probs = compute_token_scores(tiny_model, sequence)
+            assert ranks == expected_ranks
+            assert log_probs == pytest.approx(expected_log_probs, abs=1e-4)
+
+    def test_one_forward_pass(self, tiny_model, token_ids):
+        """Test the whole batch takes a single forward pass."""
+        calls = []
+        handle = tiny_model.register_forward_hook(lambda *args: calls.append(1))
+        try:
+            compute_batch_scores(tiny_model, [token_ids[:10], token_ids[10:30]])
+        finally:
+            handle.remove()
+        assert len(calls) == 1
+
+
+class TestSummarizeRanks:
+    """Tests for summarize_ranks()."""
+
+    def test_empty_ranks(self):
+        """Test empty input returns empty dict."""
+        assert summarize_ranks([]) == {}
+
+    def test_percentages(self):
+        """Test top-k percentages and mean rank."""
+        metrics = summarize_ranks([0, 5, 50, 500, 5000])
+        assert metrics["gltr_top10_percentage"] == 0.4
+        assert metrics["gltr_top100_percentage"] == 0.6
+        assert metrics["gltr_top1000_percentage"] == 0.8
+        assert metrics["gltr_mean_rank"] == 1111.0
+
+    def test_likelihood_for_predictable_text(self):
+        """Test high top-10 concentration maps to high AI likelihood."""
+        assert summarize_ranks([0] * 9 + [500])["gltr_likelihood"] == 0.90
+
+
+class TestDeadline:
+    """Tests for cancellation between LM windows."""
+
+    def test_expired_deadline_stops_scoring(self, tiny_model, token_ids):
+        """Test an expired analysis deadline raises before the next window."""
+        deadline = Deadline(1)
+        deadline._expires_at -= 2
+        with deadline_scope(deadline), pytest.raises(DeadlineExceeded):
+            compute_token_ranks(tiny_model, token_ids)
@@ -0,0 +1,271 @@
+"""
+Tests for the shared causal language model service.
+
+Uses a tiny randomly initialised GPT-2 injected into the service so no model
+download is needed.
+"""
+
+import math
+
+import pytest
+import torch
+from transformers import GPT2Config, GPT2LMHeadModel
+
+from writescore.core.analysis_config import AnalysisConfig
+from writescore.utils.gltr import compute_token_ranks
+from writescore.utils.language_model import (
+    LanguageModelService,
+    TokenScores,
+    clear_language_models,
+    get_language_model,
+    get_language_model_for,
+    resolve_dtype,
+)
+
+
+@pytest.fixture(scope="module")
+def tiny_model():
+    """Small random GPT-2 with a 32-token context window."""
+    torch.manual_seed(0)
+    config = GPT2Config(
+        n_layer=2,
+        n_embd=32,
+        n_head=2,
+        vocab_size=128,
+        n_positions=32,
+        bos_token_id=0,
+        eos_token_id=0,
+    )
+    return GPT2LMHeadModel(config).eval()
+
+
+class _CharTokenizer:
+    """Minimal tokenizer mapping characters to ids below the tiny vocab size."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text):
+        self.calls += 1
+        return [ord(c) % 128 for c in text]
+
+
+@pytest.fixture
+def service(tiny_model):
+    """Service with the tiny model and tokenizer already loaded."""
+    svc = LanguageModelService("tiny", device="cpu")
+    svc._model = tiny_model
+    svc._tokenizer = _CharTokenizer()
+    return svc
+
+
+@pytest.fixture
+def token_ids():
+    """Deterministic token sequence longer than the context window."""
+    generator = torch.Generator().manual_seed(1)
+    return torch.randint(0, 128, (80,), generator=generator).tolist()
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry():
+    """Keep the process-wide registry clean between tests."""
+    clear_language_models()
+    yield
+    clear_language_models()
+
+
+class TestTokenScores:
+    """Tests for TokenScores."""
+
+    def test_perplexity_matches_model_loss(self, service, tiny_model, token_ids):
+        """Test perplexity equals exp of the model's own mean cross-entropy."""
+        ids = token_ids[:30]
+        scores = service.score_tokens(ids)
+        with torch.no_grad():
+            loss = tiny_model(torch.tensor([ids]), labels=torch.tensor([ids])).loss.item()
+        assert scores.mean_nll == pytest.approx(loss, rel=1e-4)
+        assert scores.perplexity == pytest.approx(math.exp(loss), rel=1e-4)
+
+    def test_empty_scores(self):
+        """Test empty sequence has zero NLL and perplexity 1."""
+        scores = TokenScores(token_ids=())
+        assert scores.mean_nll == 0.0
+        assert scores.perplexity == 1.0
+
+    def test_head(self, service, token_ids):
+        """Test head() keeps one rank per token after the first."""
+        head = service.score_tokens(token_ids[:20]).head(10)
+        assert head.token_count == 10
+        assert len(head.ranks) == 9
+        assert len(head.log_probs) == 9
+
+
+class TestScoreCache:
+    """Tests for score reuse across requests."""
+
+    def test_ranks_match_engine(self, service, tiny_model, token_ids):
+        """Test service ranks equal the GLTR engine over the same tokens."""
+        assert service.score_tokens(token_ids).ranks == compute_token_ranks(tiny_model, token_ids)
+
+    def test_exact_hit_skips_model(self, service, tiny_model, token_ids):
+        """Test repeated request is served without a forward pass."""
+        first = service.score_tokens(token_ids[:30])
+        calls = []
+        handle = tiny_model.register_forward_hook(lambda *args: calls.append(1))
+        try:
+            second = service.score_tokens(token_ids[:30])
+        finally:
+            handle.remove()
+        assert second is first
+        assert calls == []
+
+    def test_prefix_reuses_first_window(self, service, tiny_model, token_ids):
+        """Test a prefix of a cached sequence is scored without the model."""
+        full = service.score_tokens(token_ids[:30])
+        calls = []
+        handle = tiny_model.register_forward_hook(lambda *args: calls.append(1))
+        try:
+            prefix = service.score_tokens(token_ids[:20])
+        finally:
+            handle.remove()
+        assert calls == []
+        assert prefix.ranks == full.ranks[:19]
+
+    def test_extension_reuses_first_window(self, service, tiny_model, token_ids):
+        """Test extending a cached first window only computes later windows."""
+        service.score_tokens(token_ids[:32])
+        calls = []
+        handle = tiny_model.register_forward_hook(lambda *args: calls.append(1))
+        try:
+            extended = service.score_tokens(token_ids)
+        finally:
+            handle.remove()
+        assert extended.ranks == compute_token_ranks(tiny_model, token_ids)
+        # 80 tokens in 32-token windows with stride 16: windows 2-4 only
+        assert len(calls) == 3
+
+    def test_cache_is_bounded(self, service, token_ids):
+        """Test score cache evicts least recently used sequences."""
+        service.cache_size = 2
+        for n in (10, 11, 12):
+            service.score_tokens(token_ids[n : n + 10])
+        assert len(service._score_cache) == 2
+
+
+class TestPrefetch:
+    """Tests for batched first-window scoring."""
+
+    def test_prefetched_scores_match_and_skip_model(self, service, tiny_model, token_ids):
+        """Test score_tokens() after prefetch() is served from the batched pass."""
+        sequences = [token_ids[i : i + 12 + i] for i in range(6)]
+        assert service.prefetch(sequences, max_batch_tokens=64) == 6
+
+        calls = []
+        handle = tiny_model.register_forward_hook(lambda *args: calls.append(1))
+        try:
+            prefetched = [service.score_tokens(sequence) for sequence in sequences]
+        finally:
+            handle.remove()
+        assert calls == []
+        for sequence, scores in zip(sequences, prefetched):
+            assert scores.ranks == compute_token_ranks(tiny_model, sequence)
+
+    def test_long_sequences_reuse_first_window(self, service, tiny_model, token_ids):
+        """Test sequences beyond the context only compute later windows."""
+        service.prefetch([token_ids])
+        calls = []
+        handle = tiny_model.register_forward_hook(lambda *args: calls.append(1))
+        try:
+            scores = service.score_tokens(token_ids)
+        finally:
+            handle.remove()
+        assert scores.ranks == compute_token_ranks(tiny_model, token_ids)
+        assert len(calls) == 3
+
+    def test_cached_and_short_sequences_skipped(self, service, token_ids):
+        """Test only uncached first windows of two or more tokens are scored."""
+        service.score_tokens(token_ids[:20])
+        sequences = [token_ids[:20], token_ids[:10], token_ids[:1], token_ids[30:50]]
+        assert service.prefetch(sequences) == 1
+
+    def test_cache_grows_to_hold_batch(self, service, token_ids):
+        """Test no prefetched sequence is evicted before it is used."""
+        service.cache_size = 2
+        sequences = [token_ids[i : i + 10] for i in range(0, 50, 5)]
+        service.prefetch(sequences)
+        assert all(tuple(sequence) in service._score_cache for sequence in sequences)
+
+
+class TestEncode:
+    """Tests for tokenization caching."""
+
+    def test_encode_cached(self, service):
+        """Test repeated text is tokenized once."""
+        first = service.encode("hello world")
+        second = service.encode("hello world")
+        assert first == second
+        assert service.tokenizer.calls == 1
+
+    def test_encode_returns_copy(self, service):
+        """Test callers cannot mutate cached token ids."""
+        service.encode("hello")[0] = -1
+        assert service.encode("hello")[0] != -1
+
+    def test_score_text_max_tokens(self, service):
+        """Test score_text truncates before scoring."""
+        scores = service.score_text("abcdefghijklmnop", max_tokens=8)
+        assert scores.token_count == 8
+
+
+class TestRegistry:
+    """Tests for the process-wide provider."""
+
+    def test_same_name_shares_service(self):
+        """Test repeated requests return the same service."""
+        assert get_language_model("gpt2") is get_language_model("gpt2")
+
+    def test_different_names_get_different_services(self):
+        """Test each model name has its own service."""
+        assert get_language_model("gpt2") is not get_language_model("distilgpt2")
+
+    def test_service_is_lazy(self):
+        """Test requesting a service does not load the model."""
+        assert not get_language_model("gpt2").is_loaded
+
+    def test_clear_language_models(self):
+        """Test clearing drops cached services."""
+        service = get_language_model("gpt2")
+        clear_language_models()
+        assert get_language_model("gpt2") is not service
+
+    def test_config_selects_model(self):
+        """Test dimensions share the configured default model."""
+        config = AnalysisConfig()
+        assert get_language_model_for(config, "perplexity") is get_language_model_for(
+            config, "predictability"
+        )
+
+    def test_dimension_override_selects_model(self):
+        """Test per-dimension model_name override."""
+        config = AnalysisConfig(
+            dimension_overrides={"predictability": {"model_name": "distilgpt2"}}
+        )
+        assert get_language_model_for(config, "predictability").model_name == "distilgpt2"
+        assert get_language_model_for(config, "perplexity").model_name == "gpt2"
+
+
+class TestResolveDtype:
+    """Tests for dtype resolution."""
+
+    def test_none(self):
+        """Test None keeps model default."""
+        assert resolve_dtype(None) is None
+
+    def test_known_dtype(self):
+        """Test supported dtype name."""
+        assert resolve_dtype("float16") == torch.float16
+
+    def test_unknown_dtype(self):
+        """Test unsupported dtype name is rejected."""
+        with pytest.raises(ValueError):
+            resolve_dtype("int4")
@@ -0,0 +1,36 @@
+"""Unit tests for deferred module imports."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from writescore.utils.lazy_import import LazyModule, lazy_import
+
+
+class TestLazyImport:
+    """Tests for lazy_import() and LazyModule."""
+
+    def test_imported_module_returned_directly(self):
+        """Test modules already imported are not wrapped."""
+        assert lazy_import("json") is sys.modules["json"]
+
+    def test_imports_on_first_attribute_access(self):
+        """Test the module is imported when an attribute is first used."""
+        module = LazyModule("json")
+        assert not module.is_loaded
+        assert module.dumps([1]) == "[1]"
+        assert module.is_loaded
+
+    def test_missing_module_fails_on_use(self):
+        """Test an ImportError surfaces on first use, not at lazy_import()."""
+        module = lazy_import("writescore_missing_module")
+        with pytest.raises(ImportError):
+            module.anything  # noqa: B018
+
+    def test_patching_reaches_real_module(self):
+        """Test attribute patches through the placeholder apply to the module."""
+        module = LazyModule("json")
+        with patch.object(module, "dumps", return_value="patched"):
+            assert sys.modules["json"].dumps([]) == "patched"
+        assert sys.modules["json"].dumps([]) == "[]"
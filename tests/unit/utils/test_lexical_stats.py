@@ -0,0 +1,98 @@
+"""Unit tests for frequency-spectrum lexical statistics."""
+
+import math
+import random
+from collections import Counter
+
+import pytest
+from scipy import stats
+
+from writescore.utils.lexical_stats import HDD_SAMPLE_SIZE, FrequencySpectrum
+
+
+@pytest.fixture
+def tokens():
+    """A Zipf-like token sequence with many repeated types."""
+    rng = random.Random(7)
+    vocabulary = [f"word{i}" for i in range(400)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    return rng.choices(vocabulary, weights=weights, k=3000)
+
+
+def reference_metrics(tokens):
+    """Per-type reference implementations (the formulas used before spectra)."""
+    counts = Counter(tokens)
+    n, v = len(tokens), len(counts)
+    hdd = (
+        sum(1.0 - stats.hypergeom.pmf(0, n, c, HDD_SAMPLE_SIZE) for c in counts.values())
+        / HDD_SAMPLE_SIZE
+    )
+    m2 = sum(c * (c - 1) for c in counts.values())
+    top = sorted(counts.values(), reverse=True)[: max(1, v // 10)]
+    return {
+        "hdd": hdd,
+        "yules_k": 10000 * (m2 - n) / n**2,
+        "maas": (math.log(n) - math.log(v)) / math.log(n) ** 2,
+        "concentration": sum(top) / n,
+    }
+
+
+class TestFrequencySpectrum:
+    """Tests for FrequencySpectrum metrics."""
+
+    def test_spectrum(self):
+        """Test the spectrum counts types per frequency."""
+        spectrum = FrequencySpectrum.from_tokens("a b a c a b d".split())
+        frequencies, types = spectrum.spectrum()
+        assert frequencies.tolist() == [1, 2, 3]
+        assert types.tolist() == [2, 1, 1]
+        assert spectrum.tokens == 7
+        assert spectrum.types == 4
+
+    def test_metrics_match_reference(self, tokens):
+        """Test closed-form metrics equal the per-type formulas."""
+        spectrum = FrequencySpectrum.from_tokens(tokens)
+        expected = reference_metrics(tokens)
+
+        assert spectrum.hdd() == pytest.approx(expected["hdd"], rel=1e-9)
+        assert spectrum.yules_k() == pytest.approx(expected["yules_k"], rel=1e-12)
+        assert spectrum.maas() == pytest.approx(expected["maas"], rel=1e-12)
+        assert spectrum.concentration() == pytest.approx(expected["concentration"])
+
+    def test_hdd_types_always_drawn(self):
+        """Test a type too frequent to be missed from a sample counts fully."""
+        tokens = ["the"] * 30 + [f"w{i}" for i in range(20)]
+        spectrum = FrequencySpectrum.from_tokens(tokens)
+        assert spectrum.hdd() == pytest.approx(reference_metrics(tokens)["hdd"], rel=1e-9)
+
+    def test_short_and_empty_texts(self):
+        """Test metrics that need more tokens return None."""
+        short = FrequencySpectrum.from_tokens(["one", "two", "three"])
+        assert short.hdd() is None
+        assert short.yules_k() is not None
+
+        empty = FrequencySpectrum()
+        assert empty.tokens == 0
+        assert empty.hdd() is None
+        assert empty.yules_k() is None
+        assert empty.maas() is None
+        assert empty.concentration() is None
+
+    def test_merge_equals_concatenation(self, tokens):
+        """Test merged window spectra equal the spectrum of the whole text."""
+        merged = FrequencySpectrum()
+        for start in range(0, len(tokens), 700):
+            merged.merge(FrequencySpectrum.from_tokens(tokens[start : start + 700]))
+        whole = FrequencySpectrum.from_tokens(tokens)
+
+        assert merged.counts == whole.counts
+        assert merged.hdd() == whole.hdd()
+        assert merged.yules_k() == whole.yules_k()
+
+    def test_update_invalidates_spectrum(self):
+        """Test adding tokens rebuilds the spectrum."""
+        spectrum = FrequencySpectrum.from_tokens(["a", "b"])
+        assert spectrum.tokens == 2
+        spectrum.update(["a", "c"])
+        assert spectrum.tokens == 4
+        assert spectrum.spectrum()[0].tolist() == [1, 2]
@@ -0,0 +1,143 @@
+"""Unit tests for the compiled psycholinguistic lexicons."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from writescore.utils import lexicons
+from writescore.utils.lexicons import (
+    FALLBACK_ABSTRACT_WORDS,
+    FALLBACK_POWER_WORDS,
+    LEXICON_SOURCES,
+    LexiconTable,
+    abstract_mask,
+    get_abstract_words,
+    get_word_concreteness,
+    is_abstract,
+    is_power_word,
+    lookup_concreteness,
+    power_word_mask,
+    read_norms_csv,
+    write_lexicon,
+)
+
+NORMS = {"apple": 4.82, "freedom": 1.93, "idea": 1.61, "conquer": 7.03, "café": 4.5}
+
+
+@pytest.fixture
+def table(tmp_path):
+    """A small compiled lexicon, memory-mapped."""
+    path = tmp_path / "test.lex"
+    write_lexicon(path, NORMS)
+    return LexiconTable.load(path)
+
+
+@pytest.fixture
+def no_lexicons(tmp_path):
+    """Point the loader at an empty data directory."""
+    lexicons.load_lexicon.cache_clear()
+    get_abstract_words.cache_clear()
+    lexicons.get_power_words.cache_clear()
+    with patch.object(lexicons, "DATA_DIR", tmp_path):
+        yield
+    lexicons.load_lexicon.cache_clear()
+    get_abstract_words.cache_clear()
+    lexicons.get_power_words.cache_clear()
+
+
+class TestLexiconTable:
+    """Tests for compiled lexicon files and lookups."""
+
+    def test_round_trip(self, table):
+        """Test a written lexicon loads back with float32 scores."""
+        assert len(table) == len(NORMS)
+        assert table.to_dict() == pytest.approx(NORMS)
+        assert isinstance(table.words, np.memmap)
+
+    def test_get(self, table):
+        """Test single-word lookup, including non-ASCII words."""
+        assert table.get("apple") == pytest.approx(4.82)
+        assert table.get("café") == pytest.approx(4.5)
+        assert table.get("appl") is None
+        assert table.get("zebra") is None
+
+    def test_lookup_matches_get(self, table):
+        """Test vectorized lookup agrees with get() for every word, repeats included."""
+        words = ["idea", "zebra", "apple", "idea", "café", "", "a"]
+        scores = table.lookup(words)
+        assert scores.dtype == np.float32
+        for word, score in zip(words, scores):
+            expected = table.get(word)
+            if expected is None:
+                assert np.isnan(score)
+            else:
+                assert score == pytest.approx(expected)
+
+    def test_words_longer_than_table_width_not_matched(self, table):
+        """Test a word whose prefix fills the table width is not truncated into a match."""
+        assert table.width == len("freedom")
+        long_word = "freedoms"
+        assert np.isnan(table.lookup([long_word])[0])
+        assert table.get(long_word) is None
+
+    def test_empty_inputs(self, table):
+        """Test empty token lists and empty tables."""
+        assert table.lookup([]).shape == (0,)
+        empty = LexiconTable.from_norms({})
+        assert len(empty) == 0
+        assert np.isnan(empty.lookup(["apple"])).all()
+        assert empty.get("apple") is None
+
+    def test_invalid_file(self, tmp_path):
+        """Test missing or foreign files are not loaded."""
+        assert LexiconTable.load(tmp_path / "missing.lex") is None
+        (tmp_path / "bad.lex").write_bytes(b"not a lexicon at all")
+        assert LexiconTable.load(tmp_path / "bad.lex") is None
+
+
+class TestPackagedLexicons:
+    """Tests for the lexicons shipped with the package."""
+
+    @pytest.mark.parametrize("name", sorted(LEXICON_SOURCES))
+    def test_compiled_lexicon_matches_csv(self, name):
+        """Test the shipped .lex files are up to date with their CSVs."""
+        column, default = LEXICON_SOURCES[name]
+        norms = read_norms_csv(lexicons.DATA_DIR / f"{name}.csv", column, default)
+        table = LexiconTable.load(lexicons.DATA_DIR / f"{name}.lex")
+        assert table is not None, "run: python -m writescore.utils.lexicons"
+        assert table.to_dict() == pytest.approx(norms)
+
+    def test_masks_match_scalar_predicates(self):
+        """Test token-list masks agree with is_abstract() and is_power_word()."""
+        words = ["freedom", "apple", "conquer", "surrender", "idea", "xyzzy", "concept"]
+        assert abstract_mask(words).tolist() == [is_abstract(w) for w in words]
+        assert power_word_mask(words).tolist() == [is_power_word(w) for w in words]
+
+    def test_threshold_sets_cached(self):
+        """Test threshold word sets are computed once per threshold."""
+        assert get_abstract_words() is get_abstract_words()
+        assert "freedom" in get_abstract_words()
+        assert lookup_concreteness(["freedom"])[0] == pytest.approx(
+            get_word_concreteness("Freedom")
+        )
+
+
+class TestFallback:
+    """Tests for behavior without lexicon files."""
+
+    def test_csv_parsed_when_compiled_missing(self, no_lexicons, tmp_path):
+        """Test the CSV is used when no compiled lexicon exists."""
+        (tmp_path / "brysbaert_concreteness.csv").write_text(
+            "Word,Conc.M\nApple,4.82\nfreedom,1.93\nbroken,oops\n", encoding="utf-8"
+        )
+        assert get_word_concreteness("apple") == pytest.approx(4.82)
+        assert get_word_concreteness("broken") is None
+
+    def test_curated_lists(self, no_lexicons):
+        """Test curated word lists stand in for missing norms."""
+        assert get_abstract_words() is FALLBACK_ABSTRACT_WORDS
+        assert abstract_mask(["concept", "apple"]).tolist() == [True, False]
+        assert power_word_mask(["breakthrough", "apple"]).tolist() == [True, False]
+        assert is_power_word("Breakthrough")
+        assert "breakthrough" in FALLBACK_POWER_WORDS
@@ -0,0 +1,105 @@
+"""Unit tests for single-pass pattern set matching."""
+
+import random
+import re
+
+import pytest
+
+from writescore.dimensions.pragmatic_markers import PragmaticMarkersDimension
+from writescore.dimensions.transition_marker import TransitionMarkerDimension
+from writescore.utils.pattern_set import PatternSet
+
+WORDS = [
+    "it",
+    "It",
+    "seems",
+    "seem",
+    "might",
+    "we",
+    "We",
+    "know",
+    "is",
+    "likely",
+    "to",
+    "however,",
+    "Moreover,",
+    "shows",
+    "clear",
+    "I",
+    "believe",
+    "perhaps.",
+]
+
+
+def separate_spans(patterns, text):
+    """Spans found by running each compiled pattern on its own."""
+    return {name: [m.span() for m in pattern.finditer(text)] for name, pattern in patterns.items()}
+
+
+class TestPatternSet:
+    """Tests for PatternSet.spans(), counts() and findall()."""
+
+    def test_overlapping_patterns(self):
+        """Test patterns matching at the same or overlapping positions all count."""
+        patterns = PatternSet({"seem": r"\bseems?\b", "it_seems": r"\bit\s+seems\b"}, re.I)
+        assert patterns.spans("It seems so. It seems.") == {
+            "seem": [(3, 8), (16, 21)],
+            "it_seems": [(0, 8), (13, 21)],
+        }
+
+    def test_matches_of_one_pattern_do_not_overlap(self):
+        """Test a pattern's matches are non-overlapping, like finditer()."""
+        patterns = {"aa": re.compile("aa"), "a": re.compile("a")}
+        text = "aaaaa"
+        assert PatternSet(patterns).spans(text) == separate_spans(patterns, text)
+
+    def test_mixed_flags(self):
+        """Test compiled patterns keep their own case sensitivity."""
+        patterns = PatternSet(
+            {"i_believe": re.compile(r"\bI\s+believe\b"), "might": re.compile(r"\bmight\b", re.I)}
+        )
+        assert patterns.counts("i believe it MIGHT. I believe.") == {"i_believe": 1, "might": 1}
+
+    def test_unbounded_patterns(self):
+        """Test patterns without a leading word boundary and top-level alternation."""
+        patterns = {
+            "ing": re.compile(r"ing\b"),
+            "either": re.compile(r"\bfacilitate[sd]?\b|ating\b"),
+        }
+        text = "facilitating, facilitated and sing"
+        assert PatternSet(patterns).spans(text) == separate_spans(patterns, text)
+
+    def test_findall(self):
+        """Test matched text is returned per pattern, in text order."""
+        patterns = PatternSet({"delve": r"\bdelv(e|es|ing)\b"}, re.I)
+        assert patterns.findall("Delve, delving, delved") == {"delve": ["Delve", "delving"]}
+
+    def test_every_name_reported(self):
+        """Test names without matches map to empty results, in set order."""
+        patterns = PatternSet({"b": "b+", "a": "a+"})
+        assert patterns.counts("xyz") == {"b": 0, "a": 0}
+        assert patterns.names == ("b", "a")
+
+    def test_rejects_numbered_backreferences(self):
+        """Test patterns whose group numbers would shift are refused."""
+        with pytest.raises(ValueError):
+            PatternSet({"double": r"(\w)\1"})
+
+    @pytest.mark.parametrize(
+        "patterns",
+        [
+            PragmaticMarkersDimension.PRAGMATIC_PATTERNS,
+            TransitionMarkerDimension.TRANSITION_PATTERNS,
+        ],
+        ids=["pragmatic", "transition"],
+    )
+    def test_same_matches_as_separate_patterns(self, patterns):
+        """Test dimension pattern sets reproduce per-pattern finditer() results."""
+        separate = {
+            name: re.compile(source, flags)
+            for name, (source, flags) in zip(patterns.names, patterns._sources)
+        }
+        rng = random.Random(0)
+        for _ in range(50):
+            text = " ".join(rng.choice(WORDS) for _ in range(80))
+            assert patterns.spans(text) == separate_spans(separate, text)
@@ -0,0 +1,109 @@
+"""Unit tests for the Aho-Corasick phrase matcher."""
+
+import random
+
+from writescore.utils.phrase_matcher import (
+    MATCHERS_DIRNAME,
+    PhraseMatcher,
+    get_phrase_matcher,
+    is_word_bounded,
+    lexicon_digest,
+)
+
+PHRASES = ["he", "she", "his", "hers", "piece of cake", "cake"]
+
+
+def brute_force(phrases, text):
+    """Every (start, end, phrase) occurrence found with str.find."""
+    lowered = text.lower()
+    found = set()
+    for phrase in phrases:
+        start = lowered.find(phrase)
+        while start != -1:
+            found.add((start, start + len(phrase), phrase))
+            start = lowered.find(phrase, start + 1)
+    return found
+
+
+class TestPhraseMatcher:
+    """Tests for PhraseMatcher.find_all() and occurrences()."""
+
+    def test_overlapping_occurrences(self):
+        """Test all overlapping and nested occurrences are reported."""
+        matcher = PhraseMatcher(PHRASES)
+        found = {(s, e, matcher.phrases[p]) for s, e, p in matcher.find_all("ushers")}
+        assert found == {(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")}
+
+    def test_matches_substring_search(self):
+        """Test results equal a substring search for every phrase."""
+        rng = random.Random(0)
+        phrases = ["".join(rng.choice("abc ") for _ in range(rng.randint(1, 5))) for _ in range(50)]
+        matcher = PhraseMatcher(phrases)
+        for _ in range(20):
+            text = "".join(rng.choice("abcABC ") for _ in range(200))
+            found = {(s, e, matcher.phrases[p]) for s, e, p in matcher.find_all(text)}
+            assert found == brute_force(matcher.phrases, text)
+
+    def test_case_insensitive(self):
+        """Test phrases and text are compared lowercased."""
+        occurrences = PhraseMatcher(["Piece of Cake"]).occurrences(
+            "A PIECE OF CAKE, a piece of cake"
+        )
+        assert occurrences == {"piece of cake": [(2, 15), (19, 32)]}
+
+    def test_positions_survive_lowercase_expansion(self):
+        """Test positions index the original text when lowercasing changes its length."""
+        text = "İstanbul was a piece of cake"
+        assert len(text.lower()) != len(text)
+        ((start, end),) = PhraseMatcher(["piece of cake"]).occurrences(text)["piece of cake"]
+        assert text[start:end] == "piece of cake"
+
+    def test_duplicates_and_empty_phrases(self):
+        """Test duplicate (case-insensitive) and empty phrases are ignored."""
+        matcher = PhraseMatcher(["Cake", "cake", ""])
+        assert matcher.phrases == ("cake",)
+        assert matcher.occurrences("cake") == {"cake": [(0, 4)]}
+
+    def test_word_bounded(self):
+        """Test whole-word filtering matches regex word boundaries."""
+        text = "delve, delves_x redelve delve"
+        spans = PhraseMatcher(["delve"]).occurrences(text)["delve"]
+        assert [s for s in spans if is_word_bounded(text, *s)] == [(0, 5), (24, 29)]
+
+
+class TestMatcherCache:
+    """Tests for saving, loading and sharing compiled matchers."""
+
+    def test_save_load_roundtrip(self, tmp_path):
+        """Test a loaded automaton finds the same occurrences."""
+        matcher = PhraseMatcher(PHRASES)
+        path = tmp_path / "matcher.pickle"
+        matcher.save(path)
+
+        loaded = PhraseMatcher.load(path, matcher.digest)
+        assert loaded.phrases == matcher.phrases
+        assert loaded.find_all("she sells a piece of cake") == matcher.find_all(
+            "she sells a piece of cake"
+        )
+
+    def test_load_rejects_other_lexicon(self, tmp_path):
+        """Test a cached automaton for another lexicon version is not used."""
+        path = tmp_path / "matcher.pickle"
+        PhraseMatcher(PHRASES).save(path)
+        assert PhraseMatcher.load(path, lexicon_digest(PHRASES + ["new idiom"])) is None
+        assert PhraseMatcher.load(tmp_path / "missing.pickle") is None
+
+    def test_load_rejects_corrupt_file(self, tmp_path):
+        """Test an unreadable cache file is treated as a miss."""
+        path = tmp_path / "matcher.pickle"
+        path.write_bytes(b"not a pickle")
+        assert PhraseMatcher.load(path) is None
+
+    def test_compiled_once_per_lexicon(self, tmp_path):
+        """Test matchers are shared in memory and written to the cache directory."""
+        phrases = ["a phrase only this test uses", "another one"]
+        matcher = get_phrase_matcher(phrases, tmp_path)
+
+        assert get_phrase_matcher(list(phrases), tmp_path) is matcher
+        cached = tmp_path / MATCHERS_DIRNAME / f"{matcher.digest}.pickle"
+        assert PhraseMatcher.load(cached, matcher.digest).phrases == matcher.phrases
@@ -130,3 +130,33 @@ class TestGetModelUrl:
 
         with pytest.raises(RuntimeError, match="Could not find compatible version"):
             _get_model_url("nonexistent_model")
+
+
+class TestGetSpacyModel:
+    """Tests for get_spacy_model shared handle."""
+
+    @patch("writescore.utils.spacy_loader.load_spacy_model")
+    def test_get_spacy_model_loads_once(self, mock_load):
+        """Test that repeated requests share one loaded model."""
+        from writescore.utils import spacy_loader
+
+        mock_load.return_value = MagicMock()
+        with patch.dict(spacy_loader._models, clear=True):
+            first = spacy_loader.get_spacy_model("en_core_web_sm")
+            second = spacy_loader.get_spacy_model("en_core_web_sm")
+
+        assert first is second
+        mock_load.assert_called_once_with("en_core_web_sm")
+
+    @patch("writescore.utils.spacy_loader.load_spacy_model")
+    def test_get_spacy_model_per_model_name(self, mock_load):
+        """Test that different model names get different handles."""
+        from writescore.utils import spacy_loader
+
+        mock_load.side_effect = lambda name: MagicMock(name=name)
+        with patch.dict(spacy_loader._models, clear=True):
+            small = spacy_loader.get_spacy_model("en_core_web_sm")
+            medium = spacy_loader.get_spacy_model("en_core_web_md")
+
+        assert small is not medium
+        assert mock_load.call_count == 2
@@ -0,0 +1,85 @@
+"""Unit tests for the AI vocabulary index."""
+
+import pytest
+
+from writescore.utils.text_processing import count_words
+from writescore.utils.vocabulary_index import (
+    AI_VOCABULARY_INDEX,
+    VocabEntry,
+    VocabularyIndex,
+)
+
+
+def found(text, index=AI_VOCABULARY_INDEX):
+    """(matched text, canonical word) per hit."""
+    return [(text[hit.start : hit.end], hit.entry.word) for hit in index.scan(text).hits]
+
+
+class TestScan:
+    """Tests for VocabularyIndex.scan()."""
+
+    def test_forms_map_to_canonical_word(self):
+        """Test inflected forms are reported under their canonical word and tier."""
+        text = "We DELVE into tapestries, delving while enhancing."
+        assert found(text) == [
+            ("DELVE", "delve"),
+            ("tapestries", "tapestry"),
+            ("delving", "delve"),
+            ("enhancing", "enhance"),
+        ]
+        assert AI_VOCABULARY_INDEX.entry("tapestry").tier == 1
+
+    def test_whole_tokens_only(self):
+        """Test forms inside longer words are not matched, like regex word boundaries."""
+        assert found("robust_x robust2 unrobust delved") == []
+        assert found("anti-robust") == [("robust", "robust")]
+
+    def test_multi_token_forms(self):
+        """Test hyphenated forms need the hyphen and spaced forms allow any whitespace."""
+        assert found("a cutting-edge tool, cutting edge") == [("cutting-edge", "cutting-edge")]
+        assert found("a paradigm\n  shift") == [("paradigm\n  shift", "paradigm shift")]
+
+    def test_overlapping_phrases(self):
+        """Test phrases sharing tokens are all reported."""
+        assert found("dive deep dive") == [("dive deep", "dive deep"), ("deep dive", "deep dive")]
+
+    @pytest.mark.parametrize("text", ["", "Don't delve, naïve café user_1 x2 ok.", "A-B c"])
+    def test_word_count_matches_count_words(self, text):
+        """Test the scan's word count equals count_words()."""
+        assert AI_VOCABULARY_INDEX.scan(text).word_count == count_words(text)
+
+
+class TestScanLines:
+    """Tests for VocabularyIndex.scan_lines()."""
+
+    def test_hits_located_by_line(self):
+        """Test hits carry line numbers and offsets within their line."""
+        lines = ["Plain line.", "# Delve heading", "We leverage a deep", "dive and delve."]
+        hits = [
+            (number, line[hit.start : hit.end])
+            for number, line, hit in AI_VOCABULARY_INDEX.scan_lines(
+                lines, lambda line: line.startswith("#")
+            )
+        ]
+        # The heading is skipped and "deep dive" across a line break is not reported
+        assert hits == [(3, "leverage"), (4, "delve")]
+
+
+class TestLexicon:
+    """Tests for the lexicon and index construction."""
+
+    def test_tiers(self):
+        """Test tier sizes and that untiered words are kept separately."""
+        assert [len(AI_VOCABULARY_INDEX.tier_words(tier)) for tier in (1, 2, 3)] == [14, 12, 8]
+        assert "utilize" in AI_VOCABULARY_INDEX.tier_words(None)
+
+    def test_every_entry_has_suggestions(self):
+        """Test each word has replacement suggestions."""
+        assert all(entry.suggestions for entry in AI_VOCABULARY_INDEX.entries)
+
+    def test_duplicate_forms_rejected(self):
+        """Test a form cannot belong to two words."""
+        with pytest.raises(ValueError):
+            VocabularyIndex(
+                [VocabEntry("a", 1, ("shared",), ("x",)), VocabEntry("b", 2, ("shared",), ("y",))]
+            )